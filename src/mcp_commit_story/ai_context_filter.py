@@ -17,8 +17,8 @@ about unrelated work or previous commits.
 """
 import os
 import json
-import re
 import logging
+from dataclasses import replace
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, TypedDict
 from git import Commit
@@ -28,6 +28,7 @@ from .telemetry import trace_mcp_operation
 from .context_types import ChatMessage
 from .ai_invocation import invoke_ai
 from .config import load_config
+from .journal_index import get_journal_sections, read_sections
 
 logger = logging.getLogger(__name__)
 
@@ -84,25 +85,13 @@ def get_previous_journal_entry(commit: Commit) -> Optional[str]:
             journal_path = os.path.join(journal_base_path, "daily", journal_filename)
             
             if os.path.exists(journal_path):
-                with open(journal_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                # The journal index locates the last entry without scanning the file
+                entries = [section for section in get_journal_sections(journal_path) if section.kind == 'entry']
                 
-                # Extract the most recent entry from the journal
-                # Pattern to match journal entry headers
-                header_pattern = re.compile(
-                    r'^(#{2,3})\s*(.+?)\s*[-—]\s*Commit\s+([\w-]+)',
-                    re.MULTILINE | re.IGNORECASE
-                )
-                
-                matches = list(header_pattern.finditer(content))
-                
-                if matches:
-                    # Get the last entry in the file
-                    last_match = matches[-1]
-                    start_pos = last_match.start()
-                    end_pos = len(content)
-                    
-                    entry_content = content[start_pos:end_pos].strip()
+                if entries:
+                    # Get the last entry in the file, through to the end of the file
+                    last_entry = replace(entries[-1], end=os.path.getsize(journal_path))
+                    entry_content = read_sections(journal_path, [last_entry])[0].strip()
                     logger.debug(f"Found previous journal entry from {previous_date.strftime('%Y-%m-%d')}")
                     return entry_content
         
@@ -3,17 +3,196 @@ AI Invocation module for reliable AI calls with retry logic.
 
 This module provides the invoke_ai function that wraps the OpenAI provider
 with retry logic and graceful degradation for production use in git hooks.
+
+Providers are reused across calls: one OpenAIProvider (and therefore one
+openai.OpenAI client with its keep-alive connection pool) is kept per config
+file and API key for the life of the process, and the configuration is only
+re-parsed when a config file changes on disk.
+
+ainvoke_ai is the async counterpart for event-loop callers: it uses the async
+OpenAI client, backs off exponentially with jitter (honoring Retry-After), and
+accepts an overall deadline.
 """
 
+import asyncio
+import email.utils
+import os
+import random
 import time
 import logging
-from typing import Dict, Any
-from mcp_commit_story.ai_provider import OpenAIProvider
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+from mcp_commit_story.ai_provider import OpenAIProvider, DEFAULT_MODEL
+from mcp_commit_story.ai_response_cache import AIResponseCache, make_cache_key, DEFAULT_MAX_CACHE_BYTES
+from mcp_commit_story.ai_rate_limiter import AIRateLimiter, DEFAULT_REQUESTS_PER_MINUTE, DEFAULT_TOKENS_PER_MINUTE
+from mcp_commit_story.context_packer import estimate_tokens
 from mcp_commit_story.telemetry import trace_mcp_operation
-from mcp_commit_story.config import load_config, ConfigError
+from mcp_commit_story.config import load_config, find_config_files, ConfigError, Config
+from mcp_commit_story.lazy_imports import lazy_import
+
+# Only needed for error classification once a call has failed
+openai = lazy_import('openai')
 
 logger = logging.getLogger(__name__)
 
+# Retry policy for ainvoke_ai: exponential backoff with full jitter between attempts
+ASYNC_MAX_RETRIES = 3
+ASYNC_BACKOFF_BASE_DELAY = 1.0  # seconds
+ASYNC_BACKOFF_MAX_DELAY = 30.0  # seconds, also caps honored Retry-After values
+ASYNC_REQUEST_TIMEOUT = 30.0  # seconds per request
+
+# Process-level caches shared by every invoke_ai call (guarded by _cache_lock)
+_cache_lock = threading.Lock()
+_cached_config: Optional[Tuple[tuple, Config]] = None
+_provider_cache: Dict[Tuple[type, Optional[str], str], OpenAIProvider] = {}
+_response_caches: Dict[Tuple[str, int], AIResponseCache] = {}
+_rate_limiters: Dict[tuple, AIRateLimiter] = {}
+
+
+def _config_files_signature() -> tuple:
+    """Return (path, mtime_ns) for each config file load_config() would read."""
+    signature = []
+    for path in find_config_files():
+        if path:
+            try:
+                signature.append((path, os.stat(path).st_mtime_ns))
+            except OSError:
+                signature.append((path, None))
+    return tuple(signature)
+
+
+def _get_config() -> Tuple[Config, bool]:
+    """
+    Return the current configuration, parsing config files only when they changed.
+    
+    Returns:
+        Tuple of (config, cache_hit)
+        
+    Raises:
+        ConfigError: If the configuration cannot be loaded (failures are not cached)
+    """
+    global _cached_config
+    signature = _config_files_signature()
+    with _cache_lock:
+        if _cached_config is not None and _cached_config[0] == signature:
+            return _cached_config[1], True
+    
+    config = load_config()
+    with _cache_lock:
+        _cached_config = (signature, config)
+    return config, False
+
+
+def _get_provider(config: Config) -> Tuple[OpenAIProvider, bool]:
+    """
+    Return the shared provider for this config's file and API key, creating it on first use.
+    
+    Returns:
+        Tuple of (provider, cache_hit)
+        
+    Raises:
+        ValueError: If the provider cannot be created (e.g. missing API key); nothing is cached
+    """
+    # The provider class is part of the key so swapping the implementation (e.g. a
+    # patched provider in tests) never hands back a client built by another class
+    key = (OpenAIProvider, getattr(config, '_config_path', None), config.ai_openai_api_key)
+    with _cache_lock:
+        provider = _provider_cache.get(key)
+        if provider is not None:
+            return provider, True
+        provider = OpenAIProvider(config=config)
+        _provider_cache[key] = provider
+        return provider, False
+
+
+def _get_response_cache(config: Config) -> Optional[AIResponseCache]:
+    """
+    Return the on-disk response cache for this config's journal, or None when disabled.
+    
+    Configured through the ai.response_cache section:
+    ``enabled`` (default true) and ``max_size_mb`` (default 50).
+    """
+    try:
+        settings = config.get('ai', {}).get('response_cache', {})
+        if settings is False:
+            return None
+        if settings is True or settings is None:
+            settings = {}
+        if not settings.get('enabled', True):
+            return None
+        journal_path = config.get('journal', {}).get('path')
+        if not journal_path:
+            return None
+        max_bytes = int(float(settings.get('max_size_mb', DEFAULT_MAX_CACHE_BYTES / (1024 * 1024))) * 1024 * 1024)
+        key = (os.path.abspath(journal_path), max_bytes)
+    except (AttributeError, TypeError, ValueError) as e:
+        logger.debug(f"AI response cache unavailable: {e}")
+        return None
+    
+    with _cache_lock:
+        cache = _response_caches.get(key)
+        if cache is None:
+            cache = AIResponseCache.for_journal(key[0], max_bytes=max_bytes)
+            _response_caches[key] = cache
+        return cache
+
+
+def _get_rate_limiter(config: Config) -> Optional[AIRateLimiter]:
+    """
+    Return the shared rate limiter for this config, or None when disabled.
+    
+    Configured through the ai.rate_limit section: ``enabled`` (default true),
+    ``requests_per_minute`` (default 300), ``tokens_per_minute`` (default 150000)
+    and ``shared`` (default true: share the budget with other processes through
+    <journal>/.cache/ai_rate_limit.json).
+    """
+    try:
+        settings = config.get('ai', {}).get('rate_limit', {})
+        if settings is False:
+            return None
+        if settings is True or settings is None:
+            settings = {}
+        if not settings.get('enabled', True):
+            return None
+        requests_per_minute = float(settings.get('requests_per_minute', DEFAULT_REQUESTS_PER_MINUTE) or 0)
+        tokens_per_minute = float(settings.get('tokens_per_minute', DEFAULT_TOKENS_PER_MINUTE) or 0)
+        journal_path = config.get('journal', {}).get('path') if settings.get('shared', True) else None
+        key = (os.path.abspath(journal_path) if journal_path else None, requests_per_minute, tokens_per_minute)
+    except (AttributeError, TypeError, ValueError) as e:
+        logger.debug(f"AI rate limiter unavailable: {e}")
+        return None
+    
+    with _cache_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            if key[0]:
+                limiter = AIRateLimiter.for_journal(key[0], requests_per_minute, tokens_per_minute)
+            else:
+                limiter = AIRateLimiter(requests_per_minute, tokens_per_minute)
+            _rate_limiters[key] = limiter
+        return limiter
+
+
+def streaming_enabled(config: Config) -> bool:
+    """Read ai.streaming (opt-in streamed completions and progressive journal section writes) from a Config object or dict."""
+    try:
+        return bool(config.get('ai', {}).get('streaming', False))
+    except AttributeError:
+        return False
+
+
+def clear_provider_cache() -> None:
+    """Drop the cached configuration, providers, rate limiters and response cache handles (e.g. after the API key changed in the environment)."""
+    global _cached_config
+    with _cache_lock:
+        _cached_config = None
+        _provider_cache.clear()
+        _rate_limiters.clear()
+        for cache in _response_caches.values():
+            cache.close()
+        _response_caches.clear()
+
 
 def _generate_api_key_warning(error_type: str = "missing") -> str:
     """
@@ -64,13 +243,67 @@ def _is_placeholder_api_key(key: str) -> bool:
     return any(placeholder in key for placeholder in placeholders)
 
 
+def _load_invocation_config(current_span) -> Tuple[Optional[Config], Optional[str]]:
+    """
+    Load the configuration for an AI call and record the config telemetry.
+    
+    Returns:
+        Tuple of (config, error_type) where error_type is "placeholder" or "config"
+        when the call cannot be made, else None
+    """
+    try:
+        config, config_cache_hit = _get_config()
+    except ConfigError as e:
+        logger.error(f"Failed to load configuration: {e}")
+        if current_span:
+            current_span.set_attribute("ai.config_load_in_invocation_total", 1)
+            current_span.set_attribute("ai.config_load_success", False)
+        return None, "config"
+    
+    if current_span:
+        current_span.set_attribute("ai.config_load_in_invocation_total", 1)
+        current_span.set_attribute("ai.config_load_success", True)
+        current_span.set_attribute("ai.config_cache_hit", config_cache_hit)
+    
+    # Check for placeholder API key
+    if _is_placeholder_api_key(config._ai_openai_api_key):
+        logger.warning("AI invocation failed due to placeholder API key")
+        return config, "placeholder"
+    return config, None
+
+
+def _lookup_cached_response(
+    config: Config, prompt: str, context: Dict[str, Any], use_cache: bool, current_span
+) -> Tuple[Optional[AIResponseCache], Optional[str], Optional[str]]:
+    """
+    Look up a request in the response cache.
+    
+    Returns:
+        Tuple of (response_cache, cache_key, cached_response); the cache and key are
+        None when caching is off, the response is None on a miss
+    """
+    response_cache = _get_response_cache(config) if use_cache else None
+    if response_cache is None:
+        return None, None, None
+    cache_key = make_cache_key(DEFAULT_MODEL, prompt, context)
+    cached_response = response_cache.get(cache_key)
+    if current_span:
+        current_span.set_attribute("ai.response_cache_hit", cached_response is not None)
+    return response_cache, cache_key, cached_response
+
+
 @trace_mcp_operation("ai.invoke")
-def invoke_ai(prompt: str, context: Dict[str, Any], return_warning: bool = False) -> str:
+def invoke_ai(prompt: str, context: Dict[str, Any], return_warning: bool = False, use_cache: bool = True) -> str:
     """
     Call AI provider with prompt and context, including retry logic.
     
     This function wraps the OpenAI provider with:
-    - Config-based API key management
+    - Config-based API key management (config parsed once, re-read when the file changes)
+    - Provider reuse (one client and connection pool per config file and API key)
+    - Content-addressed response cache (identical model/prompt/context answered from
+      <journal>/.cache/ai_responses.db; opt out with ai.response_cache.enabled: false)
+    - Optional streamed completions (ai.streaming: true)
+    - Shared rate limit (calls queue when the requests/tokens per minute budget is spent)
     - Retry logic (up to 3 attempts with 1-second delays)
     - Graceful degradation (returns empty string or warning on failure)
     - Telemetry tracking (success, latency, error types)
@@ -85,11 +318,17 @@ def invoke_ai(prompt: str, context: Dict[str, Any], return_warning: bool = False
     - ai.error_type: Exception class name if failed (only set on failure)
     - ai.config_load_in_invocation_total: Counter for config loading operations
     - ai.config_load_success: Boolean indicating if config loaded successfully
+    - ai.config_cache_hit: Boolean indicating the config was served without re-parsing
+    - ai.provider_cache_hit: Boolean indicating an existing provider was reused
+    - ai.response_cache_hit: Boolean indicating the response came from the response cache
+    - ai.rate_limit_wait_ms: Time spent queued behind the shared rate limit
+      (configured under ai.rate_limit)
     
     Args:
         prompt: The system prompt (usually from a function's docstring)
         context: Dictionary containing git, chat, and journal context
         return_warning: If True, return warning message on failure. If False, return empty string.
+        use_cache: If False, bypass the response cache for this call (no lookup, no store).
         
     Returns:
         String response from AI provider, or warning message/empty string if configuration fails
@@ -111,29 +350,46 @@ def invoke_ai(prompt: str, context: Dict[str, Any], return_warning: bool = False
     current_span = trace.get_current_span()
     
     # Load configuration
-    try:
-        config = load_config()
-        if current_span:
-            current_span.set_attribute("ai.config_load_in_invocation_total", 1)
-            current_span.set_attribute("ai.config_load_success", True)
-            
-        # Check for placeholder API key
-        if _is_placeholder_api_key(config._ai_openai_api_key):
-            logger.warning("AI invocation failed due to placeholder API key")
-            return _generate_api_key_warning("placeholder") if return_warning else ""
-            
-    except ConfigError as e:
-        logger.error(f"Failed to load configuration: {e}")
+    config, config_error = _load_invocation_config(current_span)
+    if config_error:
+        return _generate_api_key_warning(config_error) if return_warning else ""
+    
+    # Identical requests (e.g. regenerating an entry) are answered from the response cache
+    response_cache, cache_key, cached_response = _lookup_cached_response(
+        config, prompt, context, use_cache, current_span
+    )
+    if cached_response is not None:
+        duration_ms = int((time.time() - start_time) * 1000)
         if current_span:
-            current_span.set_attribute("ai.config_load_in_invocation_total", 1)
-            current_span.set_attribute("ai.config_load_success", False)
-        return _generate_api_key_warning("config") if return_warning else ""
+            current_span.set_attribute("ai.success", True)
+            current_span.set_attribute("ai.latency_ms", duration_ms)
+        return cached_response
+    
+    rate_limiter = _get_rate_limiter(config)
+    request_tokens = estimate_tokens(prompt) + estimate_tokens(context)
+    rate_limit_wait = 0.0
     
     for attempt in range(max_retries):
         try:
-            # Create provider with config and make the call
-            provider = OpenAIProvider(config=config)
-            response = provider.call(prompt, context)
+            # Reuse the provider (and its HTTP connection pool) for this config and make the call
+            provider, provider_cache_hit = _get_provider(config)
+            if current_span:
+                current_span.set_attribute("ai.provider_cache_hit", provider_cache_hit)
+            
+            # Queue behind the shared request/token budget instead of provoking 429s
+            if rate_limiter is not None:
+                wait_start = time.monotonic()
+                rate_limiter.acquire(request_tokens)
+                rate_limit_wait += time.monotonic() - wait_start
+                if current_span:
+                    current_span.set_attribute("ai.rate_limit_wait_ms", int(rate_limit_wait * 1000))
+            if streaming_enabled(config):
+                response = provider.call(prompt, context, stream=True)
+            else:
+                response = provider.call(prompt, context)
+            
+            if response_cache is not None and isinstance(response, str) and response:
+                response_cache.put(cache_key, response)
             
             # Success - record telemetry and return
             duration_ms = int((time.time() - start_time) * 1000)
@@ -179,4 +435,193 @@ def invoke_ai(prompt: str, context: Dict[str, Any], return_warning: bool = False
         if final_error:
             current_span.set_attribute("ai.error_type", type(final_error).__name__)
     
-    return _generate_api_key_warning("missing") if return_warning else "" 
\ No newline at end of file
+    return _generate_api_key_warning("missing") if return_warning else "" 
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Return the server-requested retry delay from an API error's Retry-After headers.
+    
+    Supports ``retry-after-ms``, ``retry-after`` in seconds, and ``retry-after`` as an HTTP date.
+    """
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not headers:
+        return None
+    try:
+        retry_after_ms = headers.get('retry-after-ms')
+        if retry_after_ms is not None:
+            return max(0.0, float(retry_after_ms) / 1000)
+        retry_after = headers.get('retry-after')
+        if retry_after is None:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+            return max(0.0, retry_at.timestamp() - time.time())
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Return the delay before retry number ``attempt + 1``.
+    
+    Uses exponential backoff with full jitter (uniform between 0 and
+    ASYNC_BACKOFF_BASE_DELAY * 2**attempt, capped at ASYNC_BACKOFF_MAX_DELAY).
+    A server-provided Retry-After takes precedence over the computed delay.
+    """
+    if retry_after is not None:
+        return min(retry_after, ASYNC_BACKOFF_MAX_DELAY)
+    return random.uniform(0, min(ASYNC_BACKOFF_MAX_DELAY, ASYNC_BACKOFF_BASE_DELAY * (2 ** attempt)))
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """Timeouts, connection errors, rate limits and 5xx responses are retryable; anything else is not."""
+    if isinstance(error, (openai.APIConnectionError, asyncio.TimeoutError)):
+        # APITimeoutError is a subclass of APIConnectionError
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in (408, 409, 429) or error.status_code >= 500
+    return False
+
+
+@trace_mcp_operation("ai.invoke_async")
+async def ainvoke_ai(
+    prompt: str,
+    context: Dict[str, Any],
+    return_warning: bool = False,
+    use_cache: bool = True,
+    timeout: Optional[float] = None
+) -> str:
+    """
+    Async, non-blocking counterpart of invoke_ai for use from async code (e.g. MCP handlers).
+    
+    Behaves like invoke_ai (shared config, provider and response cache; graceful
+    degradation; same telemetry attributes) but calls the async OpenAI client and
+    never blocks the event loop while waiting:
+    - Retries use exponential backoff with full jitter instead of a fixed 1-second sleep
+    - A Retry-After header on rate-limit or overload responses is honored
+    - Permanent API errors (e.g. 400 Bad Request) are not retried
+    - Waiting for the shared rate limit happens with asyncio.sleep and counts against the deadline
+    - ``timeout`` is a deadline for the whole call, including retries and backoff
+    
+    Additional telemetry attributes:
+    - ai.attempts: Number of API requests made
+    - ai.deadline_exceeded: Boolean, set when the call ran out of time
+    
+    Args:
+        prompt: The system prompt (usually from a function's docstring)
+        context: Dictionary containing git, chat, and journal context
+        return_warning: If True, return warning message on failure. If False, return empty string.
+        use_cache: If False, bypass the response cache for this call (no lookup, no store).
+        timeout: Overall deadline in seconds; None means only the per-request timeout applies.
+        
+    Returns:
+        String response from AI provider, or warning message/empty string on failure
+    """
+    from opentelemetry import trace
+    
+    start_time = time.time()
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    final_error = None
+    deadline_exceeded = False
+    attempts = 0
+    current_span = trace.get_current_span()
+    
+    config, config_error = _load_invocation_config(current_span)
+    if config_error:
+        return _generate_api_key_warning(config_error) if return_warning else ""
+    
+    response_cache, cache_key, cached_response = _lookup_cached_response(
+        config, prompt, context, use_cache, current_span
+    )
+    if cached_response is not None:
+        duration_ms = int((time.time() - start_time) * 1000)
+        if current_span:
+            current_span.set_attribute("ai.success", True)
+            current_span.set_attribute("ai.latency_ms", duration_ms)
+        return cached_response
+    
+    try:
+        provider, provider_cache_hit = _get_provider(config)
+        if current_span:
+            current_span.set_attribute("ai.provider_cache_hit", provider_cache_hit)
+    except ValueError as e:
+        logger.warning(f"AI invocation failed due to API key configuration: {e}")
+        return _generate_api_key_warning("invalid") if return_warning else ""
+    
+    rate_limiter = _get_rate_limiter(config)
+    request_tokens = estimate_tokens(prompt) + estimate_tokens(context)
+    rate_limit_wait = 0.0
+    
+    for attempt in range(ASYNC_MAX_RETRIES):
+        # Queue behind the shared request/token budget (within the deadline)
+        if rate_limiter is not None:
+            wait_start = time.monotonic()
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            acquired = await rate_limiter.acquire_async(request_tokens, timeout=remaining)
+            rate_limit_wait += time.monotonic() - wait_start
+            if current_span:
+                current_span.set_attribute("ai.rate_limit_wait_ms", int(rate_limit_wait * 1000))
+            if not acquired:
+                deadline_exceeded = True
+                break
+        
+        request_timeout = ASYNC_REQUEST_TIMEOUT
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                deadline_exceeded = True
+                break
+            request_timeout = min(request_timeout, remaining)
+        
+        attempts += 1
+        try:
+            response = await asyncio.wait_for(
+                provider.acall(prompt, context, timeout=request_timeout), timeout=request_timeout
+            )
+            
+            if response_cache is not None and isinstance(response, str) and response:
+                response_cache.put(cache_key, response)
+            
+            duration_ms = int((time.time() - start_time) * 1000)
+            if current_span:
+                current_span.set_attribute("ai.success", True)
+                current_span.set_attribute("ai.latency_ms", duration_ms)
+                current_span.set_attribute("ai.attempts", attempts)
+            return response
+            
+        except openai.AuthenticationError as e:
+            # Invalid API key - retrying won't help
+            logger.warning(f"AI invocation failed due to API key configuration: {e}")
+            if current_span:
+                current_span.set_attribute("ai.success", False)
+                current_span.set_attribute("ai.error_type", type(e).__name__)
+            return _generate_api_key_warning("invalid") if return_warning else ""
+            
+        except Exception as e:
+            final_error = e
+            logger.warning(f"Async AI invocation failed (attempt {attempt + 1}/{ASYNC_MAX_RETRIES}): {e}")
+            if not _is_retryable_error(e) or attempt == ASYNC_MAX_RETRIES - 1:
+                break
+            delay = _backoff_delay(attempt, _retry_after_seconds(e))
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                deadline_exceeded = True
+                break
+            await asyncio.sleep(delay)
+    
+    if final_error is not None and not deadline_exceeded:
+        logger.error(f"Async AI invocation failed after {attempts} attempts")
+    elif deadline_exceeded:
+        logger.error(f"Async AI invocation gave up after {attempts} attempts: {timeout}s deadline exceeded")
+    
+    duration_ms = int((time.time() - start_time) * 1000)
+    if current_span:
+        current_span.set_attribute("ai.success", False)
+        current_span.set_attribute("ai.latency_ms", duration_ms)
+        current_span.set_attribute("ai.attempts", attempts)
+        current_span.set_attribute("ai.deadline_exceeded", deadline_exceeded)
+        if final_error:
+            current_span.set_attribute("ai.error_type", type(final_error).__name__)
+    
+    return _generate_api_key_warning("missing") if return_warning else ""
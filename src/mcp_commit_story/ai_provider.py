@@ -7,14 +7,20 @@ degradation when AI is unavailable.
 """
 
 import os
-import openai
 import logging
 from typing import Dict, Any, Optional
 from mcp_commit_story.config import Config
+from mcp_commit_story.lazy_imports import lazy_import
 from mcp_commit_story.telemetry import get_mcp_metrics
 
+# Imported on first use: the SDK is only needed once an AI call is made
+openai = lazy_import('openai')
+
 logger = logging.getLogger(__name__)
 
+# Model used for all journal generation calls
+DEFAULT_MODEL = "gpt-4o-mini"
+
 
 class OpenAIProvider:
     """
@@ -65,6 +71,9 @@ class OpenAIProvider:
                 raise ValueError("OpenAI API key not configured in .mcp-commit-storyrc.yaml")
             
             self.client = openai.OpenAI(api_key=api_key)
+            self.model = DEFAULT_MODEL
+            self._api_key = api_key
+            self._async_client = None
             
             # Record successful initialization
             if metrics:
@@ -76,7 +85,43 @@ class OpenAIProvider:
                 metrics.record_counter('ai.provider_initialization_total', 1, {'status': 'failure'})
             raise
     
-    def call(self, prompt: str, context: Dict[str, Any]) -> str:
+    @property
+    def async_client(self) -> "openai.AsyncOpenAI":
+        """Async OpenAI client sharing this provider's API key, created on first use."""
+        if self._async_client is None:
+            self._async_client = openai.AsyncOpenAI(api_key=self._api_key)
+        return self._async_client
+    
+    async def acall(self, prompt: str, context: Dict[str, Any], timeout: float = 30) -> str:
+        """
+        Async counterpart of call() built on the async OpenAI client.
+        
+        Unlike call(), API errors are raised rather than swallowed so the caller
+        (ainvoke_ai) can back off, honor Retry-After and stop on permanent errors.
+        
+        Args:
+            prompt: The system prompt (usually from a function's docstring)
+            context: Dictionary containing git, chat, and journal context
+            timeout: Request timeout in seconds
+            
+        Returns:
+            String response from OpenAI (empty string if the response has no content)
+            
+        Raises:
+            openai.OpenAIError: If the request fails
+        """
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": str(context)}
+            ],
+            timeout=timeout
+        )
+        content = response.choices[0].message.content
+        return content if content is not None else ""
+    
+    def call(self, prompt: str, context: Dict[str, Any], stream: bool = False) -> str:
         """
         Send prompt and context to OpenAI and return the response.
         
@@ -87,6 +132,7 @@ class OpenAIProvider:
         Args:
             prompt: The system prompt (usually from a function's docstring)
             context: Dictionary containing git, chat, and journal context
+            stream: If True, request a streamed completion and assemble it from chunks
             
         Returns:
             String response from OpenAI, or empty string if any error occurs
@@ -108,12 +154,25 @@ class OpenAIProvider:
             if context_size > 10000:  # 10KB  
                 print(f"WARNING: Large context size: {context_size:,} characters")
                 
+            messages = [
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": context_str}
+            ]
+            
+            if stream:
+                # Consume the completion as it is produced; the timeout then bounds
+                # the gap between chunks rather than the whole completion
+                chunks = []
+                for chunk in self.client.chat.completions.create(
+                    model=self.model, messages=messages, timeout=30, stream=True
+                ):
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        chunks.append(chunk.choices[0].delta.content)
+                return "".join(chunks)
+            
             response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": prompt},
-                    {"role": "user", "content": context_str}
-                ],
+                model=self.model,
+                messages=messages,
                 timeout=30
             )
             
@@ -0,0 +1,193 @@
+"""
+Client-side rate limiting for AI calls.
+
+Concurrent section generation, summary backfills and AI boundary filtering can
+all call the API at the same time. Without a shared budget, busy days produced
+bursts of 429 responses, and every retry added latency. This module provides a
+token-bucket limiter that every invoke_ai/ainvoke_ai call goes through.
+
+Design Choices:
+- Two buckets: requests per minute and (estimated) tokens per minute. A call
+  proceeds only when both have capacity; otherwise it waits (queues) instead
+  of failing.
+- Buckets refill continuously, so short bursts up to the per-minute budget are
+  allowed while the long-run rate is capped.
+- Process-wide by default. With a state file the bucket state lives on disk,
+  guarded by an exclusive lock on that file, so the git hook worker and the
+  background worker share one budget. Where file locking is unavailable
+  (non-POSIX platforms) the limiter falls back to process-wide state.
+- Limiter failures never break AI calls: state file errors are logged at
+  debug level and the limiter continues with in-memory state.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+from .journal_cache import ensure_cache_dir, get_journal_cache_dir
+
+logger = logging.getLogger(__name__)
+
+AI_RATE_LIMIT_STATE_FILENAME = "ai_rate_limit.json"
+
+# Defaults sit below the lowest paid OpenAI tier limits for gpt-4o-mini
+DEFAULT_REQUESTS_PER_MINUTE = 300
+DEFAULT_TOKENS_PER_MINUTE = 150000
+
+# Upper bound for a single wait so a queued caller re-checks shared state regularly
+MAX_WAIT_INTERVAL = 1.0  # seconds
+
+
+class AIRateLimiter:
+    """
+    Token-bucket limiter for requests per minute and tokens per minute.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: Optional[float] = DEFAULT_TOKENS_PER_MINUTE,
+        state_path: Optional[Union[str, Path]] = None
+    ):
+        """
+        Args:
+            requests_per_minute: Request budget; None or 0 disables the request bucket
+            tokens_per_minute: Estimated token budget; None or 0 disables the token bucket
+            state_path: Optional state file shared across processes. Its directory
+                is treated as a dedicated cache directory.
+        """
+        self.capacities: Dict[str, float] = {}
+        if requests_per_minute:
+            self.capacities['requests'] = float(requests_per_minute)
+        if tokens_per_minute:
+            self.capacities['tokens'] = float(tokens_per_minute)
+        self.state_path = Path(state_path) if state_path is not None and fcntl is not None else None
+        self._lock = threading.Lock()
+        self._state = self._full_state(time.time())
+
+    @classmethod
+    def for_journal(
+        cls,
+        journal_path: Union[str, Path],
+        requests_per_minute: Optional[float] = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: Optional[float] = DEFAULT_TOKENS_PER_MINUTE
+    ) -> 'AIRateLimiter':
+        """Create a limiter whose state is shared through the journal's cache directory."""
+        return cls(
+            requests_per_minute, tokens_per_minute,
+            state_path=get_journal_cache_dir(journal_path) / AI_RATE_LIMIT_STATE_FILENAME
+        )
+
+    def _full_state(self, now: float) -> Dict[str, Dict[str, float]]:
+        return {name: {'level': capacity, 'updated': now} for name, capacity in self.capacities.items()}
+
+    def _reserve(self, state: Dict[str, Dict[str, float]], costs: Dict[str, float], now: float) -> float:
+        """
+        Refill the buckets and take ``costs`` from them if every bucket has enough.
+
+        Returns:
+            0 when the costs were taken, otherwise the seconds until they would fit
+        """
+        wait = 0.0
+        for name, capacity in self.capacities.items():
+            bucket = state.get(name) or {'level': capacity, 'updated': now}
+            elapsed = max(0.0, now - bucket['updated'])
+            bucket['level'] = min(capacity, bucket['level'] + elapsed * capacity / 60)
+            bucket['updated'] = now
+            state[name] = bucket
+            deficit = costs[name] - bucket['level']
+            if deficit > 0:
+                wait = max(wait, deficit * 60 / capacity)
+
+        if wait == 0:
+            for name in self.capacities:
+                state[name]['level'] -= costs[name]
+        return wait
+
+    def _reserve_shared(self, costs: Dict[str, float]) -> float:
+        """Reserve against the shared state file, falling back to process state on errors."""
+        try:
+            ensure_cache_dir(self.state_path.parent)
+            with open(self.state_path, 'a+') as state_file:
+                fcntl.flock(state_file, fcntl.LOCK_EX)
+                try:
+                    state_file.seek(0)
+                    raw = state_file.read()
+                    state = json.loads(raw) if raw.strip() else {}
+                    wait = self._reserve(state, costs, time.time())
+                    state_file.seek(0)
+                    state_file.truncate()
+                    json.dump(state, state_file)
+                    state_file.flush()
+                    return wait
+                finally:
+                    fcntl.flock(state_file, fcntl.LOCK_UN)
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.debug(f"AI rate limit state file unavailable ({self.state_path}), using process state: {e}")
+            self.state_path = None
+            return self._reserve(self._state, costs, time.time())
+
+    def try_acquire(self, tokens: float = 0) -> float:
+        """
+        Take one request and ``tokens`` estimated tokens if the budget allows.
+
+        A single call larger than the token budget is charged the whole budget
+        so it can still proceed once the bucket is full.
+
+        Returns:
+            0 when acquired, otherwise the seconds to wait before trying again
+        """
+        if not self.capacities:
+            return 0.0
+        costs = {'requests': 1.0, 'tokens': float(tokens)}
+        for name, capacity in self.capacities.items():
+            costs[name] = min(costs[name], capacity)
+
+        with self._lock:
+            if self.state_path is not None:
+                return self._reserve_shared(costs)
+            return self._reserve(self._state, costs, time.time())
+
+    def acquire(self, tokens: float = 0, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the budget allows one request of ``tokens`` estimated tokens.
+
+        Args:
+            tokens: Estimated tokens the request will use
+            timeout: Maximum seconds to wait; None waits as long as needed
+
+        Returns:
+            True when acquired, False if the timeout ran out first
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= wait:
+                    return False
+            time.sleep(min(wait, MAX_WAIT_INTERVAL))
+
+    async def acquire_async(self, tokens: float = 0, timeout: Optional[float] = None) -> bool:
+        """Async counterpart of acquire() that waits without blocking the event loop."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= wait:
+                    return False
+            await asyncio.sleep(min(wait, MAX_WAIT_INTERVAL))
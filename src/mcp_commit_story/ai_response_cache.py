@@ -0,0 +1,175 @@
+"""
+Content-addressed on-disk cache of AI responses.
+
+Regenerating a journal entry (background worker retries, backfilling missed
+commits) used to re-request every section from the model even though the
+prompt and context were identical. This cache stores each successful response
+under a hash of the model, the prompt and the canonicalized context, so
+identical requests are answered locally.
+
+Storage:
+    A sidecar SQLite file under the journal directory
+    (``<journal>/.cache/ai_responses.db``), next to the other journal caches.
+
+Design Choices:
+- Keys are SHA-256 digests of ``(schema version, model, prompt, context)`` with
+  the context serialized as sorted-key JSON, so dict ordering never causes misses.
+- Size-bounded LRU: every hit refreshes an entry's ``last_used`` time, and each
+  write evicts the least recently used entries until the total stored response
+  size fits ``max_bytes``.
+- Empty responses (failed calls) are never stored.
+- An unusable cache file (see journal_cache.SQLiteSidecar) turns every lookup
+  into a miss, so the model is simply called as before.
+- Opt out with ``ai.response_cache.enabled: false`` in the config.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .journal_cache import SQLiteSidecar, get_journal_cache_dir
+
+logger = logging.getLogger(__name__)
+
+AI_RESPONSE_CACHE_FILENAME = "ai_responses.db"
+
+# Bump when the key derivation or stored format changes to invalidate old entries
+AI_RESPONSE_CACHE_SCHEMA_VERSION = 1
+
+# Default upper bound for the total size of cached responses
+DEFAULT_MAX_CACHE_BYTES = 50 * 1024 * 1024
+
+
+def make_cache_key(model: str, prompt: str, context: Any) -> str:
+    """
+    Derive the content address for an AI request.
+
+    Args:
+        model: Model name the request is sent to
+        prompt: Full system prompt
+        context: Context payload (serialized as sorted-key JSON)
+
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    canonical_context = json.dumps(context, sort_keys=True, separators=(',', ':'), default=str)
+    digest = hashlib.sha256()
+    for part in (str(AI_RESPONSE_CACHE_SCHEMA_VERSION), model, prompt, canonical_context):
+        encoded = part.encode('utf-8')
+        # Length-prefix each part so different splits of the same text never collide
+        digest.update(len(encoded).to_bytes(8, 'big'))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class AIResponseCache(SQLiteSidecar):
+    """
+    Size-bounded LRU cache of AI responses keyed by make_cache_key().
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS ai_responses ("
+        "cache_key TEXT PRIMARY KEY, "
+        "response TEXT NOT NULL, "
+        "size INTEGER NOT NULL, "
+        "last_used REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS ai_responses_last_used ON ai_responses (last_used)",
+    )
+    DESCRIPTION = "AI response cache"
+
+    def __init__(self, cache_path: Union[str, Path], max_bytes: int = DEFAULT_MAX_CACHE_BYTES):
+        """
+        Args:
+            cache_path: Path of the SQLite cache file, created on first use.
+                Its directory is treated as a dedicated cache directory.
+            max_bytes: Upper bound for the total size of stored responses
+        """
+        super().__init__(cache_path)
+        self.max_bytes = max_bytes
+
+    @property
+    def cache_path(self) -> Path:
+        return self.db_path
+
+    @classmethod
+    def for_journal(cls, journal_path: Union[str, Path], max_bytes: int = DEFAULT_MAX_CACHE_BYTES) -> 'AIResponseCache':
+        """Create a cache stored under the journal's cache directory."""
+        return cls(get_journal_cache_dir(journal_path) / AI_RESPONSE_CACHE_FILENAME, max_bytes=max_bytes)
+
+    def get(self, cache_key: str) -> Optional[str]:
+        """
+        Return the cached response for a key and mark it as recently used.
+
+        Returns:
+            The cached response, or None on a cache miss
+        """
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return None
+            try:
+                row = connection.execute(
+                    "SELECT response FROM ai_responses WHERE cache_key = ?", (cache_key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                connection.execute(
+                    "UPDATE ai_responses SET last_used = ? WHERE cache_key = ?", (time.time(), cache_key)
+                )
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"AI response cache read failed: {e}")
+                return None
+        return row[0]
+
+    def put(self, cache_key: str, response: str) -> None:
+        """
+        Store a response and evict least recently used entries beyond max_bytes.
+
+        Empty responses and responses larger than max_bytes are not stored.
+        """
+        if not response:
+            return
+        size = len(response.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO ai_responses (cache_key, response, size, last_used) VALUES (?, ?, ?, ?)",
+                    (cache_key, response, size, time.time())
+                )
+                # Keep the most recently used entries whose running size fits the bound
+                connection.execute(
+                    "DELETE FROM ai_responses WHERE cache_key IN ("
+                    "SELECT cache_key FROM ("
+                    "SELECT cache_key, SUM(size) OVER (ORDER BY last_used DESC, cache_key) AS running_size "
+                    "FROM ai_responses) WHERE running_size > ?)",
+                    (self.max_bytes,)
+                )
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"AI response cache write failed: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of cached entries and their total size in bytes."""
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return {'entries': 0, 'total_bytes': 0}
+            try:
+                entries, total_bytes = connection.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM ai_responses"
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.debug(f"AI response cache stats failed: {e}")
+                return {'entries': 0, 'total_bytes': 0}
+        return {'entries': entries, 'total_bytes': total_bytes}
@@ -14,6 +14,11 @@ Background journal worker implementation using these design principles:
 Architecture Decision: Background Execution Model (2025-06-27)
 Journal generation now runs in detached background processes to ensure
 git operations complete immediately without waiting for AI generation.
+
+Commits are funneled through JournalJobQueue: each worker enqueues its commit
+and only one worker drains the queue, so rapid successive commits are processed
+in order, never append to the journal concurrently, and adjacent commits share
+one chat extraction pass (see batch_extraction_context()).
 """
 
 import os
@@ -21,9 +26,11 @@ import sys
 import argparse
 import time
 import logging
+import sqlite3
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
 # Add src to path for imports when run as standalone script
 if __name__ == '__main__':
@@ -32,7 +39,8 @@ if __name__ == '__main__':
     sys.path.insert(0, str(src_dir))
 
 from mcp_commit_story.journal_workflow import handle_journal_entry_creation
-from mcp_commit_story.git_utils import get_repo
+from mcp_commit_story.git_utils import get_repo, git_run_memo
+from mcp_commit_story.journal_job_queue import JournalJobQueue
 from mcp_commit_story.telemetry import get_mcp_metrics
 from mcp_commit_story.config import load_config
 
@@ -200,6 +208,35 @@ def generate_journal_entry_background(commit_hash: str, repo_path: str) -> Dict[
         }
 
 
+@contextmanager
+def batch_extraction_context(commit_hashes: List[str], repo_path: str) -> Iterator[None]:
+    """
+    Share per-run work between a batch of queued commits.
+    
+    Git artifacts are memoized across the batch, and chat is extracted once for
+    the window spanning the first commit's start to the last commit's end; each
+    commit then filters that extraction for its own window.
+    
+    Args:
+        commit_hashes: Commits of the batch, in processing order
+        repo_path: Path to git repository
+    """
+    with ExitStack() as stack:
+        stack.enter_context(git_run_memo())
+        if len(commit_hashes) > 1:
+            try:
+                from mcp_commit_story.cursor_db import get_commit_time_window, shared_chat_extraction
+                windows = [get_commit_time_window(commit_hash, repo_path) for commit_hash in commit_hashes]
+                stack.enter_context(shared_chat_extraction(
+                    min(start for start, _ in windows),
+                    max(end for _, end in windows)
+                ))
+            except Exception as e:
+                # Sharing is an optimization; each commit can still extract on its own
+                logger.warning(f"Shared chat extraction unavailable, extracting per commit: {e}")
+        yield
+
+
 def main():
     """Main entry point for background journal worker."""
     parser = argparse.ArgumentParser(description='Background journal generation worker')
@@ -223,21 +260,40 @@ def main():
             
             import signal
             signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(args.timeout)
         
-        # Generate journal entry
-        result = generate_journal_entry_background(args.commit_hash, args.repo_path)
+        def process_commit(commit_hash: str) -> Dict[str, Any]:
+            # The timeout applies to each commit, not to the whole queue
+            if hasattr(os, 'alarm'):
+                signal.alarm(args.timeout)
+            try:
+                return generate_journal_entry_background(commit_hash, args.repo_path)
+            finally:
+                if hasattr(os, 'alarm'):
+                    signal.alarm(0)
         
-        # Cancel timeout alarm
-        if hasattr(os, 'alarm'):
-            signal.alarm(0)
+        try:
+            job_queue = JournalJobQueue(args.repo_path)
+            job_queue.enqueue(args.commit_hash)
+            results = job_queue.drain(
+                process_commit,
+                batch_context=lambda batch: batch_extraction_context(batch, args.repo_path)
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Journal job queue unavailable, processing commit directly: {e}")
+            results = {args.commit_hash: process_commit(args.commit_hash)}
+        
+        if results is None:
+            logger.info(f"Commit {args.commit_hash[:8]} queued for the worker already running")
+            sys.exit(0)
         
         # Log final result
-        if result['status'] == 'success':
-            logger.info(f"Background journal worker completed successfully in {result['execution_time']:.2f}s")
+        failed = [result for result in results.values() if result['status'] != 'success']
+        if not failed:
+            logger.info(f"Background journal worker completed {len(results)} commit(s) successfully")
             sys.exit(0)
         else:
-            logger.error(f"Background journal worker failed: {result.get('error', 'Unknown error')}")
+            for result in failed:
+                logger.error(f"Background journal worker failed: {result.get('error', 'Unknown error')}")
             sys.exit(1)
             
     except TimeoutError as e:
@@ -61,7 +61,7 @@ def cli():
     
     Setup Commands:
     - journal-init: Initialize journal configuration and directory structure
-    - install-hook: Install git post-commit hook for automated journal entries (supports --background mode)
+    - install-hook: Install git post-commit hook for automated journal entries (supports --background and --daemon modes)
     """
     pass
 
@@ -91,15 +91,18 @@ def journal_init(repo_path, config_path, journal_path):
 @click.option('--repo-path', type=click.Path(), default=None, help='Path to git repository (default: current directory)')
 @click.option('--background', is_flag=True, default=False, help='Run journal generation in background to avoid blocking git commits')
 @click.option('--timeout', type=int, default=30, help='Timeout in seconds for background worker (default: 30)')
-def install_hook(repo_path, background, timeout):
+@click.option('--daemon', is_flag=True, default=False, help='Queue commits with a long-running journal daemon that keeps caches warm')
+def install_hook(repo_path, background, timeout, daemon):
     """
     Install or replace the git post-commit hook for MCP Journal system.
     
     With --background flag, journal generation runs in background to avoid blocking git commits.
+    With --daemon flag, the hook hands each commit to a local journal daemon (started on demand)
+    that stays warm between commits.
     Returns JSON output matching the approved CLI contract.
     """
     try:
-        success = install_post_commit_hook(repo_path, background=background, timeout=timeout)
+        success = install_post_commit_hook(repo_path, background=background, timeout=timeout, daemon=daemon)
     except FileNotFoundError as e:
         output = {
             "status": "error",
@@ -133,12 +136,13 @@ def install_hook(repo_path, background, timeout):
         print(json.dumps(output, indent=2))
         return ERROR_CODES["general"]
     
-    mode_description = "background" if background else "synchronous"
+    mode_description = "daemon" if daemon else "background" if background else "synchronous"
     result = {
         "status": "success",
         "result": {
             "message": f"Post-commit hook installed successfully ({mode_description} mode).",
             "background_mode": background,
+            "daemon_mode": daemon,
             "timeout": timeout if background else None
         }
     }
@@ -9,16 +9,23 @@ handling, telemetry, and performance monitoring.
 import json
 import logging
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
 from opentelemetry import trace
 
 from mcp_commit_story.cursor_db.query_executor import execute_cursor_query
 from mcp_commit_story.telemetry import trace_mcp_operation, get_mcp_metrics
 
+if TYPE_CHECKING:
+    from mcp_commit_story.cursor_db.session_cache import ComposerSessionCache
+
 # Performance threshold for ComposerChatProvider operations (500ms as approved)
 COMPOSER_CHAT_PROVIDER_THRESHOLD_MS = 500
 
+# Maximum bubble keys per IN (...) list in batched mode. Stays well below
+# SQLite's historical 999 host-parameter limit.
+BUBBLE_BATCH_SIZE = 500
+
 # Initialize logger
 logger = logging.getLogger(__name__)
 
@@ -32,16 +39,25 @@ class ComposerChatProvider:
     handling, telemetry integration, and performance monitoring.
     
     Design Features (per approved design):
-    - Per-request connections with no connection pooling
-    - No caching - query fresh data every time  
+    - Per-request connections, pooled read-only when run inside cursor_connection_pool()
+    - Optional incremental session cache - sessions whose lastUpdatedAt has not
+      moved are served from the cache instead of being re-extracted
     - Reuses existing execute_cursor_query infrastructure
+    - Optional batched bubble retrieval (one query per chunk of bubbles
+      instead of one query per message)
     - Bubbles up database errors from execute_cursor_query
     - Comprehensive telemetry with @trace_mcp_operation decorator
     - Performance threshold monitoring (500ms)
     - Debug logging for empty results
     """
 
-    def __init__(self, workspace_db_path: str, global_db_path: str):
+    def __init__(
+        self,
+        workspace_db_path: str,
+        global_db_path: str,
+        batch_bubbles: bool = False,
+        session_cache: Optional['ComposerSessionCache'] = None
+    ):
         """
         Initialize ComposerChatProvider with database paths.
         
@@ -52,9 +68,15 @@ class ComposerChatProvider:
         Args:
             workspace_db_path: Path to workspace database (workspaceStorage/{hash}/state.vscdb)
             global_db_path: Path to global database (globalStorage/state.vscdb)
+            batch_bubbles: When True, fetch all bubbles of a session with chunked
+                ``IN (...)`` queries instead of one query per bubbleId
+            session_cache: Optional ComposerSessionCache; sessions with an
+                unchanged lastUpdatedAt are served from it
         """
         self.workspace_db_path = workspace_db_path
         self.global_db_path = global_db_path
+        self.batch_bubbles = batch_bubbles
+        self.session_cache = session_cache
 
     @trace_mcp_operation("composer_chat_retrieval")
     def getChatHistoryForCommit(self, start_timestamp_ms: int, end_timestamp_ms: int) -> List[Dict[str, Any]]:
@@ -80,47 +102,14 @@ class ComposerChatProvider:
         start_time = time.time()
         
         try:
-            # Get session metadata from workspace database
-            session_metadata = self._get_session_metadata()
+            sessions = self.getChatSessionsForWindow(start_timestamp_ms, end_timestamp_ms)
             
-            if not session_metadata:
+            if sessions is None:
                 logger.debug("No composer sessions found in workspace database")
                 self._record_metrics("no_sessions", start_time, 0)
                 return []
             
-            all_messages = []
-            
-            # Process each session
-            for session in session_metadata:
-                composer_id = session.get('composerId')
-                session_name = session.get('name', 'Unknown Session')
-                session_created_at = session.get('createdAt', 0)  # Get timestamp from session metadata
-                session_updated_at = session.get('lastUpdatedAt', session_created_at)  # Get end timestamp
-                
-                if not composer_id:
-                    continue
-                
-                # Check if this session overlaps with the time window using proper overlap detection
-                # Session overlaps if: session.lastUpdatedAt > window.start AND session.createdAt < window.end
-                # This captures sessions that started before but continued during the window
-                if not (session_updated_at > start_timestamp_ms and session_created_at < end_timestamp_ms):
-                    continue  # Skip session if no overlap with time window
-                
-                # Get message headers from global database
-                message_headers = self._get_message_headers(composer_id)
-                
-                if not message_headers:
-                    continue
-                
-                # Get messages for this session, passing session timestamp
-                session_messages = self._get_session_messages(
-                    composer_id,
-                    session_name,
-                    message_headers,
-                    session_created_at  # Pass session timestamp
-                )
-                
-                all_messages.extend(session_messages)
+            all_messages = [message for session in sessions for message in session['messages']]
             
             # Sort all messages chronologically by session timestamp, with composerId as tiebreaker
             # This ensures deterministic ordering when sessions have identical timestamps
@@ -139,6 +128,83 @@ class ComposerChatProvider:
             self._record_metrics("error", start_time, 0)
             raise
 
+    def getChatSessionsForWindow(self, start_timestamp_ms: int, end_timestamp_ms: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retrieve the sessions overlapping a time window, each with its messages.
+        
+        Keeping the session bounds lets callers re-filter one wide extraction
+        for narrower windows (e.g. several queued commits sharing one pass).
+        
+        Args:
+            start_timestamp_ms: Start of time window (milliseconds since epoch)
+            end_timestamp_ms: End of time window (milliseconds since epoch)
+            
+        Returns:
+            List of dicts with 'createdAt', 'lastUpdatedAt' and 'messages' (unsorted),
+            or None when the workspace database has no composer sessions
+        """
+        # Get session metadata from workspace database
+        session_metadata = self._get_session_metadata()
+        
+        if not session_metadata:
+            return None
+        
+        sessions = []
+        sessions_from_cache = 0
+        
+        # Process each session
+        for session in session_metadata:
+            composer_id = session.get('composerId')
+            session_name = session.get('name', 'Unknown Session')
+            session_created_at = session.get('createdAt', 0)  # Get timestamp from session metadata
+            session_updated_at = session.get('lastUpdatedAt', session_created_at)  # Get end timestamp
+            
+            if not composer_id:
+                continue
+            
+            # Check if this session overlaps with the time window using proper overlap detection
+            # Session overlaps if: session.lastUpdatedAt > window.start AND session.createdAt < window.end
+            # This captures sessions that started before but continued during the window
+            if not (session_updated_at > start_timestamp_ms and session_created_at < end_timestamp_ms):
+                continue  # Skip session if no overlap with time window
+            
+            # Reuse previously extracted messages if the session hasn't changed
+            cache_key_timestamp = session.get('lastUpdatedAt')
+            session_messages = None
+            if self.session_cache is not None:
+                session_messages = self.session_cache.get(composer_id, cache_key_timestamp)
+                if session_messages is not None:
+                    sessions_from_cache += 1
+            
+            if session_messages is None:
+                # Get message headers from global database
+                message_headers = self._get_message_headers(composer_id)
+                
+                if not message_headers:
+                    continue
+                
+                # Get messages for this session, passing session timestamp
+                session_messages = self._get_session_messages(
+                    composer_id,
+                    session_name,
+                    message_headers,
+                    session_created_at  # Pass session timestamp
+                )
+                
+                if self.session_cache is not None:
+                    self.session_cache.put(composer_id, cache_key_timestamp, session_messages)
+            
+            sessions.append({
+                'createdAt': session_created_at,
+                'lastUpdatedAt': session_updated_at,
+                'messages': session_messages
+            })
+        
+        if self.session_cache is not None:
+            self._set_cache_span_attributes(sessions_from_cache)
+        
+        return sessions
+
     def _get_session_metadata(self) -> List[Dict[str, Any]]:
         """
         Retrieve session metadata from workspace database.
@@ -226,6 +292,15 @@ class ComposerChatProvider:
         # Get conversation headers (message list)
         conversation_headers = message_headers.get('fullConversationHeadersOnly', [])
         
+        # In batched mode, pull every bubble for this session up front
+        batched_messages = None
+        if self.batch_bubbles:
+            bubble_ids = [
+                header.get('bubbleId') for header in conversation_headers
+                if header.get('bubbleId') and header.get('type') is not None
+            ]
+            batched_messages = self._get_session_bubbles(composer_id, bubble_ids)
+        
         for header in conversation_headers:
             bubble_id = header.get('bubbleId')
             message_type = header.get('type')
@@ -234,7 +309,10 @@ class ComposerChatProvider:
                 continue
             
             # Get individual message content
-            message_data = self._get_individual_message(composer_id, bubble_id)
+            if batched_messages is not None:
+                message_data = batched_messages.get(bubble_id)
+            else:
+                message_data = self._get_individual_message(composer_id, bubble_id)
             
             if not message_data:
                 continue
@@ -291,6 +369,47 @@ class ComposerChatProvider:
         message_json = result[0][0]
         return json.loads(message_json)
 
+    def _get_session_bubbles(self, composer_id: str, bubble_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve message content for many bubbles of one session from global database.
+        
+        Issues one ``[key] IN (...)`` query per BUBBLE_BATCH_SIZE bubbles instead
+        of one point lookup per bubble. Callers keep their own ordering (from
+        fullConversationHeadersOnly); the returned mapping is unordered.
+        
+        Args:
+            composer_id: Session identifier
+            bubble_ids: Bubble identifiers to fetch
+            
+        Returns:
+            Dictionary mapping bubbleId to message data. Bubbles missing from
+            the database are absent from the result.
+            
+        Raises:
+            CursorDatabaseAccessError: When global database cannot be accessed
+            CursorDatabaseQueryError: When query fails
+            json.JSONDecodeError: When JSON data is malformed
+        """
+        key_prefix = f"bubbleId:{composer_id}:"
+        bubbles = {}
+        
+        unique_ids = list(dict.fromkeys(bubble_ids))
+        for offset in range(0, len(unique_ids), BUBBLE_BATCH_SIZE):
+            chunk = unique_ids[offset:offset + BUBBLE_BATCH_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            result = execute_cursor_query(
+                self.global_db_path,
+                f"SELECT [key], value FROM cursorDiskKV WHERE [key] IN ({placeholders})",
+                tuple(f"{key_prefix}{bubble_id}" for bubble_id in chunk)
+            )
+            
+            for key, value in result or []:
+                if value is None:
+                    continue
+                bubbles[key[len(key_prefix):]] = json.loads(value)
+        
+        return bubbles
+
     def _map_message_type_to_role(self, message_type: int) -> str:
         """
         Map Cursor message type to standard role format.
@@ -363,6 +482,21 @@ class ComposerChatProvider:
         # Set span attributes for telemetry
         self._set_span_attributes(strategy, duration_ms, message_count)
 
+    def _set_cache_span_attributes(self, sessions_from_cache: int) -> None:
+        """
+        Record how many sessions were served from the session cache.
+        
+        Args:
+            sessions_from_cache: Number of sessions whose messages came from the cache
+        """
+        try:
+            span = trace.get_current_span()
+            if span:
+                span.set_attribute("composer_chat.sessions_from_cache", sessions_from_cache)
+        except Exception:
+            # Ignore telemetry errors to avoid disrupting main functionality
+            pass
+
     def _set_span_attributes(self, strategy: str, duration_ms: float, message_count: int) -> None:
         """
         Set telemetry span attributes for ComposerChatProvider operations.
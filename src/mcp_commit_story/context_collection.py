@@ -20,7 +20,7 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from mcp_commit_story.context_types import ChatHistory, GitContext, RecentJournalContext
-from mcp_commit_story.git_utils import get_repo, get_current_commit, get_commit_details, get_commit_diff_summary, classify_file_type, classify_commit_size, NULL_TREE, get_commit_file_diffs
+from mcp_commit_story.git_utils import get_repo, get_current_commit, get_commit_details, get_commit_diff_summary, classify_file_type, classify_commit_size, NULL_TREE, get_commit_file_diffs, get_commit_snapshot, MAX_FILE_DIFF_SIZE, memoize_for_run, find_run_memo
 from mcp_commit_story.telemetry import (
     trace_git_operation, 
     trace_mcp_operation,
@@ -34,15 +34,15 @@ from mcp_commit_story.telemetry import (
 # Import cursor_db for chat history collection
 from mcp_commit_story.cursor_db import query_cursor_chat_database
 from mcp_commit_story.ai_context_filter import filter_chat_for_commit
+from mcp_commit_story.journal_index import get_trailing_sections, read_sections
 
 import re
 
 logger = logging.getLogger(__name__)
 
-# Pre-compiled regex patterns for journal parsing (performance optimization)
-_JOURNAL_ENTRY_PATTERN = re.compile(r'^## (\d{1,2}:\d{2} (?:AM|PM)) — Git Commit: ([a-zA-Z0-9]+)', re.MULTILINE)
-_CAPTURE_REFLECTION_PATTERN = re.compile(r'^### (\d{1,2}:\d{2} (?:AM|PM)|[\d:]+) — (?:AI Context Capture|Reflection)', re.MULTILINE)
-_SECTION_BOUNDARY_PATTERN = re.compile(r'^##+ (?:\d{1,2}:\d{2} (?:AM|PM)|[\d:]+) —', re.MULTILINE)
+# Chat windows smaller than this skip the AI boundary filter (see _boundary_filter_skip_reason)
+MIN_MESSAGES_FOR_BOUNDARY_FILTER = 10
+
 
 
 @trace_git_operation("chat_history", 
@@ -62,6 +62,8 @@ def collect_chat_history(
     history from previous development work.
 
     AI Filtering Process:
+    - Skipped when the window is small, a single Composer session, or entirely newer
+      than the parent commit (see _boundary_filter_skip_reason)
     - Analyzes conversation context to identify where current commit work begins
     - Uses git context, previous commits, and conversation flow for boundary detection
     - Provides confidence scoring and reasoning for transparency
@@ -101,16 +103,29 @@ def collect_chat_history(
         # Extract chat messages directly - no limiting applied
         chat_messages = chat_data.get('chat_history', [])
         
-        # Apply AI filtering if we have messages and a commit object
-        if chat_messages and commit is not None:
+        # Apply AI filtering if we have messages and a commit object, unless a cheap
+        # heuristic shows the window needs no boundary (saves a full AI round-trip)
+        skip_reason = _boundary_filter_skip_reason(chat_messages, commit) if chat_messages and commit is not None else None
+        if skip_reason:
+            from opentelemetry import trace
+            span = trace.get_current_span()
+            if span:
+                span.set_attribute("ai_filter.skipped", True)
+                span.set_attribute("ai_filter.skip_reason", skip_reason)
+                span.set_attribute("ai_filter.messages_before", len(chat_messages))
+                span.set_attribute("ai_filter.messages_after", len(chat_messages))
+            logger.info(f"AI filtering skipped ({skip_reason}): keeping {len(chat_messages)} messages")
+        elif chat_messages and commit is not None:
             # Telemetry: Track filtering effectiveness
             from opentelemetry import trace
             span = trace.get_current_span()
             messages_before = len(chat_messages)
+            if span:
+                span.set_attribute("ai_filter.skipped", False)
             
             try:
-                # Collect git context for AI filtering
-                git_context = collect_git_context(commit_hash=commit.hexsha)
+                # Collect git context for AI filtering, reusing the run's context for this commit
+                git_context = find_run_memo('git_context', commit.hexsha) or collect_git_context(commit_hash=commit.hexsha)
                 filtered_messages = filter_chat_for_commit(chat_messages, commit, git_context)
                 
                 # Update to use filtered messages
@@ -172,6 +187,39 @@ def collect_chat_history(
         return ChatHistory(messages=[])
 
 
+def _boundary_filter_skip_reason(chat_messages: List[Dict[str, Any]], commit) -> Optional[str]:
+    """
+    Decide whether AI boundary filtering can be skipped for a commit's chat window.
+    
+    The boundary call only pays off when the window mixes work for this commit with
+    earlier work. It is skipped when:
+    - the window has fewer than MIN_MESSAGES_FOR_BOUNDARY_FILTER messages
+    - all messages belong to a single Composer session
+    - every message is newer than the parent commit, so nothing predates this commit's work
+    
+    Returns:
+        The skip reason ("few_messages", "single_session" or "after_parent_commit"),
+        or None when the AI boundary call should run
+    """
+    if len(chat_messages) < MIN_MESSAGES_FOR_BOUNDARY_FILTER:
+        return "few_messages"
+    
+    composer_ids = {msg.get('composerId') for msg in chat_messages}
+    if len(composer_ids) == 1 and None not in composer_ids:
+        return "single_session"
+    
+    try:
+        parent_time_ms = commit.parents[0].committed_date * 1000
+        timestamps = [msg['timestamp'] for msg in chat_messages]
+        if all(timestamp >= parent_time_ms for timestamp in timestamps):
+            return "after_parent_commit"
+    except (AttributeError, IndexError, KeyError, TypeError):
+        # Root commit, missing timestamps or an unusual commit object - let the AI decide
+        pass
+    
+    return None
+
+
 @trace_git_operation("git_context",
                     performance_thresholds={"duration": 2.0},
                     error_categories=["git", "filesystem", "memory"])
@@ -199,6 +247,9 @@ def collect_git_context(commit_hash=None, repo=None, journal_path=None) -> GitCo
     - This function enforces the in-memory-only rule for context data.
     - File diffs are collected with size limits for performance (see get_commit_file_diffs).
     - If journal_path is provided, all journal files are filtered from changed_files, file_stats, and diff_summary to prevent recursion.
+    - Inside git_utils.git_run_memo() the result is memoized per commit, repo and journal_path,
+      and the underlying commit snapshot per commit and repo, so contexts that differ only in
+      journal_path share one git pass.
     """
     # Handle repo parameter - can be None, string path, Path object, or git.Repo object
     if repo is None:
@@ -221,8 +272,23 @@ def collect_git_context(commit_hash=None, repo=None, journal_path=None) -> GitCo
             raise
         raise
     
+    # Within a journal run (git_run_memo) each commit's context is collected once
+    memo_key = ('git_context', commit.hexsha, str(getattr(repo, 'working_dir', None)), str(journal_path) if journal_path else None)
+    return memoize_for_run(memo_key, lambda: _build_git_context(repo, commit, journal_path))
+
+
+def _build_git_context(repo, commit, journal_path=None) -> GitContext:
+    """Collect the GitContext for a resolved commit (see collect_git_context)."""
+    # One git diff-tree pass shared by details, summary, changed files and file diffs,
+    # and within a run by every journal_path view of the commit.
+    # Patches are capped at the largest per-file diff budget so huge files are never held whole.
+    snapshot = memoize_for_run(
+        ('commit_snapshot', commit.hexsha, str(getattr(repo, 'working_dir', None))),
+        lambda: get_commit_snapshot(repo, commit, max_patch_size=MAX_FILE_DIFF_SIZE)
+    )
+    
     # Metadata collection
-    details = get_commit_details(commit)
+    details = get_commit_details(commit, snapshot=snapshot)
     metadata = {
         'hash': details.get('hash'),
         'author': details.get('author'),
@@ -231,32 +297,33 @@ def collect_git_context(commit_hash=None, repo=None, journal_path=None) -> GitCo
     }
     
     # Diff summary
-    diff_summary = get_commit_diff_summary(commit)
+    diff_summary = get_commit_diff_summary(commit, snapshot=snapshot)
     
     # Changed files with smart sampling and performance limits
-    parent = commit.parents[0] if commit.parents else None
-    # For the initial commit, diff against the empty tree (NULL_TREE)
-    try:
-        diffs = commit.diff(parent) if parent else commit.diff(NULL_TREE)
-        
-        # Defensive programming: handle case where diff returns None
-        if diffs is None:
-            raise TypeError("Git diff operation returned None - possibly due to repository corruption or timeout")
+    if snapshot is not None:
+        all_changed_files = [change.path for change in snapshot.files]
+    else:
+        parent = commit.parents[0] if commit.parents else None
+        # For the initial commit, diff against the empty tree (NULL_TREE)
+        try:
+            diffs = commit.diff(parent) if parent else commit.diff(NULL_TREE)
             
-    except (TypeError, AttributeError) as e:
-        # Handle cases where diff() returns None or other unexpected types
-        logger.error(f"Git diff operation failed: {e}")
-        raise
-    
-    all_changed_files = []
-    total_file_count = 0
-    
-    # Collect all files first for analysis
-    for diff in diffs:
-        fname = diff.b_path or diff.a_path
-        if fname:
-            all_changed_files.append(fname)
-            total_file_count += 1
+            # Defensive programming: handle case where diff returns None
+            if diffs is None:
+                raise TypeError("Git diff operation returned None - possibly due to repository corruption or timeout")
+                
+        except (TypeError, AttributeError) as e:
+            # Handle cases where diff() returns None or other unexpected types
+            logger.error(f"Git diff operation failed: {e}")
+            raise
+        
+        # Collect all files first for analysis
+        all_changed_files = []
+        for diff in diffs:
+            fname = diff.b_path or diff.a_path
+            if fname:
+                all_changed_files.append(fname)
+    total_file_count = len(all_changed_files)
     
     # Apply performance mitigation for large commits
     if total_file_count > PERFORMANCE_THRESHOLDS["detailed_analysis_file_count_limit"]:
@@ -319,7 +386,7 @@ def collect_git_context(commit_hash=None, repo=None, journal_path=None) -> GitCo
     
     # Collect file diffs
     try:
-        file_diffs = get_commit_file_diffs(repo, commit)
+        file_diffs = get_commit_file_diffs(repo, commit, snapshot=snapshot)
     except Exception as e:
         logger.warning(f"Failed to collect file diffs for commit {commit.hexsha}: {e}")
         file_diffs = {}
@@ -481,7 +548,9 @@ def collect_recent_journal_context(commit) -> RecentJournalContext:
     that entry to provide relevant context while avoiding duplication. Uses the commit's
     date to determine which journal file to examine, following existing codebase patterns.
     
-    Uses regex patterns for maintainable section parsing and implements comprehensive 
+    Section boundaries come from the journal index, or from reading the file
+    backwards when the index is not current (see journal_index), so only the
+    latest entry and the captures after it are read from disk. Implements comprehensive
     telemetry tracking with graceful error handling.
     
     Args:
@@ -543,10 +612,23 @@ def collect_recent_journal_context(commit) -> RecentJournalContext:
         if current_span:
             current_span.set_attribute("journal.file_exists", True)
         
-        # Read journal file content
+        # Locate the trailing sections and read only the ones needed
         try:
-            with open(journal_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            sections = get_trailing_sections(journal_file_path)
+            entry_sections = [section for section in sections if section.kind == 'entry']
+            capture_sections = [section for section in sections if section.kind in ('capture', 'reflection')]
+            
+            # The most recent journal entry is the last one in the file
+            latest_entry_section = entry_sections[-1] if entry_sections else None
+            latest_entry_end_pos = latest_entry_section.end if latest_entry_section else 0
+            
+            # Only include captures/reflections that come after the latest entry
+            later_captures = [section for section in capture_sections if section.start >= latest_entry_end_pos]
+            
+            texts = read_sections(
+                journal_file_path,
+                ([latest_entry_section] if latest_entry_section else []) + later_captures
+            )
         except Exception as e:
             logger.warning(f"Failed to read journal file {journal_file_path}: {e}")
             if current_span:
@@ -565,56 +647,15 @@ def collect_recent_journal_context(commit) -> RecentJournalContext:
             )
         
         if current_span:
-            current_span.set_attribute("journal.content_length", len(content))
+            current_span.set_attribute("journal.content_length", journal_file_path.stat().st_size)
         
-        # Parse journal content to identify sections
-        
-        # Find the most recent journal entry (last one in the file)
-        entry_matches = list(_JOURNAL_ENTRY_PATTERN.finditer(content))
         latest_entry = None
-        latest_entry_end_pos = 0
-        
-        if entry_matches:
-            # Get the last entry match (most recent)
-            latest_entry_match = entry_matches[-1]
-            latest_entry_start = latest_entry_match.start()
-            
-            # Find where this entry ends (start of next section or end of file)
-            next_section_pos = len(content)
-            
-            # Look for the next section starting with ## (any section, not just entries)
-            next_section_match = _SECTION_BOUNDARY_PATTERN.search(content[latest_entry_start + 1:])
-            if next_section_match:
-                next_section_pos = latest_entry_start + 1 + next_section_match.start()
-            
-            # Extract the latest entry content
-            latest_entry = content[latest_entry_start:next_section_pos].strip()
-            latest_entry_end_pos = next_section_pos
-            
+        if latest_entry_section:
+            latest_entry = texts.pop(0).strip()
             if current_span:
                 current_span.set_attribute("journal.latest_entry_length", len(latest_entry))
         
-        # Find captures/reflections added after the latest entry
-        additional_context = []
-        capture_matches = list(_CAPTURE_REFLECTION_PATTERN.finditer(content))
-        
-        for match in capture_matches:
-            capture_start = match.start()
-            
-            # Only include captures that come after the latest entry
-            # Use >= instead of > to include sections that start exactly at the boundary
-            if capture_start >= latest_entry_end_pos:
-                # Find where this capture/reflection ends
-                capture_end_pos = len(content)
-                
-                # Look for the next section
-                next_section_match = _SECTION_BOUNDARY_PATTERN.search(content[capture_start + 1:])
-                if next_section_match:
-                    capture_end_pos = capture_start + 1 + next_section_match.start()
-                
-                # Extract the capture/reflection content
-                capture_content = content[capture_start:capture_end_pos].strip()
-                additional_context.append(capture_content)
+        additional_context = [text.strip() for text in texts]
         
         # Record success metrics
         duration = time.time() - start_time
@@ -646,7 +687,7 @@ def collect_recent_journal_context(commit) -> RecentJournalContext:
                 'latest_entry_found': latest_entry is not None,
                 'additional_context_count': len(additional_context),
                 'date': commit_date_str,
-                'parser_sections': len(entry_matches) + len(capture_matches)
+                'parser_sections': len(entry_sections) + len(capture_sections)
             }
         )
         
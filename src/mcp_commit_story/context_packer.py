@@ -0,0 +1,203 @@
+"""
+Token-budgeted packing of JournalContext before section generation.
+
+Section generators serialize the whole JournalContext into every prompt. Large
+commits and long chat sessions used to produce oversized requests that were
+slow, failed with 400s and were retried. This module sits between the
+``collect_*`` functions and the section generators and trims the context to a
+token budget.
+
+Packing Strategy:
+- Tokens are estimated from the serialized JSON size (about 4 characters per
+  token), which is close enough for budgeting and needs no tokenizer.
+- Commit metadata, diff summary, changed files and file stats are always kept
+  and are charged against the budget first.
+- The remaining budget is filled by priority: diffs of source files, then the
+  most recent chat messages, then recent journal context, then the remaining
+  (tests, docs, config) diffs.
+- Items are kept or dropped whole; dropped diffs are replaced by a short
+  placeholder so the AI still knows the file changed.
+- What was dropped is recorded on the current span and logged.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from opentelemetry import trace
+
+from .context_types import JournalContext
+from .git_utils import classify_file_type
+from .telemetry import trace_mcp_operation
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio for English text and code
+CHARS_PER_TOKEN = 4
+
+# Default budget for the serialized JournalContext, in estimated tokens
+DEFAULT_CONTEXT_TOKEN_BUDGET = 30000
+
+# Placeholder kept in file_diffs for a diff that did not fit the budget
+DROPPED_DIFF_PLACEHOLDER = "[diff omitted to fit the context budget]"
+
+
+@dataclass
+class PackingReport:
+    """What pack_journal_context kept and dropped."""
+    budget_tokens: int
+    tokens_before: int = 0
+    tokens_after: int = 0
+    dropped_diffs: List[str] = field(default_factory=list)
+    dropped_chat_messages: int = 0
+    dropped_journal_items: int = 0
+
+    @property
+    def trimmed(self) -> bool:
+        return bool(self.dropped_diffs or self.dropped_chat_messages or self.dropped_journal_items)
+
+
+def estimate_tokens(value: Any) -> int:
+    """
+    Estimate the token count of a value as it will appear in a prompt.
+
+    Strings are measured directly; anything else is measured as JSON.
+    """
+    if value is None:
+        return 0
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _select_recent(items: List[Any], budget: int) -> Tuple[List[Any], int]:
+    """
+    Keep the newest items (end of the list) whose combined estimate fits the budget.
+
+    Returns:
+        Tuple of (kept items in original order, tokens used)
+    """
+    kept = []
+    used = 0
+    for item in reversed(items):
+        cost = estimate_tokens(item)
+        if used + cost > budget:
+            break
+        kept.append(item)
+        used += cost
+    kept.reverse()
+    return kept, used
+
+
+@trace_mcp_operation("context.pack", attributes={"operation_type": "context_packing"})
+def pack_journal_context(
+    journal_context: JournalContext,
+    max_tokens: int = DEFAULT_CONTEXT_TOKEN_BUDGET
+) -> Tuple[JournalContext, PackingReport]:
+    """
+    Trim a JournalContext to an estimated token budget.
+
+    The input is not modified; trimmed components are shallow copies.
+
+    Args:
+        journal_context: Context produced by the collect_* functions
+        max_tokens: Budget for the whole serialized context, in estimated tokens
+
+    Returns:
+        Tuple of (packed JournalContext, PackingReport)
+    """
+    report = PackingReport(budget_tokens=max_tokens)
+    report.tokens_before = estimate_tokens(journal_context)
+
+    if report.tokens_before <= max_tokens:
+        report.tokens_after = report.tokens_before
+        _record_packing(report)
+        return journal_context, report
+
+    git = dict(journal_context.get('git') or {})
+    chat = journal_context.get('chat')
+    journal = journal_context.get('journal')
+    file_diffs: Dict[str, str] = git.pop('file_diffs', None) or {}
+
+    # Always-kept git fields (and the placeholders for every diff) come off the top
+    remaining = max_tokens - estimate_tokens(git) - estimate_tokens(
+        {path: DROPPED_DIFF_PLACEHOLDER for path in file_diffs}
+    )
+
+    # Priority 1: source diffs. Special keys (__truncated__, __error__) are kept with them.
+    source_paths = [p for p in file_diffs if p.startswith('__') or classify_file_type(p) == 'source']
+    other_paths = [p for p in file_diffs if p not in source_paths]
+    kept_diffs: Dict[str, str] = {}
+    for path in source_paths:
+        cost = estimate_tokens(file_diffs[path]) - estimate_tokens(DROPPED_DIFF_PLACEHOLDER)
+        if cost <= remaining:
+            kept_diffs[path] = file_diffs[path]
+            remaining -= cost
+
+    # Priority 2: most recent chat messages
+    packed_chat = chat
+    if chat and chat.get('messages'):
+        messages = chat['messages']
+        kept_messages, used = _select_recent(messages, max(remaining, 0))
+        remaining -= used
+        report.dropped_chat_messages = len(messages) - len(kept_messages)
+        if report.dropped_chat_messages:
+            packed_chat = {**chat, 'messages': kept_messages}
+
+    # Priority 3: recent journal context (newest additional context first, then the latest entry)
+    packed_journal = journal
+    if journal:
+        additional = journal.get('additional_context') or []
+        kept_additional, used = _select_recent(additional, max(remaining, 0))
+        remaining -= used
+        latest_entry = journal.get('latest_entry')
+        latest_cost = estimate_tokens(latest_entry)
+        keep_latest = latest_entry is not None and latest_cost <= remaining
+        if keep_latest:
+            remaining -= latest_cost
+        report.dropped_journal_items = (len(additional) - len(kept_additional)) + (
+            1 if latest_entry is not None and not keep_latest else 0
+        )
+        if report.dropped_journal_items:
+            packed_journal = {
+                **journal,
+                'latest_entry': latest_entry if keep_latest else None,
+                'additional_context': kept_additional
+            }
+
+    # Priority 4: remaining diffs (tests, docs, config)
+    for path in other_paths:
+        cost = estimate_tokens(file_diffs[path]) - estimate_tokens(DROPPED_DIFF_PLACEHOLDER)
+        if cost <= remaining:
+            kept_diffs[path] = file_diffs[path]
+            remaining -= cost
+
+    # Preserve the original diff order; dropped diffs become placeholders
+    git['file_diffs'] = {path: kept_diffs.get(path, DROPPED_DIFF_PLACEHOLDER) for path in file_diffs}
+    report.dropped_diffs = [path for path in file_diffs if path not in kept_diffs]
+
+    packed = JournalContext(chat=packed_chat, git=git, journal=packed_journal)
+    report.tokens_after = estimate_tokens(packed)
+    _record_packing(report)
+    return packed, report
+
+
+def _record_packing(report: PackingReport) -> None:
+    """Record the packing outcome on the current span and in the log."""
+    span = trace.get_current_span()
+    if span:
+        span.set_attribute("context.budget_tokens", report.budget_tokens)
+        span.set_attribute("context.tokens_before", report.tokens_before)
+        span.set_attribute("context.tokens_after", report.tokens_after)
+        span.set_attribute("context.trimmed", report.trimmed)
+        span.set_attribute("context.dropped_diff_count", len(report.dropped_diffs))
+        span.set_attribute("context.dropped_chat_messages", report.dropped_chat_messages)
+        span.set_attribute("context.dropped_journal_items", report.dropped_journal_items)
+
+    if report.trimmed:
+        logger.info(
+            f"Packed journal context from ~{report.tokens_before} to ~{report.tokens_after} tokens "
+            f"(budget {report.budget_tokens}): dropped {len(report.dropped_diffs)} diffs, "
+            f"{report.dropped_chat_messages} chat messages, {report.dropped_journal_items} journal items"
+        )
+
@@ -7,8 +7,10 @@ Cursor's SQLite workspace databases across different platforms.
 
 import os
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 
 # Optional OpenTelemetry import with graceful degradation
 try:
@@ -41,6 +43,9 @@ from .exceptions import (
 )
 from .workspace_detection import WorkspaceDetectionError, detect_workspace_for_repo
 from .query_executor import execute_cursor_query
+from .connection_pool import cursor_connection_pool
+from .session_cache import ComposerSessionCache, get_session_cache_for_repo
+from .workspace_index import WorkspaceIndex, get_workspace_index_for_repo
 from .message_extraction import (
     extract_prompts_data,
     extract_generations_data
@@ -129,6 +134,54 @@ def reset_circuit_breaker():
     global _circuit_breaker
     _circuit_breaker.reset()
 
+
+# Extraction window shared by a batch of queued commits (see shared_chat_extraction)
+_shared_chat_window: ContextVar[Optional[Dict[str, Any]]] = ContextVar('_shared_chat_window', default=None)
+
+
+@contextmanager
+def shared_chat_extraction(start_timestamp_ms: int, end_timestamp_ms: int) -> Iterator[None]:
+    """
+    Share one Composer extraction pass between commits processed together.
+    
+    Inside the block, the first query_cursor_chat_database() call per workspace
+    database extracts every session overlapping [start, end]; later calls whose
+    commit window lies within it re-filter those sessions instead of querying
+    the databases again. Calls outside the window query as usual.
+    """
+    token = _shared_chat_window.set({
+        'start': start_timestamp_ms,
+        'end': end_timestamp_ms,
+        'sessions': {}
+    })
+    try:
+        yield
+    finally:
+        _shared_chat_window.reset(token)
+
+
+def _get_chat_history(provider: ComposerChatProvider, workspace_db_path: str,
+                      start_timestamp_ms: int, end_timestamp_ms: int) -> List[Dict[str, Any]]:
+    """Chat history for one database, served from the shared batch extraction when possible."""
+    shared = _shared_chat_window.get()
+    if shared is None or start_timestamp_ms < shared['start'] or end_timestamp_ms > shared['end']:
+        return provider.getChatHistoryForCommit(start_timestamp_ms, end_timestamp_ms)
+    
+    sessions = shared['sessions'].get(workspace_db_path)
+    if sessions is None:
+        sessions = provider.getChatSessionsForWindow(shared['start'], shared['end']) or []
+        shared['sessions'][workspace_db_path] = sessions
+    
+    # Same overlap rule and ordering as getChatHistoryForCommit; copies because callers annotate messages
+    messages = [
+        dict(message)
+        for session in sessions
+        if session['lastUpdatedAt'] > start_timestamp_ms and session['createdAt'] < end_timestamp_ms
+        for message in session['messages']
+    ]
+    messages.sort(key=lambda msg: (msg['timestamp'], msg['composerId']))
+    return messages
+
 @trace_mcp_operation("cursor_db.query_composer")
 def query_cursor_chat_database(commit=None) -> Dict[str, Any]:
     """
@@ -244,7 +297,8 @@ def query_cursor_chat_database(commit=None) -> Dict[str, Any]:
             try:
                 # Use current working directory as repo path
                 repo_path = os.getcwd()
-                workspace_match = detect_workspace_for_repo(repo_path)
+                workspace_index = get_workspace_index_for_repo(repo_path)
+                workspace_match = detect_workspace_for_repo(repo_path, workspace_index=workspace_index)
                 
                 # Get the workspace root directory from the detected match
                 workspace_root = workspace_match.workspace_folder
@@ -252,7 +306,9 @@ def query_cursor_chat_database(commit=None) -> Dict[str, Any]:
                     workspace_root = workspace_root[7:]
                 
                 # Get workspace and global databases using the working method
-                workspace_db_path, global_db_path = find_workspace_composer_databases(repo_path)
+                workspace_db_path, global_db_path = find_workspace_composer_databases(
+                    repo_path, workspace_index=workspace_index
+                )
                 workspace_db_paths = [workspace_db_path] if workspace_db_path else []
                 
                 # Try to discover additional databases for multi-database support
@@ -408,25 +464,41 @@ def query_cursor_chat_database(commit=None) -> Dict[str, Any]:
             databases_failed = 0
             failure_reasons = []
             
-            # Query each workspace database with the same global database
-            for workspace_db_path in workspace_db_paths:
-                try:
-                    provider = ComposerChatProvider(workspace_db_path, global_db_path)
-                    messages = provider.getChatHistoryForCommit(start_timestamp_ms, end_timestamp_ms)
+            # Sessions unchanged since the previous commit are served from the journal's cache
+            session_cache = get_session_cache_for_repo(os.getcwd())
+            
+            try:
+                # Reuse read-only connections across all providers; they share the global database
+                with cursor_connection_pool():
+                    # Query each workspace database with the same global database
+                    for workspace_db_path in workspace_db_paths:
+                        try:
+                            provider = ComposerChatProvider(
+                                workspace_db_path,
+                                global_db_path,
+                                batch_bubbles=True,
+                                session_cache=session_cache
+                            )
+                            messages = _get_chat_history(
+                                provider, workspace_db_path, start_timestamp_ms, end_timestamp_ms
+                            )
                     
-                    # Add message index to preserve within-session order
-                    # (ComposerChatProvider already sorts messages properly, but when we combine
-                    # messages from multiple databases, we need to preserve that order)
-                    for i, message in enumerate(messages):
-                        message['_message_index'] = i
+                            # Add message index to preserve within-session order
+                            # (ComposerChatProvider already sorts messages properly, but when we combine
+                            # messages from multiple databases, we need to preserve that order)
+                            for i, message in enumerate(messages):
+                                message['_message_index'] = i
                     
-                    all_messages.extend(messages)
-                    databases_queried += 1
-                except Exception as provider_error:
-                    databases_failed += 1
-                    failure_reasons.append(f"Database {workspace_db_path}: {str(provider_error)}")
-                    logger.warning(f"Failed to query database {workspace_db_path}: {provider_error}")
-                    continue  # Skip this database, continue with others
+                            all_messages.extend(messages)
+                            databases_queried += 1
+                        except Exception as provider_error:
+                            databases_failed += 1
+                            failure_reasons.append(f"Database {workspace_db_path}: {str(provider_error)}")
+                            logger.warning(f"Failed to query database {workspace_db_path}: {provider_error}")
+                            continue  # Skip this database, continue with others
+            finally:
+                if session_cache is not None:
+                    session_cache.close()
             
             # Sort all messages using the same multi-criteria logic as ComposerChatProvider:
             # 1. timestamp (session chronological order)
@@ -662,10 +734,14 @@ __all__ = [
     'get_cursor_workspace_paths',
     'validate_workspace_path',
     'execute_cursor_query',
+    'cursor_connection_pool',
+    'ComposerSessionCache',
+    'WorkspaceIndex',
     'extract_prompts_data',
     'extract_generations_data',
     # 'reconstruct_chat_history' - removed, Composer provides chronological data
     'query_cursor_chat_database',
+    'shared_chat_extraction',
     'get_primary_workspace_path',
     'discover_all_cursor_databases',
     'get_recent_databases',
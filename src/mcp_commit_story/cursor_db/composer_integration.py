@@ -13,6 +13,7 @@ import git
 
 from ..git_utils import get_repo, get_current_commit
 from .workspace_detection import detect_workspace_for_repo, WorkspaceMatch
+from .workspace_index import WorkspaceIndex
 from ..commit_time_window import get_commit_time_window as _get_commit_time_window
 
 
@@ -98,7 +99,8 @@ def get_commit_time_window(commit_or_hash, repo_path: Optional[str] = None) -> T
         return (start_time_ms, current_time_ms)
 
 
-def find_workspace_composer_databases(repo_path: Optional[str] = None) -> Tuple[str, str]:
+def find_workspace_composer_databases(repo_path: Optional[str] = None,
+                                      workspace_index: Optional[WorkspaceIndex] = None) -> Tuple[str, str]:
     """
     Find Composer workspace and global database paths for a repository.
     
@@ -107,6 +109,7 @@ def find_workspace_composer_databases(repo_path: Optional[str] = None) -> Tuple[
     
     Args:
         repo_path: Optional path to repository. Defaults to current directory.
+        workspace_index: Optional persistent workspace-detection index
         
     Returns:
         Tuple[str, str]: (workspace_db_path, global_db_path)
@@ -119,7 +122,7 @@ def find_workspace_composer_databases(repo_path: Optional[str] = None) -> Tuple[
             repo_path = os.getcwd()
             
         # Use workspace detection to find the matching workspace
-        workspace_match: WorkspaceMatch = detect_workspace_for_repo(repo_path)
+        workspace_match: WorkspaceMatch = detect_workspace_for_repo(repo_path, workspace_index=workspace_index)
         
         # Use the actual workspace database path found by detection
         # workspace_match.path already contains the full correct path
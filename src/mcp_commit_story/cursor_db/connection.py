@@ -13,6 +13,7 @@ from contextlib import contextmanager
 import time
 
 from .platform import get_cursor_workspace_paths
+from .connection_pool import get_active_pool
 from .exceptions import (
     CursorDatabaseNotFoundError,
     CursorDatabaseAccessError,
@@ -253,6 +254,9 @@ def query_cursor_chat_database(database_path: str, sql: str, parameters: Optiona
     """
     Execute a SQL query against a Cursor chat database.
     
+    Inside a cursor_connection_pool() scope the query runs on a pooled read-only
+    connection, and file validation is skipped once that connection is open.
+    
     Args:
         database_path: Path to the SQLite database file
         sql: SQL query to execute (use ? placeholders for parameters)
@@ -273,11 +277,14 @@ def query_cursor_chat_database(database_path: str, sql: str, parameters: Optiona
     logger.debug(f"SQL: {sql}")
     logger.debug(f"Parameters: {parameters}")
     
-    # Validate database file first
-    _validate_database_file(Path(database_path))
+    pool = get_active_pool()
+    
+    # Validate database file first (pooled connections were validated when opened)
+    if pool is None or not pool.is_cached(database_path):
+        _validate_database_file(Path(database_path))
     
     try:
-        with sqlite3.connect(database_path) as conn:
+        with _open_query_connection(database_path, pool) as conn:
             cursor = conn.cursor()
             
             try:
@@ -402,6 +409,23 @@ def query_cursor_chat_database(database_path: str, sql: str, parameters: Optiona
         raise error from e
 
 
+@contextmanager
+def _open_query_connection(database_path: str, pool):
+    """
+    Yield a connection for query_cursor_chat_database.
+    
+    Uses the pooled read-only connection when a pool is active, otherwise a
+    fresh per-query connection.
+    """
+    if pool is None:
+        with sqlite3.connect(database_path) as conn:
+            yield conn
+        return
+    
+    with pool.connection(database_path) as conn:
+        yield conn
+
+
 @contextmanager
 def cursor_chat_database_context(user_override_path: Optional[Union[str, Path]] = None):
     """
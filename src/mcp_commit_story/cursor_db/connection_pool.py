@@ -0,0 +1,195 @@
+"""
+Read-only SQLite connection pool for cursor database operations.
+
+Cursor's global state.vscdb is large and gets queried hundreds of times during a
+single chat extraction. Opening a fresh connection per query means paying the
+connect and schema-load cost every time. This module keeps one read-only
+connection per database path for the duration of a pool scope.
+
+Design Choices:
+- Pooling is scoped: connections are only reused inside ``cursor_connection_pool()``.
+  Outside a scope, callers fall back to their own per-query connections.
+- Connections open read-only (``file:...?mode=ro`` URI plus ``PRAGMA query_only``)
+  so the pool can never modify Cursor's databases.
+- A pooled connection is invalidated when the database file's inode or mtime
+  changes (Cursor rewrote or replaced the file).
+- Scopes nest; the outermost scope owns the pool and closes every connection on exit.
+- Thread-safe: each pooled connection is guarded by its own lock.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Same fixed timeout as execute_cursor_query
+POOL_CONNECTION_TIMEOUT_SECONDS = 5.0
+
+
+class _PooledConnection:
+    """A pooled read-only connection and the file signature it was opened against."""
+
+    def __init__(self, connection: sqlite3.Connection, signature: Tuple[int, int]):
+        self.connection = connection
+        self.signature = signature
+        self.lock = threading.Lock()
+
+
+def _file_signature(db_path: str) -> Optional[Tuple[int, int]]:
+    """Return (inode, mtime_ns) for a database file, or None if it cannot be stat'ed."""
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns)
+
+
+def _open_read_only(db_path: str) -> sqlite3.Connection:
+    """
+    Open a read-only connection to a SQLite database.
+
+    Raises:
+        sqlite3.OperationalError: When the file cannot be opened (same error
+            messages as a regular sqlite3.connect, so callers' error
+            classification keeps working)
+    """
+    uri = f"{Path(db_path).absolute().as_uri()}?mode=ro"
+    connection = sqlite3.connect(
+        uri,
+        uri=True,
+        timeout=POOL_CONNECTION_TIMEOUT_SECONDS,
+        check_same_thread=False
+    )
+    connection.execute("PRAGMA query_only = ON")
+    return connection
+
+
+class CursorConnectionPool:
+    """
+    Pool of read-only SQLite connections keyed by database path.
+
+    Use through ``cursor_connection_pool()`` rather than instantiating directly.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _PooledConnection] = {}
+        self._lock = threading.Lock()
+
+    def _get_entry(self, db_path: str) -> _PooledConnection:
+        """Return a valid pooled connection for db_path, (re)opening it if needed."""
+        signature = _file_signature(db_path)
+
+        with self._lock:
+            entry = self._entries.get(db_path)
+            if entry is not None and entry.signature == signature:
+                return entry
+
+            if entry is not None:
+                logger.debug(f"Database file changed, reopening pooled connection: {db_path}")
+                self._entries.pop(db_path)
+                _close_quietly(entry)
+
+            # Let sqlite3 raise its usual "unable to open database file" error
+            # for missing files so callers classify it as an access error
+            entry = _PooledConnection(_open_read_only(db_path), signature)
+            if signature is not None:
+                self._entries[db_path] = entry
+            return entry
+
+    def is_cached(self, db_path: str) -> bool:
+        """Check whether a still-valid connection for db_path is already pooled."""
+        with self._lock:
+            entry = self._entries.get(db_path)
+        return entry is not None and entry.signature == _file_signature(db_path)
+
+    @contextmanager
+    def connection(self, db_path: str) -> Iterator[sqlite3.Connection]:
+        """
+        Hold the pooled connection for db_path for the duration of the block.
+
+        Raises:
+            sqlite3.Error: Any SQLite error, unwrapped, for the caller to classify
+        """
+        entry = self._get_entry(db_path)
+        with entry.lock:
+            yield entry.connection
+
+    def execute(self, db_path: str, query: str, parameters: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        """
+        Execute a query on the pooled connection for db_path and fetch all rows.
+
+        Raises:
+            sqlite3.Error: Any SQLite error, unwrapped, for the caller to classify
+        """
+        with self.connection(db_path) as conn:
+            cursor = conn.execute(query, parameters)
+            try:
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            _close_quietly(entry)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _close_quietly(entry: _PooledConnection) -> None:
+    """Close a pooled connection, ignoring errors during cleanup."""
+    with entry.lock:
+        try:
+            entry.connection.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Error closing pooled connection: {e}")
+
+
+_active_pool: Optional[CursorConnectionPool] = None
+_active_depth = 0
+_scope_lock = threading.Lock()
+
+
+def get_active_pool() -> Optional[CursorConnectionPool]:
+    """Return the pool for the current scope, or None when pooling is inactive."""
+    return _active_pool
+
+
+@contextmanager
+def cursor_connection_pool() -> Iterator[CursorConnectionPool]:
+    """
+    Reuse read-only connections for all cursor_db queries inside this scope.
+
+    Nested scopes share the outermost pool. Connections are closed when the
+    outermost scope exits.
+
+    Example:
+        with cursor_connection_pool():
+            provider.getChatHistoryForCommit(start_ms, end_ms)
+    """
+    global _active_pool, _active_depth
+
+    with _scope_lock:
+        if _active_pool is None:
+            _active_pool = CursorConnectionPool()
+        _active_depth += 1
+        pool = _active_pool
+
+    try:
+        yield pool
+    finally:
+        with _scope_lock:
+            _active_depth -= 1
+            if _active_depth == 0:
+                _active_pool = None
+                pool.close()
@@ -27,6 +27,11 @@ Performance Thresholds:
 - extract_from_multiple_databases: 500ms (multi-database processing)
 - get_recent_databases: 10ms (file modification time checks)
 
+Parallel Extraction:
+extract_from_multiple_databases accepts a max_workers argument. With more than
+one worker, databases are extracted on a bounded thread pool (sqlite3 releases
+the GIL during I/O) while results keep the input ordering.
+
 Error Handling:
 Both functions use graceful error handling with skip-and-continue patterns.
 Individual database failures don't prevent processing of other databases.
@@ -58,14 +63,21 @@ This module is designed to be used alongside the existing cursor_db functions:
 import os
 import logging
 import time
-from typing import List, Dict, Any
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 
-from ..telemetry import trace_mcp_operation, PERFORMANCE_THRESHOLDS
+from opentelemetry import trace
+
+from ..telemetry import trace_mcp_operation, get_tracer, PERFORMANCE_THRESHOLDS
 from .message_extraction import extract_prompts_data, extract_generations_data
 
 logger = logging.getLogger(__name__)
 
+# Default worker count for extract_from_multiple_databases (1 = sequential)
+DEFAULT_EXTRACTION_WORKERS = 1
+
 
 def get_recent_databases(all_databases: List[str], current_time: float = None) -> List[str]:
     """
@@ -283,7 +295,10 @@ def discover_all_cursor_databases(workspace_path: str) -> List[str]:
 
 
 @trace_mcp_operation(operation_name="extract_from_multiple_databases")
-def extract_from_multiple_databases(database_paths: List[str]) -> List[Dict[str, Any]]:
+def extract_from_multiple_databases(
+    database_paths: List[str],
+    max_workers: int = DEFAULT_EXTRACTION_WORKERS
+) -> List[Dict[str, Any]]:
     """
     Extract prompts and generations from multiple Cursor databases.
     
@@ -293,7 +308,8 @@ def extract_from_multiple_databases(database_paths: List[str]) -> List[Dict[str,
     Does not attempt chronological merging or deduplication.
     
     Processing Strategy:
-    - Each database processed independently in sequence
+    - Each database processed independently, in sequence by default or on a
+      bounded thread pool when max_workers > 1
     - Both prompts and generations extracted per database
     - If either extraction fails, entire database is skipped
     - No cross-database validation or merging
@@ -307,12 +323,15 @@ def extract_from_multiple_databases(database_paths: List[str]) -> List[Dict[str,
     
     Performance:
     - Threshold: 500ms for typical multi-database workloads
-    - Sequential processing (no parallelization)
+    - Sequential by default; max_workers > 1 extracts databases concurrently
+      (worker count is capped at the number of databases)
     - Leverages existing optimized extraction functions
     
     Args:
         database_paths: List of absolute paths to state.vscdb files.
                        Typically from discover_all_cursor_databases().
+        max_workers: Number of databases to extract concurrently. Values
+                    below 2 keep sequential processing.
         
     Returns:
         List of dictionaries with structure:
@@ -328,6 +347,8 @@ def extract_from_multiple_databases(database_paths: List[str]) -> List[Dict[str,
     Telemetry:
         - Tracks extraction duration with 500ms threshold  
         - Records database_count, successful_count, failed_count attributes
+        - One child span per database (cursor_db.extract_database) with its
+          path, duration and success
         - Logs individual database failures but continues processing
         
     Examples:
@@ -352,6 +373,9 @@ def extract_from_multiple_databases(database_paths: List[str]) -> List[Dict[str,
         ...     total_prompts = sum(len(r['prompts']) for r in results)
         ...     print(f"Total prompts across all databases: {total_prompts}")
         
+        >>> # Extract many workspace databases concurrently
+        >>> results = extract_from_multiple_databases(databases, max_workers=4)
+        
         >>> # Empty input handling
         >>> results = extract_from_multiple_databases([])
         >>> assert results == []  # Returns empty list
@@ -368,18 +392,68 @@ def extract_from_multiple_databases(database_paths: List[str]) -> List[Dict[str,
     """
     start_time = time.time()
     results = []
-    successful_count = 0
-    failed_count = 0
     
     # Handle empty input
     if not database_paths:
         logger.debug("No database paths provided for extraction")
         return results
     
-    logger.info(f"Starting extraction from {len(database_paths)} databases")
+    worker_count = max(1, min(max_workers or 1, len(database_paths)))
+    logger.info(f"Starting extraction from {len(database_paths)} databases ({worker_count} workers)")
+    
+    if worker_count == 1:
+        extracted = [_extract_single_database(db_path) for db_path in database_paths]
+    else:
+        # Copy the caller's context per task so per-database spans nest under
+        # the current span in worker threads; map() keeps input ordering
+        contexts = [contextvars.copy_context() for _ in database_paths]
+        with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="cursor-db-extract") as executor:
+            extracted = list(executor.map(
+                lambda ctx, db_path: ctx.run(_extract_single_database, db_path),
+                contexts,
+                database_paths
+            ))
+    
+    results = [result for result in extracted if result is not None]
+    successful_count = len(results)
+    failed_count = len(database_paths) - successful_count
+    
+    span = trace.get_current_span()
+    if span:
+        span.set_attribute("database_count", len(database_paths))
+        span.set_attribute("successful_count", successful_count)
+        span.set_attribute("failed_count", failed_count)
+        span.set_attribute("worker_count", worker_count)
     
-    # Process each database independently
-    for db_path in database_paths:
+    # Record telemetry
+    duration_ms = (time.time() - start_time) * 1000
+    
+    # Log performance if it exceeds threshold
+    threshold_ms = PERFORMANCE_THRESHOLDS.get("extract_from_multiple_databases", 500)
+    if duration_ms > threshold_ms:
+        logger.warning(f"Multi-database extraction took {duration_ms:.1f}ms (threshold: {threshold_ms}ms)")
+    
+    logger.info(f"Extraction completed: {successful_count} successful, {failed_count} failed in {duration_ms:.1f}ms")
+    
+    return results
+
+
+def _extract_single_database(db_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract prompts and generations from one database inside its own timing span.
+    
+    Args:
+        db_path: Absolute path to a state.vscdb file
+        
+    Returns:
+        Result dictionary for extract_from_multiple_databases, or None if
+        extraction failed (the failure is logged, skip-and-continue)
+    """
+    tracer = get_tracer(__name__)
+    with tracer.start_as_current_span("cursor_db.extract_database") as span:
+        span.set_attribute("database_path", db_path)
+        start_time = time.time()
+        
         try:
             logger.debug(f"Extracting data from database: {db_path}")
             
@@ -387,32 +461,20 @@ def extract_from_multiple_databases(database_paths: List[str]) -> List[Dict[str,
             prompts = extract_prompts_data(db_path)
             generations = extract_generations_data(db_path)
             
-            # Create result entry
-            result = {
+            logger.debug(f"Successfully extracted {len(prompts)} prompts and {len(generations)} generations from {db_path}")
+            span.set_attribute("success", True)
+            
+            return {
                 "database_path": db_path,
                 "prompts": prompts,
                 "generations": generations
             }
             
-            results.append(result)
-            successful_count += 1
-            
-            logger.debug(f"Successfully extracted {len(prompts)} prompts and {len(generations)} generations from {db_path}")
-            
         except Exception as e:
-            failed_count += 1
             logger.warning(f"Failed to extract from database {db_path}: {e}")
-            # Continue with next database (skip-and-continue pattern)
-            continue
-    
-    # Record telemetry
-    duration_ms = (time.time() - start_time) * 1000
-    
-    # Log performance if it exceeds threshold
-    threshold_ms = PERFORMANCE_THRESHOLDS.get("extract_from_multiple_databases", 500)
-    if duration_ms > threshold_ms:
-        logger.warning(f"Multi-database extraction took {duration_ms:.1f}ms (threshold: {threshold_ms}ms)")
-    
-    logger.info(f"Extraction completed: {successful_count} successful, {failed_count} failed in {duration_ms:.1f}ms")
-    
-    return results 
\ No newline at end of file
+            span.set_attribute("success", False)
+            span.set_attribute("error.type", type(e).__name__)
+            return None
+            
+        finally:
+            span.set_attribute("duration_ms", (time.time() - start_time) * 1000)
@@ -10,6 +10,9 @@ Telemetry Instrumentation:
 - Categorizes errors (database access vs SQL syntax issues)
 - 50ms threshold chosen as baseline for simple SQLite SELECT operations
 - No sampling applied - all operations tracked for local database access patterns
+
+Inside a cursor_connection_pool() scope, queries reuse pooled read-only
+connections instead of opening a new connection per query.
 """
 
 import sqlite3
@@ -25,6 +28,7 @@ from .exceptions import (
     CursorDatabaseAccessError,
     CursorDatabaseNotFoundError
 )
+from .connection_pool import get_active_pool
 from ..telemetry import trace_mcp_operation, PERFORMANCE_THRESHOLDS
 
 
@@ -69,7 +73,8 @@ def execute_cursor_query(
     Design Choices (as approved):
         - Fixed 5-second timeout (not configurable)
         - Returns List[Tuple[Any, ...]] - SQLite's native format
-        - No connection pooling - one connection per query with proper cleanup
+        - One connection per query with proper cleanup, unless called inside a
+          cursor_connection_pool() scope, which reuses read-only connections
         - Comprehensive error wrapping in custom exceptions
     """
     if parameters is None:
@@ -84,12 +89,17 @@ def execute_cursor_query(
         span.set_attribute("database_path", db_path)
         span.set_attribute("query_duration_ms", 0)  # Will be updated below
         
-        # Use context manager for automatic connection cleanup
-        # Fixed 5-second timeout as per approved design
-        with sqlite3.connect(db_path, timeout=5.0) as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, parameters)
-            result = cursor.fetchall()
+        pool = get_active_pool()
+        span.set_attribute("pooled_connection", pool is not None)
+        if pool is not None:
+            result = pool.execute(db_path, query, parameters)
+        else:
+            # Use context manager for automatic connection cleanup
+            # Fixed 5-second timeout as per approved design
+            with sqlite3.connect(db_path, timeout=5.0) as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, parameters)
+                result = cursor.fetchall()
             
         # Calculate duration and set metrics
         duration_ms = (time.time() - start_time) * 1000
@@ -0,0 +1,138 @@
+"""
+Incremental on-disk cache of extracted Composer session messages.
+
+Back-to-back commits in one long Composer session used to re-extract the same
+thousands of messages every time. This cache stores the formatted messages of
+each session together with the session's ``lastUpdatedAt`` value from
+``composer.composerData``. A session is only re-extracted when that timestamp
+moves.
+
+Storage:
+    A sidecar SQLite file under the journal directory
+    (``<journal>/.cache/composer_sessions.db``). The ``.cache`` directory gets
+    its own ``.gitignore`` so cache files are never committed with the journal.
+
+Design Choices:
+- The cache is a journal_cache.SQLiteSidecar; when it cannot be used, sessions
+  are extracted from Cursor's databases as if nothing were cached.
+- Sessions without a ``lastUpdatedAt`` value are never cached.
+"""
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ..journal_cache import SQLiteSidecar, get_journal_cache_dir, resolve_journal_path
+
+logger = logging.getLogger(__name__)
+
+SESSION_CACHE_FILENAME = "composer_sessions.db"
+
+# Bump when the stored message format changes to invalidate old entries
+SESSION_CACHE_SCHEMA_VERSION = 1
+
+
+class ComposerSessionCache(SQLiteSidecar):
+    """
+    Cache of extracted Composer session messages keyed by composerId.
+
+    Entries are valid only for the exact ``lastUpdatedAt`` they were stored with.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS composer_sessions ("
+        "composer_id TEXT PRIMARY KEY, "
+        "last_updated_at INTEGER NOT NULL, "
+        "schema_version INTEGER NOT NULL, "
+        "messages TEXT NOT NULL)",
+    )
+    DESCRIPTION = "Composer session cache"
+
+    @property
+    def cache_path(self) -> Path:
+        return self.db_path
+
+    @classmethod
+    def for_journal(cls, journal_path: Union[str, Path]) -> 'ComposerSessionCache':
+        """Create a cache stored under the journal's cache directory."""
+        return cls(get_journal_cache_dir(journal_path) / SESSION_CACHE_FILENAME)
+
+    def get(self, composer_id: str, last_updated_at: Optional[int]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return cached messages for a session if its lastUpdatedAt is unchanged.
+
+        Args:
+            composer_id: Session identifier
+            last_updated_at: Current lastUpdatedAt from composer.composerData
+
+        Returns:
+            List of formatted message dictionaries, or None on a cache miss
+        """
+        if last_updated_at is None:
+            return None
+
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return None
+            try:
+                row = connection.execute(
+                    "SELECT messages FROM composer_sessions "
+                    "WHERE composer_id = ? AND last_updated_at = ? AND schema_version = ?",
+                    (composer_id, last_updated_at, SESSION_CACHE_SCHEMA_VERSION)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.debug(f"Composer session cache read failed for {composer_id}: {e}")
+                return None
+
+        if row is None:
+            return None
+
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+
+    def put(self, composer_id: str, last_updated_at: Optional[int], messages: List[Dict[str, Any]]) -> None:
+        """
+        Store the extracted messages for a session.
+
+        Args:
+            composer_id: Session identifier
+            last_updated_at: lastUpdatedAt the messages were extracted at
+            messages: Formatted message dictionaries for the session
+        """
+        if last_updated_at is None:
+            return
+
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO composer_sessions "
+                    "(composer_id, last_updated_at, schema_version, messages) VALUES (?, ?, ?, ?)",
+                    (composer_id, last_updated_at, SESSION_CACHE_SCHEMA_VERSION, json.dumps(messages))
+                )
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"Composer session cache write failed for {composer_id}: {e}")
+
+
+def get_session_cache_for_repo(repo_path: str) -> Optional[ComposerSessionCache]:
+    """
+    Build the Composer session cache for a repository from its journal config.
+
+    Args:
+        repo_path: Repository root; relative journal paths are resolved against it
+
+    Returns:
+        ComposerSessionCache, or None when the journal path cannot be determined
+    """
+    journal_path = resolve_journal_path(repo_path)
+    if journal_path is None:
+        return None
+    return ComposerSessionCache.for_journal(journal_path)
@@ -19,7 +19,7 @@ import time
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
@@ -28,6 +28,9 @@ from .exceptions import CursorDatabaseNotFoundError
 from .platform import get_cursor_workspace_paths
 from ..telemetry import trace_mcp_operation, get_mcp_metrics, PERFORMANCE_THRESHOLDS
 
+if TYPE_CHECKING:
+    from .workspace_index import WorkspaceIndex
+
 logger = logging.getLogger(__name__)
 
 # Configuration constants
@@ -58,7 +61,8 @@ class WorkspaceDetectionError(Exception):
 
 
 @trace_mcp_operation("cursor_db.detect_workspace_for_repo")
-def detect_workspace_for_repo(repo_path: Union[str, Path]) -> WorkspaceMatch:
+def detect_workspace_for_repo(repo_path: Union[str, Path],
+                              workspace_index: Optional['WorkspaceIndex'] = None) -> WorkspaceMatch:
     """
     Detect the correct Cursor workspace database for a git repository.
     
@@ -70,6 +74,8 @@ def detect_workspace_for_repo(repo_path: Union[str, Path]) -> WorkspaceMatch:
     
     Args:
         repo_path: Path to the git repository
+        workspace_index: Optional persistent index. A still-valid indexed match
+            skips the workspace scan; confident scan results are recorded in it.
         
     Returns:
         WorkspaceMatch object containing the detected workspace info
@@ -85,6 +91,7 @@ def detect_workspace_for_repo(repo_path: Union[str, Path]) -> WorkspaceMatch:
         - match_type: Type of match found
         - fallback_used: Whether fallback strategy was used
         - selected_workspace_path: Final selected workspace path
+        - workspace_index.hit: Whether the match came from the workspace index
     """
     span = trace.get_current_span()
     start_time = time.time()
@@ -111,6 +118,21 @@ def detect_workspace_for_repo(repo_path: Union[str, Path]) -> WorkspaceMatch:
         _record_workspace_detection_metrics(metrics, start_time, detection_strategy, success)
         raise WorkspaceDetectionError(error_msg, repo_path=str(repo_path))
     
+    if workspace_index is not None:
+        indexed_match = workspace_index.lookup(repo_path)
+        span.set_attribute("workspace_index.hit", indexed_match is not None)
+        if indexed_match is not None:
+            detection_strategy = "workspace_index"
+            success = True
+            span.set_attribute("detection_strategy", detection_strategy)
+            span.set_attribute("match_confidence", indexed_match.confidence)
+            span.set_attribute("match_type", indexed_match.match_type)
+            span.set_attribute("selected_workspace_path", str(indexed_match.path))
+            logger.debug(f"Using indexed workspace: {indexed_match.path}")
+            
+            _record_workspace_detection_metrics(metrics, start_time, detection_strategy, success)
+            return indexed_match
+    
     try:
         # Scan workspace directories for potential matches
         logger.info(f"Scanning workspaces for repository: {repo_path}")
@@ -165,6 +187,9 @@ def detect_workspace_for_repo(repo_path: Union[str, Path]) -> WorkspaceMatch:
             span.set_attribute("selected_workspace_path", str(best_match.path))
             logger.info(f"Found good workspace match: {best_match.path} (confidence: {best_match.confidence:.2f})")
             
+            if workspace_index is not None:
+                workspace_index.record(repo_path, best_match)
+            
             # Record successful metrics
             _record_workspace_detection_metrics(metrics, start_time, detection_strategy, success)
             return best_match
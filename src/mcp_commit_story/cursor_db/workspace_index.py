@@ -0,0 +1,190 @@
+"""
+Persistent workspace-detection index for Cursor chat databases.
+
+Workspace detection scans every hash directory under ``workspaceStorage``,
+parses each ``workspace.json`` and shells out to ``git remote -v``. With
+hundreds of workspace directories this costs hundreds of milliseconds per git
+hook. This index remembers which workspace database was detected for a
+repository so repeated commits can skip the scan entirely.
+
+Storage:
+    A JSON file under the journal cache directory
+    (``<journal>/.cache/workspace_index.json``), keyed by the repository's
+    resolved path.
+
+Invalidation:
+    An entry is only reused while both of these hold:
+    - The ``workspaceStorage`` directory mtime is unchanged (Cursor adds or
+      removes a hash directory whenever a workspace is created or deleted)
+    - The selected ``state.vscdb`` still exists
+
+Design Choices:
+- Only confident matches are indexed. The "most recent workspace" fallback
+  depends on database mtimes and is recomputed on every call.
+- The index file is read lazily and written with journal_cache.replace_cache_file().
+  An unreadable or unwritable index only means the next hook scans again.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .workspace_detection import WorkspaceMatch
+from ..journal_cache import ensure_cache_dir, get_journal_cache_dir, replace_cache_file, resolve_journal_path
+
+logger = logging.getLogger(__name__)
+
+WORKSPACE_INDEX_FILENAME = "workspace_index.json"
+
+# Bump when the stored entry format changes to invalidate old indexes
+WORKSPACE_INDEX_SCHEMA_VERSION = 1
+
+
+def _index_key(repo_path: Union[str, Path]) -> str:
+    """Return the index key for a repository path."""
+    return os.path.realpath(str(repo_path))
+
+
+def _directory_mtime_ns(path: Union[str, Path]) -> Optional[int]:
+    """Return a directory's mtime in nanoseconds, or None if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class WorkspaceIndex:
+    """
+    On-disk mapping of repository path to detected workspace database.
+    """
+
+    def __init__(self, index_path: Union[str, Path]):
+        """
+        Args:
+            index_path: Path of the JSON index file, created on first write.
+                Its directory is treated as a dedicated cache directory.
+        """
+        self.index_path = Path(index_path)
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_journal(cls, journal_path: Union[str, Path]) -> 'WorkspaceIndex':
+        """Create an index stored under the journal's cache directory."""
+        return cls(get_journal_cache_dir(journal_path) / WORKSPACE_INDEX_FILENAME)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the index file on first use; missing or unreadable files load as empty."""
+        if self._entries is not None:
+            return self._entries
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("schema_version") == WORKSPACE_INDEX_SCHEMA_VERSION:
+                entries = dict(data.get("entries", {}))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable workspace index {self.index_path}: {e}")
+
+        self._entries = entries
+        return entries
+
+    def lookup(self, repo_path: Union[str, Path]) -> Optional[WorkspaceMatch]:
+        """
+        Return the indexed workspace match for a repository if it is still valid.
+
+        Args:
+            repo_path: Path to the git repository
+
+        Returns:
+            WorkspaceMatch from the index, or None on a miss or stale entry
+        """
+        with self._lock:
+            entry = self._load().get(_index_key(repo_path))
+
+        if not entry:
+            return None
+
+        try:
+            db_path = Path(entry["db_path"])
+            storage_mtime_ns = entry["storage_mtime_ns"]
+            storage_path = entry["storage_path"]
+        except (KeyError, TypeError):
+            return None
+
+        if _directory_mtime_ns(storage_path) != storage_mtime_ns:
+            logger.debug(f"Workspace index entry stale (workspaceStorage changed): {repo_path}")
+            return None
+        if not db_path.exists():
+            logger.debug(f"Workspace index entry stale (database missing): {db_path}")
+            return None
+
+        return WorkspaceMatch(
+            path=db_path,
+            confidence=entry.get("confidence", 0.0),
+            match_type=entry.get("match_type", ""),
+            workspace_folder=entry.get("workspace_folder", ""),
+            git_remote=entry.get("git_remote")
+        )
+
+    def record(self, repo_path: Union[str, Path], match: WorkspaceMatch) -> None:
+        """
+        Store the detected workspace for a repository.
+
+        The workspaceStorage directory is derived from the match path
+        (``workspaceStorage/<hash>/state.vscdb``).
+
+        Args:
+            repo_path: Path to the git repository
+            match: Workspace match produced by a full scan
+        """
+        storage_path = Path(match.path).parent.parent
+        storage_mtime_ns = _directory_mtime_ns(storage_path)
+        if storage_mtime_ns is None:
+            return
+
+        with self._lock:
+            entries = self._load()
+            entries[_index_key(repo_path)] = {
+                "db_path": str(match.path),
+                "storage_path": str(storage_path),
+                "storage_mtime_ns": storage_mtime_ns,
+                "confidence": match.confidence,
+                "match_type": match.match_type,
+                "workspace_folder": match.workspace_folder,
+                "git_remote": match.git_remote
+            }
+            self._write(entries)
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically replace the index file; failures are logged and ignored."""
+        try:
+            ensure_cache_dir(self.index_path.parent)
+            replace_cache_file(
+                self.index_path,
+                json.dumps({"schema_version": WORKSPACE_INDEX_SCHEMA_VERSION, "entries": entries})
+            )
+        except OSError as e:
+            logger.debug(f"Workspace index write failed ({self.index_path}): {e}")
+
+
+def get_workspace_index_for_repo(repo_path: str) -> Optional[WorkspaceIndex]:
+    """
+    Build the workspace-detection index for a repository from its journal config.
+
+    Args:
+        repo_path: Repository root; relative journal paths are resolved against it
+
+    Returns:
+        WorkspaceIndex, or None when the journal path cannot be determined
+    """
+    journal_path = resolve_journal_path(repo_path)
+    if journal_path is None:
+        return None
+    return WorkspaceIndex.for_journal(journal_path)
@@ -9,6 +9,7 @@ Key features:
 - Consolidated standalone and MCP-based generation in a single module  
 - Unified reflection extraction using markdown header parsing
 - File-creation-based trigger system for automated summary generation
+- Optional incremental generation that only sends new entries to the AI
 - Comprehensive telemetry and error handling
 """
 
@@ -16,6 +17,8 @@ import os
 import re
 import logging
 import json
+import hashlib
+from dataclasses import replace
 from datetime import datetime, date, timedelta
 from typing import Optional, Dict, List
 from pathlib import Path
@@ -420,7 +423,9 @@ from mcp_commit_story.telemetry import trace_mcp_operation, get_mcp_metrics
 from mcp_commit_story.journal_workflow_types import DailySummary
 from mcp_commit_story.journal_generate import JournalEntry, get_journal_file_path, ensure_journal_directory
 from mcp_commit_story.journal import JournalParser
-from mcp_commit_story.config import load_config
+from mcp_commit_story.journal_index import get_journal_sections, read_sections
+from mcp_commit_story.journal_cache import ensure_cache_dir, get_journal_cache_dir, replace_cache_file
+from mcp_commit_story.config import load_config, get_config_value
 from opentelemetry import trace
 import time
 
@@ -461,33 +466,18 @@ def load_journal_entries_for_date(date_str: str, config: Dict) -> List[JournalEn
             logger.info(f"No journal file found for date {date_str} at {journal_file_path}")
             return entries
         
-        # Read and parse the journal file
-        with open(journal_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Skip any preamble via the journal index and read the entries in one pass
+        entry_offsets = [section for section in get_journal_sections(journal_file_path) if section.kind == 'entry']
+        if not entry_offsets:
+            logger.info(f"No journal entries found for {date_str}")
+            return entries
+        entries_text, = read_sections(
+            journal_file_path, [replace(entry_offsets[0], end=os.path.getsize(journal_file_path))]
+        )
         
         # Parse journal entries using the established parser
         from mcp_commit_story.journal_generate import JournalParser
-        
-        # Split on entry headers (### timestamp — Commit hash)
-        # This pattern matches the header format used by JournalEntry.to_markdown()
-        entry_pattern = r'(?=^### .+ — Commit [a-zA-Z0-9]+)'
-        entry_sections = re.split(entry_pattern, content, flags=re.MULTILINE)
-        
-        # Remove empty sections and parse each entry
-        for section in entry_sections:
-            section = section.strip()
-            if section and section.startswith('###'):
-                try:
-                    # Add horizontal rule separator for consistent parsing
-                    normalized_section = section + '\n\n---\n\n'
-                    entry = JournalParser.parse(normalized_section)
-                    if entry:  # Only add valid entries
-                        entries.append(entry)
-                except Exception as e:
-                    logger.warning(f"Failed to parse journal entry section: {e}")
-                    # Log the problematic section for debugging
-                    logger.debug(f"Problematic section (first 200 chars): {section[:200]}")
-                    continue
+        entries.extend(JournalParser.parse_entries(entries_text))
         
         logger.info(f"Loaded {len(entries)} journal entries for {date_str}")
         return entries
@@ -652,25 +642,7 @@ def _call_ai_for_daily_summary(entries: List[JournalEntry], date_str: str, confi
             "operation": "daily_summary_generation"
         }
         
-        ai_response_text = invoke_ai(prompt, context)
-        
-        # Parse the AI response as JSON
-        try:
-            response = json.loads(ai_response_text)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse AI response as JSON: {e}")
-            logger.error(f"AI response text: {ai_response_text}")
-            raise ValueError(f"AI returned invalid JSON response: {e}")
-        
-        # Validate response has required fields
-        if not isinstance(response, dict):
-            raise ValueError("AI response must be a JSON object")
-        
-        # Ensure required fields exist with defaults
-        required_fields = ["summary", "progress_made", "key_accomplishments", "daily_metrics"]
-        for field in required_fields:
-            if field not in response:
-                response[field] = "" if field != "key_accomplishments" and field != "daily_metrics" else ([] if field == "key_accomplishments" else {})
+        response = _parse_daily_summary_response(invoke_ai(prompt, context))
         
         logger.info(f"Generated daily summary for {date_str} from {len(entries)} entries")
         return response
@@ -681,11 +653,195 @@ def _call_ai_for_daily_summary(entries: List[JournalEntry], date_str: str, confi
         raise
 
 
-def _format_entries_for_ai(entries: List[JournalEntry]) -> str:
+def _parse_daily_summary_response(ai_response_text: str) -> Dict:
+    """Parse and validate the JSON returned by the daily summary prompt.
+    
+    Args:
+        ai_response_text: Raw AI response
+        
+    Returns:
+        Response dictionary with the required fields present
+        
+    Raises:
+        ValueError: If the response is not a JSON object
+    """
+    try:
+        response = json.loads(ai_response_text)
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse AI response as JSON: {e}")
+        logger.error(f"AI response text: {ai_response_text}")
+        raise ValueError(f"AI returned invalid JSON response: {e}")
+    
+    # Validate response has required fields
+    if not isinstance(response, dict):
+        raise ValueError("AI response must be a JSON object")
+    
+    # Ensure required fields exist with defaults
+    required_fields = ["summary", "progress_made", "key_accomplishments", "daily_metrics"]
+    for field in required_fields:
+        if field not in response:
+            response[field] = "" if field != "key_accomplishments" and field != "daily_metrics" else ([] if field == "key_accomplishments" else {})
+    
+    return response
+
+
+# =============================================================================
+# Incremental Daily Summary Generation
+# =============================================================================
+#
+# With journal.incremental_daily_summary enabled, a per-day summary state is
+# kept in <journal>/.cache/daily_summary_state/<date>.json. It records the
+# entries already covered (commit hash plus a hash of the entry content) and
+# the AI response built from them, which serves as the digest of those
+# entries. When the summary is regenerated and the covered entries are still
+# the first entries of the day, unchanged, only the new entries are sent to the
+# AI together with that digest, so the prompt grows with the new work rather
+# than with the whole day. Any other change (an edited or removed entry, a
+# missing or unreadable state) falls back to a full regeneration.
+
+DAILY_SUMMARY_STATE_DIRNAME = "daily_summary_state"
+
+# Bump when the state layout changes; older states are ignored
+DAILY_SUMMARY_STATE_VERSION = 1
+
+
+def _get_summary_state_path(journal_path: str, date_str: str) -> Path:
+    return get_journal_cache_dir(journal_path) / DAILY_SUMMARY_STATE_DIRNAME / f"{date_str}.json"
+
+
+def _entry_fingerprint(entry: JournalEntry) -> List[str]:
+    """Commit hash and content hash identifying one covered entry."""
+    content_hash = hashlib.sha256(entry.to_markdown().encode('utf-8')).hexdigest()
+    return [entry.commit_hash, content_hash]
+
+
+def load_daily_summary_state(journal_path: str, date_str: str) -> Optional[Dict]:
+    """Load the incremental summary state for a date.
+    
+    Args:
+        journal_path: Journal root directory
+        date_str: Date in YYYY-MM-DD format
+        
+    Returns:
+        State dictionary with 'entries' and 'ai_response', or None if there is
+        no usable state
+    """
+    try:
+        with open(_get_summary_state_path(journal_path, date_str), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable daily summary state for {date_str}: {e}")
+        return None
+    
+    if (not isinstance(state, dict)
+            or state.get('version') != DAILY_SUMMARY_STATE_VERSION
+            or not isinstance(state.get('entries'), list)
+            or not isinstance(state.get('ai_response'), dict)):
+        return None
+    return state
+
+
+def save_daily_summary_state(journal_path: str, date_str: str, entries: List[JournalEntry], ai_response: Dict) -> None:
+    """Record which entries an AI response covers, replacing the state atomically.
+    
+    Failures are logged and ignored; the next run then regenerates in full.
+    
+    Args:
+        journal_path: Journal root directory
+        date_str: Date in YYYY-MM-DD format
+        entries: Entries covered by the response, in journal order
+        ai_response: Daily summary AI response for those entries
+    """
+    state = {
+        'version': DAILY_SUMMARY_STATE_VERSION,
+        'date': date_str,
+        'entries': [_entry_fingerprint(entry) for entry in entries],
+        'ai_response': ai_response,
+    }
+    state_path = _get_summary_state_path(journal_path, date_str)
+    try:
+        ensure_cache_dir(state_path.parent.parent)
+        state_path.parent.mkdir(exist_ok=True)
+        replace_cache_file(state_path, json.dumps(state))
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not save daily summary state for {date_str}: {e}")
+
+
+def _format_incremental_content(previous_response: Dict, new_entries: List[JournalEntry], covered_count: int) -> str:
+    """Format the existing summary digest and the new entries for an update prompt."""
+    lines = [
+        "# Existing Daily Summary",
+        "",
+        f"The JSON summary below already covers the first {covered_count} journal entries of this day. "
+        "Update it with the new journal entries that follow: merge them into every section, keep existing "
+        "content unless the new entries revise it, keep every existing reflection verbatim, and update the "
+        "daily metrics to cover all entries. Return the complete updated summary in the same JSON format.",
+        "",
+        "```json",
+        json.dumps(previous_response, indent=2),
+        "```",
+        "",
+        _format_entries_for_ai(new_entries, start=covered_count + 1),
+    ]
+    return "\n".join(lines)
+
+
+def _call_ai_for_incremental_daily_summary(entries: List[JournalEntry], date_str: str, config: dict) -> Dict:
+    """Generate the daily summary AI response, digesting only entries not yet covered.
+    
+    Args:
+        entries: All journal entries for the day, in journal order
+        date_str: Date in YYYY-MM-DD format
+        config: Configuration for AI generation
+        
+    Returns:
+        Dictionary containing generated summary sections for all entries
+    """
+    journal_path = config.get("journal", {}).get("path", "")
+    state = load_daily_summary_state(journal_path, date_str) if journal_path else None
+    
+    current_span = trace.get_current_span()
+    covered = state['entries'] if state else []
+    fingerprints = [_entry_fingerprint(entry) for entry in entries]
+    
+    if state and len(covered) <= len(fingerprints) and fingerprints[:len(covered)] == covered:
+        new_entries = entries[len(covered):]
+        if current_span:
+            current_span.set_attribute("summary.incremental_new_entries", len(new_entries))
+        if not new_entries:
+            logger.info(f"Daily summary for {date_str} already covers all {len(entries)} entries")
+            return state['ai_response']
+        
+        prompt = _build_daily_summary_prompt(
+            _format_incremental_content(state['ai_response'], new_entries, len(covered)), date_str
+        )
+        context = {
+            "date": date_str,
+            "entries_count": len(new_entries),
+            "operation": "daily_summary_incremental_update"
+        }
+        response = _parse_daily_summary_response(invoke_ai(prompt, context))
+        logger.info(f"Updated daily summary for {date_str} with {len(new_entries)} new entries")
+    else:
+        if state:
+            logger.info(f"Journal entries for {date_str} changed since the last summary, regenerating in full")
+        if current_span:
+            current_span.set_attribute("summary.incremental_new_entries", len(entries))
+        response = _call_ai_for_daily_summary(entries, date_str, config)
+    
+    if journal_path:
+        save_daily_summary_state(journal_path, date_str, entries, response)
+    return response
+
+
+def _format_entries_for_ai(entries: List[JournalEntry], start: int = 1) -> str:
     """Format journal entries into a structured context for AI generation.
     
     Args:
         entries: List of journal entries to format
+        start: Number of the first entry (entries are numbered within the day)
         
     Returns:
         Formatted string containing all entry content
@@ -695,7 +851,7 @@ def _format_entries_for_ai(entries: List[JournalEntry]) -> str:
     
     lines = ["# Journal Entries for Daily Summary Generation", ""]
     
-    for i, entry in enumerate(entries, 1):
+    for i, entry in enumerate(entries, start):
         lines.extend([
             f"## Entry {i} - {entry.timestamp} (Commit {entry.commit_hash})",
             ""
@@ -1077,7 +1233,8 @@ def _generate_mock_daily_summary_response(entries: List[JournalEntry], date_str:
 
 
 @trace_mcp_operation("daily_summary.generate", attributes={"operation_type": "ai_generation", "section_type": "daily_summary"})
-def generate_daily_summary(journal_entries: List[JournalEntry], date_str: str, config: dict) -> DailySummary:
+def generate_daily_summary(journal_entries: List[JournalEntry], date_str: str, config: dict,
+                           incremental: Optional[bool] = None) -> DailySummary:
     """
     AI Prompt for Daily Summary Generation
 
@@ -1284,6 +1441,8 @@ def generate_daily_summary(journal_entries: List[JournalEntry], date_str: str, c
         journal_entries: List of journal entries for the specified date
         date_str: Date in YYYY-MM-DD format
         config: Configuration dictionary with AI model settings
+        incremental: Only send entries not covered by the stored summary state to the AI.
+            Defaults to the journal.incremental_daily_summary config setting (off).
         
     Returns:
         DailySummary object with generated content
@@ -1293,7 +1452,12 @@ def generate_daily_summary(journal_entries: List[JournalEntry], date_str: str, c
         markdown_reflections = extract_reflections_from_journal_file(date_str, config)
         
         # Call AI to generate the summary
-        ai_response = _call_ai_for_daily_summary(journal_entries, date_str, config)
+        if incremental is None:
+            incremental = bool(get_config_value(config, 'journal.incremental_daily_summary', False))
+        if incremental:
+            ai_response = _call_ai_for_incremental_daily_summary(journal_entries, date_str, config)
+        else:
+            ai_response = _call_ai_for_daily_summary(journal_entries, date_str, config)
         
         # Build the DailySummary object, omitting empty sections
         summary_data = {
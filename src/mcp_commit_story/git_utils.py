@@ -4,12 +4,20 @@ Git utilities for MCP Journal.
 This module provides functions for interacting with Git repositories
 and processing commits for journal entry generation.
 """
+import codecs
+import contextvars
+import functools
+import itertools
+import logging
 import os
+import subprocess
 import time
 import shutil
 import re
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
+from typing import Callable, Dict, List, Any, Iterator, Optional, Tuple, TypeVar, Union
 
 # Import git library conditionally to handle environments where it might not be available
 try:
@@ -21,9 +29,78 @@ except ImportError:
 # SHA for the empty tree object in Git (used for initial commit diffs)
 NULL_TREE = '4b825dc642cb6eb9a060e54bf8d69288fbee4904'
 
+# Largest per-file diff kept by get_commit_file_diffs (the small-commit adaptive limit)
+MAX_FILE_DIFF_SIZE = 10 * 1024
+
+# Bytes read from git per call when streaming patches, so a single huge line stays bounded
+PATCH_READ_CHUNK_SIZE = 64 * 1024
+
 from mcp_commit_story.context_types import GitContext
 from mcp_commit_story.telemetry import trace_git_operation
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Per-run memo of git artifacts keyed by (kind, commit SHA, ...); None outside a run.
+# Held in a contextvar so threads started with copy_context() share their run's memo.
+_git_run_memo: contextvars.ContextVar[Optional[Dict[tuple, Any]]] = contextvars.ContextVar(
+    'git_run_memo', default=None
+)
+
+
+@contextmanager
+def git_run_memo() -> Iterator[Dict[tuple, Any]]:
+    """
+    Memoize git artifacts per commit for the duration of one journal run.
+    
+    Inside the block, collect_git_context() and get_previous_commit_info() compute
+    each artifact once per commit SHA; nested blocks reuse the outer run's memo.
+    """
+    memo = _git_run_memo.get()
+    if memo is not None:
+        yield memo
+        return
+    token = _git_run_memo.set({})
+    try:
+        yield _git_run_memo.get()
+    finally:
+        _git_run_memo.reset(token)
+
+
+def with_git_run_memo(func: Callable[..., T]) -> Callable[..., T]:
+    """Decorator running a whole function inside git_run_memo()."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with git_run_memo():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def memoize_for_run(key: tuple, compute: Callable[[], T]) -> T:
+    """
+    Return the run's memoized value for key, computing and storing it on first use.
+    
+    Outside git_run_memo() the value is always computed. Failures are not memoized.
+    """
+    memo = _git_run_memo.get()
+    if memo is None:
+        return compute()
+    if key not in memo:
+        memo[key] = compute()
+    return memo[key]
+
+
+def find_run_memo(kind: str, commit_hash: str) -> Optional[Any]:
+    """Return any value memoized in the current run for (kind, commit_hash, ...), or None."""
+    memo = _git_run_memo.get()
+    if not memo:
+        return None
+    for key, value in list(memo.items()):
+        if key[:2] == (kind, commit_hash):
+            return value
+    return None
+
 
 def is_git_repo(path: Optional[str] = None) -> bool:
     """
@@ -102,22 +179,31 @@ def is_journal_only_commit(commit: 'git.Commit', journal_path: str) -> bool:
     return all(f.startswith(journal_path) for f in file_paths) if file_paths else False
 
 
-def get_commit_details(commit: 'git.Commit') -> Dict[str, Any]:
+def get_commit_details(commit: 'git.Commit', snapshot: Optional['CommitSnapshot'] = None) -> Dict[str, Any]:
     """
     Extract relevant details from a commit for reporting or journal entry generation.
 
     Args:
         commit (git.Commit): Commit to extract details from.
+        snapshot (CommitSnapshot, optional): Precomputed snapshot of the commit's changes.
+            When provided, stats are taken from it instead of running another git diff.
 
     Returns:
         dict: Dictionary with commit details (hash, message, timestamp, datetime, author, stats).
     """
     dt = datetime.fromtimestamp(commit.committed_date)
-    stats = {
-        'files': len(commit.stats.files),
-        'insertions': sum(file_stats['insertions'] for file_stats in commit.stats.files.values()),
-        'deletions': sum(file_stats['deletions'] for file_stats in commit.stats.files.values())
-    }
+    if snapshot is not None:
+        stats = {
+            'files': len(snapshot.files),
+            'insertions': snapshot.insertions,
+            'deletions': snapshot.deletions
+        }
+    else:
+        stats = {
+            'files': len(commit.stats.files),
+            'insertions': sum(file_stats['insertions'] for file_stats in commit.stats.files.values()),
+            'deletions': sum(file_stats['deletions'] for file_stats in commit.stats.files.values())
+        }
     return {
         'hash': commit.hexsha,
         'message': commit.message,
@@ -147,11 +233,21 @@ def get_previous_commit_info(commit: 'git.Commit') -> Optional[Dict[str, Any]]:
     # Get first parent (main branch for merge commits)
     previous_commit = commit.parents[0]
     
-    # Calculate stats
+    # Parent stats need a full diff of the parent; compute them once per run
+    return memoize_for_run(
+        ('previous_commit_info', commit.hexsha),
+        lambda: _previous_commit_info(previous_commit)
+    )
+
+
+def _previous_commit_info(previous_commit: 'git.Commit') -> Dict[str, Any]:
+    """Build get_previous_commit_info()'s result for the parent commit."""
+    # Calculate stats (Commit.stats runs a diff on every access, so read it once)
+    file_stats = previous_commit.stats.files
     stats = {
-        'files': len(previous_commit.stats.files),
-        'insertions': sum(file_stats['insertions'] for file_stats in previous_commit.stats.files.values()),
-        'deletions': sum(file_stats['deletions'] for file_stats in previous_commit.stats.files.values())
+        'files': len(file_stats),
+        'insertions': sum(entry['insertions'] for entry in file_stats.values()),
+        'deletions': sum(entry['deletions'] for entry in file_stats.values())
     }
     
     return {
@@ -186,12 +282,289 @@ def is_blob_binary(blob) -> bool:
         return False
 
 
-def get_commit_diff_summary(commit) -> str:
+@dataclass
+class FileChange:
+    """A single file change from a commit snapshot."""
+    path: str
+    change_type: str  # "A", "D", "M", "R", "T" (git diff-tree status letter)
+    old_path: Optional[str] = None
+    old_sha: str = ""
+    new_sha: str = ""
+    insertions: int = 0
+    deletions: int = 0
+    is_binary: bool = False
+    patch: str = ""
+    patch_truncated: bool = False  # patch was cut at the snapshot's max_patch_size
+
+
+@dataclass
+class CommitSnapshot:
+    """
+    Every change in a commit, collected from a single git subprocess.
+
+    Feeds get_commit_details, get_commit_diff_summary and get_commit_file_diffs
+    so one journal run does not generate the commit's patches several times.
+    """
+    commit_hash: str
+    files: List[FileChange] = field(default_factory=list)
+
+    @property
+    def insertions(self) -> int:
+        return sum(change.insertions for change in self.files)
+
+    @property
+    def deletions(self) -> int:
+        return sum(change.deletions for change in self.files)
+
+
+def _unquote_git_path(path: str) -> str:
+    """Decode a C-style quoted path as printed by git for unusual file names."""
+    if len(path) >= 2 and path.startswith('"') and path.endswith('"'):
+        raw = codecs.escape_decode(path[1:-1].encode('utf-8'))[0]
+        return raw.decode('utf-8', errors='replace')
+    return path
+
+
+def _parse_raw_line(line: str) -> FileChange:
+    """Parse one ``--raw`` line (``:old_mode new_mode old_sha new_sha STATUS\tpath[\tpath]``)."""
+    meta, *paths = line.split('\t')
+    _old_mode, _new_mode, old_sha, new_sha, status = meta[1:].split(' ')
+    paths = [_unquote_git_path(p) for p in paths]
+    change_type = status[0]
+    if change_type in ('R', 'C') and len(paths) == 2:
+        return FileChange(path=paths[1], old_path=paths[0], change_type=change_type,
+                          old_sha=old_sha, new_sha=new_sha)
+    return FileChange(path=paths[0], change_type=change_type, old_sha=old_sha, new_sha=new_sha)
+
+
+def _iter_output_lines(stream, chunk_size: int = PATCH_READ_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Decode subprocess output line by line without holding more than chunk_size bytes.
+
+    Lines longer than chunk_size (minified or generated files) arrive as several
+    pieces; only the last piece ends with a newline.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    for raw in iter(lambda: stream.readline(chunk_size), b''):
+        yield decoder.decode(raw)
+
+
+def _iter_patch_blocks(lines: Iterator[str], budgets: Optional[List[Optional[int]]] = None) -> Iterator[Tuple[str, bool]]:
+    """
+    Yield ``(patch, truncated)`` for each ``diff --git`` block, in file order.
+
+    The body matches GitPython's ``Diff.diff``: everything after the file
+    headers, starting at the first hunk or the "Binary files ... differ" line.
+
+    Args:
+        lines: Decoded diff output positioned at the first patch block.
+        budgets: Optional per-block character limits (by block index). Once a
+            block reaches its limit the rest of it is read and discarded, so
+            memory stays bounded by the budget rather than the patch size.
+    """
+    body: Optional[List[str]] = None
+    size = 0
+    limit: Optional[int] = None
+    truncated = False
+    in_hunks = False
+    index = -1
+    at_line_start = True
+    for line in lines:
+        starts_line = at_line_start
+        at_line_start = line.endswith('\n')
+        if starts_line and line.startswith('diff --git '):
+            if body is not None:
+                yield ''.join(body), truncated
+            index += 1
+            body = []
+            size = 0
+            truncated = False
+            in_hunks = False
+            limit = budgets[index] if budgets is not None and index < len(budgets) else None
+            continue
+        if body is None:
+            continue
+        if not in_hunks and starts_line and (line.startswith('@@') or line.startswith('Binary files ')):
+            in_hunks = True
+        if not in_hunks or truncated:
+            continue
+        if limit is not None and size + len(line) > limit:
+            body.append(line[:limit - size])
+            size = limit
+            truncated = True
+            continue
+        body.append(line)
+        size += len(line)
+    if body is not None:
+        yield ''.join(body), truncated
+
+
+def _patch_block_count(change: FileChange) -> int:
+    """Number of ``diff --git`` blocks git prints for a change (a typechange is split in two)."""
+    return 2 if change.change_type == 'T' else 1
+
+
+def _iter_file_patches(lines: Iterator[str], files: List[FileChange],
+                       budgets: Optional[List[Optional[int]]] = None) -> Iterator[Tuple[str, bool]]:
+    """
+    Yield ``(patch, truncated)`` for each file of a snapshot, in file order.
+
+    git prints a typechange (``T``, e.g. a file replaced by a symlink) as two
+    blocks: the deletion of the old entry and the creation of the new one. Both
+    are joined into that file's patch, so later files still get their own blocks.
+
+    Args:
+        lines: Decoded diff output positioned at the first patch block.
+        files: The snapshot's files, in diff-tree order.
+        budgets: Optional per-file character limits (by file index), applied to
+            each block while streaming and to the joined patch.
+    """
+    block_budgets = None
+    if budgets is not None:
+        block_budgets = [
+            budget for change, budget in zip(files, budgets) for _ in range(_patch_block_count(change))
+        ]
+    blocks = _iter_patch_blocks(lines, block_budgets)
+    for index, change in enumerate(files):
+        parts = list(itertools.islice(blocks, _patch_block_count(change)))
+        patch = ''.join(part for part, _ in parts)
+        truncated = any(part_truncated for _, part_truncated in parts)
+        limit = budgets[index] if budgets is not None and index < len(budgets) else None
+        if limit is not None and len(patch) > limit:
+            patch, truncated = patch[:limit], True
+        yield patch, truncated
+
+
+def _spawn_diff_tree(repo: 'git.Repo', commit: 'git.Commit') -> subprocess.Popen:
+    """Start ``git diff-tree --raw --numstat -p`` for a commit against its first parent (or the empty tree)."""
+    parent = commit.parents[0].hexsha if commit.parents else NULL_TREE
+    args = [
+        'git', '-c', 'core.quotepath=false', 'diff-tree', '-r', '-M',
+        '--raw', '--numstat', '-p', '--no-abbrev', '--full-index',
+        '--no-color', '--no-ext-diff', parent, commit.hexsha
+    ]
+    return subprocess.Popen(
+        args,
+        cwd=repo.working_tree_dir or repo.git_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+
+
+def _read_change_headers(lines: Iterator[str], commit_hash: str) -> Tuple[CommitSnapshot, Iterator[str]]:
+    """
+    Parse the ``--raw`` and ``--numstat`` sections of diff-tree output.
+
+    Returns:
+        The snapshot (without patches) and the line iterator positioned at the first patch block.
+
+    Raises:
+        ValueError, IndexError: If the output is not in the expected format.
+    """
+    snapshot = CommitSnapshot(commit_hash=commit_hash)
+    numstat_index = 0
+    for line in lines:
+        stripped = line.rstrip('\n')
+        if stripped.startswith(':'):
+            snapshot.files.append(_parse_raw_line(stripped))
+        elif stripped and numstat_index < len(snapshot.files):
+            added, deleted, _ = stripped.split('\t', 2)
+            change = snapshot.files[numstat_index]
+            if added == '-' and deleted == '-':
+                change.is_binary = True
+            else:
+                change.insertions, change.deletions = int(added), int(deleted)
+            numstat_index += 1
+        else:
+            # Blank separator: patches follow in the same order (see _iter_file_patches)
+            if stripped:
+                lines = itertools.chain([line], lines)
+            break
+    return snapshot, lines
+
+
+def _stop_diff_tree(process: subprocess.Popen) -> int:
+    """Stop a diff-tree process, killing it if its output was not read to the end."""
+    if process.poll() is None and process.stdout.read(1):
+        process.kill()
+    process.stdout.close()
+    return process.wait()
+
+
+def get_commit_snapshot(
+    repo: 'git.Repo',
+    commit: 'git.Commit',
+    max_patch_size: Optional[int] = None
+) -> Optional[CommitSnapshot]:
+    """
+    Collect name-status, numstat, binary markers and patches for a commit in one git pass.
+
+    Runs a single ``git diff-tree --raw --numstat -p`` against the first parent
+    (or the empty tree for the initial commit) and parses its output as a stream.
+
+    Args:
+        repo (git.Repo): Repository containing the commit.
+        commit (git.Commit): Commit to snapshot.
+        max_patch_size (int, optional): Keep at most this many characters of each
+            file's patch; longer patches are marked ``patch_truncated``.
+
+    Returns:
+        CommitSnapshot, or None when git cannot be run (callers fall back to GitPython diffs).
+    """
+    try:
+        process = _spawn_diff_tree(repo, commit)
+    except Exception as e:
+        logger.debug(f"Commit snapshot unavailable, falling back to GitPython diffs: {e}")
+        return None
+
+    try:
+        snapshot, lines = _read_change_headers(_iter_output_lines(process.stdout), commit.hexsha)
+        budgets = [max_patch_size] * len(snapshot.files) if max_patch_size is not None else None
+        for change, (patch, truncated) in zip(snapshot.files, _iter_file_patches(lines, snapshot.files, budgets)):
+            change.patch = patch
+            change.patch_truncated = truncated
+    except (ValueError, IndexError) as e:
+        logger.debug(f"Could not parse git diff-tree output for {commit.hexsha}: {e}")
+        _stop_diff_tree(process)
+        return None
+
+    returncode = _stop_diff_tree(process)
+    if returncode != 0:
+        logger.debug(f"git diff-tree exited with {returncode} for {commit.hexsha}")
+        return None
+    return snapshot
+
+
+def _summarize_snapshot(snapshot: CommitSnapshot) -> str:
+    """Build the get_commit_diff_summary text from a commit snapshot."""
+    if not snapshot.files:
+        return "No changes in this commit."
+    summary_lines = []
+    for change in snapshot.files:
+        fname = change.path
+        if change.change_type == 'A':
+            summary_lines.append(f"{fname}: binary file added" if change.is_binary else f"{fname}: added")
+        elif change.change_type == 'D':
+            summary_lines.append(f"{fname}: binary file deleted" if change.is_binary else f"{fname}: deleted")
+        elif change.change_type == 'R':
+            summary_lines.append(f"{change.old_path} → {fname}: renamed")
+        elif change.is_binary:
+            summary_lines.append(f"{fname}: binary file changed")
+        elif change.old_sha != change.new_sha:
+            summary_lines.append(f"{fname}: modified")
+        else:
+            summary_lines.append(f"{fname}: changed (no content diff)")
+    return "\n".join(summary_lines)
+
+
+def get_commit_diff_summary(commit, snapshot: Optional[CommitSnapshot] = None) -> str:
     """
     Generate a human-readable summary of file changes in a commit.
 
     Args:
         commit (git.Commit): Commit to summarize.
+        snapshot (CommitSnapshot, optional): Precomputed snapshot of the commit's changes.
+            When provided, the summary is built from it without another git diff.
 
     Returns:
         str: Summary of file changes (added, deleted, modified, renamed, binary, etc.).
@@ -200,6 +573,9 @@ def get_commit_diff_summary(commit) -> str:
         - Prefers diff.change_type if available, falls back to blob/content comparison.
         - Handles ambiguous cases and logs warnings.
     """
+    if snapshot is not None:
+        return _summarize_snapshot(snapshot)
+
     parent = commit.parents[0] if commit.parents else None
     diffs = commit.diff(parent, create_patch=True)
     if not diffs:
@@ -265,7 +641,7 @@ def get_commit_diff_summary(commit) -> str:
     return "\n".join(summary_lines)
 
 
-def generate_hook_content(command: str = None, background: bool = False, timeout: int = 30) -> str:
+def generate_hook_content(command: str = None, background: bool = False, timeout: int = 30, daemon: bool = False) -> str:
     """
     Generate the content for a portable Git post-commit hook script.
 
@@ -276,6 +652,9 @@ def generate_hook_content(command: str = None, background: bool = False, timeout
         background (bool, optional): If True, spawn journal generation in background 
                                    to avoid blocking git commits. Defaults to False.
         timeout (int, optional): Timeout in seconds for background worker. Defaults to 30.
+        daemon (bool, optional): If True, queue the commit with the long-running journal
+                               daemon (started on demand) instead of starting a new
+                               Python worker per commit. Defaults to False.
 
     Returns:
         str: The complete hook script content as a string.
@@ -284,6 +663,8 @@ def generate_hook_content(command: str = None, background: bool = False, timeout
         - Uses '#!/bin/sh' for maximum portability.
         - Default behavior: Calls Python worker for journal entries + daily summary triggering.
         - Background mode: Spawns background worker that doesn't block git operations.
+        - Daemon mode: Sends the commit hash to the journal daemon, which keeps imports,
+          config and the AI client warm between commits.
         - Custom command: Uses legacy behavior for backwards compatibility.
         - Runs the specified command, redirecting all output to /dev/null.
         - Appends '|| true' to ensure the hook never blocks a commit, even on error.
@@ -292,6 +673,18 @@ def generate_hook_content(command: str = None, background: bool = False, timeout
     if command is not None:
         # Legacy behavior for backwards compatibility
         return f"#!/bin/sh\n{command} >/dev/null 2>&1 || true\n"
+    elif daemon:
+        # Daemon mode - queue the commit with the warm journal daemon
+        return '''#!/bin/sh
+# Get the current commit hash
+COMMIT_HASH=$(git rev-parse HEAD)
+
+# Queue the commit with the journal daemon (starts one if none is running)
+python -m mcp_commit_story.journal_daemon submit \\
+    --repo-path "$PWD" \\
+    --commit-hash "$COMMIT_HASH" \\
+    >/dev/null 2>&1 || true
+'''
     elif background:
         # Background mode - spawn detached background worker
         return f'''#!/bin/sh
@@ -331,7 +724,7 @@ def backup_existing_hook(hook_path: str) -> Optional[str]:
     return backup_path
 
 
-def install_post_commit_hook(repo_path: str = None, background: bool = False, timeout: int = 30) -> bool:
+def install_post_commit_hook(repo_path: str = None, background: bool = False, timeout: int = 30, daemon: bool = False) -> bool:
     """
     Install or replace the post-commit hook in the given repo's .git/hooks directory.
 
@@ -340,6 +733,8 @@ def install_post_commit_hook(repo_path: str = None, background: bool = False, ti
         background (bool, optional): If True, install hook that runs journal generation 
                                    in background to avoid blocking git commits. Defaults to False.
         timeout (int, optional): Timeout in seconds for background worker. Defaults to 30.
+        daemon (bool, optional): If True, install hook that queues commits with the
+                               long-running journal daemon. Defaults to False.
 
     Returns:
         bool: True if hook was installed successfully, False otherwise.
@@ -377,7 +772,7 @@ def install_post_commit_hook(repo_path: str = None, background: bool = False, ti
         backup_path = backup_existing_hook(hook_path)
     
     # Generate hook content with background mode support
-    hook_content = generate_hook_content(background=background, timeout=timeout)
+    hook_content = generate_hook_content(background=background, timeout=timeout, daemon=daemon)
     
     with open(hook_path, 'w') as f:
         f.write(hook_content)
@@ -560,7 +955,9 @@ def get_commit_file_diffs(
     repo: 'git.Repo', 
     commit: 'git.Commit', 
     max_file_size: int = 10 * 1024, 
-    max_total_size: int = 50 * 1024
+    max_total_size: int = 50 * 1024,
+    snapshot: Optional[CommitSnapshot] = None,
+    stream: bool = False
 ) -> Dict[str, str]:
     """
     Extract diff content for all files changed in a commit with intelligent size management.
@@ -624,13 +1021,20 @@ def get_commit_file_diffs(
     **Performance Characteristics:**
     - Typical execution: <100ms for commits with <10 files
     - Large commits (>50 files): <500ms due to sampling and limits
-    - Memory usage: Bounded by max_total_size parameter
+    - Memory usage: Bounded by max_total_size parameter; with stream=True patches are
+      never held beyond their per-file budget, even for very large generated files
     
     Args:
         repo: GitPython repository object (required, must be valid git repo)
         commit: GitPython commit object (required, must exist in repo)
         max_file_size: Base limit for individual file diffs in bytes (adaptive logic overrides this)
         max_total_size: Hard limit for total diff content in bytes (default: 50KB)
+        snapshot: Optional precomputed CommitSnapshot; when provided its patches are
+            used instead of generating them again through GitPython
+        stream: Read patches incrementally from ``git diff-tree`` instead of materializing
+            them. Each file is read only up to its adaptive budget and git is stopped once
+            max_total_size is reached, so memory is bounded by the budget rather than the
+            commit. Ignored when a snapshot is given; falls back to GitPython if git cannot run.
         
     Returns:
         Dict[str, str]: File path to diff content mapping. Special keys:
@@ -660,44 +1064,63 @@ def get_commit_file_diffs(
     span.set_attribute("operation.max_file_size", max_file_size)
     span.set_attribute("operation.max_total_size", max_total_size)
     
+    process = None
     try:
-        # Get all diff items first to count them for adaptive limits
-        if parent:
-            diff_items = list(commit.diff(parent, create_patch=True))
+        patch_lines = None
+        if snapshot is None and stream:
+            try:
+                process = _spawn_diff_tree(repo, commit)
+                snapshot, patch_lines = _read_change_headers(_iter_output_lines(process.stdout), commit.hexsha)
+            except Exception as e:
+                logger.debug(f"Streaming diffs unavailable, falling back to GitPython: {e}")
+                if process is not None:
+                    _stop_diff_tree(process)
+                    process = None
+                snapshot = None
+        span.set_attribute("operation.streaming", process is not None)
+
+        # Collect (file_path, is_binary, diff_content, truncated) for every changed file;
+        # streamed patches are read later, once each file's budget is known
+        if snapshot is not None:
+            diff_entries = [
+                (change.path, change.is_binary, change.patch or None, change.patch_truncated)
+                for change in snapshot.files
+            ]
         else:
-            diff_items = list(commit.diff(NULL_TREE, create_patch=True))
+            if parent:
+                diff_items = list(commit.diff(parent, create_patch=True))
+            else:
+                diff_items = list(commit.diff(NULL_TREE, create_patch=True))
+            diff_entries = []
+            for diff_item in diff_items:
+                # Prefer b_path for new files, fall back to a_path for deleted files
+                file_path = diff_item.b_path or diff_item.a_path
+                if not file_path:
+                    continue
+                is_binary = bool(
+                    (diff_item.a_blob and is_blob_binary(diff_item.a_blob)) or
+                    (diff_item.b_blob and is_blob_binary(diff_item.b_blob))
+                )
+                diff_bytes = getattr(diff_item, 'diff', None)
+                diff_entries.append((file_path, is_binary, diff_bytes or None, False))
         
         # Filter out binary and generated files first
         filtered_diff_items = []
-        for diff_item in diff_items:
-            # Get file path (prefer b_path for new files, fall back to a_path for deleted files)
-            file_path = diff_item.b_path or diff_item.a_path
-            if not file_path:
-                continue
-            
-            # Skip binary files - check if the diff_item represents a binary file
-            # For GitPython, we need to check if the blobs are binary
-            is_binary = False
-            if diff_item.a_blob and is_blob_binary(diff_item.a_blob):
-                is_binary = True
-            elif diff_item.b_blob and is_blob_binary(diff_item.b_blob):
-                is_binary = True
-            
+        binary_files_filtered = 0
+        for index, (file_path, is_binary, diff_content, truncated) in enumerate(diff_entries):
             if is_binary:
+                binary_files_filtered += 1
                 continue
                 
             # Skip generated files
             if is_generated_file(file_path):
                 continue
                 
-            filtered_diff_items.append(diff_item)
+            filtered_diff_items.append((index, file_path, diff_content, truncated))
         
         # Apply adaptive size limits based on file count
         file_count = len(filtered_diff_items)
-        original_file_count = len(diff_items)
-        binary_files_filtered = sum(1 for item in diff_items if 
-                                   (item.a_blob and is_blob_binary(item.a_blob)) or
-                                   (item.b_blob and is_blob_binary(item.b_blob)))
+        original_file_count = len(diff_entries)
         generated_files_filtered = original_file_count - binary_files_filtered - file_count
         
         # Set telemetry attributes for file analysis
@@ -708,7 +1131,7 @@ def get_commit_file_diffs(
         
         if file_count <= 5:
             # ≤5 files: 10KB per file
-            adaptive_max_file_size = 10 * 1024
+            adaptive_max_file_size = MAX_FILE_DIFF_SIZE
             span.set_attribute("adaptive_sizing.category", "small_commit")
         elif file_count <= 20:
             # 6-20 files: 2.5KB per file
@@ -722,21 +1145,29 @@ def get_commit_file_diffs(
             span.set_attribute("files.truncated_to", 50)
         
         span.set_attribute("adaptive_sizing.file_limit_bytes", adaptive_max_file_size)
+
+        if process is not None:
+            # Read only the selected files' patches, each up to its adaptive budget;
+            # skipped files get a zero budget and are discarded as they stream past
+            selected = {index for index, _, _, _ in filtered_diff_items}
+            budgets = [adaptive_max_file_size if index in selected else 0 for index in range(original_file_count)]
+            streamed = enumerate(_iter_file_patches(patch_lines, snapshot.files, budgets))
+            patches = ((patch or None, truncated) for index, (patch, truncated) in streamed if index in selected)
+        else:
+            patches = ((diff_content, truncated) for _, _, diff_content, truncated in filtered_diff_items)
         
         # Process each filtered diff item
-        for diff_item in filtered_diff_items:
-            file_path = diff_item.b_path or diff_item.a_path
-            
+        for (_, file_path, _, _), (raw_diff, truncated) in zip(filtered_diff_items, patches):
             try:
                 # Get the diff content
-                if hasattr(diff_item, 'diff') and diff_item.diff:
-                    diff_content = diff_item.diff.decode('utf-8', errors='replace')
+                if raw_diff:
+                    diff_content = raw_diff.decode('utf-8', errors='replace') if isinstance(raw_diff, bytes) else raw_diff
                 else:
                     # Fallback if diff content is not available
                     diff_content = f"[Unable to extract diff for {file_path}]"
                 
                 # Apply file size limits
-                if len(diff_content) > adaptive_max_file_size:
+                if truncated or len(diff_content) > adaptive_max_file_size:
                     # Truncate with message
                     diff_content = diff_content[:adaptive_max_file_size] + "\n[... diff truncated due to size limits ...]"
                 
@@ -765,6 +1196,10 @@ def get_commit_file_diffs(
         span.set_attribute("operation.success", False)
         span.set_attribute("error.type", type(e).__name__)
         return {"__error__": f"Error extracting commit diffs: {str(e)}"}
+    finally:
+        if process is not None:
+            # Stops git early once the total budget or the selected files are exhausted
+            _stop_diff_tree(process)
     
     # Set final telemetry attributes
     span.set_attribute("operation.success", True)
@@ -17,6 +17,7 @@ from ..journal_generate import (
     ensure_journal_directory,
     get_journal_file_path,
     append_to_journal_file,
+    append_entries_to_journal_file,
     load_journal_context,
     generate_summary_section,
     generate_technical_synopsis_section,
@@ -32,7 +33,7 @@ __all__ = [
     '_add_ai_generation_telemetry', '_record_ai_generation_metrics',
     'log_ai_agent_interaction', '_get_size_bucket',
     'ensure_journal_directory', 'get_journal_file_path', 
-    'append_to_journal_file', 'load_journal_context',
+    'append_to_journal_file', 'append_entries_to_journal_file', 'load_journal_context',
     'generate_summary_section', 'generate_technical_synopsis_section',
     'generate_accomplishments_section', 'generate_frustrations_section',
     'generate_tone_mood_section', 'generate_discussion_notes_section',
@@ -0,0 +1,174 @@
+"""
+Journal cache directory helpers for MCP Commit Story.
+
+Sidecar caches (extracted chat sessions and similar derived data) live in a
+``.cache`` directory under the journal root. The directory is created on demand
+(see docs/on-demand-directory-pattern.md) and carries its own ``.gitignore`` so
+cache files are never committed together with journal entries.
+
+Every sidecar is an optimization over data that can be recomputed, so none of
+them may break the operation it speeds up. SQLiteSidecar and
+replace_cache_file() implement the shared parts: lazy opening, atomic
+replacement, and turning SQLite or filesystem errors into debug logs and misses.
+"""
+
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = ".cache"
+
+
+def ensure_cache_dir(cache_dir: Union[str, Path]) -> Path:
+    """
+    Create a cache directory on demand and make git ignore its contents.
+
+    Args:
+        cache_dir: Cache directory to create
+
+    Returns:
+        Path to the cache directory
+
+    Raises:
+        OSError: When the directory or its .gitignore cannot be written
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("*\n")
+
+    return cache_dir
+
+
+def get_journal_cache_dir(journal_path: Union[str, Path]) -> Path:
+    """
+    Return the cache directory path for a journal without creating it.
+
+    Args:
+        journal_path: Journal root directory
+
+    Returns:
+        Path to ``<journal_path>/.cache``
+    """
+    return Path(journal_path) / CACHE_DIR_NAME
+
+
+def replace_cache_file(path: Union[str, Path], text: str) -> None:
+    """
+    Atomically replace a cache file with new text.
+
+    The text is written to a temporary file in the same directory and renamed
+    over the target, so readers see either the old or the new content. The
+    directory must already exist.
+
+    Args:
+        path: Cache file to replace
+        text: New file content
+
+    Raises:
+        OSError: When the file cannot be written; the temporary file is removed
+    """
+    path = Path(path)
+    fd, temp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class SQLiteSidecar:
+    """
+    SQLite database in a cache directory, opened on first use.
+
+    Subclasses list their ``CREATE ... IF NOT EXISTS`` statements in SCHEMA and
+    name themselves in DESCRIPTION for log messages. Constructing a sidecar has
+    no filesystem side effects. If the database cannot be opened the sidecar
+    disables itself for the life of the object and _get_connection() returns
+    None, which callers treat as a miss.
+    """
+
+    SCHEMA: Tuple[str, ...] = ()
+    DESCRIPTION = "Journal cache"
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Args:
+            db_path: Path of the SQLite file, created on first use.
+                Its directory is treated as a dedicated cache directory.
+        """
+        self.db_path = Path(db_path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._disabled = False
+
+    def _get_connection(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use (call with _lock held); None once disabled."""
+        if self._disabled:
+            return None
+        if self._connection is not None:
+            return self._connection
+
+        try:
+            ensure_cache_dir(self.db_path.parent)
+            connection = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False)
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+            connection.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"{self.DESCRIPTION} disabled ({self.db_path}): {e}")
+            self._disabled = True
+            return None
+
+        self._connection = connection
+        return connection
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def resolve_journal_path(repo_path: str) -> Optional[str]:
+    """
+    Resolve the configured journal directory for a repository.
+
+    Uses the same rules as the git hook worker: ``journal.path`` from the
+    loaded config, relative paths resolved against the repository root.
+
+    Args:
+        repo_path: Repository root directory
+
+    Returns:
+        Absolute journal path, or None when the config cannot be loaded
+    """
+    try:
+        from .config import load_config
+
+        config = load_config()
+        journal_path = config.get("journal", {}).get("path", "journal")
+    except Exception as e:
+        logger.debug(f"Could not resolve journal path from config: {e}")
+        return None
+
+    if not journal_path:
+        return None
+    if not os.path.isabs(journal_path):
+        journal_path = os.path.join(repo_path, journal_path)
+
+    return journal_path
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Long-running local journal daemon fed by the git hook over a Unix socket.
+
+Without the daemon every commit spawns a fresh Python process that pays for
+interpreter startup, imports of opentelemetry, openai, GitPython and yaml,
+config loading and telemetry setup before any work starts. The daemon pays
+those costs once and keeps warm state (imported modules, parsed config, the
+shared AI provider and its connection pool, database caches) across commits.
+
+Architecture:
+- ``submit`` (run by the hook) imports only the standard library, sends the
+  commit SHA to the daemon's socket and exits within milliseconds. If no daemon
+  is listening it starts one detached, handing it the commit as its first job.
+- ``serve`` runs the daemon: an accept thread queues SHAs (dropping duplicates
+  already waiting) and a single worker thread generates entries in order via
+  background_journal_worker.generate_journal_entry_background().
+- The socket lives in the temp directory, named after a hash of the repository
+  path, so each repository has its own daemon.
+- The daemon exits after DEFAULT_IDLE_TIMEOUT seconds without work, so nothing
+  lingers once commits stop.
+
+Protocol: one JSON object per connection, answered with one JSON line.
+    {"commit_hash": "<sha>"}  ->  {"status": "queued", "queue_depth": 1}
+    {"command": "ping"}       ->  {"status": "ok", "queue_depth": 0}
+
+Only this module's top-level imports run in the hook, so they must stay
+standard-library only; heavy imports happen inside the worker.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import queue
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Daemon exits after this many seconds without queued work
+DEFAULT_IDLE_TIMEOUT = 30 * 60
+
+# Seconds the hook waits for the daemon to accept a job before starting a new one
+SUBMIT_TIMEOUT = 2.0
+
+# Largest accepted request, in bytes
+MAX_REQUEST_SIZE = 4096
+
+
+def get_socket_path(repo_path: str) -> str:
+    """
+    Return the daemon socket path for a repository.
+
+    Socket paths are limited to about 100 bytes, so the path is derived from a
+    hash of the resolved repository path instead of living inside the repo.
+    """
+    digest = hashlib.sha1(os.path.realpath(repo_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"mcp-journal-{digest}.sock")
+
+
+def _request(socket_path: str, payload: Dict[str, Any], timeout: float = SUBMIT_TIMEOUT) -> Dict[str, Any]:
+    """Send one request to the daemon and return its decoded reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path)
+        client.sendall(json.dumps(payload).encode('utf-8') + b"\n")
+        client.shutdown(socket.SHUT_WR)
+        reply = b""
+        while not reply.endswith(b"\n"):
+            chunk = client.recv(MAX_REQUEST_SIZE)
+            if not chunk:
+                break
+            reply += chunk
+    return json.loads(reply.decode('utf-8'))
+
+
+def submit_commit(repo_path: str, commit_hash: str, start_daemon: bool = True) -> str:
+    """
+    Queue a commit with the repository's daemon, starting the daemon if needed.
+
+    Args:
+        repo_path: Path to the git repository
+        commit_hash: Commit to generate a journal entry for
+        start_daemon: Start a detached daemon (with this commit queued) when none is running
+
+    Returns:
+        "queued" when a running daemon accepted the commit, "started" when a new
+        daemon was spawned for it, or "unavailable" when neither worked
+    """
+    socket_path = get_socket_path(repo_path)
+    try:
+        reply = _request(socket_path, {'commit_hash': commit_hash})
+        if reply.get('status') == 'queued':
+            return 'queued'
+    except (OSError, ValueError):
+        pass
+
+    if not start_daemon:
+        return 'unavailable'
+
+    try:
+        subprocess.Popen(
+            [sys.executable, '-m', 'mcp_commit_story.journal_daemon', 'serve',
+             '--repo-path', repo_path, '--commit-hash', commit_hash],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            cwd=repo_path,
+            start_new_session=True
+        )
+    except OSError:
+        return 'unavailable'
+    return 'started'
+
+
+class JournalDaemon:
+    """
+    Unix-socket job queue that generates journal entries for submitted commits.
+    """
+
+    def __init__(self, repo_path: str, socket_path: Optional[str] = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """
+        Args:
+            repo_path: Path to the git repository served by this daemon
+            socket_path: Socket to listen on (defaults to get_socket_path(repo_path))
+            idle_timeout: Seconds without work after which serve_forever() returns
+        """
+        self.repo_path = os.path.realpath(repo_path)
+        self.socket_path = socket_path or get_socket_path(repo_path)
+        self.idle_timeout = idle_timeout
+        self.jobs: "queue.Queue[str]" = queue.Queue()
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._last_activity = time.monotonic()
+        self._server: Optional[socket.socket] = None
+
+    def enqueue(self, commit_hash: str) -> int:
+        """Queue a commit unless it is already waiting; returns the queue depth."""
+        with self._pending_lock:
+            self._last_activity = time.monotonic()
+            if commit_hash not in self._pending:
+                self._pending.add(commit_hash)
+                self.jobs.put(commit_hash)
+            return len(self._pending)
+
+    def bind(self) -> bool:
+        """
+        Start listening on the socket.
+
+        Returns:
+            False if another daemon is already serving this repository
+        """
+        if os.path.exists(self.socket_path):
+            try:
+                _request(self.socket_path, {'command': 'ping'}, timeout=0.5)
+                return False
+            except (OSError, ValueError):
+                # Stale socket from a daemon that did not shut down cleanly
+                os.unlink(self.socket_path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o077)  # only the current user may submit jobs
+        try:
+            server.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+        server.listen()
+        server.settimeout(0.5)
+        self._server = server
+        return True
+
+    def _handle_connection(self, connection: socket.socket) -> None:
+        with connection:
+            connection.settimeout(SUBMIT_TIMEOUT)
+            data = b""
+            while len(data) < MAX_REQUEST_SIZE:
+                chunk = connection.recv(MAX_REQUEST_SIZE)
+                if not chunk:
+                    break
+                data += chunk
+                if data.endswith(b"\n"):
+                    break
+            try:
+                request = json.loads(data.decode('utf-8'))
+                if request.get('command') == 'ping':
+                    reply = {'status': 'ok', 'queue_depth': self.queue_depth}
+                elif isinstance(request.get('commit_hash'), str) and request['commit_hash']:
+                    reply = {'status': 'queued', 'queue_depth': self.enqueue(request['commit_hash'])}
+                else:
+                    reply = {'status': 'error', 'error': 'expected commit_hash or command'}
+            except (ValueError, AttributeError) as e:
+                reply = {'status': 'error', 'error': f'invalid request: {e}'}
+            connection.sendall(json.dumps(reply).encode('utf-8') + b"\n")
+
+    @property
+    def queue_depth(self) -> int:
+        with self._pending_lock:
+            return len(self._pending)
+
+    def _accept_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                connection, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                if not self._stop.is_set():
+                    logger.exception("Journal daemon stopped accepting connections")
+                    self._stop.set()
+                return
+            try:
+                self._handle_connection(connection)
+            except OSError as e:
+                logger.warning(f"Journal daemon connection failed: {e}")
+
+    def process(self, commit_hash: str) -> Dict[str, Any]:
+        """Generate the journal entry for one queued commit."""
+        from mcp_commit_story.background_journal_worker import generate_journal_entry_background
+
+        logger.info(f"Journal daemon processing commit {commit_hash[:8]}")
+        return generate_journal_entry_background(commit_hash, self.repo_path)
+
+    def serve_forever(self) -> None:
+        """Accept jobs and process them in order until idle for idle_timeout seconds or stopped."""
+        if self._server is None and not self.bind():
+            logger.info("Journal daemon already running for this repository")
+            return
+
+        accept_thread = threading.Thread(target=self._accept_loop, name="journal-daemon-accept", daemon=True)
+        accept_thread.start()
+        try:
+            while not self._stop.is_set():
+                try:
+                    commit_hash = self.jobs.get(timeout=0.5)
+                except queue.Empty:
+                    with self._pending_lock:
+                        idle = not self._pending and time.monotonic() - self._last_activity > self.idle_timeout
+                    if idle:
+                        logger.info("Journal daemon idle, shutting down")
+                        break
+                    continue
+
+                try:
+                    self.process(commit_hash)
+                except Exception:
+                    # A failed entry must never take the daemon down
+                    logger.exception(f"Journal daemon failed to process commit {commit_hash[:8]}")
+                finally:
+                    with self._pending_lock:
+                        self._pending.discard(commit_hash)
+                        self._last_activity = time.monotonic()
+        finally:
+            self.stop()
+            accept_thread.join(timeout=2)
+
+    def stop(self) -> None:
+        """Stop serving and remove the socket."""
+        self._stop.set()
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+
+
+def main(argv=None) -> int:
+    """Entry point: ``submit`` a commit from the hook, or ``serve`` as the daemon."""
+    parser = argparse.ArgumentParser(description='Journal daemon for fast post-commit hooks')
+    parser.add_argument('action', choices=['submit', 'serve'])
+    parser.add_argument('--repo-path', required=True, help='Path to git repository')
+    parser.add_argument('--commit-hash', help='Commit to generate a journal entry for')
+    parser.add_argument('--idle-timeout', type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help=f'Seconds without work before the daemon exits (default: {DEFAULT_IDLE_TIMEOUT})')
+    args = parser.parse_args(argv)
+
+    if args.action == 'submit':
+        if not args.commit_hash:
+            parser.error('submit requires --commit-hash')
+        return 0 if submit_commit(args.repo_path, args.commit_hash) != 'unavailable' else 1
+
+    from mcp_commit_story.background_journal_worker import setup_background_logging
+    setup_background_logging(args.repo_path)
+    # Daemon progress goes to the same log file as the background worker
+    logger.setLevel(logging.INFO)
+    logger.handlers = logging.getLogger('mcp_commit_story.background_journal_worker').handlers
+
+    daemon = JournalDaemon(args.repo_path, idle_timeout=args.idle_timeout)
+    if not daemon.bind():
+        # Another daemon won the race; hand it our commit instead
+        if args.commit_hash:
+            submit_commit(args.repo_path, args.commit_hash, start_daemon=False)
+        return 0
+    if args.commit_hash:
+        daemon.enqueue(args.commit_hash)
+    logger.info(f"Journal daemon listening on {daemon.socket_path} for {daemon.repo_path}")
+    daemon.serve_forever()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,9 +2,15 @@ import re
 import logging
 import json
 import inspect
-from typing import List, Optional, Dict, Union, Any
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Dict, Union, Any
 from pathlib import Path
 import os
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
 from mcp_commit_story.context_types import ChatHistory, SummarySection, TechnicalSynopsisSection, JournalContext, AccomplishmentsSection, FrustrationsSection, ToneMoodSection, DiscussionNotesSection, CommitMetadataSection
 from .telemetry import (
     trace_mcp_operation, 
@@ -12,6 +18,7 @@ from .telemetry import (
     sanitize_for_telemetry
 )
 from .ai_invocation import invoke_ai
+from .journal_index import record_journal_append
 
 logger = logging.getLogger(__name__)
 
@@ -155,6 +162,53 @@ def _get_size_bucket(size: int) -> str:
         return "xlarge"
 
 
+def _strip_code_fence(response: str) -> str:
+    """Strip a surrounding markdown code block (```json, ```python or bare ```) if present."""
+    if response.startswith('```json') and response.endswith('```'):
+        return response[7:-3].strip()  # Remove ```json and ```
+    elif response.startswith('```python') and response.endswith('```'):
+        return response[9:-3].strip()  # Remove ```python and ```
+    elif response.startswith('```') and response.endswith('```'):
+        return response[3:-3].strip()  # Remove ``` and ```
+    return response
+
+
+def _coerce_field_value(field_value: Any, fallback_value: Any = "", parse_as_list: bool = False) -> Any:
+    """
+    Normalize a JSON field value from an AI response to the shape a section expects.
+    
+    Args:
+        field_value: Value of the expected field in the parsed JSON
+        fallback_value: Section default; a string default means the field should be text
+        parse_as_list: If True, string values are split into a list of lines
+    
+    Returns:
+        Text for string sections (structured dicts are flattened), a list for list sections,
+        otherwise the value unchanged
+    """
+    # If the field value is a dict but we expected a string, convert it
+    if isinstance(field_value, dict) and not parse_as_list and isinstance(fallback_value, str):
+        # Convert dict to string representation
+        if 'description' in field_value:
+            return field_value['description']
+        elif 'text' in field_value:
+            return field_value['text']
+        else:
+            # Convert structured fields into flowing paragraph text
+            return _convert_structured_dict_to_text(field_value)
+    
+    # Special handling for string field values when parse_as_list=True
+    if parse_as_list and isinstance(field_value, str):
+        # Handle special case where AI returns '[]' to indicate no items
+        if field_value == '[]':
+            return []
+        # Split by newlines, strip, and filter empty lines
+        lines = field_value.split('\n')
+        return [line.strip() for line in lines if line.strip()]
+    
+    return field_value
+
+
 def _parse_ai_response(response: str, expected_field: str, fallback_value: Any = "", parse_as_list: bool = False) -> Any:
     """
     Parse AI response that could be JSON or plain text.
@@ -172,43 +226,14 @@ def _parse_ai_response(response: str, expected_field: str, fallback_value: Any =
     if not response or not response.strip():
         return fallback_value
     
-    response = response.strip()
-    
-    # Strip markdown code blocks if present
-    if response.startswith('```json') and response.endswith('```'):
-        response = response[7:-3].strip()  # Remove ```json and ```
-    elif response.startswith('```python') and response.endswith('```'):
-        response = response[9:-3].strip()  # Remove ```python and ```
-    elif response.startswith('```') and response.endswith('```'):
-        response = response[3:-3].strip()  # Remove ``` and ```
+    response = _strip_code_fence(response.strip())
     
     # Try to parse as JSON first
     try:
         parsed_json = json.loads(response)
         if isinstance(parsed_json, dict):
             if expected_field in parsed_json:
-                field_value = parsed_json[expected_field]
-                # If the field value is a dict but we expected a string, convert it
-                if isinstance(field_value, dict) and not parse_as_list and isinstance(fallback_value, str):
-                    # Convert dict to string representation
-                    if 'description' in field_value:
-                        return field_value['description']
-                    elif 'text' in field_value:
-                        return field_value['text']
-                    else:
-                        # Convert structured fields into flowing paragraph text
-                        return _convert_structured_dict_to_text(field_value)
-                
-                # Special handling for string field values when parse_as_list=True
-                if parse_as_list and isinstance(field_value, str):
-                    # Handle special case where AI returns '[]' to indicate no items
-                    if field_value == '[]':
-                        return []
-                    # Split by newlines, strip, and filter empty lines
-                    lines = field_value.split('\n')
-                    return [line.strip() for line in lines if line.strip()]
-                
-                return field_value
+                return _coerce_field_value(parsed_json[expected_field], fallback_value, parse_as_list)
             else:
                 # Valid JSON but missing expected field
                 # Check if this is a recognizable structure that can be converted to text
@@ -591,7 +616,96 @@ class JournalEntry:
             
             raise
 
+# Precompiled patterns for JournalParser
+# Entry header: "### 2:30 PM — Commit abc123"
+_ENTRY_HEADER_PATTERN = re.compile(r"###\s+(.*?) — Commit ([a-zA-Z0-9]+)")
+# Entry header at the start of a line, used to split a file into entries
+_ENTRY_START_PATTERN = re.compile(r"^###\s+(.*?) — Commit ([a-zA-Z0-9]+)", re.MULTILINE)
+# Section header: "#### Summary"
+_SECTION_HEADER_PATTERN = re.compile(r"^#### ([^\n]*)\n", re.MULTILINE)
+# Speaker-attributed discussion note: "> **Human:** text"
+_SPEAKER_NOTE_PATTERN = re.compile(r'> \*\*(.+?):\*\* (.+)')
+
+
+def _split_sections(md: str) -> Dict[str, str]:
+    """
+    Split an entry into its H4 (####) sections in one pass.
+    
+    Each section runs from its header line to the next H4 header or the end of
+    the text. If a header appears more than once, the first occurrence wins.
+    """
+    headers = list(_SECTION_HEADER_PATTERN.finditer(md))
+    sections: Dict[str, str] = {}
+    for position, match in enumerate(headers):
+        end = headers[position + 1].start() if position + 1 < len(headers) else len(md)
+        sections.setdefault(match.group(1), md[match.end():end].strip())
+    return sections
+
+
+def _parse_discussion_lines(section: str) -> List[Union[str, Dict[str, str]]]:
+    notes: List[Union[str, Dict[str, str]]] = []
+    for l in section.splitlines():
+        l = l.strip()
+        if l.startswith('> **'):
+            # Speaker-attributed
+            m = _SPEAKER_NOTE_PATTERN.match(l)
+            if m:
+                notes.append({"speaker": m.group(1), "text": m.group(2)})
+        elif l.startswith('> '):
+            notes.append(l[2:])
+    return notes
+
+
 class JournalParser:
+    @staticmethod
+    def _parse_entry(md: str) -> Optional['JournalEntry']:
+        """
+        Build a JournalEntry from one entry's markdown, without telemetry.
+        
+        Returns:
+            JournalEntry, or None if the text has no "### <time> — Commit <hash>" header
+        """
+        timestamp_commit = _ENTRY_HEADER_PATTERN.search(md)
+        if not timestamp_commit:
+            return None
+        
+        sections = _split_sections(md)
+        
+        # Accomplishments / Frustrations
+        accomplishments = [line[2:].strip() for line in sections.get("Accomplishments", '').splitlines() if line.startswith('- ')]
+        frustrations = [line[2:].strip() for line in sections.get("Frustrations or Roadblocks", '').splitlines() if line.startswith('- ')]
+        
+        # Tone/Mood
+        tone_mood = None
+        tm_section = sections.get("Tone/Mood", '')
+        if tm_section:
+            tm_lines = [l.strip('> ').strip() for l in tm_section.splitlines() if l.strip().startswith('>')]
+            mood = tm_lines[0] if len(tm_lines) >= 1 else ''
+            indicators = tm_lines[1] if len(tm_lines) >= 2 else ''
+            if mood or indicators:
+                tone_mood = {"mood": mood, "indicators": indicators}
+        
+        # Commit Metadata
+        commit_metadata = {}
+        for l in sections.get("Commit Metadata", '').splitlines():
+            l = l.strip()
+            if l.startswith('- **') and ':** ' in l:
+                k, v = l[4:].split(':** ', 1)
+                commit_metadata[k.strip()] = v.strip()
+        
+        return JournalEntry(
+            timestamp=timestamp_commit.group(1),
+            commit_hash=timestamp_commit.group(2),
+            summary=sections.get("Summary", ''),
+            technical_synopsis=sections.get("Technical Synopsis", ''),
+            accomplishments=accomplishments,
+            frustrations=frustrations,
+            discussion_notes=_parse_discussion_lines(sections.get("Discussion Notes (from chat)", '')),
+            discussion_notes_simple=_parse_discussion_lines(sections.get("Discussion Notes (Simple Version)", '')),
+            tone_mood=tone_mood,
+            commit_metadata=commit_metadata,
+        )
+    
     @staticmethod
     @trace_mcp_operation("journal.parse_entry", attributes={"operation_type": "file_read", "file_type": "markdown"})
     def parse(md):
@@ -624,103 +738,13 @@ class JournalParser:
                     current_span.set_attribute("error.category", "empty_content")
                 raise JournalParseError('Empty entry')
             
-            # Parse H4 (####) headers for all sections
-            def extract_section(header):
-                escaped_header = re.escape(header)
-                pattern = rf"#### {escaped_header}\n(.+?)(?=\n#### |\Z)"
-                m = re.search(pattern, md, re.DOTALL)
-                return m.group(1).strip() if m else ''
-            
-            timestamp_commit = re.search(r"###\s+(.*?) — Commit ([a-zA-Z0-9]+)", md)
-            if timestamp_commit:
-                timestamp = timestamp_commit.group(1)
-                commit_hash = timestamp_commit.group(2)
-                
+            entry = JournalParser._parse_entry(md)
+            if entry is not None:
                 # Add parsed commit info to span
                 if current_span:
-                    current_span.set_attribute("journal.entry_id", commit_hash)
-                    current_span.set_attribute("journal.timestamp", timestamp)
-                
-                summary = extract_section("Summary")
-                technical_synopsis = extract_section("Technical Synopsis")
-                
-                # Accomplishments
-                accomplishments = []
-                acc_section = extract_section("Accomplishments")
-                if acc_section:
-                    accomplishments = [line[2:].strip() for line in acc_section.splitlines() if line.startswith('- ')]
-                
-                # Frustrations
-                frustrations = []
-                frus_section = extract_section("Frustrations or Roadblocks")
-                if frus_section:
-                    frustrations = [line[2:].strip() for line in frus_section.splitlines() if line.startswith('- ')]
-                
-                # Tone/Mood
-                tone_mood = None
-                tm_section = extract_section("Tone/Mood")
-                if tm_section:
-                    tm_lines = [l.strip('> ').strip() for l in tm_section.splitlines() if l.strip().startswith('>')]
-                    mood = tm_lines[0] if len(tm_lines) >= 1 else ''
-                    indicators = tm_lines[1] if len(tm_lines) >= 2 else ''
-                    if mood or indicators:
-                        tone_mood = {"mood": mood, "indicators": indicators}
-                    else:
-                        tone_mood = None
-                
-                # Discussion Notes
-                discussion_notes = []
-                dn_section = extract_section("Discussion Notes (from chat)")
-                if dn_section:
-                    for l in dn_section.splitlines():
-                        l = l.strip()
-                        if l.startswith('> **'):
-                            # Speaker-attributed
-                            m = re.match(r'> \*\*(.+?):\*\* (.+)', l)
-                            if m:
-                                discussion_notes.append({"speaker": m.group(1), "text": m.group(2)})
-                        elif l.startswith('> '):
-                            discussion_notes.append(l[2:])
-                
-                # Discussion Notes (Simple Version)
-                discussion_notes_simple = []
-                sn_section = extract_section("Discussion Notes (Simple Version)")
-                if sn_section:
-                    for l in sn_section.splitlines():
-                        l = l.strip()
-                        if l.startswith('> **'):
-                            # Speaker-attributed
-                            m = re.match(r'> \*\*(.+?):\*\* (.+)', l)
-                            if m:
-                                discussion_notes_simple.append({"speaker": m.group(1), "text": m.group(2)})
-                        elif l.startswith('> '):
-                            discussion_notes_simple.append(l[2:])
-                
-                # Commit Metadata
-                commit_metadata = {}
-                cm_section = extract_section("Commit Metadata")
-                if cm_section:
-                    for l in cm_section.splitlines():
-                        l = l.strip()
-                        if l.startswith('- **') and ':** ' in l:
-                            k, v = l[4:].split(':** ', 1)
-                            commit_metadata[k.strip()] = v.strip()
-                
-                # Count parsed sections for metrics
-                section_count = sum([
-                    1 if summary else 0,
-                    1 if technical_synopsis else 0,
-                    1 if accomplishments else 0,
-                    1 if frustrations else 0,
-                    1 if tone_mood else 0,
-                    1 if discussion_notes else 0,
-                    1 if discussion_notes_simple else 0,
-
-                    1 if commit_metadata else 0
-                ])
-                
-                if current_span:
-                    current_span.set_attribute("journal.sections_parsed", section_count)
+                    current_span.set_attribute("journal.entry_id", entry.commit_hash)
+                    current_span.set_attribute("journal.timestamp", entry.timestamp)
+                    current_span.set_attribute("journal.sections_parsed", _count_parsed_sections(entry))
                 
                 # Record successful parsing metrics
                 duration = time.time() - start_time
@@ -738,24 +762,12 @@ class JournalParser:
                         operation_type="parse"
                     )
                 
-                return JournalEntry(
-                    timestamp=timestamp,
-                    commit_hash=commit_hash,
-                    summary=summary,
-                    technical_synopsis=technical_synopsis,
-                    accomplishments=accomplishments,
-                    frustrations=frustrations,
-                    discussion_notes=discussion_notes,
-                    discussion_notes_simple=discussion_notes_simple,
-                    tone_mood=tone_mood,
-                    commit_metadata=commit_metadata,
-                )
+                return entry
             
             # Failed to parse - invalid format
             if current_span:
                 current_span.set_attribute("error.category", "invalid_format")
             
-            duration = time.time() - start_time
             metrics = get_mcp_metrics()
             if metrics:
                 metrics.record_tool_call(
@@ -771,7 +783,6 @@ class JournalParser:
             raise
         except Exception as e:
             # Record unexpected error metrics
-            duration = time.time() - start_time
             metrics = get_mcp_metrics()
             if metrics:
                 metrics.record_tool_call(
@@ -784,6 +795,76 @@ class JournalParser:
                 current_span.set_attribute("error.category", "parse_exception")
             
             raise JournalParseError(f'Parse error: {e}')
+    
+    @staticmethod
+    def parse_entries(md):
+        """
+        Lazily parse every journal entry in a daily journal file's content.
+        
+        The content is walked once: entries are delimited by their
+        "### <time> — Commit <hash>" header lines and each is parsed as it is
+        yielded. Text before the first entry is ignored, and an entry that
+        cannot be parsed is skipped with a warning.
+        
+        Telemetry is aggregated: one duration and one operation count are
+        recorded when the iteration finishes, instead of a span and two
+        metrics per entry as with parse().
+        
+        Args:
+            md: Markdown content of a journal file (or part of one)
+            
+        Yields:
+            JournalEntry: Parsed entries in file order
+        """
+        import time
+        
+        start_time = time.time()
+        parsed = failed = 0
+        headers = list(_ENTRY_START_PATTERN.finditer(md or ''))
+        try:
+            for position, match in enumerate(headers):
+                end = headers[position + 1].start() if position + 1 < len(headers) else len(md)
+                try:
+                    entry = JournalParser._parse_entry(md[match.start():end])
+                except Exception as e:
+                    logger.warning(f"Failed to parse journal entry for commit {match.group(2)}: {e}")
+                    failed += 1
+                    continue
+                parsed += 1
+                yield entry
+        finally:
+            metrics = get_mcp_metrics()
+            if metrics:
+                metrics.record_operation_duration(
+                    "journal.parse_duration_seconds",
+                    time.time() - start_time,
+                    operation_type="parse_batch",
+                    file_type="markdown"
+                )
+                metrics.record_counter(
+                    "journal.entries_parsed_total",
+                    value=parsed,
+                    attributes={"operation_type": "parse_batch"}
+                )
+                if failed:
+                    metrics.record_counter(
+                        "journal.entry_parse_failures_total",
+                        value=failed,
+                        attributes={"operation_type": "parse_batch"}
+                    )
+
+
+def _count_parsed_sections(entry: 'JournalEntry') -> int:
+    return sum(1 for value in (
+        entry.summary,
+        entry.technical_synopsis,
+        entry.accomplishments,
+        entry.frustrations,
+        entry.tone_mood,
+        entry.discussion_notes,
+        entry.discussion_notes_simple,
+        entry.commit_metadata,
+    ) if value)
 
 @trace_mcp_operation("journal.get_file_path", attributes={"operation_type": "file_path_generation"})
 def get_journal_file_path(date: str, entry_type: str) -> str:
@@ -883,8 +964,29 @@ def get_journal_file_path(date: str, entry_type: str) -> str:
         
         raise
 
-@trace_mcp_operation("journal.append_file", attributes={"operation_type": "file_write", "file_type": "markdown"})
-def append_to_journal_file(text, file_path):
+@contextmanager
+def locked_journal_file(file_path) -> Iterator[Any]:
+    """
+    Open a journal file for appending while holding an exclusive advisory lock.
+    
+    The file is opened unbuffered with O_APPEND, so each write() is a single
+    system call that lands at the current end of the file. The flock is held
+    until the file is closed, so appends from concurrent background workers and
+    MCP tools (reflections, context captures) never interleave.
+    
+    Args:
+        file_path: Journal file to open; created if missing
+    
+    Yields:
+        The open binary file object
+    """
+    with open(file_path, "ab", buffering=0) as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        yield f
+
+
+def append_to_journal_file(text, file_path, header=None):
     """
     Append a text entry to the specified journal file, creating parent directories as needed (on-demand pattern).
     This function implements the on-demand pattern for directory creation: parent directories are created only when needed, not upfront.
@@ -892,6 +994,26 @@ def append_to_journal_file(text, file_path):
     Args:
         text (str): The text to append
         file_path (str or Path): The file to append to
+        header (str, optional): Written before the entry if the file is empty (e.g. a daily file title)
+    """
+    append_entries_to_journal_file([text], file_path, header=header)
+
+
+@trace_mcp_operation("journal.append_file", attributes={"operation_type": "file_write", "file_type": "markdown"})
+def append_entries_to_journal_file(entries, file_path, header=None):
+    """
+    Append several entries to a journal file under a single lock acquisition.
+    
+    Entries are separated by horizontal rules exactly as consecutive
+    append_to_journal_file() calls would separate them, and are written with one
+    write() while the file is locked (see locked_journal_file()). Whether the
+    file is empty, and so whether the header and the leading rule are written,
+    is decided under the lock, so concurrent writers cannot both create the file.
+    Raises ValueError if file cannot be written due to permissions.
+    Args:
+        entries (list of str): The texts to append, in order
+        file_path (str or Path): The file to append to
+        header (str, optional): Written before the first entry if the file is empty
     """
     import time
     from opentelemetry import trace
@@ -904,7 +1026,8 @@ def append_to_journal_file(text, file_path):
     if current_span:
         current_span.set_attribute("file.path", str(file_path.name))  # Only filename for privacy
         current_span.set_attribute("file.extension", file_path.suffix)
-        current_span.set_attribute("journal.content_length", len(text))
+        current_span.set_attribute("journal.content_length", sum(len(text) for text in entries))
+        current_span.set_attribute("journal.entries_appended", len(entries))
     
     try:
         ensure_journal_directory(file_path)
@@ -913,13 +1036,26 @@ def append_to_journal_file(text, file_path):
             current_span.set_attribute("error.category", "permission_denied_directory")
         raise ValueError(f"Permission denied (directory): {e}")
     
-    add_rule = file_path.exists() and file_path.stat().st_size > 0
-    
     try:
-        with open(file_path, "a") as f:
-            if add_rule:
-                f.write("\n---\n")
-            f.write(text)
+        with locked_journal_file(file_path) as f:
+            previous_stat = os.fstat(f.fileno())
+            is_empty = previous_stat.st_size == 0
+            
+            parts = [header] if is_empty and header else []
+            for position, text in enumerate(entries):
+                if position > 0 or not is_empty:
+                    parts.append("\n---\n")
+                parts.append(text)
+            payload = "".join(parts).encode("utf-8")
+            
+            # One write for the whole batch; loop only in case the write is short
+            remaining = memoryview(payload)
+            while remaining:
+                remaining = remaining[f.write(remaining):]
+            
+            # Keep the section index in step without rescanning the file
+            record_journal_append(file_path, None if is_empty else previous_stat, payload)
+            file_size = os.fstat(f.fileno()).st_size
         
         # Record file operation metrics
         duration = time.time() - start_time
@@ -932,14 +1068,8 @@ def append_to_journal_file(text, file_path):
                 file_type="markdown"
             )
             
-            # Record file size if we can get it
-            try:
-                file_size = file_path.stat().st_size
-                if current_span:
-                    current_span.set_attribute("file.size_bytes", file_size)
-                # We could add a histogram for file sizes here if needed
-            except Exception:
-                pass  # Don't fail on metrics collection
+            if current_span:
+                current_span.set_attribute("file.size_bytes", file_size)
                 
             # Record success counter
             metrics.record_tool_call(
@@ -1320,6 +1450,27 @@ def generate_technical_synopsis_section(journal_context: JournalContext) -> Tech
             # If even fallback fails, return empty
             return TechnicalSynopsisSection(technical_synopsis="")
 
+
+def _git_fallback_accomplishments(journal_context) -> List[str]:
+    """Build accomplishments from the commit message and changed files when the AI returned none."""
+    accomplishments = []
+    git_context = journal_context.get('git') if journal_context else None
+    if git_context:
+        commit_message = git_context.get('metadata', {}).get('message', 'Unknown') if git_context.get('metadata') else 'Unknown'
+        changed_files = git_context.get('changed_files', [])
+        
+        # Generate fallback accomplishments if we have meaningful context
+        if commit_message and commit_message != 'Unknown' and commit_message.strip():
+            accomplishments.append(f"Completed: {commit_message.strip()}")
+        
+        if changed_files:
+            if len(changed_files) == 1:
+                accomplishments.append(f"Modified {changed_files[0]}")
+            else:
+                accomplishments.append(f"Successfully updated {len(changed_files)} files")
+    return accomplishments
+
+
 # Section Generator: Accomplishments
 # Purpose: Extracts and summarizes what was successfully completed or achieved in the commit, focusing on developer satisfaction and explicit evidence from chat and git context.
 # Assumptions: Only includes accomplishments with clear evidence; does not infer or speculate. Returns an empty list if nothing is found.
@@ -1468,21 +1619,8 @@ def generate_accomplishments_section(journal_context: JournalContext) -> Accompl
         accomplishments = _parse_ai_response(response, "accomplishments", [], parse_as_list=True)
         
         # If AI returns empty but we have meaningful git context, use fallback
-        if not accomplishments and journal_context:
-            git_context = journal_context.get('git')
-            if git_context:
-                commit_message = git_context.get('metadata', {}).get('message', 'Unknown') if git_context.get('metadata') else 'Unknown'
-                changed_files = git_context.get('changed_files', [])
-                
-                # Generate fallback accomplishments if we have meaningful context
-                if commit_message and commit_message != 'Unknown' and commit_message.strip():
-                    accomplishments.append(f"Completed: {commit_message.strip()}")
-                
-                if changed_files:
-                    if len(changed_files) == 1:
-                        accomplishments.append(f"Modified {changed_files[0]}")
-                    else:
-                        accomplishments.append(f"Successfully updated {len(changed_files)} files")
+        if not accomplishments:
+            accomplishments = _git_fallback_accomplishments(journal_context)
         
         result = AccomplishmentsSection(accomplishments=accomplishments)
         
@@ -2181,6 +2319,153 @@ def generate_commit_metadata_section(journal_context: JournalContext) -> CommitM
         _record_ai_generation_metrics("commit_metadata", duration, False, "ai_generation_failed")
         raise
 
+# Combined Section Generation
+# Purpose: Generates every AI-driven section from a single AI call instead of one call per section.
+# The JournalContext is serialized and sent once; each section's own docstring prompt is embedded under
+# its JSON key. Sections missing from (or malformed in) the response are left out so callers can fall
+# back to the individual generators for just those sections.
+COMBINED_SECTIONS = (
+    'summary',
+    'technical_synopsis',
+    'accomplishments',
+    'frustrations',
+    'tone_mood',
+    'discussion_notes',
+    'discussion_notes_simple',
+)
+
+
+def _combined_section_generators() -> Dict[str, Any]:
+    """Map each combined section key to the generator whose docstring holds its prompt."""
+    return {
+        'summary': generate_summary_section,
+        'technical_synopsis': generate_technical_synopsis_section,
+        'accomplishments': generate_accomplishments_section,
+        'frustrations': generate_frustrations_section,
+        'tone_mood': generate_tone_mood_section,
+        'discussion_notes': generate_discussion_notes_section,
+        'discussion_notes_simple': generate_discussion_notes_section_simple,
+    }
+
+
+def _build_combined_prompt(journal_context: JournalContext) -> str:
+    """Build one prompt containing every section's instructions followed by the context, serialized once."""
+    generators = _combined_section_generators()
+    parts = [
+        "You are generating several sections of one development journal entry in a single response.\n"
+        "Each section's complete instructions follow under its own heading. Apply each section's rules only to that section.\n\n"
+        "Return ONLY a JSON object with exactly these keys:\n"
+        '- "summary": string\n'
+        '- "technical_synopsis": string\n'
+        '- "accomplishments": list of strings\n'
+        '- "frustrations": list of strings\n'
+        '- "tone_mood": object with "mood" and "indicators" strings (both empty strings if there is no clear evidence)\n'
+        '- "discussion_notes": list of strings or {"speaker": ..., "text": ...} objects\n'
+        '- "discussion_notes_simple": list of strings or {"speaker": ..., "text": ...} objects\n'
+        "Use an empty string or empty list for a section with no supported content."
+    ]
+    for section_name in COMBINED_SECTIONS:
+        prompt = inspect.getdoc(generators[section_name]) or ""
+        parts.append(f"=== SECTION: {section_name} ===\n{prompt}")
+    
+    context_json = json.dumps(journal_context, indent=2, default=str)
+    parts.append(f"The journal_context object has the following structure:\n{context_json}")
+    return "\n\n".join(parts)
+
+
+def _parse_combined_section(section_name: str, value: Any, journal_context: JournalContext) -> Optional[Dict[str, Any]]:
+    """
+    Convert one key of the combined response into its section TypedDict.
+    
+    Returns:
+        The section TypedDict, or None if the value does not have the expected shape.
+    """
+    if section_name == 'summary':
+        summary = _coerce_field_value(value, "")
+        return SummarySection(summary=summary) if isinstance(summary, str) else None
+    elif section_name == 'technical_synopsis':
+        synopsis = _coerce_field_value(value, "")
+        return TechnicalSynopsisSection(technical_synopsis=synopsis) if isinstance(synopsis, str) else None
+    elif section_name == 'tone_mood':
+        if not isinstance(value, dict):
+            return None
+        return ToneMoodSection(mood=value.get("mood", ""), indicators=value.get("indicators", ""))
+    
+    items = _coerce_field_value(value, [], parse_as_list=True)
+    if not isinstance(items, list):
+        return None
+    if section_name == 'accomplishments':
+        # Same git-based fallback the individual generator applies to an empty AI answer
+        return AccomplishmentsSection(accomplishments=items or _git_fallback_accomplishments(journal_context))
+    elif section_name == 'frustrations':
+        return FrustrationsSection(frustrations=items)
+    elif section_name in ('discussion_notes', 'discussion_notes_simple'):
+        return DiscussionNotesSection(discussion_notes=items)
+    return None
+
+
+@trace_mcp_operation("journal.generate_combined_sections", attributes={"operation_type": "ai_generation", "section_type": "combined"})
+def generate_combined_sections(journal_context: JournalContext) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate all AI-driven journal sections with a single AI call.
+    
+    Sends the JournalContext once and asks for a JSON object keyed by section
+    name (see COMBINED_SECTIONS), then fans the response out into the same
+    TypedDicts the individual generators return. commit_metadata is
+    programmatic and is not included.
+    
+    Args:
+        journal_context: JournalContext containing git metadata, chat history, and previous entries
+    
+    Returns:
+        Dict mapping section name to its section TypedDict. Sections that are
+        missing or malformed in the response are omitted (an unusable response
+        yields an empty dict), so callers can generate just those individually.
+    """
+    import time
+    
+    start_time = time.time()
+    _add_ai_generation_telemetry("combined", journal_context, start_time)
+    
+    if journal_context is None:
+        return {}
+    if journal_context.get('git') is None and journal_context.get('chat') is None:
+        return {}
+    
+    try:
+        response = invoke_ai(_build_combined_prompt(journal_context), {})
+        parsed_json = json.loads(_strip_code_fence((response or "").strip()))
+    except (json.JSONDecodeError, TypeError) as e:
+        logger.warning(f"Combined section response could not be parsed, falling back to individual sections: {e}")
+        _record_ai_generation_metrics("combined", time.time() - start_time, False, "response_parse_failed")
+        return {}
+    except Exception as e:
+        logger.warning(f"Combined section generation failed, falling back to individual sections: {e}")
+        _record_ai_generation_metrics("combined", time.time() - start_time, False, "ai_generation_failed")
+        return {}
+    
+    if not isinstance(parsed_json, dict):
+        _record_ai_generation_metrics("combined", time.time() - start_time, False, "response_parse_failed")
+        return {}
+    
+    sections = {}
+    for section_name in COMBINED_SECTIONS:
+        if section_name not in parsed_json:
+            continue
+        try:
+            section = _parse_combined_section(section_name, parsed_json[section_name], journal_context)
+        except Exception as e:
+            logger.debug(f"Could not parse combined {section_name} section: {e}")
+            section = None
+        if section is not None:
+            sections[section_name] = section
+        else:
+            logger.debug(f"Combined response has malformed {section_name} section")
+    
+    _record_ai_generation_metrics("combined", time.time() - start_time, True)
+    return sections
+
+
 @trace_mcp_operation("journal.ensure_directory", attributes={"operation_type": "directory_creation"})
 def ensure_journal_directory(file_path):
     """
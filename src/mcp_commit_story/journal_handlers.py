@@ -6,6 +6,7 @@ manually added to journal entries. It supports both targeted context capture
 and context across AI sessions.
 """
 
+import asyncio
 import time
 from datetime import datetime
 from pathlib import Path
@@ -14,7 +15,7 @@ from typing import Dict, Any, Optional
 from .journal_generate import get_journal_file_path, append_to_journal_file
 from .config import load_config
 from .telemetry import trace_mcp_operation, get_mcp_metrics
-from .ai_invocation import invoke_ai
+from .ai_invocation import invoke_ai, ainvoke_ai
 
 
 def _categorize_capture_context_error(error: Exception) -> str:
@@ -102,6 +103,11 @@ def format_ai_context_capture(context_text: str) -> str:
     return f"\n\n### {timestamp} — AI Context Capture\n\n{context_text}"
 
 
+AI_CONTEXT_DUMP_PROMPT = """Provide a comprehensive context capture of your current understanding of this project, recent development insights, and key context that would help a fresh AI understand where we are and how we got here. Focus on context that shows what's been learned, what patterns have emerged, and what the current state and direction of the project is."""
+
+AI_CONTEXT_DUMP_TIMEOUT = 120.0  # seconds, deadline for the async dump including retries
+
+
 def generate_ai_context_dump() -> str:
     """
     Generate a comprehensive AI context dump using the approved prompt.
@@ -112,59 +118,61 @@ def generate_ai_context_dump() -> str:
     Raises:
         Exception: If AI generation fails
     """
-    approved_prompt = """Provide a comprehensive context capture of your current understanding of this project, recent development insights, and key context that would help a fresh AI understand where we are and how we got here. Focus on context that shows what's been learned, what patterns have emerged, and what the current state and direction of the project is."""
+    try:
+        return invoke_ai(AI_CONTEXT_DUMP_PROMPT, {})
+    except Exception as e:
+        # Return fallback message on AI failure
+        return f"Unable to generate AI context dump due to error: {str(e)}"
+
+
+async def agenerate_ai_context_dump(timeout: Optional[float] = AI_CONTEXT_DUMP_TIMEOUT) -> str:
+    """
+    Async counterpart of generate_ai_context_dump that does not block the event loop.
     
+    Args:
+        timeout: Overall deadline in seconds for the AI call, including retries
+        
+    Returns:
+        Generated AI context content string, or a fallback message on failure
+    """
     try:
-        return invoke_ai(approved_prompt, {})
+        return await ainvoke_ai(AI_CONTEXT_DUMP_PROMPT, {}, timeout=timeout)
     except Exception as e:
         # Return fallback message on AI failure
         return f"Unable to generate AI context dump due to error: {str(e)}"
 
 
-@trace_mcp_operation("capture_context.handle_journal", attributes={
-    "operation_type": "manual_input",
-    "content_type": "ai_context"
-})
-def handle_journal_capture_context(text: Optional[str] = None) -> Dict[str, Any]:
+def _empty_text_error() -> Dict[str, Any]:
+    return {
+        "status": "error", 
+        "file_path": None,
+        "error": "Text parameter cannot be empty"
+    }
+
+
+def _set_capture_mode(text: Optional[str]) -> None:
+    """Record whether this capture is an AI dump or user-provided text on the current span."""
+    from opentelemetry import trace
+    current_span = trace.get_current_span()
+    if current_span:
+        current_span.set_attribute("capture_context.mode", "ai_dump" if text is None else "user_text")
+
+
+def _append_context_capture(text: str, start_time: float) -> Dict[str, Any]:
     """
-    Handle AI context capture requests, supporting both manual capture 
-    and automated AI context dumping. Uses the unified journal header format 
-    and proper file path resolution.
+    Append resolved context text to today's journal file and record metrics.
     
     Args:
-        text: Optional text to capture. If None, generates AI context dump
+        text: The context text to capture
+        start_time: When the capture request started (for duration metrics)
         
     Returns:
         Dict with status, error (if any), and file_path
-        
-    Format:
-        \\n\\n### H:MM AM/PM — AI Context Capture\\n\\n[text]
     """
-    start_time = time.time()
-    
     try:
-        # Add span attributes for telemetry
+        # Add content attributes to span
         from opentelemetry import trace
         current_span = trace.get_current_span()
-        if current_span:
-            current_span.set_attribute("capture_context.mode", "ai_dump" if text is None else "user_text")
-        
-        # Handle dual-mode operation
-        if text is None:
-            # No text provided - generate AI context dump
-            text = generate_ai_context_dump()
-            mode = "ai_dump"
-        elif not text.strip():
-            # Empty text parameter
-            return {
-                "status": "error", 
-                "file_path": None,
-                "error": "Text parameter cannot be empty"
-            }
-        else:
-            mode = "user_text"
-        
-        # Add content attributes to span
         if current_span:
             current_span.set_attribute("capture_context.content_length", len(text))
         
@@ -224,4 +232,69 @@ def handle_journal_capture_context(text: Optional[str] = None) -> Dict[str, Any]
             "status": "error",
             "file_path": None,
             "error": str(e)
-        } 
\ No newline at end of file
+        }
+
+
+@trace_mcp_operation("capture_context.handle_journal", attributes={
+    "operation_type": "manual_input",
+    "content_type": "ai_context"
+})
+def handle_journal_capture_context(text: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Handle AI context capture requests, supporting both manual capture 
+    and automated AI context dumping. Uses the unified journal header format 
+    and proper file path resolution.
+    
+    Args:
+        text: Optional text to capture. If None, generates AI context dump
+        
+    Returns:
+        Dict with status, error (if any), and file_path
+        
+    Format:
+        \\n\\n### H:MM AM/PM — AI Context Capture\\n\\n[text]
+    """
+    start_time = time.time()
+    _set_capture_mode(text)
+    
+    # Handle dual-mode operation
+    if text is None:
+        # No text provided - generate AI context dump
+        text = generate_ai_context_dump()
+    elif not text.strip():
+        return _empty_text_error()
+    
+    return _append_context_capture(text, start_time)
+
+
+@trace_mcp_operation("capture_context.handle_journal_async", attributes={
+    "operation_type": "manual_input",
+    "content_type": "ai_context"
+})
+async def ahandle_journal_capture_context(
+    text: Optional[str] = None,
+    timeout: Optional[float] = AI_CONTEXT_DUMP_TIMEOUT
+) -> Dict[str, Any]:
+    """
+    Async counterpart of handle_journal_capture_context for MCP handlers.
+    
+    The AI context dump awaits ainvoke_ai so the event loop keeps serving other
+    requests while the model responds; the journal write runs in a worker thread.
+    
+    Args:
+        text: Optional text to capture. If None, generates AI context dump
+        timeout: Overall deadline in seconds for the AI context dump
+        
+    Returns:
+        Dict with status, error (if any), and file_path
+    """
+    start_time = time.time()
+    _set_capture_mode(text)
+    
+    if text is None:
+        text = await agenerate_ai_context_dump(timeout)
+    elif not text.strip():
+        return _empty_text_error()
+    
+    # asyncio.to_thread copies the current context, so the span is still active there
+    return await asyncio.to_thread(_append_context_capture, text, start_time)
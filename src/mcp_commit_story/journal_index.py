@@ -0,0 +1,387 @@
+"""
+Sidecar index of journal sections for direct lookups by date, commit and kind.
+
+Readers such as collect_recent_journal_context(), get_previous_journal_entry()
+and load_journal_entries_for_date() used to read and regex-scan whole daily
+journal files to find entry boundaries. On long-lived journals this meant
+re-parsing the same files on every commit. The index records where each
+section of a daily file starts and ends, so readers can seek straight to the
+bytes they need.
+
+Storage:
+    A sidecar SQLite file under the journal directory
+    (``<journal>/.cache/journal_index.db``). The ``.cache`` directory gets its
+    own ``.gitignore`` so the index is never committed with the journal.
+
+Sections:
+    Each ``##``/``###`` header of the form ``<time> — <title>`` (the time may
+    include a date, the dash may be ``—`` or ``-``) starts a section, which runs
+    until the next such header or the end of the file. Sections are classified
+    as 'entry' (``Commit <hash>`` or ``Git Commit: <hash>``), 'capture'
+    (AI Context Capture), 'reflection' or 'other'.
+
+Design Choices:
+- Index rows are valid only for the exact size and mtime of the file they
+  were built from; any other change to the file triggers a rescan, so edits
+  made outside append_to_journal_file() are picked up.
+- append_to_journal_file() extends the index incrementally by scanning only
+  the bytes it appended, without re-reading the file.
+- Readers that only need the end of a file (the latest entry and what
+  follows it) use get_trailing_sections(), which reads backwards in blocks
+  when the index is not current instead of rescanning the whole file.
+- Only files in a ``daily`` directory are indexed. For other files, and
+  whenever the index cannot be used, sections are computed by scanning the
+  file in memory, so readers always have one code path.
+- The index database is a journal_cache.SQLiteSidecar. Once it proves
+  unusable it stays disabled for the process and readers take the in-memory
+  scan path described above; writes to the journal itself are unaffected.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from .journal_cache import SQLiteSidecar, get_journal_cache_dir
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_INDEX_FILENAME = "journal_index.db"
+
+# Bump when section detection changes to force a rescan of every file
+JOURNAL_INDEX_SCHEMA_VERSION = 1
+
+# Block size for reading a journal file backwards from its end
+TAIL_READ_BLOCK_SIZE = 64 * 1024
+
+# Section header: "### 2:30 PM — Commit abc", "## 14:30 - Reflection", "### 2025-07-04 10:00 — ..."
+_SECTION_HEADER_PATTERN = re.compile(
+    r'^#{2,3} +\d[^\n]*? +(?:—|-) +([^\n]*)'.encode('utf-8'), re.MULTILINE
+)
+_COMMIT_TITLE_PATTERN = re.compile(r'(?:Git )?Commit:? +([\w-]+)', re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class JournalSection:
+    """Location of one section in a journal file (byte offsets)."""
+    kind: str
+    start: int
+    end: int
+    commit_hash: Optional[str] = None
+
+
+def _classify(title: str) -> Tuple[str, Optional[str]]:
+    commit_match = _COMMIT_TITLE_PATTERN.match(title)
+    if commit_match:
+        return 'entry', commit_match.group(1)
+    if title.startswith('AI Context Capture'):
+        return 'capture', None
+    if title.startswith('Reflection'):
+        return 'reflection', None
+    return 'other', None
+
+
+def scan_sections(content: bytes, offset: int = 0) -> List[JournalSection]:
+    """
+    Find the sections in journal content.
+
+    Args:
+        content: Raw file content (or an appended chunk of it)
+        offset: Byte offset of ``content`` within the file
+
+    Returns:
+        Sections in file order; the last one ends at the end of ``content``
+    """
+    headers = list(_SECTION_HEADER_PATTERN.finditer(content))
+    sections = []
+    for position, match in enumerate(headers):
+        end = headers[position + 1].start() if position + 1 < len(headers) else len(content)
+        kind, commit_hash = _classify(match.group(1).decode('utf-8', errors='replace').strip())
+        sections.append(JournalSection(kind, offset + match.start(), offset + end, commit_hash))
+    return sections
+
+
+class JournalIndex(SQLiteSidecar):
+    """
+    Section index for the daily files of one journal.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS journal_files ("
+        "file TEXT PRIMARY KEY, "
+        "size INTEGER NOT NULL, "
+        "mtime_ns INTEGER NOT NULL, "
+        "schema_version INTEGER NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS journal_sections ("
+        "file TEXT NOT NULL, "
+        "start INTEGER NOT NULL, "
+        "end INTEGER NOT NULL, "
+        "kind TEXT NOT NULL, "
+        "commit_hash TEXT, "
+        "PRIMARY KEY (file, start))",
+        "CREATE INDEX IF NOT EXISTS journal_sections_commit ON journal_sections (commit_hash)",
+    )
+    DESCRIPTION = "Journal index"
+
+    @property
+    def index_path(self) -> Path:
+        return self.db_path
+
+    @classmethod
+    def for_journal(cls, journal_path: Union[str, Path]) -> 'JournalIndex':
+        """Create an index stored under the journal's cache directory."""
+        return cls(get_journal_cache_dir(journal_path) / JOURNAL_INDEX_FILENAME)
+
+    def _key(self, file_path: Path) -> str:
+        """Index key of a daily file, relative to the journal root."""
+        return os.path.relpath(os.path.abspath(file_path), os.path.abspath(self.index_path.parent.parent))
+
+    def _store(self, connection: sqlite3.Connection, key: str, stat: os.stat_result,
+               sections: List[JournalSection], replace: bool) -> None:
+        if replace:
+            connection.execute("DELETE FROM journal_sections WHERE file = ?", (key,))
+        connection.executemany(
+            "INSERT OR REPLACE INTO journal_sections (file, start, end, kind, commit_hash) VALUES (?, ?, ?, ?, ?)",
+            [(key, s.start, s.end, s.kind, s.commit_hash) for s in sections]
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO journal_files (file, size, mtime_ns, schema_version) VALUES (?, ?, ?, ?)",
+            (key, stat.st_size, stat.st_mtime_ns, JOURNAL_INDEX_SCHEMA_VERSION)
+        )
+        connection.commit()
+
+    def _is_current(self, connection: sqlite3.Connection, key: str, stat: os.stat_result) -> bool:
+        row = connection.execute(
+            "SELECT size, mtime_ns, schema_version FROM journal_files WHERE file = ?", (key,)
+        ).fetchone()
+        return row == (stat.st_size, stat.st_mtime_ns, JOURNAL_INDEX_SCHEMA_VERSION)
+
+    def _load(self, connection: sqlite3.Connection, key: str) -> List[JournalSection]:
+        rows = connection.execute(
+            "SELECT kind, start, end, commit_hash FROM journal_sections WHERE file = ? ORDER BY start", (key,)
+        ).fetchall()
+        return [JournalSection(*row) for row in rows]
+
+    def get_sections(self, file_path: Union[str, Path], rescan: bool = True) -> Optional[List[JournalSection]]:
+        """
+        Sections of a daily file, rescanning it if it changed since it was indexed.
+
+        Args:
+            file_path: Daily journal file
+            rescan: If False, return None instead of rescanning a changed file
+
+        Returns:
+            Sections in file order, or None if the index is unavailable
+        """
+        file_path = Path(file_path)
+        try:
+            stat = file_path.stat()
+        except OSError as e:
+            logger.debug(f"Journal index lookup failed for {file_path}: {e}")
+            return None
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return None
+            key = self._key(file_path)
+            try:
+                if self._is_current(connection, key, stat):
+                    return self._load(connection, key)
+                if not rescan:
+                    return None
+                content = file_path.read_bytes()
+                sections = scan_sections(content)
+                # Skip storing if the file grew while it was read; the next read rescans
+                if len(content) == stat.st_size:
+                    self._store(connection, key, stat, sections, replace=True)
+                return sections
+            except (sqlite3.Error, OSError) as e:
+                logger.debug(f"Journal index lookup failed for {file_path}: {e}")
+                return None
+
+    def record_append(self, file_path: Union[str, Path], previous_stat: Optional[os.stat_result],
+                      appended: bytes) -> None:
+        """
+        Update the index after bytes were appended to a daily file.
+
+        Args:
+            file_path: File that was appended to
+            previous_stat: stat of the file before the append, or None if it did not exist
+            appended: Bytes written by the append
+        """
+        file_path = Path(file_path)
+        old_size = previous_stat.st_size if previous_stat is not None else 0
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return
+        if old_size + len(appended) != stat.st_size:
+            # Another writer appended too (or the encoding differed); get_sections() rescans
+            return
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return
+            key = self._key(file_path)
+            try:
+                if previous_stat is not None and not self._is_current(connection, key, previous_stat):
+                    # Index was already stale; get_sections() rescans the whole file on next read
+                    return
+                sections = scan_sections(appended, offset=old_size)
+                # The previous last section now runs up to the first appended section
+                connection.execute(
+                    "UPDATE journal_sections SET end = ? WHERE file = ? AND end = ?",
+                    (sections[0].start if sections else stat.st_size, key, old_size)
+                )
+                self._store(connection, key, stat, sections, replace=previous_stat is None)
+            except (sqlite3.Error, OSError) as e:
+                logger.debug(f"Journal index update failed for {file_path}: {e}")
+
+    def find_entry(self, commit_hash: str) -> Optional[Tuple[Path, JournalSection]]:
+        """
+        Locate the entry for a commit across indexed files.
+
+        Matches full hashes and the abbreviated hashes used in entry headers.
+        Only files indexed so far are searched.
+
+        Returns:
+            (file path, section) or None if no indexed entry matches
+        """
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return None
+            try:
+                rows = connection.execute(
+                    "SELECT file, kind, start, end, commit_hash FROM journal_sections "
+                    "WHERE kind = 'entry' AND (commit_hash = ? OR commit_hash = substr(?, 1, length(commit_hash))) "
+                    "ORDER BY file DESC, start DESC LIMIT 1",
+                    (commit_hash, commit_hash)
+                ).fetchall()
+            except sqlite3.Error as e:
+                logger.debug(f"Journal index commit lookup failed for {commit_hash}: {e}")
+                return None
+        if not rows:
+            return None
+        file_key, *section = rows[0]
+        return self.index_path.parent.parent / file_key, JournalSection(*section)
+
+
+_indexes: Dict[Path, JournalIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index_for_file(file_path: Union[str, Path]) -> Optional[JournalIndex]:
+    """
+    Return the shared index for a daily journal file.
+
+    Args:
+        file_path: Path of a journal file
+
+    Returns:
+        JournalIndex for the file's journal, or None for files outside a ``daily`` directory
+    """
+    directory = Path(os.path.abspath(file_path)).parent
+    if directory.name != 'daily':
+        return None
+    index_path = get_journal_cache_dir(directory.parent) / JOURNAL_INDEX_FILENAME
+    with _indexes_lock:
+        index = _indexes.get(index_path)
+        if index is None:
+            index = _indexes[index_path] = JournalIndex(index_path)
+        return index
+
+
+def get_journal_sections(file_path: Union[str, Path]) -> List[JournalSection]:
+    """
+    Sections of a journal file, from the index when possible.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    index = get_index_for_file(file_path)
+    if index is not None:
+        sections = index.get_sections(file_path)
+        if sections is not None:
+            return sections
+    return scan_sections(Path(file_path).read_bytes())
+
+
+def _from_last_entry(sections: List[JournalSection]) -> List[JournalSection]:
+    entry_positions = [position for position, section in enumerate(sections) if section.kind == 'entry']
+    return sections[entry_positions[-1]:] if entry_positions else sections
+
+
+def read_trailing_sections(file_path: Union[str, Path],
+                           block_size: int = TAIL_READ_BLOCK_SIZE) -> List[JournalSection]:
+    """
+    Sections from the last entry to the end of a file, found by reading backwards.
+
+    Blocks are read from the end of the file until one contains an entry
+    header, so only the tail of the file is loaded and scanned. A file without
+    entries is read completely.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(file_path, 'rb') as f:
+        start = os.fstat(f.fileno()).st_size
+        tail = b''
+        while True:
+            block_start = max(0, start - block_size)
+            f.seek(block_start)
+            block = f.read(start - block_start)
+            start = block_start
+            tail = block + tail
+            # A block may begin mid-line; headers can only start after a newline
+            line_start = 0 if start == 0 else tail.find(b'\n') + 1
+            if start > 0 and line_start == 0:
+                continue
+            sections = scan_sections(tail[line_start:], offset=start + line_start)
+            if start == 0 or any(section.kind == 'entry' for section in sections):
+                return _from_last_entry(sections)
+
+
+def get_trailing_sections(file_path: Union[str, Path]) -> List[JournalSection]:
+    """
+    Sections from the last entry of a journal file to its end.
+
+    Uses the index when it is current for the file and a backwards tail read
+    otherwise, so the whole file is never rescanned.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    index = get_index_for_file(file_path)
+    if index is not None:
+        sections = index.get_sections(file_path, rescan=False)
+        if sections is not None:
+            return _from_last_entry(sections)
+    return read_trailing_sections(file_path)
+
+
+def read_sections(file_path: Union[str, Path], sections: List[JournalSection]) -> List[str]:
+    """
+    Read the text of the given sections, seeking directly to each one.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    texts = []
+    with open(file_path, 'rb') as f:
+        for section in sections:
+            f.seek(section.start)
+            texts.append(f.read(section.end - section.start).decode('utf-8', errors='replace'))
+    return texts
+
+
+def record_journal_append(file_path: Union[str, Path], previous_stat: Optional[os.stat_result],
+                          appended: bytes) -> None:
+    """Update the index of a daily file after an append (no-op for other files)."""
+    index = get_index_for_file(file_path)
+    if index is not None:
+        index.record_append(file_path, previous_stat, appended)
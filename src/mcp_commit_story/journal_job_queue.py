@@ -0,0 +1,211 @@
+"""
+Durable, de-duplicating job queue for background journal generation.
+
+An interactive rebase or a burst of commits used to spawn one independent
+background worker per commit. Those workers raced on the same daily journal
+file and each re-extracted the same Composer data. With this queue every
+background worker enqueues its commit, but only one worker at a time drains
+the queue, in commit order.
+
+Storage:
+    A SQLite file under the repository's git directory
+    (``.git/mcp-journal-queue.db``), next to the hook log. A separate lock file
+    (``.git/mcp-journal-queue.lock``) held with ``flock`` elects the single worker.
+
+Design Choices:
+- A commit is queued at most once (commit_hash is unique), so re-running the
+  hook for the same commit does not produce a second entry. A commit whose
+  last run failed is set back to pending instead, so it can be retried.
+- The worker claims pending commits in small batches. A batch is processed
+  inside batch_context() so adjacent commits can share expensive work such as
+  one chat extraction pass.
+- A worker that cannot take the lock exits immediately; the lock holder
+  re-checks the queue after releasing the lock so no job is stranded.
+- Jobs left 'running' by a crashed worker are returned to 'pending' by the
+  next worker that takes the lock.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+QUEUE_DB_FILENAME = "mcp-journal-queue.db"
+QUEUE_LOCK_FILENAME = "mcp-journal-queue.lock"
+
+# Commits claimed (and sharing one batch context) per round
+DEFAULT_MAX_BATCH_SIZE = 10
+
+# Finished jobs older than this are pruned
+FINISHED_JOB_RETENTION_SECONDS = 30 * 24 * 60 * 60
+
+
+class JournalJobQueue:
+    """
+    SQLite-backed queue of commits awaiting journal generation.
+    """
+
+    def __init__(self, repo_path: str, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE):
+        """
+        Args:
+            repo_path: Path to the git repository; queue files live in its .git directory
+            max_batch_size: Maximum commits processed together in one batch
+        """
+        git_dir = os.path.join(repo_path, '.git')
+        self.db_path = os.path.join(git_dir, QUEUE_DB_FILENAME)
+        self.lock_path = os.path.join(git_dir, QUEUE_LOCK_FILENAME)
+        self.max_batch_size = max(1, max_batch_size)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS journal_jobs ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "commit_hash TEXT NOT NULL UNIQUE, "
+            "status TEXT NOT NULL DEFAULT 'pending', "
+            "enqueued_at REAL NOT NULL, "
+            "finished_at REAL, "
+            "error TEXT)"
+        )
+        return connection
+
+    def enqueue(self, commit_hash: str) -> bool:
+        """
+        Add a commit to the queue, or requeue it if its last run failed.
+
+        Returns:
+            True if the commit was queued, False if it is already pending, running or done
+        """
+        with self._connection() as connection:
+            cursor = connection.execute(
+                "INSERT INTO journal_jobs (commit_hash, enqueued_at) VALUES (?, ?) "
+                "ON CONFLICT(commit_hash) DO UPDATE SET "
+                "status = 'pending', enqueued_at = excluded.enqueued_at, finished_at = NULL, error = NULL "
+                "WHERE status = 'failed'",
+                (commit_hash, time.time())
+            )
+            return cursor.rowcount > 0
+
+    def pending_count(self) -> int:
+        """Number of commits waiting to be processed."""
+        with self._connection() as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM journal_jobs WHERE status = 'pending'"
+            ).fetchone()[0]
+
+    def get_status(self, commit_hash: str) -> Optional[str]:
+        """Status of a commit ('pending', 'running', 'done', 'failed'), or None if unknown."""
+        with self._connection() as connection:
+            row = connection.execute(
+                "SELECT status FROM journal_jobs WHERE commit_hash = ?", (commit_hash,)
+            ).fetchone()
+        return row[0] if row else None
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connect()
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _worker_lock(self) -> Iterator[bool]:
+        """Try to become the single worker; yields False if another worker holds the lock."""
+        if fcntl is None:
+            yield True
+            return
+        with open(self.lock_path, 'a') as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _recover_and_prune(self, connection: sqlite3.Connection) -> None:
+        """Requeue jobs orphaned by a crashed worker and drop old finished jobs (lock held)."""
+        connection.execute("UPDATE journal_jobs SET status = 'pending' WHERE status = 'running'")
+        connection.execute(
+            "DELETE FROM journal_jobs WHERE status IN ('done', 'failed') AND finished_at < ?",
+            (time.time() - FINISHED_JOB_RETENTION_SECONDS,)
+        )
+
+    def _claim_batch(self, connection: sqlite3.Connection) -> List[str]:
+        """Mark the oldest pending commits as running and return them in queue order."""
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            rows = connection.execute(
+                "SELECT id, commit_hash FROM journal_jobs WHERE status = 'pending' ORDER BY id LIMIT ?",
+                (self.max_batch_size,)
+            ).fetchall()
+            connection.executemany(
+                "UPDATE journal_jobs SET status = 'running' WHERE id = ?",
+                [(row[0],) for row in rows]
+            )
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            connection.execute("ROLLBACK")
+            raise
+        return [row[1] for row in rows]
+
+    def _finish(self, connection: sqlite3.Connection, commit_hash: str, error: Optional[str]) -> None:
+        connection.execute(
+            "UPDATE journal_jobs SET status = ?, finished_at = ?, error = ? WHERE commit_hash = ?",
+            ('failed' if error else 'done', time.time(), error, commit_hash)
+        )
+
+    def drain(
+        self,
+        process_commit: Callable[[str], Dict[str, Any]],
+        batch_context: Optional[Callable[[List[str]], ContextManager]] = None
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Process queued commits in order until the queue is empty.
+
+        Args:
+            process_commit: Called once per commit; a result whose 'status' is not
+                'success' (or an exception) marks the job failed
+            batch_context: Optional factory for a context manager entered around
+                each claimed batch of commits
+
+        Returns:
+            Results keyed by commit hash, or None if another worker is draining the queue
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        while True:
+            with self._worker_lock() as is_worker:
+                if not is_worker:
+                    return results or None
+                with self._connection() as connection:
+                    self._recover_and_prune(connection)
+                    while True:
+                        batch = self._claim_batch(connection)
+                        if not batch:
+                            break
+                        logger.info(f"Processing {len(batch)} queued commit(s): {', '.join(c[:8] for c in batch)}")
+                        with (batch_context(batch) if batch_context else nullcontext()):
+                            for commit_hash in batch:
+                                try:
+                                    result = process_commit(commit_hash)
+                                except Exception as e:
+                                    result = {'status': 'error', 'error': str(e), 'commit_hash': commit_hash}
+                                results[commit_hash] = result
+                                error = None if result.get('status') == 'success' else result.get('error', 'unknown error')
+                                self._finish(connection, commit_hash, error)
+
+            # A commit queued while we held the lock may have seen it taken and exited
+            if not self.pending_count():
+                return results
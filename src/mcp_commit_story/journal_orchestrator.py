@@ -31,7 +31,7 @@ from mcp_commit_story.journal_generate import (
 
     generate_commit_metadata_section
 )
-from mcp_commit_story.git_utils import get_repo
+from mcp_commit_story.git_utils import get_repo, with_git_run_memo
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +75,7 @@ AI_FUNCTION_MAP = {
 
 
 @trace_mcp_operation("orchestrate_journal_generation")
+@with_git_run_memo
 def orchestrate_journal_generation(commit_hash: str, journal_path: str) -> Dict[str, Any]:
     """
     Main orchestration function coordinating entire journal generation workflow.
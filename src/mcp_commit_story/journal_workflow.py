@@ -5,32 +5,60 @@ This module handles the high-level workflow of generating journal entries,
 orchestrating context collection and section generation functions.
 """
 
+import contextvars
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 from datetime import datetime
 
 from .telemetry import trace_mcp_operation
+from .ai_invocation import streaming_enabled
 from .journal_generate import JournalEntry
 from .context_types import JournalContext
+from .context_packer import DEFAULT_CONTEXT_TOKEN_BUDGET, pack_journal_context
+from .git_utils import with_git_run_memo
 
 logger = logging.getLogger(__name__)
 
+# Default number of sections generated concurrently (1 = sequential);
+# override with journal.section_workers in the config
+DEFAULT_SECTION_WORKERS = 1
+
+# "per_section" makes one AI call per section; "combined" asks for all sections in
+# one call and falls back to per-section calls only for sections it could not parse.
+# Override with journal.generation_mode in the config
+GENERATION_MODES = ('per_section', 'combined')
+DEFAULT_GENERATION_MODE = 'per_section'
+
+# With ai.streaming enabled, entries being generated are written section by
+# section to <journal>/.cache/in_progress/<commit>.md (plus a .json copy of the
+# sections used to resume an interrupted run) until they are saved
+IN_PROGRESS_DIR_NAME = 'in_progress'
+
 
 @trace_mcp_operation("journal.generate_entry", attributes={"operation_type": "workflow_orchestration"})
-def generate_journal_entry(commit, config, debug=False) -> Optional[JournalEntry]:
+@with_git_run_memo
+def generate_journal_entry(commit, config, debug=False, on_section=None, completed_sections=None) -> Optional[JournalEntry]:
     """
     Generate a complete journal entry by orchestrating all context collection and section generation functions.
     
     This is the core workflow function that:
     1. Detects journal-only commits and skips them to prevent infinite loops
-    2. Collects all available context (chat, terminal, git)
-    3. Orchestrates all section generators to build a complete journal entry
+    2. Collects all available context (chat, terminal, git) and trims it to
+       ai.context_token_budget; git artifacts are computed once per commit for the run
+    3. Orchestrates all section generators to build a complete journal entry, concurrently
+       when journal.section_workers is greater than 1, or with a single combined AI call
+       when journal.generation_mode is "combined"
     4. Implements graceful degradation - continues processing even if individual sections fail
     
     Args:
         commit: GitPython commit object
         config: Configuration object with journal settings
         debug: Enable debug logging for troubleshooting
+        on_section: Optional callback(section_name, value) invoked as each section completes
+        completed_sections: Optional section name to value mapping from an interrupted
+                    earlier run; these sections are reused instead of regenerated
         
     Returns:
         JournalEntry: Complete journal entry object, or None if commit should be skipped
@@ -60,18 +88,6 @@ def generate_journal_entry(commit, config, debug=False) -> Optional[JournalEntry
     # Step 2: Collect all available context with graceful degradation
     context_data = {}
     
-    # Collect chat history - fixed function signature
-    try:
-        if debug:
-            logger.debug("Collecting chat history context")
-        context_data['chat_history'] = collect_chat_history(since_commit=commit.hexsha, max_messages_back=150)
-    except Exception as e:
-        logger.error(f"Failed to collect chat history: {e}")
-        context_data['chat_history'] = None
-    
-    # Terminal command collection removed per architectural decision
-        # Terminal command collection infrastructure has been removed
-    
     # Collect git context - fixed function signature
     try:
         if debug:
@@ -93,6 +109,18 @@ def generate_journal_entry(commit, config, debug=False) -> Optional[JournalEntry
             'commit_context': {}
         }
     
+    # Collect chat history - after git context, so AI boundary filtering reuses this run's git context
+    try:
+        if debug:
+            logger.debug("Collecting chat history context")
+        context_data['chat_history'] = collect_chat_history(commit=commit, max_messages_back=150)
+    except Exception as e:
+        logger.error(f"Failed to collect chat history: {e}")
+        context_data['chat_history'] = None
+    
+    # Terminal command collection removed per architectural decision
+        # Terminal command collection infrastructure has been removed
+    
     # Collect recent journal context for better AI generation
     try:
         if debug:
@@ -112,9 +140,17 @@ def generate_journal_entry(commit, config, debug=False) -> Optional[JournalEntry
     if debug:
         logger.debug(f"Built journal context with git context and optional chat data")
     
-    # Step 3: Generate all sections with graceful degradation
-    sections = {}
+    # Trim oversized context to the token budget (diffs of source files, then recent chat, then journal)
+    token_budget = _get_context_token_budget(config)
+    if token_budget:
+        try:
+            journal_context, packing_report = pack_journal_context(journal_context, max_tokens=token_budget)
+            if debug and packing_report.trimmed:
+                logger.debug(f"Dropped diffs to fit context budget: {packing_report.dropped_diffs}")
+        except Exception as e:
+            logger.error(f"Failed to pack journal context, using it untrimmed: {e}")
     
+    # Step 3: Generate all sections with graceful degradation
     # List of all section generators and their corresponding fields (7 total, down from 8)
     section_generators = [
         ('summary', generate_summary_section),
@@ -127,46 +163,37 @@ def generate_journal_entry(commit, config, debug=False) -> Optional[JournalEntry
         ('commit_metadata', generate_commit_metadata_section)
     ]
     
-    for section_name, generator_func in section_generators:
-        try:
-            if debug:
-                logger.debug(f"Generating {section_name} section")
-            
-            section_content = generator_func(journal_context)
-            
-            # Extract content using correct field names from TypedDict definitions
-            if section_name == 'summary':
-                sections[section_name] = section_content.get('summary', '')
-            elif section_name == 'technical_synopsis':
-                sections[section_name] = section_content.get('technical_synopsis', '')
-            elif section_name == 'accomplishments':
-                sections[section_name] = section_content.get('accomplishments', [])
-            elif section_name == 'frustrations':
-                sections[section_name] = section_content.get('frustrations', [])
-            elif section_name == 'tone_mood':
-                mood_data = section_content
-                if mood_data.get('mood') or mood_data.get('indicators'):
-                    # Handle indicators - could be list or string
-                    indicators = mood_data.get('indicators', '')
-                    if isinstance(indicators, list):
-                        indicators = '\n'.join(f"- {item}" for item in indicators)
-                    
-                    sections[section_name] = {
-                        'mood': mood_data.get('mood', ''),
-                        'indicators': indicators
-                    }
-            elif section_name == 'discussion_notes':
-                sections[section_name] = section_content.get('discussion_notes', [])
-            elif section_name == 'discussion_notes_simple':
-                sections[section_name] = section_content.get('discussion_notes', [])
-            elif section_name == 'commit_metadata':
-                sections[section_name] = section_content.get('commit_metadata', {})
-                
-        except Exception as e:
-            logger.error(f"Failed to generate {section_name} section: {e}")
-            # Graceful degradation - skip failed sections entirely
-            if debug:
-                logger.debug(f"Skipping {section_name} section due to generation failure")
+    # Sections finished by an interrupted earlier run are kept as they are
+    section_names = {section_name for section_name, _ in section_generators}
+    sections = {
+        section_name: value for section_name, value in (completed_sections or {}).items()
+        if section_name in section_names
+    }
+    section_generators = [
+        (section_name, generator_func) for section_name, generator_func in section_generators
+        if section_name not in sections
+    ]
+    
+    # Combined mode: one AI call for all sections, individual generators only for what it could not parse
+    if _get_generation_mode(config) == 'combined' and section_generators:
+        combined = {
+            section_name: value for section_name, value in _generate_combined(journal_context, debug=debug).items()
+            if section_name not in sections
+        }
+        for section_name, value in combined.items():
+            if value is not None:
+                sections[section_name] = value
+                if on_section is not None:
+                    on_section(section_name, value)
+        section_generators = [
+            (section_name, generator_func) for section_name, generator_func in section_generators
+            if section_name not in combined
+        ]
+    
+    sections.update(_generate_sections(
+        section_generators, journal_context,
+        max_workers=_get_section_workers(config), debug=debug, on_section=on_section
+    ))
     
     # Step 4: Build the final journal entry with cross-platform timestamp format
     # Use commit time for consistency (same approach as server.py)
@@ -196,6 +223,181 @@ def generate_journal_entry(commit, config, debug=False) -> Optional[JournalEntry
     return journal_entry
 
 
+def _get_section_workers(config) -> int:
+    """Read journal.section_workers from a Config object or dict (defaults to sequential)."""
+    try:
+        workers = config.get('journal', {}).get('section_workers', DEFAULT_SECTION_WORKERS)
+        return max(1, int(workers))
+    except (AttributeError, TypeError, ValueError):
+        return DEFAULT_SECTION_WORKERS
+
+
+def _get_context_token_budget(config) -> Optional[int]:
+    """Read ai.context_token_budget from a Config object or dict (0 or less disables packing)."""
+    try:
+        budget = int(config.get('ai', {}).get('context_token_budget', DEFAULT_CONTEXT_TOKEN_BUDGET))
+    except (AttributeError, TypeError, ValueError):
+        return DEFAULT_CONTEXT_TOKEN_BUDGET
+    return budget if budget > 0 else None
+
+
+def _get_generation_mode(config) -> str:
+    """Read journal.generation_mode ("per_section" or "combined") from a Config object or dict."""
+    try:
+        mode = config.get('journal', {}).get('generation_mode', DEFAULT_GENERATION_MODE)
+    except AttributeError:
+        return DEFAULT_GENERATION_MODE
+    if mode not in GENERATION_MODES:
+        logger.warning(f"Unknown journal.generation_mode '{mode}', using '{DEFAULT_GENERATION_MODE}'")
+        return DEFAULT_GENERATION_MODE
+    return mode
+
+
+def _generate_combined(journal_context, debug=False) -> dict:
+    """
+    Generate sections with one combined AI call.
+    
+    Returns:
+        dict: Section name to extracted value (None for a parsed but empty
+        section) for every section the combined response produced; an empty
+        dict if the combined call failed.
+    """
+    from .journal_generate import generate_combined_sections
+    
+    try:
+        combined = generate_combined_sections(journal_context)
+    except Exception as e:
+        logger.error(f"Combined section generation failed: {e}")
+        return {}
+    
+    sections = {}
+    for section_name, section_content in combined.items():
+        try:
+            value = _extract_section_value(section_name, section_content)
+        except Exception as e:
+            logger.error(f"Failed to extract combined {section_name} section: {e}")
+            continue
+        sections[section_name] = value
+    
+    if debug:
+        logger.debug(f"Combined generation produced {len(sections)} sections")
+    return sections
+
+
+def _extract_section_value(section_name: str, section_content):
+    """
+    Pull the journal entry field out of a section generator's TypedDict result.
+    
+    Returns:
+        The value to store on JournalEntry, or None when the section should be omitted.
+    """
+    # Extract content using correct field names from TypedDict definitions
+    if section_name == 'summary':
+        return section_content.get('summary', '')
+    elif section_name == 'technical_synopsis':
+        return section_content.get('technical_synopsis', '')
+    elif section_name == 'accomplishments':
+        return section_content.get('accomplishments', [])
+    elif section_name == 'frustrations':
+        return section_content.get('frustrations', [])
+    elif section_name == 'tone_mood':
+        mood_data = section_content
+        if mood_data.get('mood') or mood_data.get('indicators'):
+            # Handle indicators - could be list or string
+            indicators = mood_data.get('indicators', '')
+            if isinstance(indicators, list):
+                indicators = '\n'.join(f"- {item}" for item in indicators)
+            
+            return {
+                'mood': mood_data.get('mood', ''),
+                'indicators': indicators
+            }
+        return None
+    elif section_name in ('discussion_notes', 'discussion_notes_simple'):
+        return section_content.get('discussion_notes', [])
+    elif section_name == 'commit_metadata':
+        return section_content.get('commit_metadata', {})
+    return None
+
+
+def _run_section_generator(section_name: str, generator_func, journal_context, debug=False):
+    """
+    Run one section generator with graceful degradation.
+    
+    Returns:
+        The extracted section value, or None if the generator failed (the failure is logged).
+    """
+    try:
+        if debug:
+            logger.debug(f"Generating {section_name} section")
+        
+        return _extract_section_value(section_name, generator_func(journal_context))
+    
+    except Exception as e:
+        logger.error(f"Failed to generate {section_name} section: {e}")
+        # Graceful degradation - skip failed sections entirely
+        if debug:
+            logger.debug(f"Skipping {section_name} section due to generation failure")
+        return None
+
+
+def _generate_sections(section_generators, journal_context, max_workers=DEFAULT_SECTION_WORKERS, debug=False,
+                       on_section=None) -> dict:
+    """
+    Run all section generators, sequentially or on a bounded thread pool.
+    
+    The generators are independent given the same JournalContext and each one
+    blocks on an AI round-trip, so with max_workers > 1 the wall-clock time is
+    roughly that of the slowest section instead of the sum of all of them.
+    
+    Args:
+        section_generators: List of (section_name, generator_func) pairs
+        journal_context: JournalContext shared (read-only) by every generator
+        max_workers: Number of sections generated concurrently. Values below 2
+                    keep sequential generation.
+        debug: Enable debug logging
+        on_section: Optional callback(section_name, value) invoked in the calling
+                    thread as each section completes successfully
+        
+    Returns:
+        dict: Section name to extracted value, in generator order. Failed or
+        empty sections are omitted.
+    """
+    worker_count = max(1, min(max_workers or 1, len(section_generators)))
+    
+    if worker_count == 1:
+        results = []
+        for section_name, generator_func in section_generators:
+            value = _run_section_generator(section_name, generator_func, journal_context, debug)
+            if on_section is not None and value is not None:
+                on_section(section_name, value)
+            results.append(value)
+    else:
+        if debug:
+            logger.debug(f"Generating {len(section_generators)} sections with {worker_count} workers")
+        # Copy the caller's context per task so section spans nest under the
+        # workflow span in worker threads; results are collected in generator order
+        with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="journal-section") as executor:
+            futures = {
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _run_section_generator, section_name, generator_func, journal_context, debug
+                ): section_name
+                for section_name, generator_func in section_generators
+            }
+            if on_section is not None:
+                for future in as_completed(futures):
+                    if future.result() is not None:
+                        on_section(futures[future], future.result())
+            results = [future.result() for future in futures]
+    
+    return {
+        section_name: value
+        for (section_name, _), value in zip(section_generators, results)
+        if value is not None
+    }
+
+
 def is_journal_only_commit(commit, journal_path):
     """
     Check if a commit only touches files within the journal path.
@@ -235,12 +437,100 @@ def is_journal_only_commit(commit, journal_path):
         return False  # Default to processing on error
 
 
+def _get_journal_root(config) -> str:
+    """Return the journal path from a Config object or dict configuration."""
+    if hasattr(config, 'journal_path'):
+        return config.journal_path
+    return config.get('journal', {}).get('path', 'sandbox-journal')
+
+
+def _get_daily_relative_path(date_str: str) -> str:
+    """Return the daily file path relative to the journal root for a YYYY-MM-DD date."""
+    from .journal_generate import get_journal_file_path
+    
+    relative_path = get_journal_file_path(date_str, "daily")
+    
+    # Fix double "journal/" prefix bug: get_journal_file_path returns "journal/daily/..."
+    # but config.journal_path is also "journal", so we need to remove the prefix
+    if relative_path.startswith("journal/"):
+        relative_path = relative_path[8:]  # Remove "journal/" prefix
+    return relative_path
+
+
+class _ProgressiveEntryWriter:
+    """
+    Write an in-progress journal entry to a partial file as its sections complete.
+    
+    The partial file lives under <journal>/.cache/in_progress/<commit>.md (ignored
+    by git), next to a <commit>.json copy of the completed section values. Both are
+    rewritten atomically (replace_cache_file) after every section, so readers
+    never see a half-written file. If generation is interrupted, the next run for
+    the same commit resumes from the saved sections and only generates the rest.
+    Once the finished entry has been appended to the daily file (under the journal
+    write lock, so it cannot simply be renamed into place) both files are discarded.
+    """
+    
+    def __init__(self, journal_path, commit):
+        from .journal_cache import get_journal_cache_dir
+        
+        self.partial_path = get_journal_cache_dir(journal_path) / IN_PROGRESS_DIR_NAME / f"{commit.hexsha}.md"
+        self.state_path = self.partial_path.with_suffix(".json")
+        self.timestamp = commit.committed_datetime.strftime("%I:%M %p").lstrip('0')
+        self.commit_hash = commit.hexsha
+        self.sections = {}
+    
+    def resume(self) -> dict:
+        """
+        Load the sections saved by an interrupted earlier run for this commit.
+        
+        Returns:
+            dict: Section name to value; empty if there is nothing to resume
+        """
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read in-progress journal entry {self.state_path}: {e}")
+            return {}
+        
+        if not isinstance(state, dict) or state.get('commit_hash') != self.commit_hash or not isinstance(state.get('sections'), dict):
+            return {}
+        self.sections = dict(state['sections'])
+        return dict(self.sections)
+    
+    def __call__(self, section_name, value):
+        self.sections[section_name] = value
+        entry = JournalEntry(timestamp=self.timestamp, commit_hash=self.commit_hash, **self.sections)
+        try:
+            from .journal_cache import ensure_cache_dir, replace_cache_file
+            
+            ensure_cache_dir(self.partial_path.parent.parent)
+            self.partial_path.parent.mkdir(exist_ok=True)
+            replace_cache_file(self.state_path, json.dumps({'commit_hash': self.commit_hash, 'sections': self.sections}))
+            replace_cache_file(self.partial_path, entry.to_markdown())
+        except (OSError, TypeError, ValueError) as e:
+            # Progress output is best-effort; the final entry is still saved normally
+            logger.debug(f"Could not write in-progress journal entry {self.partial_path}: {e}")
+    
+    def discard(self):
+        for path in (self.state_path, self.partial_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug(f"Could not remove in-progress journal entry {path}: {e}")
+
+
 def save_journal_entry(journal_entry, config, debug=False, date_str=None):
     """
     Save a journal entry to the appropriate daily file with header logic.
     
-    Detects when creating a new daily file and adds the appropriate header.
-    Handles both Config objects and dict configurations.
+    Adds the daily header when the entry starts a new daily file. The header
+    is decided under the journal write lock, so concurrent workers cannot both
+    create the file. Handles both Config objects and dict configurations.
     
     Args:
         journal_entry: JournalEntry object to save
@@ -251,31 +541,14 @@ def save_journal_entry(journal_entry, config, debug=False, date_str=None):
     Returns:
         str: Path to the saved file
     """
-    from .journal_generate import append_to_journal_file, ensure_journal_directory, get_journal_file_path
+    from .journal_generate import append_to_journal_file, ensure_journal_directory
     from pathlib import Path
     
     # Use provided date or fall back to current date
     if date_str is None:
         date_str = datetime.now().strftime("%Y-%m-%d")
     
-    # Handle both Config objects and dict configurations to get journal path
-    if hasattr(config, 'journal_path'):
-        journal_path = config.journal_path
-    else:
-        journal_path = config.get('journal', {}).get('path', 'sandbox-journal')
-    
-    # Get relative path and combine with configured journal path
-    relative_path = get_journal_file_path(date_str, "daily")
-    
-    # Fix double "journal/" prefix bug: get_journal_file_path returns "journal/daily/..."
-    # but config.journal_path is also "journal", so we need to remove the prefix
-    if relative_path.startswith("journal/"):
-        relative_path = relative_path[8:]  # Remove "journal/" prefix
-    
-    full_path = Path(journal_path) / relative_path
-    
-    # Check if this is a new daily file
-    file_exists = full_path.exists()
+    full_path = Path(_get_journal_root(config)) / _get_daily_relative_path(date_str)
     
     # Ensure directory exists
     ensure_journal_directory(str(full_path))
@@ -283,24 +556,19 @@ def save_journal_entry(journal_entry, config, debug=False, date_str=None):
     # Get entry markdown
     entry_markdown = journal_entry.to_markdown()
     
-    # Add daily header if creating new file, otherwise append to existing file
-    if not file_exists:
-        # Parse the date string to create a formatted header
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        date_formatted = date_obj.strftime("%B %d, %Y")  # "June 3, 2025"
-        content = f"# Daily Journal Entries - {date_formatted}\n\n{entry_markdown}"
-        
-        if debug:
-            logger.debug(f"Adding daily header to new file: {full_path}")
-        
-        with open(str(full_path), 'w') as f:
-            f.write(content)
-    else:
-        # File exists, use append function which handles separators correctly
-        if debug:
+    # Parse the date string to create the header used if this starts the daily file
+    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+    date_formatted = date_obj.strftime("%B %d, %Y")  # "June 3, 2025"
+    header = f"# Daily Journal Entries - {date_formatted}\n\n"
+    
+    if debug:
+        if full_path.exists():
             logger.debug(f"Appending to existing file: {full_path}")
-        
-        append_to_journal_file(entry_markdown, str(full_path))
+        else:
+            logger.debug(f"Adding daily header to new file: {full_path}")
+    
+    # The append function handles separators and writes the header only into an empty file
+    append_to_journal_file(entry_markdown, str(full_path), header=header)
     
     if debug:
         logger.debug(f"Saved journal entry to: {full_path}")
@@ -324,8 +592,19 @@ def handle_journal_entry_creation(commit, config, debug=False):
         dict: Result with success status and file path
     """
     try:
-        # Generate journal entry
-        journal_entry = generate_journal_entry(commit, config, debug)
+        # Generate journal entry, writing completed sections to a partial file in streaming mode
+        # and resuming from the sections an interrupted earlier run already wrote
+        progress_writer = None
+        if streaming_enabled(config):
+            progress_writer = _ProgressiveEntryWriter(_get_journal_root(config), commit)
+            completed_sections = progress_writer.resume()
+            if completed_sections:
+                logger.info(f"Resuming journal entry for {commit.hexsha[:8]} with {len(completed_sections)} completed section(s)")
+            journal_entry = generate_journal_entry(
+                commit, config, debug, on_section=progress_writer, completed_sections=completed_sections
+            )
+        else:
+            journal_entry = generate_journal_entry(commit, config, debug)
         
         if journal_entry is None:
             return {
@@ -338,6 +617,8 @@ def handle_journal_entry_creation(commit, config, debug=False):
         # Save journal entry using commit date for consistency
         commit_date_str = commit.committed_datetime.strftime("%Y-%m-%d")
         file_path = save_journal_entry(journal_entry, config, debug, date_str=commit_date_str)
+        if progress_writer is not None:
+            progress_writer.discard()
         
         return {
             'success': True,
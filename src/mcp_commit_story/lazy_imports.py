@@ -0,0 +1,55 @@
+"""
+Deferred imports for heavy optional-path dependencies.
+
+The post-commit hook imports the journal workflow on every ``git commit``, and
+in synchronous mode that import time is added directly to the commit. Modules
+such as ``openai`` (and, through it, pydantic models for the whole API) are only
+needed once an entry is actually generated, not on the skip and trigger-check
+paths.
+
+``lazy_import(name)`` returns a stand-in module whose attributes are resolved
+from the real module on first access, so call sites keep the familiar
+``openai.OpenAI(...)`` spelling while the import cost is paid only when used.
+
+Design Choices:
+- Attribute lookups are forwarded to ``sys.modules`` via importlib on every
+  access rather than cached, so patches applied to the real module (for
+  example ``patch('openai.OpenAI')``) are seen through the stand-in.
+- Loading goes through the regular import system, so it is thread-safe and a
+  module already imported elsewhere is reused.
+- Attributes set on the stand-in (for example by ``unittest.mock.patch``)
+  shadow the real module's attributes, which keeps module-level patching working.
+"""
+
+import importlib
+import sys
+import types
+from typing import Any
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __getattr__(self, attribute: str) -> Any:
+        # Only called for attributes not set on the stand-in itself
+        if attribute.startswith('__') and attribute.endswith('__'):
+            raise AttributeError(attribute)
+        return getattr(importlib.import_module(self.__name__), attribute)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.__name__ in sys.modules else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Return module ``name``, deferring the import until an attribute is used.
+
+    If the module is already imported the real module is returned directly.
+    A missing module raises ImportError on first attribute access instead of
+    at import time.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
@@ -13,6 +13,7 @@ Provides two core MCP tools:
 
 Intended for use as the main server entrypoint for the mcp-commit-story project.
 """
+import asyncio
 import inspect
 import logging
 import sys
@@ -30,7 +31,7 @@ from mcp_commit_story.config import load_config, Config, ConfigError
 from mcp_commit_story import telemetry
 from mcp_commit_story.telemetry import trace_mcp_operation, get_mcp_metrics
 from mcp_commit_story.reflection_core import add_manual_reflection
-from mcp_commit_story.journal_handlers import handle_journal_capture_context
+from mcp_commit_story.journal_handlers import ahandle_journal_capture_context
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -383,8 +384,9 @@ async def handle_journal_capture_context_mcp(request: CaptureContextRequest) ->
     # Note: 'text' field is optional - if missing, defaults to None which triggers AI dump
     # This maintains backward compatibility and allows for flexible usage
     
-    # Call the actual implementation (sync function)
-    result = handle_journal_capture_context(request.get("text"))
+    # The AI dump awaits the async client and the file write runs in a worker thread,
+    # so the event loop keeps serving other MCP requests while this one waits
+    result = await ahandle_journal_capture_context(request.get("text"))
     
     return {
         "status": result["status"],
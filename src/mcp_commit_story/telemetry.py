@@ -12,7 +12,6 @@ import logging
 import re
 import os
 import time
-import psutil
 import contextlib
 from typing import Optional, Dict, Any, Callable, List, Union, Generator, Set
 from opentelemetry import trace, metrics
@@ -27,28 +26,20 @@ from collections import defaultdict
 
 # Import structured logging functionality
 from .structured_logging import setup_structured_logging
+from .lazy_imports import lazy_import
 
-# Optional exporters - gracefully handle if not available
-try:
-    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-    from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
-    OTLP_AVAILABLE = True
-except ImportError:
-    OTLP_AVAILABLE = False
-
-try:
-    from opentelemetry.exporter.prometheus import PrometheusMetricReader
-    PROMETHEUS_AVAILABLE = True
-except ImportError:
-    PROMETHEUS_AVAILABLE = False
-
-# Import version function for Datadog enhancement
-try:
-    from .server import get_version_from_pyproject
-except ImportError:
-    # Fallback if server module is not available
-    def get_version_from_pyproject() -> str:
+# Only needed when memory tracking runs
+psutil = lazy_import('psutil')
+
+
+def get_version_from_pyproject() -> str:
+    """Project version for resource attributes, read via the server module on first use."""
+    try:
+        # Deferred: importing the server loads the MCP SDK, which the git hook never needs
+        from .server import get_version_from_pyproject as read_version
+    except ImportError:
         return "unknown"
+    return read_version()
 
 
 # Global state tracking
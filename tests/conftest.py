@@ -5,6 +5,40 @@ import tempfile
 import git
 from unittest.mock import Mock, patch
 
+@pytest.fixture(autouse=True)
+def clear_ai_provider_cache():
+    """Keep invoke_ai's process-level config/provider cache from leaking between tests."""
+    import sys
+    import mcp_commit_story.ai_invocation
+
+    def clear_all():
+        # Some tests import the module as src.mcp_commit_story.ai_invocation, which has its own cache
+        for name, module in list(sys.modules.items()):
+            if name.endswith('mcp_commit_story.ai_invocation') and hasattr(module, 'clear_provider_cache'):
+                module.clear_provider_cache()
+
+    clear_all()
+    yield
+    clear_all()
+
+@pytest.fixture(autouse=True)
+def disable_ai_response_cache(monkeypatch):
+    """Keep tests from reading or writing the on-disk AI response cache; cache tests patch it back in."""
+    import sys
+    import mcp_commit_story.ai_invocation
+    for name, module in list(sys.modules.items()):
+        if name.endswith('mcp_commit_story.ai_invocation') and hasattr(module, '_get_response_cache'):
+            monkeypatch.setattr(module, '_get_response_cache', lambda config: None)
+
+@pytest.fixture(autouse=True)
+def disable_ai_rate_limiter(monkeypatch):
+    """Keep tests from queueing on (or writing state for) the shared AI rate limiter; limiter tests patch it back in."""
+    import sys
+    import mcp_commit_story.ai_invocation
+    for name, module in list(sys.modules.items()):
+        if name.endswith('mcp_commit_story.ai_invocation') and hasattr(module, '_get_rate_limiter'):
+            monkeypatch.setattr(module, '_get_rate_limiter', lambda config: None)
+
 @pytest.fixture
 def git_repo():
     # Create a temporary directory
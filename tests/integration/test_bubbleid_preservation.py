@@ -123,7 +123,8 @@ class TestBubbleIdPreservationIntegration:
         # Mock the full pipeline
         with patch('mcp_commit_story.context_collection.query_cursor_chat_database') as mock_query, \
              patch('mcp_commit_story.context_collection.filter_chat_for_commit') as mock_filter, \
-             patch('mcp_commit_story.context_collection.collect_git_context') as mock_git_context:
+             patch('mcp_commit_story.context_collection.collect_git_context') as mock_git_context, \
+             patch('mcp_commit_story.context_collection._boundary_filter_skip_reason', return_value=None):
 
             # Setup mocks
             mock_query.return_value = {'chat_history': original_messages}
@@ -97,6 +97,18 @@ class TestComposerWorkflowIntegration:
                     f"All messages in session {session_id} should have same timestamp"
 
 
+    def test_batched_bubble_retrieval_matches_per_bubble_retrieval(self, test_db_paths):
+        """Test that batched bubble mode returns exactly the per-bubble results."""
+        
+        per_bubble = ComposerChatProvider(test_db_paths["workspace"], test_db_paths["global"])
+        batched = ComposerChatProvider(
+            test_db_paths["workspace"], test_db_paths["global"], batch_bubbles=True
+        )
+        
+        assert batched.getChatHistoryForCommit(0, 9999999999999) == \
+            per_bubble.getChatHistoryForCommit(0, 9999999999999)
+
+
 class TestComposerPerformanceIntegration:
     """Integration tests for performance validation."""
     
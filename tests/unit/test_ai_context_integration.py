@@ -99,7 +99,8 @@ class TestAIFilteringIntegration:
     @patch('mcp_commit_story.context_collection.filter_chat_for_commit')
     @patch('mcp_commit_story.context_collection.query_cursor_chat_database')
     @patch('mcp_commit_story.context_collection.collect_git_context')
-    def test_ai_filtering_called_when_messages_exist(self, mock_git_context, mock_query, mock_filter):
+    @patch('mcp_commit_story.context_collection._boundary_filter_skip_reason', return_value=None)
+    def test_ai_filtering_called_when_messages_exist(self, mock_skip_reason, mock_git_context, mock_query, mock_filter):
         """Test that AI filtering is called when messages are available"""
         mock_commit = Mock(spec=Commit)
         mock_commit.hexsha = "abc123"
@@ -171,7 +172,8 @@ class TestAIFilteringIntegration:
     @patch('mcp_commit_story.context_collection.filter_chat_for_commit')
     @patch('mcp_commit_story.context_collection.query_cursor_chat_database')
     @patch('mcp_commit_story.context_collection.collect_git_context')
-    def test_telemetry_tracks_filtering_effectiveness(self, mock_git_context, mock_query, mock_filter):
+    @patch('mcp_commit_story.context_collection._boundary_filter_skip_reason', return_value=None)
+    def test_telemetry_tracks_filtering_effectiveness(self, mock_skip_reason, mock_git_context, mock_query, mock_filter):
         """Test that telemetry tracks AI filtering effectiveness"""
         mock_commit = Mock(spec=Commit)
         mock_commit.hexsha = "abc123"
@@ -212,6 +214,58 @@ class TestAIFilteringIntegration:
             mock_filter.assert_called_once()  # AI filtering was called
 
 
+class TestBoundaryFilterPreFilter:
+    """Test the heuristic that skips the AI boundary call for simple chat windows"""
+
+    @staticmethod
+    def _messages(count, sessions=2, start=1_000_000):
+        return [
+            {'role': 'user', 'content': f'Message {i}', 'bubbleId': f'msg{i}',
+             'composerId': f'session{i % sessions}', 'timestamp': start + i}
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _commit(parent_committed_date=2000):
+        mock_commit = Mock(spec=Commit)
+        mock_commit.hexsha = "abc123"
+        parent = Mock()
+        parent.committed_date = parent_committed_date
+        mock_commit.parents = [parent]
+        return mock_commit
+
+    def test_skip_reasons(self):
+        """Test each heuristic and that mixed, older windows still get the AI call"""
+        from mcp_commit_story.context_collection import _boundary_filter_skip_reason, MIN_MESSAGES_FOR_BOUNDARY_FILTER
+        count = MIN_MESSAGES_FOR_BOUNDARY_FILTER
+
+        assert _boundary_filter_skip_reason(self._messages(count - 1), self._commit()) == "few_messages"
+        assert _boundary_filter_skip_reason(self._messages(count, sessions=1), self._commit()) == "single_session"
+        # Parent committed at 500s; every message (from 1,000,000ms) is newer
+        assert _boundary_filter_skip_reason(self._messages(count), self._commit(500)) == "after_parent_commit"
+        assert _boundary_filter_skip_reason(self._messages(count), self._commit(2000)) is None
+
+    @patch('mcp_commit_story.context_collection.filter_chat_for_commit')
+    @patch('mcp_commit_story.context_collection.query_cursor_chat_database')
+    @patch('mcp_commit_story.context_collection.collect_git_context')
+    def test_skipped_filter_reports_telemetry(self, mock_git_context, mock_query, mock_filter):
+        """Test that a skipped boundary call makes no AI or git calls and records the reason"""
+        raw_messages = self._messages(3)
+        mock_query.return_value = {'chat_history': raw_messages}
+
+        with patch('opentelemetry.trace.get_current_span') as mock_span:
+            mock_span_instance = Mock()
+            mock_span.return_value = mock_span_instance
+
+            result = collect_chat_history(commit=self._commit(), max_messages_back=150)
+
+        mock_filter.assert_not_called()
+        mock_git_context.assert_not_called()
+        assert len(result['messages']) == 3
+        mock_span_instance.set_attribute.assert_any_call("ai_filter.skipped", True)
+        mock_span_instance.set_attribute.assert_any_call("ai_filter.skip_reason", "few_messages")
+
+
 class TestPipelineIntegration:
     """Test complete pipeline integration"""
 
@@ -222,7 +276,8 @@ class TestPipelineIntegration:
     @patch('mcp_commit_story.cursor_db.find_workspace_composer_databases')
     @patch('mcp_commit_story.cursor_db.detect_workspace_for_repo')
     @patch('mcp_commit_story.context_collection.collect_git_context')
-    def test_end_to_end_pipeline_with_ai_filtering(self, mock_git_context, mock_detect_workspace, mock_find_workspace, mock_discover, mock_time, mock_provider, mock_filter):
+    @patch('mcp_commit_story.context_collection._boundary_filter_skip_reason', return_value=None)
+    def test_end_to_end_pipeline_with_ai_filtering(self, mock_skip_reason, mock_git_context, mock_detect_workspace, mock_find_workspace, mock_discover, mock_time, mock_provider, mock_filter):
         """Test complete pipeline from orchestrator through AI filtering"""
         # Reset circuit breaker to ensure clean test state
         from mcp_commit_story.cursor_db import reset_circuit_breaker
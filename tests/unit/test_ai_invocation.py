@@ -6,8 +6,10 @@ and graceful degradation for production use in git hooks.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
+import os
 import time
+from mcp_commit_story import ai_invocation
 from mcp_commit_story.ai_invocation import invoke_ai
 
 
@@ -138,4 +140,178 @@ class TestAIInvocation:
             
             result = invoke_ai("Test prompt", {"context": "data"})
             
-            assert result == "" 
\ No newline at end of file
+            assert result == "" 
+
+class TestProviderReuse:
+    """Test that invoke_ai reuses one provider and one parsed config across calls."""
+    
+    def test_provider_created_once_across_calls_and_retries(self):
+        """Test that repeated calls and retries share a single provider."""
+        with patch('mcp_commit_story.ai_invocation.OpenAIProvider') as mock_provider_class:
+            mock_provider = Mock()
+            mock_provider.call.side_effect = [Exception("Temp error"), "First", "Second"]
+            mock_provider_class.return_value = mock_provider
+            
+            with patch('time.sleep'):
+                assert invoke_ai("Prompt 1", {}) == "First"
+                assert invoke_ai("Prompt 2", {}) == "Second"
+            
+            assert mock_provider_class.call_count == 1
+            assert mock_provider.call.call_count == 3
+    
+    def test_config_parsed_once_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that config is re-read only when the config file changes."""
+        config_file = tmp_path / '.mcp-commit-storyrc.yaml'
+        config_file.write_text('ai:\n  openai_api_key: "sk-first-key"\n')
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr('os.path.expanduser', lambda path: str(tmp_path / 'no-global-config.yaml'))
+        
+        with patch('mcp_commit_story.ai_invocation.OpenAIProvider') as mock_provider_class, \
+             patch('mcp_commit_story.ai_invocation.load_config', wraps=ai_invocation.load_config) as mock_load_config:
+            mock_provider_class.return_value.call.return_value = "ok"
+            
+            invoke_ai("Prompt", {})
+            invoke_ai("Prompt", {})
+            assert mock_load_config.call_count == 1
+            assert mock_provider_class.call_count == 1
+            
+            # Rewriting the config (new API key, new mtime) reloads it and builds a new provider
+            config_file.write_text('ai:\n  openai_api_key: "sk-second-key"\n')
+            stat = config_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            invoke_ai("Prompt", {})
+            
+            assert mock_load_config.call_count == 2
+            assert mock_provider_class.call_count == 2
+            assert mock_provider_class.call_args[1]['config'].ai_openai_api_key == "sk-second-key"
+    
+    def test_failed_provider_creation_is_not_cached(self):
+        """Test that a provider that failed to initialize is retried on the next call."""
+        with patch('mcp_commit_story.ai_invocation.OpenAIProvider') as mock_provider_class:
+            mock_provider = Mock()
+            mock_provider.call.return_value = "Recovered"
+            mock_provider_class.side_effect = [ValueError("OpenAI API key not configured"), mock_provider]
+            
+            assert invoke_ai("Prompt", {}) == ""
+            assert invoke_ai("Prompt", {}) == "Recovered"
+            assert mock_provider_class.call_count == 2
+
+
+def _api_status_error(error_class, status_code, headers=None):
+    """Build an OpenAI API status error with the given response headers."""
+    import httpx
+    request = httpx.Request('POST', 'https://api.openai.com/v1/chat/completions')
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return error_class(f"HTTP {status_code}", response=response, body=None)
+
+
+class TestAsyncInvokeAI:
+    """Test ainvoke_ai backoff, Retry-After handling and deadlines."""
+    
+    @pytest.mark.asyncio
+    async def test_retries_with_backoff_and_honors_retry_after(self):
+        """Test that a rate-limited call waits for Retry-After and then succeeds."""
+        import openai
+        from mcp_commit_story.ai_invocation import ainvoke_ai
+        
+        with patch('mcp_commit_story.ai_invocation.OpenAIProvider') as mock_provider_class, \
+             patch('mcp_commit_story.ai_invocation.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            mock_provider = Mock()
+            mock_provider.acall = AsyncMock(side_effect=[
+                _api_status_error(openai.RateLimitError, 429, {'retry-after': '2'}),
+                _api_status_error(openai.InternalServerError, 500),
+                "Async response"
+            ])
+            mock_provider_class.return_value = mock_provider
+            
+            result = await ainvoke_ai("Prompt", {})
+        
+        assert result == "Async response"
+        assert mock_provider.acall.await_count == 3
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        assert delays[0] == 2.0
+        assert 0 <= delays[1] <= ai_invocation.ASYNC_BACKOFF_BASE_DELAY * 2
+    
+    @pytest.mark.asyncio
+    async def test_permanent_errors_are_not_retried(self):
+        """Test that a 400 response fails immediately without backoff."""
+        import openai
+        from mcp_commit_story.ai_invocation import ainvoke_ai
+        
+        with patch('mcp_commit_story.ai_invocation.OpenAIProvider') as mock_provider_class, \
+             patch('mcp_commit_story.ai_invocation.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            mock_provider = Mock()
+            mock_provider.acall = AsyncMock(side_effect=_api_status_error(openai.BadRequestError, 400))
+            mock_provider_class.return_value = mock_provider
+            
+            result = await ainvoke_ai("Prompt", {})
+        
+        assert result == ""
+        assert mock_provider.acall.await_count == 1
+        mock_sleep.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_connection_errors_are_retried(self):
+        """Test that connection failures and timeouts are retried."""
+        import httpx
+        import openai
+        from mcp_commit_story.ai_invocation import ainvoke_ai
+        
+        request = httpx.Request('POST', 'https://api.openai.com/v1/chat/completions')
+        with patch('mcp_commit_story.ai_invocation.OpenAIProvider') as mock_provider_class, \
+             patch('mcp_commit_story.ai_invocation.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            mock_provider = Mock()
+            mock_provider.acall = AsyncMock(side_effect=[
+                openai.APIConnectionError(request=request),
+                openai.APITimeoutError(request=request),
+                "Async response"
+            ])
+            mock_provider_class.return_value = mock_provider
+            
+            result = await ainvoke_ai("Prompt", {})
+        
+        assert result == "Async response"
+        assert mock_sleep.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_unexpected_errors_are_not_retried(self):
+        """Test that errors other than connection, timeout or retryable status failures fail fast."""
+        from mcp_commit_story.ai_invocation import ainvoke_ai
+        
+        with patch('mcp_commit_story.ai_invocation.OpenAIProvider') as mock_provider_class, \
+             patch('mcp_commit_story.ai_invocation.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            mock_provider = Mock()
+            mock_provider.acall = AsyncMock(side_effect=TypeError("bad argument"))
+            mock_provider_class.return_value = mock_provider
+            
+            result = await ainvoke_ai("Prompt", {})
+        
+        assert result == ""
+        assert mock_provider.acall.await_count == 1
+        mock_sleep.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_deadline_stops_retries(self):
+        """Test that a call gives up once the backoff would pass its deadline."""
+        import openai
+        from mcp_commit_story.ai_invocation import ainvoke_ai
+        
+        with patch('mcp_commit_story.ai_invocation.OpenAIProvider') as mock_provider_class, \
+             patch('mcp_commit_story.ai_invocation.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            mock_provider = Mock()
+            mock_provider.acall = AsyncMock(
+                side_effect=_api_status_error(openai.RateLimitError, 429, {'retry-after': '20'})
+            )
+            mock_provider_class.return_value = mock_provider
+            
+            result = await ainvoke_ai("Prompt", {}, timeout=5)
+        
+        assert result == ""
+        assert mock_provider.acall.await_count == 1
+        mock_sleep.assert_not_awaited()
+    
+    def test_backoff_delay_is_capped(self):
+        """Test that jittered delays and Retry-After values respect the maximum delay."""
+        for attempt in range(10):
+            assert 0 <= ai_invocation._backoff_delay(attempt) <= ai_invocation.ASYNC_BACKOFF_MAX_DELAY
+        assert ai_invocation._backoff_delay(0, retry_after=600) == ai_invocation.ASYNC_BACKOFF_MAX_DELAY
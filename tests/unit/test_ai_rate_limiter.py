@@ -0,0 +1,104 @@
+"""
+Tests for the client-side AI rate limiter.
+
+Covers the token buckets, queueing instead of failing, the shared state file,
+and invoke_ai integration.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from mcp_commit_story import ai_invocation, ai_rate_limiter
+from mcp_commit_story.ai_invocation import invoke_ai
+from mcp_commit_story.ai_rate_limiter import AIRateLimiter, AI_RATE_LIMIT_STATE_FILENAME
+from mcp_commit_story.journal_cache import CACHE_DIR_NAME
+
+# The autouse conftest fixture replaces _get_rate_limiter; keep the real one for config tests
+_real_get_rate_limiter = ai_invocation._get_rate_limiter
+
+
+class TestTokenBuckets:
+    """Test budget accounting."""
+
+    def test_request_budget_allows_burst_then_reports_wait(self):
+        limiter = AIRateLimiter(requests_per_minute=2, tokens_per_minute=None)
+
+        assert limiter.try_acquire() == 0
+        assert limiter.try_acquire() == 0
+        # The third request fits once half a minute's refill has accumulated
+        assert limiter.try_acquire() == pytest.approx(30, abs=0.5)
+
+    def test_token_budget_and_oversized_requests(self):
+        limiter = AIRateLimiter(requests_per_minute=None, tokens_per_minute=600)
+
+        assert limiter.try_acquire(tokens=500) == 0
+        assert limiter.try_acquire(tokens=200) == pytest.approx(10, abs=0.5)
+        # A request larger than the whole budget waits for a full bucket instead of forever
+        assert limiter.try_acquire(tokens=10000) == pytest.approx(50, abs=0.5)
+
+    def test_acquire_queues_instead_of_failing(self):
+        limiter = AIRateLimiter(requests_per_minute=60, tokens_per_minute=None)
+        limiter.try_acquire()
+        limiter._state['requests']['level'] = 0
+
+        with patch('mcp_commit_story.ai_rate_limiter.time.sleep') as mock_sleep:
+            # Each sleep moves the bucket clock back so the refill is observed
+            def advance(seconds):
+                limiter._state['requests']['updated'] -= seconds
+            mock_sleep.side_effect = advance
+            assert limiter.acquire() is True
+
+        assert mock_sleep.called
+
+    def test_acquire_timeout(self):
+        limiter = AIRateLimiter(requests_per_minute=1, tokens_per_minute=None)
+        limiter.try_acquire()
+
+        assert limiter.acquire(timeout=0.01) is False
+
+
+class TestSharedState:
+    """Test the budget shared between processes through the state file."""
+
+    def test_limiters_share_budget_through_state_file(self, tmp_path):
+        first = AIRateLimiter.for_journal(tmp_path, requests_per_minute=2, tokens_per_minute=None)
+        second = AIRateLimiter.for_journal(tmp_path, requests_per_minute=2, tokens_per_minute=None)
+
+        assert first.try_acquire() == 0
+        assert second.try_acquire() == 0
+        assert first.try_acquire() > 0
+        assert (tmp_path / CACHE_DIR_NAME / AI_RATE_LIMIT_STATE_FILENAME).exists()
+
+    def test_unwritable_state_falls_back_to_process_state(self, tmp_path):
+        blocker = tmp_path / "blocker"
+        blocker.write_text("not a directory")
+        limiter = AIRateLimiter(requests_per_minute=5, tokens_per_minute=None, state_path=blocker / "state.json")
+
+        assert limiter.try_acquire() == 0
+        assert limiter.state_path is None
+
+
+class TestInvokeAIRateLimit:
+    """Test invoke_ai integration."""
+
+    def test_invoke_ai_acquires_before_each_call(self, monkeypatch):
+        limiter = Mock()
+        monkeypatch.setattr(ai_invocation, '_get_rate_limiter', lambda config: limiter)
+
+        with patch('mcp_commit_story.ai_invocation.OpenAIProvider') as mock_provider_class:
+            mock_provider_class.return_value.call.return_value = "ok"
+            assert invoke_ai("Prompt", {"git": {"message": "x" * 400}}) == "ok"
+
+        limiter.acquire.assert_called_once()
+        assert limiter.acquire.call_args[0][0] > 100
+
+    def test_rate_limit_config(self, tmp_path):
+        config = {'journal': {'path': str(tmp_path)}, 'ai': {'rate_limit': {'requests_per_minute': 10}}}
+        limiter = _real_get_rate_limiter(config)
+
+        assert limiter.capacities['requests'] == 10
+        assert limiter.capacities['tokens'] == ai_rate_limiter.DEFAULT_TOKENS_PER_MINUTE
+        assert limiter.state_path == tmp_path / CACHE_DIR_NAME / AI_RATE_LIMIT_STATE_FILENAME
+        assert _real_get_rate_limiter(config) is limiter
+        assert _real_get_rate_limiter({'ai': {'rate_limit': {'enabled': False}}}) is None
+        assert _real_get_rate_limiter({'ai': {'rate_limit': {'shared': False}}}).state_path is None
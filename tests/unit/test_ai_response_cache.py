@@ -0,0 +1,154 @@
+"""
+Tests for the content-addressed AI response cache.
+
+Covers key derivation, LRU eviction by total size, graceful degradation when
+the cache cannot be opened, and invoke_ai integration including the opt-outs.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from mcp_commit_story import ai_invocation
+from mcp_commit_story.ai_invocation import invoke_ai
+from mcp_commit_story.ai_response_cache import (
+    AIResponseCache,
+    AI_RESPONSE_CACHE_FILENAME,
+    make_cache_key
+)
+from mcp_commit_story.journal_cache import CACHE_DIR_NAME
+
+# The autouse conftest fixture replaces _get_response_cache; keep the real one for config tests
+_real_get_response_cache = ai_invocation._get_response_cache
+
+
+class TestCacheKey:
+    """Test content addressing."""
+
+    def test_context_key_order_does_not_matter(self):
+        """Test that equal contexts with different dict ordering share a key."""
+        first = make_cache_key("gpt-4o-mini", "prompt", {"git": {"a": 1, "b": 2}, "chat": None})
+        second = make_cache_key("gpt-4o-mini", "prompt", {"chat": None, "git": {"b": 2, "a": 1}})
+        assert first == second
+
+    def test_model_prompt_and_context_change_the_key(self):
+        """Test that every part of the request is part of the key."""
+        base = make_cache_key("gpt-4o-mini", "prompt", {"x": 1})
+        assert make_cache_key("gpt-4o", "prompt", {"x": 1}) != base
+        assert make_cache_key("gpt-4o-mini", "prompt!", {"x": 1}) != base
+        assert make_cache_key("gpt-4o-mini", "prompt", {"x": 2}) != base
+
+
+class TestAIResponseCache:
+    """Test cache storage semantics."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a stored response is returned for the same key."""
+        cache = AIResponseCache(tmp_path / "cache" / AI_RESPONSE_CACHE_FILENAME)
+        cache.put("key-1", "response one")
+
+        assert cache.get("key-1") == "response one"
+        assert cache.get("missing") is None
+        assert (tmp_path / "cache" / ".gitignore").read_text() == "*\n"
+
+    def test_empty_responses_not_stored(self, tmp_path):
+        """Test that failed (empty) responses are never cached."""
+        cache = AIResponseCache(tmp_path / AI_RESPONSE_CACHE_FILENAME)
+        cache.put("key-1", "")
+
+        assert cache.get("key-1") is None
+
+    def test_lru_eviction_by_total_size(self, tmp_path):
+        """Test that least recently used entries are evicted once max_bytes is exceeded."""
+        cache = AIResponseCache(tmp_path / AI_RESPONSE_CACHE_FILENAME, max_bytes=25)
+        with patch('mcp_commit_story.ai_response_cache.time.time', side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.put("old", "a" * 10)
+            cache.put("recent", "b" * 10)
+            assert cache.get("old") == "a" * 10  # refreshes "old"
+            cache.put("new", "c" * 10)
+
+        assert cache.get("recent") is None
+        assert cache.get("old") == "a" * 10
+        assert cache.get("new") == "c" * 10
+        assert cache.stats() == {'entries': 2, 'total_bytes': 20}
+
+    def test_for_journal_uses_journal_cache_dir(self, tmp_path):
+        """Test that the cache file lives in the journal's .cache directory."""
+        cache = AIResponseCache.for_journal(tmp_path / "journal")
+        assert cache.cache_path == tmp_path / "journal" / CACHE_DIR_NAME / AI_RESPONSE_CACHE_FILENAME
+
+    def test_unwritable_location_degrades_to_misses(self, tmp_path):
+        """Test that a cache that cannot be opened behaves as always-miss."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("file")
+        cache = AIResponseCache(blocker / AI_RESPONSE_CACHE_FILENAME)
+
+        cache.put("key-1", "response")
+        assert cache.get("key-1") is None
+
+
+class TestInvokeAIResponseCache:
+    """Test invoke_ai integration with the response cache."""
+
+    @pytest.fixture
+    def response_cache(self, tmp_path):
+        cache = AIResponseCache(tmp_path / AI_RESPONSE_CACHE_FILENAME)
+        with patch('mcp_commit_story.ai_invocation._get_response_cache', return_value=cache):
+            yield cache
+        cache.close()
+
+    def test_identical_request_served_from_cache(self, response_cache):
+        """Test that a repeated request does not call the provider again."""
+        with patch('mcp_commit_story.ai_invocation.OpenAIProvider') as mock_provider_class:
+            mock_provider_class.return_value.call.return_value = "Generated summary"
+
+            assert invoke_ai("Summarize", {"git": {"message": "fix"}}) == "Generated summary"
+            assert invoke_ai("Summarize", {"git": {"message": "fix"}}) == "Generated summary"
+            assert invoke_ai("Summarize", {"git": {"message": "other"}}) == "Generated summary"
+
+            assert mock_provider_class.return_value.call.call_count == 2
+
+    def test_failed_calls_are_not_cached(self, response_cache):
+        """Test that an empty response is retried on the next invocation."""
+        with patch('mcp_commit_story.ai_invocation.OpenAIProvider') as mock_provider_class:
+            mock_provider_class.return_value.call.side_effect = ["", "Recovered"]
+
+            assert invoke_ai("Summarize", {}) == ""
+            assert invoke_ai("Summarize", {}) == "Recovered"
+
+    def test_use_cache_false_bypasses_cache(self, response_cache):
+        """Test the per-call opt-out."""
+        with patch('mcp_commit_story.ai_invocation.OpenAIProvider') as mock_provider_class:
+            mock_provider_class.return_value.call.side_effect = ["First", "Second"]
+
+            assert invoke_ai("Summarize", {}, use_cache=False) == "First"
+            assert invoke_ai("Summarize", {}, use_cache=False) == "Second"
+            assert response_cache.stats()['entries'] == 0
+
+
+class TestResponseCacheConfig:
+    """Test how the response cache is configured."""
+
+    def _config(self, ai_section, journal_path):
+        config = Mock()
+        config.get.side_effect = lambda key, default=None: {
+            'ai': ai_section,
+            'journal': {'path': str(journal_path)}
+        }.get(key, default)
+        return config
+
+    def test_enabled_by_default_under_journal(self, tmp_path):
+        """Test that the cache defaults on and lives under the journal path."""
+        cache = _real_get_response_cache(self._config({'openai_api_key': 'sk-test'}, tmp_path / "journal"))
+
+        assert cache is not None
+        assert cache.cache_path.parent == tmp_path / "journal" / CACHE_DIR_NAME
+
+    def test_opt_out_flag(self, tmp_path):
+        """Test that ai.response_cache.enabled: false disables the cache."""
+        config = self._config({'response_cache': {'enabled': False}}, tmp_path / "journal")
+        assert _real_get_response_cache(config) is None
+
+    def test_max_size_mb(self, tmp_path):
+        """Test that max_size_mb sets the cache bound."""
+        config = self._config({'response_cache': {'max_size_mb': 2}}, tmp_path / "journal")
+        assert _real_get_response_cache(config).max_bytes == 2 * 1024 * 1024
@@ -10,12 +10,13 @@ Covers core functionality:
 """
 
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import AsyncMock, patch, Mock
 from pathlib import Path
 from datetime import datetime
 
 from mcp_commit_story.journal_handlers import (
     handle_journal_capture_context, 
+    ahandle_journal_capture_context,
     format_ai_context_capture
 )
 from mcp_commit_story.server import handle_journal_capture_context_mcp
@@ -161,6 +162,28 @@ class TestCaptureContextHandler:
             assert "AI Context Capture" in content
 
 
+    @pytest.mark.asyncio
+    async def test_async_ai_context_dump_awaits_ainvoke_ai(self, tmp_path):
+        """Test the async handler awaits ainvoke_ai with a deadline instead of calling invoke_ai."""
+        with patch('mcp_commit_story.journal_handlers.load_config') as mock_config, \
+             patch('mcp_commit_story.journal_handlers.get_journal_file_path') as mock_path, \
+             patch('mcp_commit_story.journal_handlers.append_to_journal_file') as mock_append, \
+             patch('mcp_commit_story.journal_handlers.invoke_ai') as mock_ai, \
+             patch('mcp_commit_story.journal_handlers.ainvoke_ai', new=AsyncMock()) as mock_aai:
+            
+            mock_config.return_value = Mock(journal_path=str(tmp_path))
+            mock_path.return_value = "journal/daily/2025-07-10-journal.md"
+            mock_aai.return_value = "Async AI context dump content"
+            
+            result = await ahandle_journal_capture_context(None, timeout=12)
+        
+        assert result["status"] == "success"
+        assert result["file_path"] == str(tmp_path / "daily" / "2025-07-10-journal.md")
+        mock_ai.assert_not_called()
+        mock_aai.assert_awaited_once()
+        assert mock_aai.await_args.kwargs["timeout"] == 12
+        assert "Async AI context dump content" in mock_append.call_args.args[0]
+
 class TestFormatAIContextCapture:
     """Test AI context capture formatting function."""
 
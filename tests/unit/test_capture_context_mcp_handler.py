@@ -13,7 +13,7 @@ class TestCaptureContextMCPHandler:
     @pytest.mark.asyncio
     async def test_handle_capture_context_valid_text(self):
         """Test MCP handler with valid text parameter."""
-        with patch('src.mcp_commit_story.server.handle_journal_capture_context') as mock_handler:
+        with patch('src.mcp_commit_story.server.ahandle_journal_capture_context') as mock_handler:
             mock_handler.return_value = {
                 "status": "success", 
                 "file_path": "/test/path/2025-07-10-journal.md"
@@ -33,7 +33,7 @@ class TestCaptureContextMCPHandler:
     @pytest.mark.asyncio
     async def test_handle_capture_context_none_text_generates_dump(self):
         """Test MCP handler with None text parameter triggers AI context dump."""
-        with patch('src.mcp_commit_story.server.handle_journal_capture_context') as mock_handler:
+        with patch('src.mcp_commit_story.server.ahandle_journal_capture_context') as mock_handler:
             mock_handler.return_value = {
                 "status": "success", 
                 "file_path": "/test/path/2025-07-10-journal.md"
@@ -53,7 +53,7 @@ class TestCaptureContextMCPHandler:
     @pytest.mark.asyncio
     async def test_handle_capture_context_missing_text_field(self):
         """Test MCP handler with missing text field uses None."""
-        with patch('src.mcp_commit_story.server.handle_journal_capture_context') as mock_handler:
+        with patch('src.mcp_commit_story.server.ahandle_journal_capture_context') as mock_handler:
             mock_handler.return_value = {
                 "status": "success", 
                 "file_path": "/test/path/2025-07-10-journal.md"
@@ -69,7 +69,7 @@ class TestCaptureContextMCPHandler:
     @pytest.mark.asyncio
     async def test_handle_capture_context_core_function_error(self):
         """Test MCP handler when core function raises error."""
-        with patch('src.mcp_commit_story.server.handle_journal_capture_context') as mock_handler:
+        with patch('src.mcp_commit_story.server.ahandle_journal_capture_context') as mock_handler:
             mock_handler.side_effect = Exception("Failed to write to journal")
             
             request = {
@@ -84,7 +84,7 @@ class TestCaptureContextMCPHandler:
     @pytest.mark.asyncio
     async def test_handle_capture_context_response_format(self):
         """Test MCP handler returns proper response format."""
-        with patch('src.mcp_commit_story.server.handle_journal_capture_context') as mock_handler:
+        with patch('src.mcp_commit_story.server.ahandle_journal_capture_context') as mock_handler:
             mock_handler.return_value = {
                 "status": "success", 
                 "file_path": "/test/path/2025-07-10-journal.md",
@@ -109,7 +109,7 @@ class TestCaptureContextMCPHandler:
     @pytest.mark.asyncio
     async def test_handle_capture_context_core_function_returns_error(self):
         """Test MCP handler when core function returns error status."""
-        with patch('src.mcp_commit_story.server.handle_journal_capture_context') as mock_handler:
+        with patch('src.mcp_commit_story.server.ahandle_journal_capture_context') as mock_handler:
             mock_handler.return_value = {
                 "status": "error", 
                 "file_path": "",
@@ -133,7 +133,7 @@ class TestCaptureContextMCPHandler:
             mock_metrics = MagicMock()
             mock_get_metrics.return_value = mock_metrics
             
-            with patch('src.mcp_commit_story.server.handle_journal_capture_context') as mock_handler:
+            with patch('src.mcp_commit_story.server.ahandle_journal_capture_context') as mock_handler:
                 mock_handler.return_value = {
                     "status": "success", 
                     "file_path": "/test/path/2025-07-10-journal.md"
@@ -151,7 +151,7 @@ class TestCaptureContextMCPHandler:
     @pytest.mark.asyncio
     async def test_handle_capture_context_trace_operation_attributes(self):
         """Test that MCP handler has proper trace operation attributes."""
-        with patch('src.mcp_commit_story.server.handle_journal_capture_context') as mock_handler:
+        with patch('src.mcp_commit_story.server.ahandle_journal_capture_context') as mock_handler:
             mock_handler.return_value = {
                 "status": "success", 
                 "file_path": "/test/path/2025-07-10-journal.md"
@@ -184,7 +184,7 @@ class TestCaptureContextMCPHandler:
     async def test_handle_capture_context_validation_error_handling(self):
         """Test that validation errors from FastMCP/Pydantic are handled gracefully."""
         # This test simulates the dict_type validation error we encountered
-        with patch('src.mcp_commit_story.server.handle_journal_capture_context') as mock_handler:
+        with patch('src.mcp_commit_story.server.ahandle_journal_capture_context') as mock_handler:
             # Simulate the validation error that would be raised by FastMCP
             validation_error = ValueError("Input should be a valid dictionary [type=dict_type, input_value='{\"text\": \"test\"}', input_type=str]")
             mock_handler.side_effect = validation_error
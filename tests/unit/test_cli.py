@@ -201,7 +201,7 @@ def test_install_hook_background_flag():
         assert result.exit_code == 0
         
         # Verify the install function was called with background=True
-        mock_install.assert_called_once_with(None, background=True, timeout=30)
+        mock_install.assert_called_once_with(None, background=True, timeout=30, daemon=False)
         
         # Verify the output mentions background mode
         assert 'background mode' in result.output
@@ -225,7 +225,7 @@ def test_install_hook_background_flag_with_timeout():
         assert result.exit_code == 0
         
         # Verify the install function was called with correct parameters
-        mock_install.assert_called_once_with(None, background=True, timeout=45)
+        mock_install.assert_called_once_with(None, background=True, timeout=45, daemon=False)
         
         # Verify the output mentions background mode
         assert 'background mode' in result.output
@@ -816,4 +816,139 @@ class TestComposerChatProviderLogging:
         end_ts = to_timestamp_ms(BASE_TIME + timedelta(minutes=30))
         mock_logger.debug.assert_called_with(
             f"No messages found in time window {start_ts} to {end_ts}"
-        ) 
\ No newline at end of file
+        ) 
+
+class TestComposerChatProviderBatchedBubbles:
+    """Test batched bubble retrieval mode (batch_bubbles=True)."""
+
+    def _session_metadata(self):
+        return {
+            "allComposers": [
+                {
+                    "composerId": "session-1",
+                    "name": "Batched session",
+                    "createdAt": to_timestamp_ms(BASE_TIME + timedelta(minutes=10)),
+                    "lastUpdatedAt": to_timestamp_ms(BASE_TIME + timedelta(minutes=20)),
+                    "type": "head"
+                }
+            ]
+        }
+
+    @patch('mcp_commit_story.composer_chat_provider.execute_cursor_query')
+    def test_batched_mode_fetches_session_bubbles_in_one_query(self, mock_execute_query):
+        """Test that all bubbles of a session are fetched with a single IN (...) query."""
+        # Arrange
+        from mcp_commit_story.composer_chat_provider import ComposerChatProvider
+        provider = ComposerChatProvider("/workspace.vscdb", "/global.vscdb", batch_bubbles=True)
+
+        message_headers = {
+            "fullConversationHeadersOnly": [
+                {"bubbleId": "msg-1", "type": 1},
+                {"bubbleId": "msg-2", "type": 2},
+                {"bubbleId": "msg-3", "type": 1}
+            ]
+        }
+
+        # Database returns rows in a different order than the conversation
+        mock_execute_query.side_effect = [
+            [(json.dumps(self._session_metadata()),)],
+            [(json.dumps(message_headers),)],
+            [
+                ("bubbleId:session-1:msg-3", json.dumps({"text": "third"})),
+                ("bubbleId:session-1:msg-1", json.dumps({"text": "first"})),
+                ("bubbleId:session-1:msg-2", json.dumps({"text": "second"}))
+            ]
+        ]
+
+        # Act
+        result = provider.getChatHistoryForCommit(
+            to_timestamp_ms(BASE_TIME), to_timestamp_ms(BASE_TIME + timedelta(hours=1))
+        )
+
+        # Assert - order follows fullConversationHeadersOnly
+        assert [msg['content'] for msg in result] == ["first", "second", "third"]
+        assert [msg['bubbleId'] for msg in result] == ["msg-1", "msg-2", "msg-3"]
+        assert [msg['role'] for msg in result] == ["user", "assistant", "user"]
+        assert mock_execute_query.call_count == 3
+
+        batch_call = mock_execute_query.call_args_list[2]
+        assert batch_call == call(
+            "/global.vscdb",
+            "SELECT [key], value FROM cursorDiskKV WHERE [key] IN (?, ?, ?)",
+            ("bubbleId:session-1:msg-1", "bubbleId:session-1:msg-2", "bubbleId:session-1:msg-3")
+        )
+
+    @patch('mcp_commit_story.composer_chat_provider.execute_cursor_query')
+    def test_batched_mode_skips_missing_bubbles(self, mock_execute_query):
+        """Test that bubbles absent from the database are skipped like in per-bubble mode."""
+        # Arrange
+        from mcp_commit_story.composer_chat_provider import ComposerChatProvider
+        provider = ComposerChatProvider("/workspace.vscdb", "/global.vscdb", batch_bubbles=True)
+
+        message_headers = {
+            "fullConversationHeadersOnly": [
+                {"bubbleId": "msg-1", "type": 1},
+                {"bubbleId": "msg-missing", "type": 2},
+                {"bubbleId": "msg-empty", "type": 2}
+            ]
+        }
+
+        mock_execute_query.side_effect = [
+            [(json.dumps(self._session_metadata()),)],
+            [(json.dumps(message_headers),)],
+            [
+                ("bubbleId:session-1:msg-1", json.dumps({"text": "hello"})),
+                ("bubbleId:session-1:msg-empty", json.dumps({"text": "   "}))
+            ]
+        ]
+
+        # Act
+        result = provider.getChatHistoryForCommit(
+            to_timestamp_ms(BASE_TIME), to_timestamp_ms(BASE_TIME + timedelta(hours=1))
+        )
+
+        # Assert
+        assert len(result) == 1
+        assert result[0]['bubbleId'] == "msg-1"
+
+    @patch('mcp_commit_story.composer_chat_provider.BUBBLE_BATCH_SIZE', 2)
+    @patch('mcp_commit_story.composer_chat_provider.execute_cursor_query')
+    def test_batched_mode_chunks_large_sessions(self, mock_execute_query):
+        """Test that sessions larger than BUBBLE_BATCH_SIZE are fetched in chunks."""
+        # Arrange
+        from mcp_commit_story.composer_chat_provider import ComposerChatProvider
+        provider = ComposerChatProvider("/workspace.vscdb", "/global.vscdb")
+
+        mock_execute_query.side_effect = [
+            [("bubbleId:session-1:a", json.dumps({"text": "a"})),
+             ("bubbleId:session-1:b", json.dumps({"text": "b"}))],
+            [("bubbleId:session-1:c", json.dumps({"text": "c"}))]
+        ]
+
+        # Act
+        bubbles = provider._get_session_bubbles("session-1", ["a", "b", "c"])
+
+        # Assert
+        assert bubbles == {"a": {"text": "a"}, "b": {"text": "b"}, "c": {"text": "c"}}
+        assert mock_execute_query.call_count == 2
+        assert mock_execute_query.call_args_list[1][0][2] == ("bubbleId:session-1:c",)
+
+    @patch('mcp_commit_story.composer_chat_provider.execute_cursor_query')
+    def test_batched_mode_errors_bubble_up(self, mock_execute_query):
+        """Test that database errors during batched retrieval propagate unchanged."""
+        # Arrange
+        from mcp_commit_story.composer_chat_provider import ComposerChatProvider
+        provider = ComposerChatProvider("/workspace.vscdb", "/global.vscdb", batch_bubbles=True)
+
+        message_headers = {"fullConversationHeadersOnly": [{"bubbleId": "msg-1", "type": 1}]}
+        mock_execute_query.side_effect = [
+            [(json.dumps(self._session_metadata()),)],
+            [(json.dumps(message_headers),)],
+            CursorDatabaseAccessError("Global database locked", path="/global.vscdb")
+        ]
+
+        # Act & Assert
+        with pytest.raises(CursorDatabaseAccessError):
+            provider.getChatHistoryForCommit(
+                to_timestamp_ms(BASE_TIME), to_timestamp_ms(BASE_TIME + timedelta(hours=1))
+            )
@@ -0,0 +1,164 @@
+"""
+Tests for the incremental Composer session cache.
+
+Covers cache hits and misses keyed by lastUpdatedAt, the journal cache
+directory layout, graceful degradation when the cache cannot be opened, and
+ComposerChatProvider integration.
+"""
+
+import json
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from mcp_commit_story.cursor_db.session_cache import (
+    ComposerSessionCache,
+    SESSION_CACHE_FILENAME,
+    get_session_cache_for_repo
+)
+from mcp_commit_story.journal_cache import CACHE_DIR_NAME, resolve_journal_path
+from mcp_commit_story.composer_chat_provider import ComposerChatProvider
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "cursor_databases"
+
+SAMPLE_MESSAGES = [
+    {
+        'role': 'user',
+        'content': 'How do I add caching?',
+        'timestamp': 1000,
+        'sessionName': 'Caching',
+        'composerId': 'session-1',
+        'bubbleId': 'msg-1'
+    }
+]
+
+
+class TestComposerSessionCache:
+    """Test cache storage semantics."""
+
+    def test_hit_when_last_updated_at_unchanged(self, tmp_path):
+        """Test that stored messages are returned for the same lastUpdatedAt."""
+        cache = ComposerSessionCache.for_journal(tmp_path)
+        cache.put("session-1", 2000, SAMPLE_MESSAGES)
+
+        assert cache.get("session-1", 2000) == SAMPLE_MESSAGES
+        cache.close()
+
+    def test_miss_when_last_updated_at_moved(self, tmp_path):
+        """Test that a moved lastUpdatedAt invalidates the entry."""
+        cache = ComposerSessionCache.for_journal(tmp_path)
+        cache.put("session-1", 2000, SAMPLE_MESSAGES)
+
+        assert cache.get("session-1", 2500) is None
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that entries survive between journal runs."""
+        first = ComposerSessionCache.for_journal(tmp_path)
+        first.put("session-1", 2000, SAMPLE_MESSAGES)
+        first.close()
+
+        second = ComposerSessionCache.for_journal(tmp_path)
+        assert second.get("session-1", 2000) == SAMPLE_MESSAGES
+        second.close()
+
+    def test_missing_last_updated_at_is_never_cached(self, tmp_path):
+        """Test that sessions without lastUpdatedAt bypass the cache."""
+        cache = ComposerSessionCache.for_journal(tmp_path)
+        cache.put("session-1", None, SAMPLE_MESSAGES)
+
+        assert cache.get("session-1", None) is None
+        assert not (tmp_path / CACHE_DIR_NAME).exists()
+
+    def test_cache_file_is_gitignored_under_journal(self, tmp_path):
+        """Test that the cache lives in <journal>/.cache with a catch-all .gitignore."""
+        cache = ComposerSessionCache.for_journal(tmp_path)
+        cache.put("session-1", 2000, SAMPLE_MESSAGES)
+        cache.close()
+
+        cache_dir = tmp_path / CACHE_DIR_NAME
+        assert (cache_dir / SESSION_CACHE_FILENAME).exists()
+        assert (cache_dir / ".gitignore").read_text() == "*\n"
+
+    def test_no_files_created_until_used(self, tmp_path):
+        """Test that constructing a cache has no filesystem side effects."""
+        ComposerSessionCache.for_journal(tmp_path)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unwritable_location_disables_cache(self, tmp_path):
+        """Test that cache errors degrade to misses instead of raising."""
+        blocker = tmp_path / "journal"
+        blocker.write_text("not a directory")
+
+        cache = ComposerSessionCache.for_journal(blocker)
+        cache.put("session-1", 2000, SAMPLE_MESSAGES)
+
+        assert cache.get("session-1", 2000) is None
+
+
+class TestSessionCacheForRepo:
+    """Test resolving the cache location from journal config."""
+
+    def test_relative_journal_path_resolved_against_repo(self, tmp_path):
+        """Test that a relative journal.path is resolved against the repo root."""
+        with patch('mcp_commit_story.config.load_config', return_value={"journal": {"path": "journal"}}):
+            cache = get_session_cache_for_repo(str(tmp_path))
+
+        assert cache.cache_path == tmp_path / "journal" / CACHE_DIR_NAME / SESSION_CACHE_FILENAME
+
+    def test_config_failure_returns_none(self, tmp_path):
+        """Test that an unloadable config disables the cache."""
+        with patch('mcp_commit_story.config.load_config', side_effect=Exception("bad config")):
+            assert resolve_journal_path(str(tmp_path)) is None
+            assert get_session_cache_for_repo(str(tmp_path)) is None
+
+
+class TestComposerChatProviderSessionCache:
+    """Test ComposerChatProvider with a session cache."""
+
+    @pytest.fixture
+    def db_paths(self):
+        return str(FIXTURES_DIR / "test_workspace.vscdb"), str(FIXTURES_DIR / "test_global.vscdb")
+
+    def test_second_run_served_from_cache(self, tmp_path, db_paths):
+        """Test that unchanged sessions skip global database queries on the next run."""
+        workspace_db, global_db = db_paths
+        cache = ComposerSessionCache.for_journal(tmp_path)
+
+        first = ComposerChatProvider(workspace_db, global_db, session_cache=cache)
+        expected = first.getChatHistoryForCommit(0, 9999999999999)
+
+        second = ComposerChatProvider(workspace_db, global_db, session_cache=cache)
+        with patch.object(second, '_get_message_headers') as mock_headers:
+            result = second.getChatHistoryForCommit(0, 9999999999999)
+
+        mock_headers.assert_not_called()
+        assert result == expected
+        assert len(result) == 15
+        cache.close()
+
+    @patch('mcp_commit_story.composer_chat_provider.execute_cursor_query')
+    def test_changed_session_is_re_extracted(self, mock_execute_query, tmp_path):
+        """Test that a session whose lastUpdatedAt moved is fetched again."""
+        cache = ComposerSessionCache.for_journal(tmp_path)
+        cache.put("session-1", 1000, [{**SAMPLE_MESSAGES[0], 'content': 'stale'}])
+
+        session_metadata = {
+            "allComposers": [
+                {"composerId": "session-1", "name": "Caching", "createdAt": 500, "lastUpdatedAt": 3000}
+            ]
+        }
+        headers = {"fullConversationHeadersOnly": [{"bubbleId": "msg-1", "type": 1}]}
+        mock_execute_query.side_effect = [
+            [(json.dumps(session_metadata),)],
+            [(json.dumps(headers),)],
+            [(json.dumps({"text": "fresh"}),)]
+        ]
+
+        provider = ComposerChatProvider("/workspace.vscdb", "/global.vscdb", session_cache=cache)
+        result = provider.getChatHistoryForCommit(0, 10000)
+
+        assert [msg['content'] for msg in result] == ["fresh"]
+        assert cache.get("session-1", 3000)[0]['content'] == "fresh"
+        cache.close()
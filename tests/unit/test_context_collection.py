@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import get_type_hints
 from mcp_commit_story.context_types import ChatMessage, ChatHistory
 from mcp_commit_story.context_collection import collect_chat_history, collect_git_context
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 # Assume these will be imported from the journal module
 # from mcp_commit_story.journal import collect_commit_metadata, extract_code_diff, gather_discussion_notes, capture_file_changes, collect_chat_history, collect_ai_terminal_commands
@@ -305,7 +305,7 @@ def test_collect_git_context_successful_diff_collection(mock_get_diffs, tmp_path
     ctx = collect_git_context(commit.hexsha, repo=repo)
     
     # Verify get_commit_file_diffs was called with correct parameters
-    mock_get_diffs.assert_called_once_with(repo, commit)
+    mock_get_diffs.assert_called_once_with(repo, commit, snapshot=ANY)
     
     # Verify file_diffs field contains the expected data
     assert ctx['file_diffs'] == expected_diffs
@@ -356,4 +356,4 @@ def test_collect_git_context_empty_diff_collection(mock_get_diffs, tmp_path):
     # Should have file_diffs field with empty dict
     assert 'file_diffs' in ctx
     assert ctx['file_diffs'] == {}
-    mock_get_diffs.assert_called_once_with(repo, commit) 
\ No newline at end of file
+    mock_get_diffs.assert_called_once_with(repo, commit, snapshot=ANY) 
\ No newline at end of file
@@ -314,7 +314,9 @@ class TestGitOperationErrorHandling:
         metrics = get_mcp_metrics()
         
         # Mock a slow git operation that returns None instead of sleeping
-        with patch('git.Commit.diff') as mock_diff:
+        # (without a diff-tree snapshot, collection falls back to Commit.diff)
+        with patch('mcp_commit_story.context_collection.get_commit_snapshot', return_value=None), \
+             patch('git.Commit.diff') as mock_diff:
             mock_diff.return_value = None  # Return None instead of causing sleep
             
             # This will cause TypeError: 'NoneType' object is not iterable
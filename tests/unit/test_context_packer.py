@@ -0,0 +1,92 @@
+"""
+Tests for token-budgeted packing of JournalContext.
+
+Covers the pass-through for small contexts, the priority order (source diffs,
+recent chat, journal, other diffs), and the workflow configuration.
+"""
+
+from mcp_commit_story.context_packer import (
+    DROPPED_DIFF_PLACEHOLDER,
+    estimate_tokens,
+    pack_journal_context
+)
+from mcp_commit_story.journal_workflow import _get_context_token_budget
+
+
+def _make_context(file_diffs, messages=None, journal=None):
+    return {
+        'git': {
+            'metadata': {'hash': 'abc123', 'author': 'Dev', 'date': '2025-06-01', 'message': 'Change things'},
+            'diff_summary': 'summary',
+            'changed_files': list(file_diffs),
+            'file_stats': {},
+            'commit_context': {},
+            'file_diffs': file_diffs
+        },
+        'chat': {'messages': messages} if messages is not None else None,
+        'journal': journal
+    }
+
+
+class TestEstimateTokens:
+    """Test the token heuristic."""
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens(None) == 0
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+        assert estimate_tokens({'a': 'b'}) == estimate_tokens('{"a": "b"}')
+
+
+class TestPackJournalContext:
+    """Test budget enforcement and priorities."""
+
+    def test_small_context_is_returned_unchanged(self):
+        context = _make_context({'src/app.py': '+x = 1'}, messages=[{'speaker': 'Human', 'text': 'hi'}])
+        packed, report = pack_journal_context(context, max_tokens=10000)
+
+        assert packed is context
+        assert not report.trimmed
+        assert report.tokens_after == report.tokens_before
+
+    def test_source_diffs_win_over_other_diffs(self):
+        context = _make_context({
+            'docs/guide.md': 'd' * 4000,
+            'src/app.py': 's' * 4000,
+            'tests/test_app.py': 't' * 4000
+        })
+        packed, report = pack_journal_context(context, max_tokens=1400)
+
+        file_diffs = packed['git']['file_diffs']
+        assert file_diffs['src/app.py'] == 's' * 4000
+        assert file_diffs['docs/guide.md'] == DROPPED_DIFF_PLACEHOLDER
+        assert file_diffs['tests/test_app.py'] == DROPPED_DIFF_PLACEHOLDER
+        assert list(file_diffs) == ['docs/guide.md', 'src/app.py', 'tests/test_app.py']
+        assert sorted(report.dropped_diffs) == ['docs/guide.md', 'tests/test_app.py']
+        assert report.tokens_after <= 1400
+        # The input is left untouched
+        assert context['git']['file_diffs']['docs/guide.md'] == 'd' * 4000
+
+    def test_keeps_most_recent_chat_before_journal(self):
+        messages = [{'speaker': 'Human', 'text': f'message {i} ' + 'x' * 400} for i in range(10)]
+        journal = {'latest_entry': 'j' * 4000, 'additional_context': [], 'metadata': {}}
+        context = _make_context({'src/app.py': '+x = 1'}, messages=messages, journal=journal)
+
+        packed, report = pack_journal_context(context, max_tokens=800)
+
+        kept = packed['chat']['messages']
+        assert 0 < len(kept) < 10
+        assert kept == messages[-len(kept):]
+        assert report.dropped_chat_messages == 10 - len(kept)
+        assert packed['journal']['latest_entry'] is None
+        assert report.dropped_journal_items == 1
+        assert report.tokens_after <= 800
+
+
+class TestContextTokenBudgetConfig:
+    """Test reading ai.context_token_budget."""
+
+    def test_budget_config(self):
+        assert _get_context_token_budget({'ai': {'context_token_budget': 5000}}) == 5000
+        assert _get_context_token_budget({'ai': {'context_token_budget': 0}}) is None
+        assert _get_context_token_budget({}) > 0
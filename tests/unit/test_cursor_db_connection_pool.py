@@ -0,0 +1,150 @@
+"""
+Tests for the read-only cursor_db connection pool.
+
+Covers connection reuse inside a pool scope, read-only enforcement,
+invalidation when the database file changes, scope nesting, and integration
+with execute_cursor_query and query_cursor_chat_database.
+"""
+
+import os
+import sqlite3
+import pytest
+from unittest.mock import patch
+
+from mcp_commit_story.cursor_db import connection_pool
+from mcp_commit_story.cursor_db.connection_pool import (
+    CursorConnectionPool,
+    cursor_connection_pool,
+    get_active_pool
+)
+from mcp_commit_story.cursor_db.query_executor import execute_cursor_query
+from mcp_commit_story.cursor_db.connection import query_cursor_chat_database
+from mcp_commit_story.cursor_db.exceptions import CursorDatabaseAccessError
+
+
+@pytest.fixture
+def kv_database(tmp_path):
+    """Create a small cursorDiskKV-style database."""
+    db_path = tmp_path / "state.vscdb"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE cursorDiskKV (key TEXT UNIQUE ON CONFLICT REPLACE, value BLOB)")
+        conn.execute("INSERT INTO cursorDiskKV VALUES ('a', '1'), ('b', '2')")
+    return str(db_path)
+
+
+class TestCursorConnectionPool:
+    """Test pool connection lifecycle."""
+
+    def test_reuses_connection_for_same_path(self, kv_database):
+        """Test that repeated queries on one path open a single connection."""
+        pool = CursorConnectionPool()
+        try:
+            with patch.object(
+                connection_pool, '_open_read_only', wraps=connection_pool._open_read_only
+            ) as mock_open:
+                for _ in range(5):
+                    assert pool.execute(kv_database, "SELECT value FROM cursorDiskKV WHERE key = ?", ("a",)) == [("1",)]
+
+            assert mock_open.call_count == 1
+            assert len(pool) == 1
+        finally:
+            pool.close()
+
+    def test_connections_are_read_only(self, kv_database):
+        """Test that pooled connections reject writes."""
+        pool = CursorConnectionPool()
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                pool.execute(kv_database, "INSERT INTO cursorDiskKV VALUES ('c', '3')")
+        finally:
+            pool.close()
+
+        with sqlite3.connect(kv_database) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM cursorDiskKV").fetchone() == (2,)
+
+    def test_missing_database_raises_unable_to_open(self, tmp_path):
+        """Test that missing files raise sqlite's usual error and are not created."""
+        missing = str(tmp_path / "missing.vscdb")
+        pool = CursorConnectionPool()
+
+        with pytest.raises(sqlite3.OperationalError, match="unable to open database file"):
+            pool.execute(missing, "SELECT 1")
+
+        assert not os.path.exists(missing)
+        assert len(pool) == 0
+
+    def test_connection_invalidated_when_file_changes(self, kv_database):
+        """Test that a changed mtime reopens the connection."""
+        pool = CursorConnectionPool()
+        try:
+            pool.execute(kv_database, "SELECT 1")
+            assert pool.is_cached(kv_database)
+
+            stat = os.stat(kv_database)
+            os.utime(kv_database, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert not pool.is_cached(kv_database)
+
+            with patch('mcp_commit_story.cursor_db.connection_pool._open_read_only') as mock_open:
+                mock_open.return_value = sqlite3.connect(":memory:", check_same_thread=False)
+                pool.execute(kv_database, "SELECT 1")
+                mock_open.assert_called_once_with(kv_database)
+        finally:
+            pool.close()
+
+    def test_close_clears_pool(self, kv_database):
+        """Test that close() drops every pooled connection."""
+        pool = CursorConnectionPool()
+        pool.execute(kv_database, "SELECT 1")
+
+        pool.close()
+
+        assert len(pool) == 0
+        assert not pool.is_cached(kv_database)
+
+
+class TestCursorConnectionPoolScope:
+    """Test the cursor_connection_pool() scope."""
+
+    def test_no_pool_outside_scope(self):
+        """Test that pooling is inactive by default."""
+        assert get_active_pool() is None
+
+    def test_nested_scopes_share_outer_pool(self):
+        """Test that nested scopes reuse the pool and only the outer scope closes it."""
+        with cursor_connection_pool() as outer:
+            with cursor_connection_pool() as inner:
+                assert inner is outer
+            assert get_active_pool() is outer
+        assert get_active_pool() is None
+
+    def test_execute_cursor_query_uses_pool_in_scope(self, kv_database):
+        """Test that execute_cursor_query reuses pooled connections inside a scope."""
+        with cursor_connection_pool() as pool:
+            with patch.object(
+                connection_pool, '_open_read_only', wraps=connection_pool._open_read_only
+            ) as mock_open:
+                first = execute_cursor_query(kv_database, "SELECT value FROM cursorDiskKV WHERE key = ?", ("b",))
+                second = execute_cursor_query(kv_database, "SELECT COUNT(*) FROM cursorDiskKV")
+
+            assert mock_open.call_count == 1
+            assert first == [("2",)]
+            assert second == [(2,)]
+            assert len(pool) == 1
+
+    def test_execute_cursor_query_missing_file_in_scope_raises_access_error(self, tmp_path):
+        """Test that pooled queries keep execute_cursor_query's error classification."""
+        with cursor_connection_pool():
+            with pytest.raises(CursorDatabaseAccessError):
+                execute_cursor_query(str(tmp_path / "missing.vscdb"), "SELECT 1")
+
+    def test_query_cursor_chat_database_skips_revalidation_in_scope(self, kv_database):
+        """Test that file validation only runs until a pooled connection exists."""
+        with cursor_connection_pool():
+            with patch(
+                'mcp_commit_story.cursor_db.connection._validate_database_file',
+                return_value=kv_database
+            ) as mock_validate:
+                for _ in range(3):
+                    assert query_cursor_chat_database(kv_database, "SELECT COUNT(*) FROM cursorDiskKV") == [(2,)]
+
+            assert mock_validate.call_count == 1
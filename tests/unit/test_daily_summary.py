@@ -1090,4 +1090,92 @@ class TestGenerateDailySummaryAIIntegration:
         assert "Tokens provide better scalability" in prompt
         assert "productive" in prompt 
 
- 
\ No newline at end of file
+ 
+
+class TestIncrementalDailySummary:
+    """Test incremental daily summary generation from new entries only."""
+    
+    AI_RESPONSE = {
+        "summary": "Morning work",
+        "progress_made": "Progress",
+        "key_accomplishments": ["First thing"],
+        "daily_metrics": {"commits": 1}
+    }
+    
+    @staticmethod
+    def _entry(commit_hash, summary):
+        from src.mcp_commit_story.journal_generate import JournalEntry
+        return JournalEntry(timestamp="10:00 AM", commit_hash=commit_hash, summary=summary)
+    
+    @staticmethod
+    def _config(tmp_path):
+        return {"journal": {"path": str(tmp_path), "incremental_daily_summary": True}}
+    
+    @patch('src.mcp_commit_story.daily_summary.invoke_ai')
+    @patch('src.mcp_commit_story.daily_summary._call_ai_for_daily_summary')
+    def test_only_new_entries_are_sent_to_ai(self, mock_full, mock_invoke_ai, tmp_path):
+        """Test that a re-run digests only entries added since the stored state."""
+        from src.mcp_commit_story.daily_summary import _call_ai_for_incremental_daily_summary
+        import json
+        
+        first = self._entry("aaa111", "Morning refactor")
+        second = self._entry("bbb222", "Afternoon bug fix")
+        mock_full.return_value = dict(self.AI_RESPONSE)
+        mock_invoke_ai.return_value = json.dumps({**self.AI_RESPONSE, "summary": "Whole day"})
+        
+        _call_ai_for_incremental_daily_summary([first], "2025-01-15", self._config(tmp_path))
+        result = _call_ai_for_incremental_daily_summary([first, second], "2025-01-15", self._config(tmp_path))
+        
+        mock_full.assert_called_once()
+        prompt = mock_invoke_ai.call_args[0][0]
+        assert "Entry 2 - 10:00 AM (Commit bbb222)" in prompt
+        assert "Afternoon bug fix" in prompt
+        assert "Morning refactor" not in prompt
+        assert '"summary": "Morning work"' in prompt
+        assert result["summary"] == "Whole day"
+        assert (tmp_path / ".cache" / "daily_summary_state" / "2025-01-15.json").exists()
+    
+    @patch('src.mcp_commit_story.daily_summary.invoke_ai')
+    @patch('src.mcp_commit_story.daily_summary._call_ai_for_daily_summary')
+    def test_no_ai_call_when_no_new_entries(self, mock_full, mock_invoke_ai, tmp_path):
+        """Test that the stored response is reused when nothing changed."""
+        from src.mcp_commit_story.daily_summary import _call_ai_for_incremental_daily_summary
+        
+        entries = [self._entry("aaa111", "Morning refactor")]
+        mock_full.return_value = dict(self.AI_RESPONSE)
+        
+        _call_ai_for_incremental_daily_summary(entries, "2025-01-15", self._config(tmp_path))
+        result = _call_ai_for_incremental_daily_summary(entries, "2025-01-15", self._config(tmp_path))
+        
+        mock_full.assert_called_once()
+        mock_invoke_ai.assert_not_called()
+        assert result == self.AI_RESPONSE
+    
+    @patch('src.mcp_commit_story.daily_summary._call_ai_for_daily_summary')
+    def test_edited_entry_triggers_full_regeneration(self, mock_full, tmp_path):
+        """Test that a changed covered entry invalidates the stored state."""
+        from src.mcp_commit_story.daily_summary import _call_ai_for_incremental_daily_summary
+        
+        mock_full.return_value = dict(self.AI_RESPONSE)
+        
+        _call_ai_for_incremental_daily_summary([self._entry("aaa111", "Original")], "2025-01-15", self._config(tmp_path))
+        _call_ai_for_incremental_daily_summary([self._entry("aaa111", "Edited")], "2025-01-15", self._config(tmp_path))
+        
+        assert mock_full.call_count == 2
+    
+    @patch('src.mcp_commit_story.daily_summary.extract_reflections_from_journal_file', return_value=[])
+    @patch('src.mcp_commit_story.daily_summary._call_ai_for_daily_summary')
+    @patch('src.mcp_commit_story.daily_summary._call_ai_for_incremental_daily_summary')
+    def test_config_setting_selects_incremental_mode(self, mock_incremental, mock_full, mock_reflections, tmp_path):
+        """Test that journal.incremental_daily_summary enables the incremental path."""
+        from src.mcp_commit_story.daily_summary import generate_daily_summary
+        
+        mock_incremental.return_value = dict(self.AI_RESPONSE)
+        mock_full.return_value = dict(self.AI_RESPONSE)
+        entries = [self._entry("aaa111", "Morning refactor")]
+        
+        generate_daily_summary(entries, "2025-01-15", self._config(tmp_path))
+        generate_daily_summary(entries, "2025-01-15", {"journal": {"path": str(tmp_path)}})
+        
+        mock_incremental.assert_called_once()
+        mock_full.assert_called_once()
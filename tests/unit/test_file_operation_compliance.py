@@ -24,6 +24,7 @@ from mcp_commit_story.journal import (
     append_to_journal_file, 
     ensure_journal_directory
 )
+from mcp_commit_story import journal_generate
 from mcp_commit_story.reflection_core import (
     add_reflection_to_journal,
     add_manual_reflection
@@ -35,15 +36,14 @@ class TestFileOperationCompliance:
 
     def test_append_to_journal_file_calls_ensure_directory(self):
         """Test that append_to_journal_file calls ensure_journal_directory before writing."""
-        with patch('mcp_commit_story.journal_generate.ensure_journal_directory') as mock_ensure, \
-             patch('builtins.open', create=True) as mock_open, \
-             patch('os.path.exists', return_value=True):
-            
-            mock_file = MagicMock()
-            mock_open.return_value.__enter__.return_value = mock_file
+        with tempfile.TemporaryDirectory() as temp_dir, \
+             patch('mcp_commit_story.journal_generate.ensure_journal_directory',
+                   wraps=ensure_journal_directory) as mock_ensure, \
+             patch('mcp_commit_story.journal_generate.locked_journal_file',
+                   wraps=journal_generate.locked_journal_file) as mock_locked_open:
             
             # Call the function
-            test_path = "/test/path/daily/2025-06-03-journal.md"
+            test_path = os.path.join(temp_dir, "path", "daily", "2025-06-03-journal.md")
             test_content = "Test content"
             append_to_journal_file(test_content, test_path)
             
@@ -52,9 +52,10 @@ class TestFileOperationCompliance:
             call_args = mock_ensure.call_args[0][0]
             assert str(call_args) == test_path
             
-            # Verify file was opened for writing - append_to_journal_file converts to Path and doesn't pass encoding
+            # Verify file was opened for locked appending - append_to_journal_file converts to Path
             expected_path = Path(test_path)
-            mock_open.assert_called_once_with(expected_path, 'a')
+            mock_locked_open.assert_called_once_with(expected_path)
+            assert expected_path.read_text() == test_content
 
     def test_reflection_operations_call_ensure_directory(self):
         """Test that reflection operations call ensure_journal_directory."""
@@ -137,11 +138,11 @@ class TestFileOperationCompliance:
     def test_file_operations_use_ensure_pattern(self):
         """Test that file operations consistently use ensure_journal_directory pattern."""
         # Test that append_to_journal_file follows the pattern
-        with patch('mcp_commit_story.journal_generate.ensure_journal_directory') as mock_ensure, \
-             patch('builtins.open', create=True), \
-             patch('os.path.exists', return_value=True):
+        with tempfile.TemporaryDirectory() as temp_dir, \
+             patch('mcp_commit_story.journal_generate.ensure_journal_directory',
+                   wraps=ensure_journal_directory) as mock_ensure:
             
-            test_path = "/test/journal/daily/2025-06-03-journal.md"
+            test_path = os.path.join(temp_dir, "journal", "daily", "2025-06-03-journal.md")
             append_to_journal_file("test content", test_path)
             
             # Verify ensure_journal_directory was called - accept both Path and string
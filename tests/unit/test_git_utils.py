@@ -16,8 +16,12 @@ from mcp_commit_story.git_utils import (
     install_post_commit_hook,
     get_commits_since_last_entry,
     get_previous_commit_info,  # NEW: Import the function we're about to implement
-    generate_hook_content  # NEW: Import the function we're about to test
+    generate_hook_content,  # NEW: Import the function we're about to test
+    get_commit_snapshot,
+    get_commit_file_diffs,
+    MAX_FILE_DIFF_SIZE
 )
+from mcp_commit_story import git_utils
 # TelemetryCollector import removed - using mock approach instead
 from mcp_commit_story.context_collection import collect_git_context
 
@@ -859,4 +863,217 @@ def test_install_post_commit_hook_background_mode_with_telemetry(tmp_path):
             'background_mode': 'true',
             'had_backup': 'false'
         }
-    ) 
\ No newline at end of file
+    ) 
+
+
+def _commit_files(repo, files, message):
+    """Write (or delete, when content is None) files and commit them."""
+    for name, content in files.items():
+        path = os.path.join(repo.working_tree_dir, name)
+        if content is None:
+            os.remove(path)
+            repo.index.remove([name])
+            continue
+        mode = 'wb' if isinstance(content, bytes) else 'w'
+        with open(path, mode) as f:
+            f.write(content)
+        repo.index.add([name])
+    return repo.index.commit(message)
+
+
+def test_commit_snapshot_parses_changes_in_one_pass(git_repo):
+    """Test that a single diff-tree pass captures status, numstat, binary and patches."""
+    _commit_files(git_repo, {'keep.txt': 'a\n', 'gone.txt': 'x\n'}, 'initial commit')
+    commit = _commit_files(git_repo, {
+        'keep.txt': 'a\nb\n',
+        'gone.txt': None,
+        'new.txt': 'new\n',
+        'image.bin': b'\x89PNG\x00\x00binary'
+    }, 'mixed changes')
+
+    snapshot = get_commit_snapshot(git_repo, commit)
+    changes = {change.path: change for change in snapshot.files}
+
+    assert changes['new.txt'].change_type == 'A'
+    assert changes['gone.txt'].change_type == 'D'
+    assert changes['keep.txt'].change_type == 'M'
+    assert changes['image.bin'].is_binary
+    assert changes['keep.txt'].patch == '@@ -1 +1,2 @@\n a\n+b\n'
+    assert (snapshot.insertions, snapshot.deletions) == (2, 1)
+
+    summary = get_commit_diff_summary(commit, snapshot=snapshot)
+    assert 'image.bin: binary file added' in summary
+    assert 'gone.txt: deleted' in summary
+    assert 'keep.txt: modified' in summary
+
+
+def test_commit_snapshot_stats_match_commit_stats(git_repo):
+    """Test that snapshot-based commit details agree with GitPython stats."""
+    _commit_files(git_repo, {'file1.txt': 'one\ntwo\n'}, 'initial commit')
+    commit = _commit_files(git_repo, {'file1.txt': 'one\nthree\nfour\n', 'file2.txt': 'x\n'}, 'update')
+
+    snapshot = get_commit_snapshot(git_repo, commit)
+
+    assert get_commit_details(commit, snapshot=snapshot)['stats'] == get_commit_details(commit)['stats']
+
+
+def test_commit_snapshot_detects_renames(git_repo):
+    """Test that renames are reported once with their old path."""
+    _commit_files(git_repo, {'old_name.py': 'print("hi")\n'}, 'initial commit')
+    git_repo.index.move(['old_name.py', 'new_name.py'])
+    commit = git_repo.index.commit('rename')
+
+    snapshot = get_commit_snapshot(git_repo, commit)
+
+    assert [(c.change_type, c.old_path, c.path) for c in snapshot.files] == [('R', 'old_name.py', 'new_name.py')]
+    assert get_commit_diff_summary(commit, snapshot=snapshot) == 'old_name.py → new_name.py: renamed'
+
+
+def test_commit_snapshot_initial_commit_diffs_against_empty_tree(git_repo):
+    """Test that the first commit is diffed against the empty tree."""
+    commit = _commit_files(git_repo, {'first.txt': 'hello\n'}, 'initial commit')
+
+    snapshot = get_commit_snapshot(git_repo, commit)
+
+    assert [(c.change_type, c.path) for c in snapshot.files] == [('A', 'first.txt')]
+    assert get_commit_file_diffs(git_repo, commit, snapshot=snapshot) == {'first.txt': '@@ -0,0 +1 @@\n+hello\n'}
+
+
+def test_commit_snapshot_unavailable_returns_none():
+    """Test that git failures return None so callers fall back to GitPython."""
+    mock_repo = MagicMock()
+    mock_repo.working_tree_dir = '/nonexistent/repo/path'
+    mock_commit = MagicMock()
+    mock_commit.parents = []
+    mock_commit.hexsha = 'abc123'
+
+    assert get_commit_snapshot(mock_repo, mock_commit) is None
+
+
+def _commit_typechange(repo):
+    """Replace a.txt by a symlink to b.txt and modify c.txt in one commit."""
+    _commit_files(repo, {'a.txt': 'a\n', 'b.txt': 'b\n', 'c.txt': 'c\n'}, 'initial commit')
+    a_path = os.path.join(repo.working_tree_dir, 'a.txt')
+    os.remove(a_path)
+    os.symlink('b.txt', a_path)
+    repo.git.add('a.txt')
+    return _commit_files(repo, {'c.txt': 'c\ncc\n'}, 'typechange')
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink'), reason="Requires symlinks")
+def test_commit_snapshot_joins_typechange_patch_blocks(git_repo):
+    """Test that a typechange's two patch blocks stay with its file and later files keep theirs."""
+    commit = _commit_typechange(git_repo)
+
+    with patch('git.Commit.diff', side_effect=AssertionError("GitPython diff should not run")):
+        snapshot = get_commit_snapshot(git_repo, commit)
+    changes = {change.path: change for change in snapshot.files}
+
+    assert changes['a.txt'].change_type == 'T'
+    assert changes['a.txt'].patch == '@@ -1 +0,0 @@\n-a\n@@ -0,0 +1 @@\n+b.txt\n\\ No newline at end of file\n'
+    assert changes['c.txt'].patch == '@@ -1 +1,2 @@\n c\n+cc\n'
+
+
+def test_collect_git_context_generates_patches_once(git_repo):
+    """Test that collect_git_context does not re-run GitPython diffs when a snapshot is available."""
+    _commit_files(git_repo, {'init.txt': 'init\n'}, 'initial commit')
+    commit = _commit_files(git_repo, {'src.py': 'x = 1\n'}, 'add src')
+
+    with patch('git.Commit.diff', side_effect=AssertionError("GitPython diff should not run")):
+        ctx = collect_git_context(commit.hexsha, repo=git_repo)
+
+    assert ctx['changed_files'] == ['src.py']
+    assert ctx['file_diffs'] == {'src.py': '@@ -0,0 +1 @@\n+x = 1\n'}
+    assert 'src.py: added' in ctx['diff_summary']
+
+
+def test_streamed_file_diffs_match_materialized_diffs(git_repo):
+    """Test that stream mode produces the same diffs as a full snapshot."""
+    _commit_files(git_repo, {'a.py': 'x = 1\n', 'b.py': 'y = 1\n'}, 'initial commit')
+    commit = _commit_files(git_repo, {
+        'a.py': 'x = 2\n' + 'z = 3\n' * 5000,
+        'b.py': None,
+        'c.py': 'c = 1\n',
+        'package-lock.json': '{}\n',
+        'image.bin': b'\x89PNG\x00\x00binary'
+    }, 'mixed changes')
+
+    streamed = get_commit_file_diffs(git_repo, commit, stream=True)
+
+    full_snapshot = get_commit_snapshot(git_repo, commit)
+    assert streamed == get_commit_file_diffs(git_repo, commit, snapshot=full_snapshot)
+    assert streamed['a.py'].endswith('[... diff truncated due to size limits ...]')
+    assert len(streamed['a.py']) < 11 * 1024
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink'), reason="Requires symlinks")
+def test_streamed_file_diffs_match_files_after_typechange(git_repo):
+    """Test that stream mode keeps each patch with its file when a commit has a typechange."""
+    commit = _commit_typechange(git_repo)
+
+    streamed = get_commit_file_diffs(git_repo, commit, stream=True)
+
+    assert streamed['c.txt'] == '@@ -1 +1,2 @@\n c\n+cc\n'
+    assert streamed == get_commit_file_diffs(git_repo, commit, snapshot=get_commit_snapshot(git_repo, commit))
+
+
+def test_streamed_file_diffs_stop_at_total_budget(git_repo):
+    """Test that streaming reads each patch only up to its budget and stops at max_total_size."""
+    _commit_files(git_repo, {'seed.txt': 'seed\n'}, 'initial commit')
+    commit = _commit_files(git_repo, {
+        'dump_a.sql': 'INSERT INTO t VALUES (1);\n' * 20000,
+        'dump_b.sql': 'INSERT INTO t VALUES (2);\n' * 20000,
+        'dump_c.sql': 'INSERT INTO t VALUES (3);\n' * 20000
+    }, 'large dumps')
+
+    blocks_read = []
+    real_iter_patch_blocks = git_utils._iter_patch_blocks
+
+    def recording_iter_patch_blocks(lines, budgets=None):
+        for block in real_iter_patch_blocks(lines, budgets):
+            blocks_read.append(len(block[0]))
+            yield block
+
+    with patch('mcp_commit_story.git_utils._iter_patch_blocks', side_effect=recording_iter_patch_blocks):
+        diffs = get_commit_file_diffs(git_repo, commit, max_total_size=15 * 1024, stream=True)
+
+    assert list(diffs) == ['dump_a.sql', '__truncated__']
+    assert len(blocks_read) == 2  # the third dump is never read
+    assert all(size <= 10 * 1024 for size in blocks_read)
+
+
+def test_commit_snapshot_caps_patch_size(git_repo):
+    """Test that max_patch_size bounds stored patches and marks them truncated."""
+    _commit_files(git_repo, {'seed.txt': 'seed\n'}, 'initial commit')
+    commit = _commit_files(git_repo, {'big.txt': 'line\n' * 10000, 'small.txt': 'ok\n'}, 'big file')
+
+    snapshot = get_commit_snapshot(git_repo, commit, max_patch_size=MAX_FILE_DIFF_SIZE)
+    changes = {change.path: change for change in snapshot.files}
+
+    assert len(changes['big.txt'].patch) == MAX_FILE_DIFF_SIZE
+    assert changes['big.txt'].patch_truncated
+    assert changes['small.txt'].patch == '@@ -0,0 +1 @@\n+ok\n'
+    assert not changes['small.txt'].patch_truncated
+    full_snapshot = get_commit_snapshot(git_repo, commit)
+    assert get_commit_file_diffs(git_repo, commit, snapshot=snapshot) == \
+        get_commit_file_diffs(git_repo, commit, snapshot=full_snapshot)
+
+
+def test_git_run_memo_collects_each_commit_once(git_repo):
+    """Test that collect_git_context and get_previous_commit_info reuse results within a run."""
+    _commit_files(git_repo, {'seed.txt': 'seed\n'}, 'initial commit')
+    commit = _commit_files(git_repo, {'app.py': 'print(1)\n'}, 'add app')
+
+    with patch('mcp_commit_story.context_collection.get_commit_snapshot', wraps=git_utils.get_commit_snapshot) as mock_snapshot:
+        with git_utils.git_run_memo():
+            first = collect_git_context(commit.hexsha, repo=git_repo)
+            second = collect_git_context(commit.hexsha, repo=git_repo)
+            assert git_utils.find_run_memo('git_context', commit.hexsha) is first
+            assert get_previous_commit_info(commit) is get_previous_commit_info(commit)
+        assert first is second
+        assert mock_snapshot.call_count == 1
+
+        # Outside a run nothing is memoized
+        collect_git_context(commit.hexsha, repo=git_repo)
+        assert mock_snapshot.call_count == 2
+        assert git_utils.find_run_memo('git_context', commit.hexsha) is None
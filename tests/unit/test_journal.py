@@ -108,6 +108,32 @@ def test_handle_malformed_entry():
         journal.JournalParser.parse(MALFORMED_MD)
 
 
+def test_parse_entries_walks_file_once_lazily():
+    second = DAILY_NOTE_MD.replace('2:17 PM — Commit def456', '3:05 PM — Commit abc789')
+    content = '# Daily Journal\n' + DAILY_NOTE_MD + REFLECTION_MD + second
+
+    parsed = journal.JournalParser.parse_entries(content)
+
+    assert not isinstance(parsed, list)
+    entries = list(parsed)
+    assert [entry.commit_hash for entry in entries] == ['def456', 'abc789']
+    assert entries[1].timestamp == '3:05 PM'
+    assert entries[0].summary == journal.JournalParser.parse(DAILY_NOTE_MD).summary
+
+
+def test_parse_entries_records_aggregate_metrics_only():
+    content = DAILY_NOTE_MD * 3
+    with patch('mcp_commit_story.journal_generate.get_mcp_metrics') as mock_get_metrics:
+        assert len(list(journal.JournalParser.parse_entries(content))) == 3
+
+    metrics = mock_get_metrics.return_value
+    metrics.record_operation_duration.assert_called_once()
+    metrics.record_counter.assert_called_once_with(
+        'journal.entries_parsed_total', value=3, attributes={'operation_type': 'parse_batch'}
+    )
+    metrics.record_tool_call.assert_not_called()
+
+
 @patch('mcp_commit_story.journal_generate.invoke_ai')
 def test_generate_summary_section_basic_commit(mock_invoke_ai):
     # Mock AI response
@@ -646,6 +672,48 @@ def test_append_to_journal_file_existing_directories(tmp_path):
     assert file_path.read_text().startswith(entry)
 
 
+def test_append_entries_to_journal_file_batches_with_header(tmp_path):
+    file_path = tmp_path / "daily" / "2025-06-03-journal.md"
+    journal.append_entries_to_journal_file(["first", "second"], file_path, header="# Title\n\n")
+    journal.append_to_journal_file("third", file_path, header="# Title\n\n")
+    assert file_path.read_text() == "# Title\n\nfirst\n---\nsecond\n---\nthird"
+
+
+def test_append_is_traced_once_around_the_write(tmp_path):
+    from unittest.mock import MagicMock
+    file_path = tmp_path / "daily" / "2025-06-03-journal.md"
+    tracer = MagicMock()
+    with patch('mcp_commit_story.telemetry.trace.get_tracer', return_value=tracer):
+        journal.append_to_journal_file("entry", file_path)
+    span_names = [call.args[0] for call in tracer.start_as_current_span.call_args_list]
+    assert span_names.count("journal.append_file") == 1
+    span = tracer.start_as_current_span.return_value.__enter__.return_value
+    span.set_attribute.assert_any_call("mcp.tool_name", "append_entries_to_journal_file")
+    assert file_path.read_text() == "entry"
+
+
+def _append_entries_in_process(file_path, worker):
+    for number in range(20):
+        journal.append_to_journal_file(f"### worker {worker} entry {number}\n" + "x" * 5000, file_path)
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="Requires fork")
+def test_concurrent_appends_from_processes_do_not_interleave(tmp_path):
+    import multiprocessing
+    file_path = tmp_path / "daily" / "2025-06-03-journal.md"
+    context = multiprocessing.get_context('fork')
+    workers = [context.Process(target=_append_entries_in_process, args=(file_path, w)) for w in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    entries = file_path.read_text().split("\n---\n")
+    assert len(entries) == 80
+    assert all(entry.startswith("### worker ") and entry.endswith("x" * 5000) for entry in entries)
+
+
 def test_append_to_journal_file_permission_error(monkeypatch, tmp_path):
     from mcp_commit_story.journal import append_to_journal_file
     file_path = tmp_path / "protected/dir/journal.md"
@@ -315,4 +315,76 @@ class TestTelemetryPreservation:
         # Verify failure telemetry was recorded
         mock_record_metrics.assert_called()
         success_arg = mock_record_metrics.call_args[0][2]  # Third argument is success boolean
-        assert success_arg is False 
\ No newline at end of file
+        assert success_arg is False 
+
+class TestGenerateCombinedSections:
+    """Test single-call generation of all AI sections."""
+    
+    @patch('mcp_commit_story.journal_generate.invoke_ai')
+    def test_single_call_fans_out_into_section_typeddicts(self, mock_invoke_ai):
+        """Test that one AI call produces every section TypedDict."""
+        mock_invoke_ai.return_value = json.dumps({
+            'summary': 'Added authentication.',
+            'technical_synopsis': {'overview': 'New auth module'},
+            'accomplishments': ['Added login', 'Protected user data'],
+            'frustrations': [],
+            'tone_mood': {'mood': 'Focused', 'indicators': 'Clear goal in chat'},
+            'discussion_notes': [{'speaker': 'Human', 'text': 'We need authentication'}],
+            'discussion_notes_simple': 'First note\nSecond note'
+        })
+        
+        sections = journal.generate_combined_sections(SAMPLE_CONTEXT)
+        
+        assert mock_invoke_ai.call_count == 1
+        prompt = mock_invoke_ai.call_args[0][0]
+        # Context is serialized once; every section's instructions are included
+        assert prompt.count(json.dumps(SAMPLE_CONTEXT, indent=2, default=str)) == 1
+        assert inspect.getdoc(journal.generate_accomplishments_section) in prompt
+        
+        assert sections['summary'] == SummarySection(summary='Added authentication.')
+        assert sections['technical_synopsis'] == TechnicalSynopsisSection(technical_synopsis='New auth module.')
+        assert sections['accomplishments'] == AccomplishmentsSection(accomplishments=['Added login', 'Protected user data'])
+        assert sections['frustrations'] == FrustrationsSection(frustrations=[])
+        assert sections['tone_mood'] == ToneMoodSection(mood='Focused', indicators='Clear goal in chat')
+        assert sections['discussion_notes'] == DiscussionNotesSection(discussion_notes=[{'speaker': 'Human', 'text': 'We need authentication'}])
+        assert sections['discussion_notes_simple'] == DiscussionNotesSection(discussion_notes=['First note', 'Second note'])
+    
+    @patch('mcp_commit_story.journal_generate.invoke_ai')
+    def test_omits_missing_and_malformed_sections(self, mock_invoke_ai):
+        """Test that only sections that parse are returned."""
+        mock_invoke_ai.return_value = '```json\n' + json.dumps({
+            'summary': 'Added authentication.',
+            'accomplishments': 42,
+            'tone_mood': 'Focused'
+        }) + '\n```'
+        
+        sections = journal.generate_combined_sections(SAMPLE_CONTEXT)
+        
+        assert set(sections) == {'summary'}
+    
+    @patch('mcp_commit_story.journal_generate.invoke_ai')
+    def test_empty_accomplishments_use_git_fallback(self, mock_invoke_ai):
+        """Test that an empty accomplishments list gets the same git fallback as the single generator."""
+        mock_invoke_ai.return_value = json.dumps({'accomplishments': []})
+        
+        sections = journal.generate_combined_sections(SAMPLE_CONTEXT)
+        
+        assert sections['accomplishments']['accomplishments'] == [
+            'Completed: Add user authentication feature',
+            'Successfully updated 2 files'
+        ]
+    
+    @patch('mcp_commit_story.journal_generate.invoke_ai')
+    def test_unparseable_response_returns_no_sections(self, mock_invoke_ai):
+        """Test that a non-JSON or failed response yields an empty dict."""
+        mock_invoke_ai.return_value = "Here is your journal entry: great work!"
+        assert journal.generate_combined_sections(SAMPLE_CONTEXT) == {}
+        
+        mock_invoke_ai.return_value = ""
+        assert journal.generate_combined_sections(SAMPLE_CONTEXT) == {}
+    
+    def test_handles_none_context(self):
+        """Test that None context returns no sections without calling AI."""
+        with patch('mcp_commit_story.journal_generate.invoke_ai') as mock_invoke_ai:
+            assert journal.generate_combined_sections(None) == {}
+            mock_invoke_ai.assert_not_called()
@@ -0,0 +1,71 @@
+"""
+Tests for the shared journal cache helpers.
+
+Covers on-demand cache directories, atomic cache file replacement, and the
+lazily opened SQLite sidecar that disables itself when it cannot be used.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from mcp_commit_story.journal_cache import SQLiteSidecar, ensure_cache_dir, replace_cache_file
+
+
+class _ExampleSidecar(SQLiteSidecar):
+    SCHEMA = ("CREATE TABLE IF NOT EXISTS items (name TEXT PRIMARY KEY)",)
+    DESCRIPTION = "Example sidecar"
+
+
+def test_ensure_cache_dir_ignores_contents(tmp_path):
+    cache_dir = ensure_cache_dir(tmp_path / "journal" / ".cache")
+
+    assert cache_dir.is_dir()
+    assert (cache_dir / ".gitignore").read_text() == "*\n"
+
+
+def test_replace_cache_file_leaves_no_temp_files(tmp_path):
+    path = tmp_path / "state.json"
+    replace_cache_file(path, "old")
+    replace_cache_file(path, "new")
+
+    assert path.read_text() == "new"
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_replace_cache_file_keeps_old_content_on_failure(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text("old")
+
+    with patch('mcp_commit_story.journal_cache.os.replace', side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            replace_cache_file(path, "new")
+
+    assert path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_sidecar_opens_lazily_with_schema(tmp_path):
+    db_path = tmp_path / ".cache" / "example.db"
+    sidecar = _ExampleSidecar(db_path)
+    assert not db_path.exists()
+
+    with sidecar._lock:
+        connection = sidecar._get_connection()
+        connection.execute("INSERT INTO items (name) VALUES ('a')")
+        assert sidecar._get_connection() is connection
+    sidecar.close()
+
+    assert db_path.exists()
+    assert (tmp_path / ".cache" / ".gitignore").exists()
+
+
+def test_unusable_sidecar_disables_itself(tmp_path):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("not a directory")
+    sidecar = _ExampleSidecar(blocker / "example.db")
+
+    with sidecar._lock:
+        assert sidecar._get_connection() is None
+    assert sidecar._disabled is True
+    sidecar.close()
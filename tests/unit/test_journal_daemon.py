@@ -0,0 +1,125 @@
+"""
+Tests for the long-running journal daemon.
+
+Covers socket naming, queue deduplication, the submit/serve round trip over a
+real Unix socket, daemon startup from submit, and daemon-mode hook content.
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+
+from mcp_commit_story import journal_daemon
+from mcp_commit_story.git_utils import generate_hook_content
+from mcp_commit_story.journal_daemon import JournalDaemon, get_socket_path, submit_commit
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are length-limited, so avoid pytest's long tmp_path
+    directory = tempfile.mkdtemp(prefix="jd-")
+    path = os.path.join(directory, "d.sock")
+    yield path
+    if os.path.exists(path):
+        os.unlink(path)
+    os.rmdir(directory)
+
+
+def test_socket_path_is_stable_per_repository(tmp_path):
+    first = tmp_path / "a"
+    second = tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+
+    assert get_socket_path(str(first)) == get_socket_path(str(first) + "/")
+    assert get_socket_path(str(first)) != get_socket_path(str(second))
+    assert len(get_socket_path(str(first))) < 100
+
+
+def test_enqueue_drops_commits_already_waiting(tmp_path):
+    daemon = JournalDaemon(str(tmp_path), socket_path="unused")
+
+    assert daemon.enqueue("abc") == 1
+    assert daemon.enqueue("abc") == 1
+    assert daemon.enqueue("def") == 2
+    assert daemon.jobs.qsize() == 2
+
+
+def test_submit_round_trip_processes_commits_in_order(tmp_path, socket_path):
+    daemon = JournalDaemon(str(tmp_path), socket_path=socket_path, idle_timeout=0.2)
+    assert daemon.bind() is True
+    processed = []
+
+    with patch.object(daemon, 'process', side_effect=processed.append), \
+            patch('mcp_commit_story.journal_daemon.get_socket_path', return_value=socket_path):
+        daemon.enqueue("first")
+        thread = threading.Thread(target=daemon.serve_forever)
+        thread.start()
+        assert submit_commit(str(tmp_path), "second", start_daemon=False) == "queued"
+        thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert processed == ["first", "second"]
+    assert not os.path.exists(socket_path)
+
+
+def test_processing_errors_do_not_stop_daemon(tmp_path, socket_path):
+    daemon = JournalDaemon(str(tmp_path), socket_path=socket_path, idle_timeout=0.2)
+    calls = []
+
+    def process(commit_hash):
+        calls.append(commit_hash)
+        if commit_hash == "bad":
+            raise RuntimeError("boom")
+
+    with patch.object(daemon, 'process', side_effect=process):
+        daemon.enqueue("bad")
+        daemon.enqueue("good")
+        daemon.serve_forever()
+
+    assert calls == ["bad", "good"]
+    assert daemon.queue_depth == 0
+
+
+def test_second_daemon_does_not_bind_running_socket(tmp_path, socket_path):
+    running = JournalDaemon(str(tmp_path), socket_path=socket_path, idle_timeout=5)
+    assert running.bind() is True
+    thread = threading.Thread(target=running.serve_forever)
+    thread.start()
+    try:
+        assert JournalDaemon(str(tmp_path), socket_path=socket_path).bind() is False
+    finally:
+        running.stop()
+        thread.join(timeout=10)
+
+
+def test_stale_socket_is_replaced(tmp_path, socket_path):
+    open(socket_path, 'w').close()
+    daemon = JournalDaemon(str(tmp_path), socket_path=socket_path)
+
+    assert daemon.bind() is True
+    daemon.stop()
+
+
+def test_submit_starts_daemon_when_none_is_listening(tmp_path, socket_path):
+    with patch('mcp_commit_story.journal_daemon.get_socket_path', return_value=socket_path), \
+            patch('mcp_commit_story.journal_daemon.subprocess.Popen') as mock_popen:
+        assert submit_commit(str(tmp_path), "abc123") == "started"
+
+    command = mock_popen.call_args[0][0]
+    assert command[1:5] == ['-m', 'mcp_commit_story.journal_daemon', 'serve', '--repo-path']
+    assert command[-2:] == ['--commit-hash', 'abc123']
+    assert mock_popen.call_args[1]['start_new_session'] is True
+
+
+def test_daemon_hook_content():
+    content = generate_hook_content(daemon=True)
+
+    assert content.startswith("#!/bin/sh\n")
+    assert "python -m mcp_commit_story.journal_daemon submit" in content
+    assert '--commit-hash "$COMMIT_HASH"' in content
+    assert content.strip().endswith("|| true")
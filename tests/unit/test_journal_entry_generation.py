@@ -7,6 +7,7 @@ journal entries from commit data.
 """
 
 import pytest
+import threading
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 from pathlib import Path
@@ -97,7 +98,7 @@ class TestGenerateJournalEntry:
         assert result.commit_metadata == {'files_changed': '1', 'insertions': '10'}
         
         # Verify context collection was called with correct GitPython commit parameters
-        mock_collect_chat_history.assert_called_once_with(since_commit='abc123def456', max_messages_back=150)
+        mock_collect_chat_history.assert_called_once_with(commit=mock_commit, max_messages_back=150)
         mock_collect_git_context.assert_called_once_with(commit_hash='abc123def456', repo='.', journal_path='test-journal')
         
         # Verify all section generators were called (7 AI functions total, down from 8 after removing terminal)
@@ -267,6 +268,115 @@ class TestGenerateJournalEntry:
         assert result.commit_hash == 'debug123'
         assert result.summary == 'Debug summary'
 
+    def test_generate_journal_entry_concurrent_sections(self):
+        """Test that section_workers runs generators concurrently and keeps graceful degradation."""
+        mock_commit = MagicMock()
+        mock_commit.hexsha = 'concurrent123'
+        mock_commit.message = 'Concurrent test commit'
+        mock_commit.author = MagicMock()
+        mock_commit.author.__str__ = lambda x: 'Concurrent Author'
+        mock_commit.committed_datetime = datetime(2025, 6, 3, 19, 15)
+        
+        mock_config = {
+            'journal': {
+                'path': 'concurrent-journal',
+                'section_workers': 4
+            }
+        }
+        
+        # Every generator waits for three others to start, which only succeeds when they overlap
+        barrier = threading.Barrier(4, timeout=5)
+        
+        def slow(result):
+            def generator(journal_context):
+                barrier.wait()
+                return result
+            return generator
+        
+        def failing(journal_context):
+            barrier.wait()
+            raise Exception("Frustrations failed")
+        
+        with patch('src.mcp_commit_story.context_collection.collect_chat_history', return_value={'messages': []}), \
+             patch('src.mcp_commit_story.context_collection.collect_git_context', return_value={
+                 'metadata': {'hash': 'concurrent123', 'author': 'Concurrent Author', 'date': '2025-06-03', 'message': 'Concurrent test'},
+                 'diff_summary': '', 'changed_files': [], 'file_stats': {}, 'commit_context': {}
+             }), \
+             patch('src.mcp_commit_story.journal_workflow.is_journal_only_commit', return_value=False), \
+             patch('src.mcp_commit_story.journal_generate.generate_summary_section', side_effect=slow({'summary': 'Concurrent summary'})), \
+             patch('src.mcp_commit_story.journal_generate.generate_technical_synopsis_section', side_effect=slow({'technical_synopsis': 'Concurrent technical'})), \
+             patch('src.mcp_commit_story.journal_generate.generate_accomplishments_section', side_effect=slow({'accomplishments': ['Parallel sections']})), \
+             patch('src.mcp_commit_story.journal_generate.generate_frustrations_section', side_effect=failing), \
+             patch('src.mcp_commit_story.journal_generate.generate_tone_mood_section', side_effect=slow({'mood': 'efficient', 'indicators': 'fast'})), \
+             patch('src.mcp_commit_story.journal_generate.generate_discussion_notes_section', side_effect=slow({'discussion_notes': ['Note']})), \
+             patch('src.mcp_commit_story.journal_generate.generate_discussion_notes_section_simple', side_effect=slow({'discussion_notes': ['Simple note']})), \
+             patch('src.mcp_commit_story.journal_generate.generate_commit_metadata_section', side_effect=slow({'commit_metadata': {'files_changed': '2'}})):
+            
+            result = generate_journal_entry(mock_commit, mock_config, debug=False)
+        
+        assert isinstance(result, JournalEntry)
+        assert result.summary == 'Concurrent summary'
+        assert result.technical_synopsis == 'Concurrent technical'
+        assert result.accomplishments == ['Parallel sections']
+        assert result.frustrations == []  # Failed section degrades to the JournalEntry default
+        assert result.tone_mood == {'mood': 'efficient', 'indicators': 'fast'}
+        assert result.discussion_notes == ['Note']
+        assert result.discussion_notes_simple == ['Simple note']
+        assert result.commit_metadata == {'files_changed': '2'}
+
+    def test_generate_journal_entry_combined_mode_falls_back_per_section(self):
+        """Test that combined mode uses one call and only regenerates sections it could not parse."""
+        mock_commit = MagicMock()
+        mock_commit.hexsha = 'combined123'
+        mock_commit.message = 'Combined test commit'
+        mock_commit.author = MagicMock()
+        mock_commit.author.__str__ = lambda x: 'Combined Author'
+        mock_commit.committed_datetime = datetime(2025, 6, 3, 20, 0)
+        
+        mock_config = {
+            'journal': {
+                'path': 'combined-journal',
+                'generation_mode': 'combined'
+            }
+        }
+        
+        combined_result = {
+            'summary': {'summary': 'Combined summary'},
+            'technical_synopsis': {'technical_synopsis': 'Combined technical'},
+            'accomplishments': {'accomplishments': ['Combined accomplishment']},
+            'frustrations': {'frustrations': []},
+            'tone_mood': {'mood': '', 'indicators': ''},
+            'discussion_notes_simple': {'discussion_notes': ['Simple note']}
+        }
+        
+        with patch('src.mcp_commit_story.context_collection.collect_chat_history', return_value={'messages': []}), \
+             patch('src.mcp_commit_story.context_collection.collect_git_context', return_value={
+                 'metadata': {'hash': 'combined123', 'author': 'Combined Author', 'date': '2025-06-03', 'message': 'Combined test'},
+                 'diff_summary': '', 'changed_files': [], 'file_stats': {}, 'commit_context': {}
+             }), \
+             patch('src.mcp_commit_story.journal_workflow.is_journal_only_commit', return_value=False), \
+             patch('src.mcp_commit_story.journal_generate.generate_combined_sections', return_value=combined_result) as mock_combined, \
+             patch('src.mcp_commit_story.journal_generate.generate_summary_section') as mock_summary, \
+             patch('src.mcp_commit_story.journal_generate.generate_tone_mood_section') as mock_tone_mood, \
+             patch('src.mcp_commit_story.journal_generate.generate_discussion_notes_section', return_value={'discussion_notes': ['Fallback note']}) as mock_discussion_notes, \
+             patch('src.mcp_commit_story.journal_generate.generate_commit_metadata_section', return_value={'commit_metadata': {'files_changed': '0'}}) as mock_commit_metadata:
+            
+            result = generate_journal_entry(mock_commit, mock_config, debug=False)
+        
+        mock_combined.assert_called_once()
+        mock_summary.assert_not_called()
+        mock_tone_mood.assert_not_called()  # Parsed but empty: omitted, not regenerated
+        mock_discussion_notes.assert_called_once()  # Missing from the combined response
+        mock_commit_metadata.assert_called_once()  # Programmatic, never part of the combined call
+        
+        assert result.summary == 'Combined summary'
+        assert result.technical_synopsis == 'Combined technical'
+        assert result.accomplishments == ['Combined accomplishment']
+        assert result.tone_mood is None
+        assert result.discussion_notes == ['Fallback note']
+        assert result.discussion_notes_simple == ['Simple note']
+        assert result.commit_metadata == {'files_changed': '0'}
+
     def test_cross_platform_timestamp_format(self):
         """Test that timestamp formatting is consistent across platforms."""
         # Create mock GitPython commit object with specific datetime
@@ -303,6 +413,136 @@ class TestGenerateJournalEntry:
         assert 'PM' in result.timestamp   # Should be in PM format
 
 
+    def test_streaming_mode_writes_sections_progressively(self, tmp_path):
+        """Test that ai.streaming writes completed sections to a partial file until the entry is saved."""
+        from src.mcp_commit_story.journal_workflow import handle_journal_entry_creation
+        
+        mock_commit = MagicMock()
+        mock_commit.hexsha = 'streaming123'
+        mock_commit.message = 'Streaming test commit'
+        mock_commit.author = MagicMock()
+        mock_commit.author.__str__ = lambda x: 'Streaming Author'
+        mock_commit.committed_datetime = datetime(2025, 6, 3, 21, 0)
+        
+        mock_config = {
+            'journal': {'path': str(tmp_path)},
+            'ai': {'streaming': True}
+        }
+        partial_path = tmp_path / '.cache' / 'in_progress' / 'streaming123.md'
+        seen_partial = []
+        
+        def technical_synopsis(journal_context):
+            # The summary finished first, so it is already visible in the partial file
+            seen_partial.append(partial_path.read_text())
+            return {'technical_synopsis': 'Streaming technical'}
+        
+        with patch('src.mcp_commit_story.context_collection.collect_chat_history', return_value={'messages': []}), \
+             patch('src.mcp_commit_story.context_collection.collect_git_context', return_value={
+                 'metadata': {'hash': 'streaming123', 'author': 'Streaming Author', 'date': '2025-06-03', 'message': 'Streaming test'},
+                 'diff_summary': '', 'changed_files': [], 'file_stats': {}, 'commit_context': {}
+             }), \
+             patch('src.mcp_commit_story.context_collection.collect_recent_journal_context', return_value=None), \
+             patch('src.mcp_commit_story.journal_workflow.is_journal_only_commit', return_value=False), \
+             patch('src.mcp_commit_story.journal_generate.generate_summary_section', return_value={'summary': 'Streaming summary'}), \
+             patch('src.mcp_commit_story.journal_generate.generate_technical_synopsis_section', side_effect=technical_synopsis):
+            
+            result = handle_journal_entry_creation(mock_commit, mock_config)
+        
+        assert result['success'] is True
+        assert 'Streaming summary' in seen_partial[0]
+        assert 'Streaming technical' not in seen_partial[0]
+        # The finished entry is appended to the daily file and the partial file is discarded
+        assert 'Streaming technical' in Path(result['file_path']).read_text()
+        assert not partial_path.exists()
+        assert not partial_path.with_suffix('.json').exists()
+    
+    def test_streaming_mode_resumes_interrupted_entry(self, tmp_path):
+        """Test that sections saved by an interrupted run are reused instead of regenerated."""
+        import json
+        from src.mcp_commit_story.journal_workflow import handle_journal_entry_creation
+        
+        mock_commit = MagicMock()
+        mock_commit.hexsha = 'resume123'
+        mock_commit.message = 'Resume test commit'
+        mock_commit.author = MagicMock()
+        mock_commit.author.__str__ = lambda x: 'Resume Author'
+        mock_commit.committed_datetime = datetime(2025, 6, 3, 22, 0)
+        
+        mock_config = {
+            'journal': {'path': str(tmp_path)},
+            'ai': {'streaming': True}
+        }
+        in_progress = tmp_path / '.cache' / 'in_progress'
+        in_progress.mkdir(parents=True)
+        (in_progress / 'resume123.json').write_text(json.dumps({
+            'commit_hash': 'resume123',
+            'sections': {'summary': 'Saved summary', 'accomplishments': ['Saved accomplishment']}
+        }))
+        
+        with patch('src.mcp_commit_story.context_collection.collect_chat_history', return_value={'messages': []}), \
+             patch('src.mcp_commit_story.context_collection.collect_git_context', return_value={
+                 'metadata': {'hash': 'resume123', 'author': 'Resume Author', 'date': '2025-06-03', 'message': 'Resume test'},
+                 'diff_summary': '', 'changed_files': [], 'file_stats': {}, 'commit_context': {}
+             }), \
+             patch('src.mcp_commit_story.context_collection.collect_recent_journal_context', return_value=None), \
+             patch('src.mcp_commit_story.journal_workflow.is_journal_only_commit', return_value=False), \
+             patch('src.mcp_commit_story.journal_generate.generate_summary_section') as mock_summary, \
+             patch('src.mcp_commit_story.journal_generate.generate_accomplishments_section') as mock_accomplishments, \
+             patch('src.mcp_commit_story.journal_generate.generate_technical_synopsis_section',
+                   return_value={'technical_synopsis': 'Fresh technical'}) as mock_technical:
+            
+            result = handle_journal_entry_creation(mock_commit, mock_config)
+        
+        assert result['success'] is True
+        mock_summary.assert_not_called()
+        mock_accomplishments.assert_not_called()
+        mock_technical.assert_called_once()
+        saved = Path(result['file_path']).read_text()
+        assert 'Saved summary' in saved
+        assert 'Saved accomplishment' in saved
+        assert 'Fresh technical' in saved
+        assert list(in_progress.iterdir()) == []
+
+
+    def test_one_commit_snapshot_per_run_with_boundary_filtering(self, tmp_path, monkeypatch):
+        """Test that the chat boundary filter reuses the run's git context instead of diffing again."""
+        import git
+        # The package's own import path: context_collection reaches the run memo through it
+        from mcp_commit_story import context_collection
+        from mcp_commit_story.journal_generate import JournalEntry as PackageJournalEntry
+        from mcp_commit_story.journal_workflow import generate_journal_entry as package_generate_journal_entry
+        
+        repo = git.Repo.init(tmp_path)
+        (tmp_path / 'app.py').write_text('print("hello")\n')
+        repo.index.add(['app.py'])
+        commit = repo.index.commit('Add app')
+        monkeypatch.chdir(tmp_path)
+        
+        chat_messages = [
+            {'role': 'user', 'content': f'message {i}', 'timestamp': i, 'composerId': f'session{i % 2}'}
+            for i in range(10)
+        ]
+        filter_contexts = []
+        
+        def filter_chat(messages, filter_commit, git_context):
+            filter_contexts.append(git_context)
+            return messages
+        
+        with patch('mcp_commit_story.context_collection.query_cursor_chat_database', return_value={'chat_history': chat_messages}), \
+             patch('mcp_commit_story.context_collection._boundary_filter_skip_reason', return_value=None), \
+             patch('mcp_commit_story.context_collection.filter_chat_for_commit', side_effect=filter_chat), \
+             patch('mcp_commit_story.context_collection.collect_recent_journal_context', return_value=None), \
+             patch('mcp_commit_story.context_collection.get_commit_snapshot', wraps=context_collection.get_commit_snapshot) as mock_snapshot, \
+             patch('mcp_commit_story.journal_generate.generate_summary_section', return_value={'summary': 'Summary'}):
+            
+            result = package_generate_journal_entry(commit, {'journal': {'path': 'journal'}})
+        
+        assert isinstance(result, PackageJournalEntry)
+        assert len(filter_contexts) == 1
+        assert filter_contexts[0]['metadata']['hash'] == commit.hexsha
+        assert mock_snapshot.call_count == 1
+
+
 class TestIsJournalOnlyCommit:
     """Test the is_journal_only_commit helper function."""
     
@@ -12,7 +12,7 @@ import tempfile
 import shutil
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch, MagicMock
 import pytest
 
 from src.mcp_commit_story.journal_workflow import save_journal_entry
@@ -25,8 +25,7 @@ class TestSaveJournalEntry:
     @patch('src.mcp_commit_story.journal_workflow.datetime')
     @patch('src.mcp_commit_story.journal_generate.append_to_journal_file')
     @patch('src.mcp_commit_story.journal_generate.ensure_journal_directory')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_save_new_daily_file_with_header(self, mock_file, mock_ensure_dir, mock_append, mock_datetime):
+    def test_save_new_daily_file_with_header(self, mock_ensure_dir, mock_append, mock_datetime):
         """Test saving journal entry to a new daily file with proper header."""
         # Mock datetime.strptime to handle the new date_str parameter
         mock_date_obj = MagicMock()
@@ -48,11 +47,11 @@ class TestSaveJournalEntry:
         # Verify directory creation
         mock_ensure_dir.assert_called_once()
         
-        # Verify file creation with header (should use open for new files)
-        expected_content = "# Daily Journal Entries - June 3, 2025\n\n### 2:34 PM — Commit abc123\n\n#### Summary\nTest entry"
-        # For new files, it writes directly with open()
-        mock_file.assert_called_once()
-        mock_file().write.assert_called_once_with(expected_content)
+        # Verify the entry is appended with the daily header, written only if the file is empty
+        mock_append.assert_called_once()
+        args, kwargs = mock_append.call_args
+        assert args[0] == "### 2:34 PM — Commit abc123\n\n#### Summary\nTest entry"
+        assert kwargs['header'] == "# Daily Journal Entries - June 3, 2025\n\n"
         
         # Verify return path contains expected components
         assert "test-journal" in result
@@ -93,8 +92,9 @@ class TestSaveJournalEntry:
         assert "daily/2025-06-03-journal.md" in result
     
     @patch('src.mcp_commit_story.journal_workflow.datetime')
+    @patch('src.mcp_commit_story.journal_generate.append_to_journal_file')
     @patch('src.mcp_commit_story.journal_generate.ensure_journal_directory')
-    def test_config_object_vs_dict_handling(self, mock_ensure_dir, mock_datetime):
+    def test_config_object_vs_dict_handling(self, mock_ensure_dir, mock_append, mock_datetime):
         """Test that both Config objects and dict configurations work."""
         # Mock datetime.strptime for the new implementation
         mock_date_obj = MagicMock()
@@ -108,20 +108,18 @@ class TestSaveJournalEntry:
         config_obj = MagicMock()
         config_obj.journal_path = 'config-obj-path'
         
-        with patch('pathlib.Path.exists', return_value=False), \
-             patch('builtins.open', mock_open()) as mock_file:
+        with patch('pathlib.Path.exists', return_value=False):
             save_journal_entry(journal_entry, config_obj, date_str="2025-06-03")
-            # Verify file was opened for writing (new file)
-            mock_file.assert_called()
+            # Verify the entry was written to the configured journal
+            assert "config-obj-path" in mock_append.call_args[0][1]
         
         # Test with dict config
         config_dict = {'journal': {'path': 'dict-config-path'}}
         
-        with patch('pathlib.Path.exists', return_value=False), \
-             patch('builtins.open', mock_open()) as mock_file:
+        with patch('pathlib.Path.exists', return_value=False):
             save_journal_entry(journal_entry, config_dict, date_str="2025-06-03")
-            # Verify file was opened for writing (new file)
-            mock_file.assert_called()
+            # Verify the entry was written to the configured journal
+            assert "dict-config-path" in mock_append.call_args[0][1]
     
     @patch('src.mcp_commit_story.journal_workflow.datetime')
     @patch('src.mcp_commit_story.journal_generate.ensure_journal_directory')
@@ -182,7 +180,7 @@ class TestSaveJournalEntry:
             
             with patch('pathlib.Path.exists', return_value=False), \
                  patch('src.mcp_commit_story.journal_generate.ensure_journal_directory'), \
-                 patch('builtins.open', mock_open()):
+                 patch('src.mcp_commit_story.journal_generate.append_to_journal_file'):
                 
                 result = save_journal_entry(journal_entry, config, date_str="2025-12-31")
                 
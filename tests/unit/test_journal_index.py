@@ -0,0 +1,180 @@
+"""
+Tests for the journal section index.
+
+Covers section detection and classification, index reuse and invalidation
+keyed by file size and mtime, incremental updates from append_to_journal_file,
+commit lookups by abbreviated hash, backwards tail reads of the latest entry,
+and the in-memory fallback for files outside a daily directory.
+"""
+
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from mcp_commit_story.journal_generate import append_to_journal_file
+from mcp_commit_story.journal_index import (
+    JOURNAL_INDEX_FILENAME,
+    JournalIndex,
+    get_index_for_file,
+    get_journal_sections,
+    get_trailing_sections,
+    read_sections,
+    read_trailing_sections,
+    scan_sections
+)
+from mcp_commit_story.journal_cache import CACHE_DIR_NAME
+
+ENTRY_A = "### 2:30 PM — Commit abc1234\n\n#### Summary\n\nFirst change.\n\n---\n\n"
+CAPTURE = "## 2:45 PM — AI Context Capture\n\nCaptured context.\n\n"
+REFLECTION = "## 14:50 - Reflection\n\nThinking out loud.\n\n"
+ENTRY_B = "### 2025-07-04 15:00 — Git Commit: def5678\n\n#### Summary\n\nSecond change.\n\n---\n\n"
+
+
+@pytest.fixture
+def daily_file(tmp_path):
+    path = tmp_path / "journal" / "daily" / "2025-07-04-journal.md"
+    path.parent.mkdir(parents=True)
+    return path
+
+
+class TestScanSections:
+    """Test section detection."""
+
+    def test_classifies_sections_and_offsets(self):
+        """Test kinds, commit hashes and contiguous byte offsets."""
+        content = (ENTRY_A + CAPTURE + REFLECTION + ENTRY_B).encode('utf-8')
+
+        sections = scan_sections(content)
+
+        assert [s.kind for s in sections] == ['entry', 'capture', 'reflection', 'entry']
+        assert [s.commit_hash for s in sections] == ['abc1234', None, None, 'def5678']
+        assert sections[0].start == 0
+        assert sections[-1].end == len(content)
+        assert all(a.end == b.start for a, b in zip(sections, sections[1:]))
+
+    def test_ignores_subsection_headers(self):
+        """Test that '####' headings do not start sections."""
+        sections = scan_sections(b"#### 10:00 - not a section\n" + ENTRY_A.encode('utf-8'))
+
+        assert len(sections) == 1
+        assert sections[0].kind == 'entry'
+
+
+class TestJournalIndex:
+    """Test index storage and invalidation."""
+
+    def test_sections_stored_under_journal_cache(self, daily_file):
+        """Test that the index lives in the journal's cache directory."""
+        daily_file.write_text(ENTRY_A + CAPTURE)
+
+        sections = get_journal_sections(daily_file)
+
+        assert [s.kind for s in sections] == ['entry', 'capture']
+        assert (daily_file.parent.parent / CACHE_DIR_NAME / JOURNAL_INDEX_FILENAME).exists()
+
+    def test_external_edit_triggers_rescan(self, daily_file):
+        """Test that a file changed outside the journal writer is rescanned."""
+        daily_file.write_text(ENTRY_A)
+        assert len(get_journal_sections(daily_file)) == 1
+
+        daily_file.write_text(ENTRY_A + ENTRY_B)
+        os.utime(daily_file, ns=(0, 10**9))
+
+        assert [s.commit_hash for s in get_journal_sections(daily_file)] == ['abc1234', 'def5678']
+
+    def test_appends_update_index_incrementally(self, daily_file):
+        """Test that appends keep the index equal to a full rescan."""
+        for chunk in (ENTRY_A, CAPTURE, REFLECTION, ENTRY_B):
+            append_to_journal_file(chunk, daily_file)
+            index = get_index_for_file(daily_file)
+            with index._lock:
+                connection = index._get_connection()
+                key = index._key(daily_file)
+                assert index._is_current(connection, key, daily_file.stat())
+                indexed = index._load(connection, key)
+            assert indexed == scan_sections(daily_file.read_bytes())
+
+    def test_read_sections_returns_section_text(self, daily_file):
+        """Test that sections are read by seeking to their offsets."""
+        daily_file.write_text(ENTRY_A + "### 3:00 PM — Commit ünïcode1\n\nCafé.\n")
+
+        texts = read_sections(daily_file, get_journal_sections(daily_file))
+
+        assert texts[0] == ENTRY_A
+        assert texts[1].startswith("### 3:00 PM — Commit ünïcode1")
+
+    def test_find_entry_matches_abbreviated_hash(self, daily_file):
+        """Test commit lookup with the full hash of an abbreviated header."""
+        daily_file.write_text(ENTRY_A + ENTRY_B)
+        get_journal_sections(daily_file)
+        index = get_index_for_file(daily_file)
+
+        file_path, section = index.find_entry("def5678" + "0" * 33)
+
+        assert Path(file_path) == daily_file
+        assert section.commit_hash == 'def5678'
+        assert index.find_entry("0000000") is None
+
+    def test_unusable_index_disables_itself(self, tmp_path):
+        """Test that an index that cannot be opened reports None."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("not a directory")
+        index = JournalIndex(blocker / JOURNAL_INDEX_FILENAME)
+
+        assert index.get_sections(tmp_path / "daily" / "missing.md") is None
+        assert index.find_entry("abc1234") is None
+
+
+class TestTrailingSections:
+    """Test tail reads of the latest entry and what follows it."""
+
+    @pytest.mark.parametrize("block_size", [7, 64, 4096])
+    def test_tail_read_matches_full_scan(self, daily_file, block_size):
+        """Test that reading backwards in blocks finds the same trailing sections."""
+        daily_file.write_text("# Journal\n" + (ENTRY_A + CAPTURE) * 20 + ENTRY_B + CAPTURE + REFLECTION)
+        full = scan_sections(daily_file.read_bytes())
+
+        trailing = read_trailing_sections(daily_file, block_size=block_size)
+
+        assert trailing == full[-3:]
+        assert trailing[0].commit_hash == 'def5678'
+
+    def test_tail_read_only_loads_the_tail(self, daily_file):
+        """Test that earlier entries are not read."""
+        daily_file.write_text(ENTRY_A * 500 + ENTRY_B)
+
+        with patch('mcp_commit_story.journal_index.scan_sections', wraps=scan_sections) as mock_scan:
+            read_trailing_sections(daily_file, block_size=256)
+
+        assert max(len(call.args[0]) for call in mock_scan.call_args_list) <= 256
+
+    def test_file_without_entries_returns_all_sections(self, daily_file):
+        """Test that captures are returned when there is no entry yet."""
+        daily_file.write_text(CAPTURE + REFLECTION)
+
+        assert [s.kind for s in read_trailing_sections(daily_file, block_size=8)] == ['capture', 'reflection']
+
+    def test_stale_index_is_not_rescanned(self, daily_file):
+        """Test that a changed file is tail-read instead of rescanned into the index."""
+        daily_file.write_text(ENTRY_A)
+        get_journal_sections(daily_file)
+        with open(daily_file, 'a') as f:
+            f.write(CAPTURE + ENTRY_B + REFLECTION)
+
+        trailing = get_trailing_sections(daily_file)
+
+        assert [s.kind for s in trailing] == ['entry', 'reflection']
+        assert trailing == scan_sections(daily_file.read_bytes())[-2:]
+        index = get_index_for_file(daily_file)
+        assert index.get_sections(daily_file, rescan=False) is None
+
+
+def test_files_outside_daily_are_scanned_in_memory(tmp_path):
+    """Test that non-daily files are not indexed but still return sections."""
+    path = tmp_path / "notes.md"
+    path.write_text(ENTRY_A + ENTRY_B)
+
+    assert get_index_for_file(path) is None
+    assert len(get_journal_sections(path)) == 2
+    assert not (tmp_path / CACHE_DIR_NAME).exists()
@@ -0,0 +1,194 @@
+"""
+Tests for the background journal job queue.
+
+Covers de-duplication, retries of failed commits, ordered single-worker
+draining, batch contexts, lock contention, crash recovery, the worker's shared
+batch context, and per-commit chat windows for drained commits.
+"""
+
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+
+from mcp_commit_story.journal_job_queue import JournalJobQueue, QUEUE_DB_FILENAME
+
+
+@pytest.fixture
+def job_queue(tmp_path):
+    (tmp_path / '.git').mkdir()
+    return JournalJobQueue(str(tmp_path), max_batch_size=2)
+
+
+def _succeed(processed):
+    def process(commit_hash):
+        processed.append(commit_hash)
+        return {'status': 'success', 'commit_hash': commit_hash}
+    return process
+
+
+def test_enqueue_deduplicates_commits(job_queue, tmp_path):
+    assert job_queue.enqueue("aaa") is True
+    assert job_queue.enqueue("aaa") is False
+    assert job_queue.enqueue("bbb") is True
+
+    assert job_queue.pending_count() == 2
+    assert (tmp_path / '.git' / QUEUE_DB_FILENAME).exists()
+
+
+def test_drain_processes_in_order_with_batch_contexts(job_queue):
+    for commit_hash in ["c1", "c2", "c3"]:
+        job_queue.enqueue(commit_hash)
+    processed, batches = [], []
+
+    @contextmanager
+    def batch_context(batch):
+        batches.append(list(batch))
+        yield
+
+    results = job_queue.drain(_succeed(processed), batch_context=batch_context)
+
+    assert processed == ["c1", "c2", "c3"]
+    assert batches == [["c1", "c2"], ["c3"]]
+    assert set(results) == {"c1", "c2", "c3"}
+    assert job_queue.get_status("c3") == "done"
+    # Finished commits are not queued again
+    assert job_queue.enqueue("c1") is False
+
+
+def test_failures_are_recorded_and_do_not_stop_the_queue(job_queue):
+    job_queue.enqueue("bad")
+    job_queue.enqueue("good")
+    processed = []
+
+    def process(commit_hash):
+        if commit_hash == "bad":
+            raise RuntimeError("boom")
+        return _succeed(processed)(commit_hash)
+
+    results = job_queue.drain(process)
+
+    assert results["bad"]["status"] == "error"
+    assert job_queue.get_status("bad") == "failed"
+    assert processed == ["good"]
+
+
+def test_failed_commits_are_requeued(job_queue):
+    job_queue.enqueue("c1")
+    job_queue.drain(lambda commit_hash: {'status': 'error', 'error': 'boom'})
+    assert job_queue.get_status("c1") == "failed"
+
+    assert job_queue.enqueue("c1") is True
+    assert job_queue.get_status("c1") == "pending"
+
+    processed = []
+    job_queue.drain(_succeed(processed))
+
+    assert processed == ["c1"]
+    assert job_queue.get_status("c1") == "done"
+    with job_queue._connection() as connection:
+        assert connection.execute("SELECT error FROM journal_jobs WHERE commit_hash = 'c1'").fetchone()[0] is None
+
+
+def test_drain_returns_none_while_another_worker_holds_lock(job_queue):
+    job_queue.enqueue("c1")
+    processed = []
+
+    with job_queue._worker_lock() as is_worker:
+        assert is_worker is True
+        assert job_queue.drain(_succeed(processed)) is None
+
+    assert processed == []
+    assert job_queue.get_status("c1") == "pending"
+
+
+def test_commits_queued_during_drain_are_picked_up(job_queue):
+    job_queue.enqueue("c1")
+    processed = []
+
+    def process(commit_hash):
+        if commit_hash == "c1":
+            job_queue.enqueue("c2")
+        return _succeed(processed)(commit_hash)
+
+    job_queue.drain(process)
+
+    assert processed == ["c1", "c2"]
+
+
+def test_jobs_orphaned_by_crashed_worker_are_retried(job_queue):
+    job_queue.enqueue("c1")
+    with job_queue._connection() as connection:
+        job_queue._claim_batch(connection)
+    assert job_queue.get_status("c1") == "running"
+
+    processed = []
+    job_queue.drain(_succeed(processed))
+
+    assert processed == ["c1"]
+
+
+def test_batch_extraction_context_spans_all_commit_windows(tmp_path):
+    from mcp_commit_story import background_journal_worker
+    from mcp_commit_story.cursor_db import _shared_chat_window
+    from mcp_commit_story.git_utils import _git_run_memo
+
+    windows = {"c1": (100, 200), "c2": (200, 350)}
+    with patch('mcp_commit_story.cursor_db.get_commit_time_window', side_effect=lambda sha, repo: windows[sha]):
+        with background_journal_worker.batch_extraction_context(["c1", "c2"], str(tmp_path)):
+            shared = _shared_chat_window.get()
+            assert (shared['start'], shared['end']) == (100, 350)
+            assert _git_run_memo.get() is not None
+
+    assert _shared_chat_window.get() is None
+
+
+def test_drained_commits_each_collect_their_own_chat_window(job_queue, tmp_path):
+    from datetime import datetime
+    from unittest.mock import MagicMock
+    from mcp_commit_story import background_journal_worker
+    from mcp_commit_story.journal_workflow import handle_journal_entry_creation
+
+    windows = {"c1": (100, 200), "c2": (200, 350), "head": (350, 400)}
+    commits = {}
+    for commit_hash in ["c1", "c2"]:
+        commit = MagicMock()
+        commit.hexsha = commit_hash
+        commit.message = f"Commit {commit_hash}"
+        commit.committed_datetime = datetime(2025, 6, 3, 12, 0)
+        commits[commit_hash] = commit
+        job_queue.enqueue(commit_hash)
+
+    def query_chat(commit=None):
+        # Mirrors query_cursor_chat_database: without a commit the window comes from HEAD
+        start, end = windows[commit.hexsha if commit is not None else "head"]
+        return {'chat_history': [{'role': 'user', 'content': f"{start}-{end}", 'timestamp': start}]}
+
+    seen_chat = {}
+
+    def summary(journal_context):
+        seen_chat[journal_context['git']['metadata']['hash']] = journal_context['chat']['messages'][0]['text']
+        return {'summary': 'Summary'}
+
+    def process(commit_hash):
+        result = handle_journal_entry_creation(commits[commit_hash], {'journal': {'path': str(tmp_path / 'journal')}})
+        return {'status': 'success' if result['success'] else 'error', 'error': result.get('error')}
+
+    with patch('mcp_commit_story.context_collection.query_cursor_chat_database', side_effect=query_chat), \
+         patch('mcp_commit_story.context_collection._boundary_filter_skip_reason', return_value='test'), \
+         patch('mcp_commit_story.context_collection.collect_git_context',
+               side_effect=lambda commit_hash=None, repo=None, journal_path=None: {
+                   'metadata': {'hash': commit_hash, 'author': 'Author', 'date': '2025-06-03', 'message': 'Commit'},
+                   'diff_summary': '', 'changed_files': [], 'file_stats': {}, 'commit_context': {}
+               }), \
+         patch('mcp_commit_story.context_collection.collect_recent_journal_context', return_value=None), \
+         patch('mcp_commit_story.journal_workflow.is_journal_only_commit', return_value=False), \
+         patch('mcp_commit_story.journal_generate.generate_summary_section', side_effect=summary), \
+         patch('mcp_commit_story.cursor_db.get_commit_time_window', side_effect=lambda sha, repo: windows[sha]):
+        results = job_queue.drain(
+            process,
+            batch_context=lambda batch: background_journal_worker.batch_extraction_context(batch, str(tmp_path))
+        )
+
+    assert all(result['status'] == 'success' for result in results.values())
+    assert seen_chat == {"c1": "100-200", "c2": "200-350"}
@@ -0,0 +1,44 @@
+"""
+Tests for the deferred-import helper.
+"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from mcp_commit_story.lazy_imports import LazyModule, lazy_import
+
+
+def test_already_imported_module_is_returned_directly():
+    import json
+
+    assert lazy_import("json") is json
+
+
+def test_module_is_loaded_on_first_attribute_access(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+
+    module = lazy_import("colorsys")
+    assert isinstance(module, LazyModule)
+    assert "colorsys" not in sys.modules
+
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert "colorsys" in sys.modules
+
+
+def test_patches_on_real_module_and_stand_in_are_visible():
+    module = LazyModule("json")
+
+    with patch("json.dumps", return_value="patched"):
+        assert module.dumps({}) == "patched"
+    with patch.object(module, "dumps", return_value="local"):
+        assert module.dumps({}) == "local"
+    assert module.dumps({}) == "{}"
+
+
+def test_missing_module_fails_on_use():
+    module = lazy_import("mcp_commit_story_missing_module")
+
+    with pytest.raises(ImportError):
+        module.anything
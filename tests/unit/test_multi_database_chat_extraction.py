@@ -7,7 +7,7 @@ results chronologically and providing data quality metadata.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import Mock, patch, MagicMock, call, ANY
 from datetime import datetime
 import json
 import time
@@ -68,8 +68,8 @@ class TestMultiDatabaseChatExtraction:
         mock_discover_all.assert_called_once_with("/test/workspace")
         assert mock_composer_provider_class.call_count == 2
         mock_composer_provider_class.assert_has_calls([
-            call("/workspace/.cursor/session1/state.vscdb", "/global/state.vscdb"),
-            call("/workspace/.cursor/session2/state.vscdb", "/global/state.vscdb")
+            call("/workspace/.cursor/session1/state.vscdb", "/global/state.vscdb", batch_bubbles=True, session_cache=ANY),
+            call("/workspace/.cursor/session2/state.vscdb", "/global/state.vscdb", batch_bubbles=True, session_cache=ANY)
         ])
 
     @patch('mcp_commit_story.cursor_db.discover_all_cursor_databases')
@@ -111,9 +111,9 @@ class TestMultiDatabaseChatExtraction:
         # Check only the constructor calls, not the method calls
         constructor_calls = [call for call in mock_composer_provider_class.call_args_list]
         expected_calls = [
-            call("/workspace1/state.vscdb", "/shared/global.vscdb"),
-            call("/workspace2/state.vscdb", "/shared/global.vscdb"),
-            call("/workspace3/state.vscdb", "/shared/global.vscdb")
+            call("/workspace1/state.vscdb", "/shared/global.vscdb", batch_bubbles=True, session_cache=ANY),
+            call("/workspace2/state.vscdb", "/shared/global.vscdb", batch_bubbles=True, session_cache=ANY),
+            call("/workspace3/state.vscdb", "/shared/global.vscdb", batch_bubbles=True, session_cache=ANY)
         ]
         assert constructor_calls == expected_calls
 
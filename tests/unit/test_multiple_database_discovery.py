@@ -8,6 +8,8 @@ Cursor databases to handle database rotation after 100 generations.
 import pytest
 import os
 import tempfile
+import threading
+import time
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
@@ -252,6 +254,86 @@ class TestExtractFromMultipleDatabases:
             assert result == []
 
 
+class TestParallelExtractFromMultipleDatabases:
+    """Test extract_from_multiple_databases with max_workers > 1."""
+    
+    def test_parallel_extraction_preserves_input_order(self):
+        """Test that results follow input order even when later databases finish first."""
+        database_paths = [f"/path/db{i}.vscdb" for i in range(4)]
+        delays = {path: 0.05 * (len(database_paths) - i) for i, path in enumerate(database_paths)}
+        
+        def prompts_side_effect(db_path):
+            time.sleep(delays[db_path])
+            return [{"id": 1, "content": db_path}]
+        
+        with patch('mcp_commit_story.cursor_db.multiple_database_discovery.extract_prompts_data') as mock_prompts, \
+             patch('mcp_commit_story.cursor_db.multiple_database_discovery.extract_generations_data') as mock_generations:
+            mock_prompts.side_effect = prompts_side_effect
+            mock_generations.return_value = []
+            
+            result = extract_from_multiple_databases(database_paths, max_workers=4)
+        
+        assert [r["database_path"] for r in result] == database_paths
+        assert [r["prompts"][0]["content"] for r in result] == database_paths
+    
+    def test_parallel_extraction_runs_concurrently(self):
+        """Test that databases are actually extracted on multiple threads."""
+        database_paths = ["/path/db1.vscdb", "/path/db2.vscdb", "/path/db3.vscdb"]
+        barrier = threading.Barrier(len(database_paths), timeout=5)
+        
+        def prompts_side_effect(db_path):
+            # Deadlocks (and times out) unless all databases run at once
+            barrier.wait()
+            return []
+        
+        with patch('mcp_commit_story.cursor_db.multiple_database_discovery.extract_prompts_data') as mock_prompts, \
+             patch('mcp_commit_story.cursor_db.multiple_database_discovery.extract_generations_data') as mock_generations:
+            mock_prompts.side_effect = prompts_side_effect
+            mock_generations.return_value = []
+            
+            result = extract_from_multiple_databases(database_paths, max_workers=3)
+        
+        assert len(result) == 3
+    
+    def test_parallel_extraction_skips_failed_databases(self):
+        """Test skip-and-continue semantics in parallel mode."""
+        database_paths = ["/path/good1.vscdb", "/path/bad.vscdb", "/path/good2.vscdb"]
+        
+        def prompts_side_effect(db_path):
+            if "bad" in db_path:
+                raise Exception("Database corrupted")
+            return [{"id": 1}]
+        
+        with patch('mcp_commit_story.cursor_db.multiple_database_discovery.extract_prompts_data') as mock_prompts, \
+             patch('mcp_commit_story.cursor_db.multiple_database_discovery.extract_generations_data') as mock_generations:
+            mock_prompts.side_effect = prompts_side_effect
+            mock_generations.return_value = []
+            
+            result = extract_from_multiple_databases(database_paths, max_workers=2)
+        
+        assert [r["database_path"] for r in result] == ["/path/good1.vscdb", "/path/good2.vscdb"]
+    
+    def test_records_span_per_database(self):
+        """Test that each database gets its own timing span."""
+        database_paths = ["/path/db1.vscdb", "/path/db2.vscdb"]
+        
+        with patch('mcp_commit_story.cursor_db.multiple_database_discovery.extract_prompts_data', return_value=[]), \
+             patch('mcp_commit_story.cursor_db.multiple_database_discovery.extract_generations_data', return_value=[]), \
+             patch('mcp_commit_story.cursor_db.multiple_database_discovery.get_tracer') as mock_get_tracer:
+            mock_span = MagicMock()
+            mock_get_tracer.return_value.start_as_current_span.return_value.__enter__.return_value = mock_span
+            
+            extract_from_multiple_databases(database_paths, max_workers=2)
+        
+        span_names = [c.args[0] for c in mock_get_tracer.return_value.start_as_current_span.call_args_list]
+        assert span_names == ["cursor_db.extract_database"] * 2
+        recorded_paths = {
+            c.args[1] for c in mock_span.set_attribute.call_args_list if c.args[0] == "database_path"
+        }
+        assert recorded_paths == set(database_paths)
+        assert any(c.args[0] == "duration_ms" for c in mock_span.set_attribute.call_args_list)
+
+
 class TestMultipleDatabaseDiscoveryTelemetry:
     """Test telemetry instrumentation for multiple database discovery functions."""
     
@@ -69,6 +69,25 @@ class TestOpenAIProvider:
             timeout=30
         )
     
+    @patch('src.mcp_commit_story.ai_provider.openai.OpenAI')
+    def test_call_method_streaming(self, mock_openai_class):
+        """Test that stream=True assembles the response from streamed chunks."""
+        def chunk(content):
+            mock_chunk = Mock()
+            mock_chunk.choices = [Mock()]
+            mock_chunk.choices[0].delta.content = content
+            return mock_chunk
+        
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = iter([chunk("Streamed "), chunk(None), chunk("response")])
+        mock_openai_class.return_value = mock_client
+        
+        provider = OpenAIProvider(config=self.mock_config)
+        result = provider.call("Test prompt", {"test": "context"}, stream=True)
+        
+        assert result == "Streamed response"
+        assert mock_client.chat.completions.create.call_args[1]['stream'] is True
+    
     @patch('src.mcp_commit_story.ai_provider.openai.OpenAI')
     def test_call_method_with_actual_journal_prompt(self, mock_openai_class):
         """Test call method with actual docstring from generate_summary_section."""
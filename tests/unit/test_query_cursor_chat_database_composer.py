@@ -188,6 +188,33 @@ class TestComposerBasedQueryCursorChatDatabase:
         assert result["workspace_info"]["total_messages"] == 0
         assert result["chat_history"] == []
 
+    @patch('mcp_commit_story.cursor_db.get_commit_time_window')
+    @patch('mcp_commit_story.cursor_db.find_workspace_composer_databases')
+    @patch('mcp_commit_story.cursor_db.get_current_commit_hash')
+    @patch('mcp_commit_story.cursor_db.detect_workspace_for_repo')
+    @patch('mcp_commit_story.cursor_db.get_session_cache_for_repo')
+    @patch('mcp_commit_story.cursor_db.cursor_connection_pool')
+    def test_session_cache_closed_when_query_fails(
+        self,
+        mock_pool,
+        mock_get_session_cache,
+        mock_detect_workspace,
+        mock_get_commit_hash,
+        mock_find_databases,
+        mock_get_time_window
+    ):
+        """Test that the session cache is closed even if querying the databases raises."""
+        mock_get_commit_hash.return_value = "abc123"
+        mock_get_time_window.return_value = (1640995200000, 1640998800000)
+        mock_find_databases.return_value = ("/workspace.vscdb", "/global.vscdb")
+        mock_detect_workspace.side_effect = Exception("Workspace detection failed")
+        mock_pool.side_effect = RuntimeError("pool unavailable")
+        
+        result = query_cursor_chat_database()
+        
+        assert result["chat_history"] == []
+        mock_get_session_cache.return_value.close.assert_called_once()
+
     @patch('mcp_commit_story.cursor_db.get_current_commit_hash')
     def test_git_error_fallback_to_24_hour(self, mock_get_commit_hash):
         """Test fallback to 24-hour window when git operations fail."""
@@ -391,4 +418,45 @@ class TestNewFunctionImports:
         assert callable(get_current_commit_hash)
         assert callable(get_commit_time_window)  
         assert callable(find_workspace_composer_databases)
-        assert callable(ComposerChatProvider) 
\ No newline at end of file
+        assert callable(ComposerChatProvider) 
+
+class TestSharedChatExtraction:
+    """Test one extraction pass shared by a batch of commits."""
+
+    def _provider(self):
+        provider = Mock()
+        provider.getChatSessionsForWindow.return_value = [
+            {'createdAt': 100, 'lastUpdatedAt': 150,
+             'messages': [{'timestamp': 100, 'composerId': 'a', 'content': 'first'}]},
+            {'createdAt': 200, 'lastUpdatedAt': 290,
+             'messages': [{'timestamp': 200, 'composerId': 'b', 'content': 'second'}]},
+        ]
+        return provider
+
+    def test_windows_inside_batch_reuse_one_extraction(self):
+        from mcp_commit_story.cursor_db import _get_chat_history, shared_chat_extraction
+
+        provider = self._provider()
+        with shared_chat_extraction(0, 300):
+            first = _get_chat_history(provider, 'db', 0, 160)
+            second = _get_chat_history(provider, 'db', 160, 300)
+
+        provider.getChatSessionsForWindow.assert_called_once_with(0, 300)
+        provider.getChatHistoryForCommit.assert_not_called()
+        assert [m['content'] for m in first] == ['first']
+        assert [m['content'] for m in second] == ['second']
+        # Callers annotate messages, so the shared extraction must not be mutated
+        first[0]['_message_index'] = 0
+        assert '_message_index' not in provider.getChatSessionsForWindow.return_value[0]['messages'][0]
+
+    def test_windows_outside_batch_query_directly(self):
+        from mcp_commit_story.cursor_db import _get_chat_history, shared_chat_extraction
+
+        provider = self._provider()
+        provider.getChatHistoryForCommit.return_value = []
+        with shared_chat_extraction(100, 300):
+            _get_chat_history(provider, 'db', 0, 200)
+        _get_chat_history(provider, 'db', 150, 200)
+
+        assert provider.getChatHistoryForCommit.call_count == 2
+        provider.getChatSessionsForWindow.assert_not_called()
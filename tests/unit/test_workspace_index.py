@@ -0,0 +1,179 @@
+"""
+Tests for the persistent workspace-detection index.
+
+Covers index hits, invalidation on workspaceStorage mtime changes and missing
+databases, the journal cache directory layout, graceful degradation on
+corrupted or unwritable index files, and detect_workspace_for_repo integration.
+"""
+
+import json
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from mcp_commit_story.cursor_db.workspace_detection import WorkspaceMatch, detect_workspace_for_repo
+from mcp_commit_story.cursor_db.workspace_index import (
+    WorkspaceIndex,
+    WORKSPACE_INDEX_FILENAME,
+    get_workspace_index_for_repo
+)
+from mcp_commit_story.journal_cache import CACHE_DIR_NAME
+
+
+@pytest.fixture
+def workspace_storage(tmp_path):
+    """Create a workspaceStorage directory with a single matching workspace."""
+    storage_path = tmp_path / "workspaceStorage"
+    workspace_dir = storage_path / "abc123hash"
+    workspace_dir.mkdir(parents=True)
+    (workspace_dir / "workspace.json").write_text(json.dumps({"folder": "file:///Users/user/project"}))
+    (workspace_dir / "state.vscdb").touch()
+    return storage_path
+
+
+@pytest.fixture
+def repo_path(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    return repo
+
+
+def _match_for(storage_path):
+    return WorkspaceMatch(
+        path=storage_path / "abc123hash" / "state.vscdb",
+        confidence=0.85,
+        match_type="folder_path",
+        workspace_folder="file:///Users/user/project"
+    )
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestWorkspaceIndex:
+    """Test index storage and invalidation."""
+
+    def test_lookup_returns_recorded_match(self, tmp_path, workspace_storage, repo_path):
+        """Test that a recorded match is returned unchanged."""
+        index = WorkspaceIndex.for_journal(tmp_path / "journal")
+        match = _match_for(workspace_storage)
+        index.record(repo_path, match)
+
+        assert index.lookup(repo_path) == match
+
+    def test_persists_across_instances(self, tmp_path, workspace_storage, repo_path):
+        """Test that the index survives between git hook runs."""
+        WorkspaceIndex.for_journal(tmp_path / "journal").record(repo_path, _match_for(workspace_storage))
+
+        assert WorkspaceIndex.for_journal(tmp_path / "journal").lookup(repo_path) == _match_for(workspace_storage)
+
+    def test_unknown_repo_misses(self, tmp_path, workspace_storage, repo_path):
+        """Test that repositories without an entry miss."""
+        index = WorkspaceIndex.for_journal(tmp_path / "journal")
+        index.record(repo_path, _match_for(workspace_storage))
+
+        assert index.lookup(tmp_path / "other-repo") is None
+
+    def test_invalidated_when_storage_mtime_changes(self, tmp_path, workspace_storage, repo_path):
+        """Test that a changed workspaceStorage mtime invalidates the entry."""
+        index = WorkspaceIndex.for_journal(tmp_path / "journal")
+        index.record(repo_path, _match_for(workspace_storage))
+
+        _bump_mtime(workspace_storage)
+
+        assert index.lookup(repo_path) is None
+
+    def test_invalidated_when_database_missing(self, tmp_path, workspace_storage, repo_path):
+        """Test that a deleted state.vscdb invalidates the entry."""
+        index = WorkspaceIndex.for_journal(tmp_path / "journal")
+        match = _match_for(workspace_storage)
+        index.record(repo_path, match)
+
+        match.path.unlink()
+
+        assert index.lookup(repo_path) is None
+
+    def test_index_file_is_gitignored_under_journal(self, tmp_path, workspace_storage, repo_path):
+        """Test that the index lives in <journal>/.cache with a catch-all .gitignore."""
+        WorkspaceIndex.for_journal(tmp_path / "journal").record(repo_path, _match_for(workspace_storage))
+
+        cache_dir = tmp_path / "journal" / CACHE_DIR_NAME
+        assert (cache_dir / WORKSPACE_INDEX_FILENAME).exists()
+        assert (cache_dir / ".gitignore").read_text() == "*\n"
+
+    def test_corrupted_index_file_is_a_miss(self, tmp_path, workspace_storage, repo_path):
+        """Test that an unreadable index degrades to a miss and is rewritten."""
+        cache_dir = tmp_path / "journal" / CACHE_DIR_NAME
+        cache_dir.mkdir(parents=True)
+        (cache_dir / WORKSPACE_INDEX_FILENAME).write_text("{not json")
+
+        index = WorkspaceIndex.for_journal(tmp_path / "journal")
+        assert index.lookup(repo_path) is None
+
+        index.record(repo_path, _match_for(workspace_storage))
+        assert WorkspaceIndex.for_journal(tmp_path / "journal").lookup(repo_path) is not None
+
+    def test_unwritable_location_does_not_raise(self, tmp_path, workspace_storage, repo_path):
+        """Test that write failures are swallowed."""
+        blocker = tmp_path / "journal"
+        blocker.write_text("not a directory")
+
+        index = WorkspaceIndex.for_journal(blocker)
+        index.record(repo_path, _match_for(workspace_storage))
+
+        assert not (blocker / CACHE_DIR_NAME).exists()
+
+    def test_get_workspace_index_for_repo_uses_journal_path(self, tmp_path):
+        """Test that the index is placed under the configured journal directory."""
+        with patch('mcp_commit_story.config.load_config', return_value={"journal": {"path": "journal"}}):
+            index = get_workspace_index_for_repo(str(tmp_path))
+
+        assert index.index_path == tmp_path / "journal" / CACHE_DIR_NAME / WORKSPACE_INDEX_FILENAME
+
+
+class TestDetectWorkspaceWithIndex:
+    """Test detect_workspace_for_repo with a workspace index."""
+
+    def test_second_detection_skips_scan(self, tmp_path, workspace_storage, repo_path):
+        """Test that a repeated detection is served from the index without scanning."""
+        index = WorkspaceIndex.for_journal(tmp_path / "journal")
+
+        with patch('mcp_commit_story.cursor_db.workspace_detection._scan_workspace_directories',
+                   return_value=[_match_for(workspace_storage)]) as mock_scan:
+            first = detect_workspace_for_repo(repo_path, workspace_index=index)
+            second = detect_workspace_for_repo(repo_path, workspace_index=index)
+
+        assert mock_scan.call_count == 1
+        assert second == first
+
+    def test_rescans_after_storage_change(self, tmp_path, workspace_storage, repo_path):
+        """Test that a workspaceStorage change forces a full scan."""
+        index = WorkspaceIndex.for_journal(tmp_path / "journal")
+
+        with patch('mcp_commit_story.cursor_db.workspace_detection._scan_workspace_directories',
+                   return_value=[_match_for(workspace_storage)]) as mock_scan:
+            detect_workspace_for_repo(repo_path, workspace_index=index)
+            (workspace_storage / "newhash").mkdir()
+            _bump_mtime(workspace_storage)
+            detect_workspace_for_repo(repo_path, workspace_index=index)
+
+        assert mock_scan.call_count == 2
+
+    def test_fallback_matches_are_not_indexed(self, tmp_path, workspace_storage, repo_path):
+        """Test that most-recent fallbacks are recomputed rather than indexed."""
+        index = WorkspaceIndex.for_journal(tmp_path / "journal")
+        fallback = WorkspaceMatch(
+            path=workspace_storage / "abc123hash" / "state.vscdb",
+            confidence=0.0,
+            match_type="most_recent",
+            workspace_folder=""
+        )
+
+        with patch('mcp_commit_story.cursor_db.workspace_detection._scan_workspace_directories', return_value=[]), \
+             patch('mcp_commit_story.cursor_db.workspace_detection._get_most_recent_workspace', return_value=fallback):
+            detect_workspace_for_repo(repo_path, workspace_index=index)
+
+        assert index.lookup(repo_path) is None